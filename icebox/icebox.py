@@ -15,8 +15,8 @@
 #  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 #
 
-import iceboxdb
-import re, sys, functools
+import re, sys, os, functools, bisect, hashlib, pickle, threading, weakref, contextlib
+from array import array
 
 
 if True:
@@ -48,21 +48,55 @@ class iceconfig:
     def __init__(self):
         self.clear()
 
+    # Pickling and copying leave out the caches derived from the tiles.
+    derived_state = ("tile_grid", "all_groups", "net_map", "tile_nets", "tile_connection_cache",
+                     "tile_seed_cache", "segment_groups", "grouped_without_graph")
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in self.derived_state:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.tile_grid = None
+        self.all_groups = None
+        self.net_map = None
+        self.tile_nets = None
+        self.tile_connection_cache = dict()
+        self.tile_seed_cache = dict()
+        self.segment_groups = None
+        self.grouped_without_graph = False
+        for kind, tiles in self.tile_kinds():
+            tiles.owner = weakref.ref(self)
+
     def clear(self):
         self.max_x = 0
         self.max_y = 0
         self.device = ""
         self.warmboot = True
-        self.logic_tiles = dict()
-        self.io_tiles = dict()
-        self.ramb_tiles = dict()
-        self.ramt_tiles = dict()
-        self.dsp_tiles = [dict() for i in range(4)]
-        self.ipcon_tiles = dict()
+        self.tile_grid = None
+        self.logic_tiles = tiledict(ic=self)
+        self.io_tiles = tiledict(ic=self)
+        self.ramb_tiles = tiledict(ic=self)
+        self.ramt_tiles = tiledict(ic=self)
+        self.dsp_tiles = [tiledict(ic=self) for i in range(4)]
+        self.ipcon_tiles = tiledict(ic=self)
         self.ram_data = dict()
         self.extra_bits = set()
         self.symbols = dict()
-        self.tile_has_net.cache_clear()
+        self.all_groups = None
+        self.net_map = None
+        self.tile_nets = None
+        self.dirty_tiles = set()
+        self.journal = list()
+        self.batches = list()
+        self.batch_edited = False
+        self.tile_connection_cache = dict()
+        self.tile_seed_cache = dict()
+        self.segment_groups = None
+        self.grouped_without_graph = False
 
     def setup_empty_384(self):
         self.clear()
@@ -72,15 +106,16 @@ class iceconfig:
 
         for x in range(1, self.max_x):
             for y in range(1, self.max_y):
-                self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
 
         for y in range(1, self.max_y):
-            self.io_tiles[(0, y)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(self.max_x, y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(0, y)] = tilebits.zeros(18)
+            self.io_tiles[(self.max_x, y)] = tilebits.zeros(18)
+        self.build_tile_grid()
 
     def setup_empty_1k(self):
         self.clear()
@@ -92,19 +127,20 @@ class iceconfig:
             for y in range(1, self.max_y):
                 if x in (3, 10):
                     if y % 2 == 1:
-                        self.ramb_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramb_tiles[(x, y)] = tilebits.zeros(42)
                     else:
-                        self.ramt_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramt_tiles[(x, y)] = tilebits.zeros(42)
                 else:
-                    self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
 
         for y in range(1, self.max_y):
-            self.io_tiles[(0, y)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(self.max_x, y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(0, y)] = tilebits.zeros(18)
+            self.io_tiles[(self.max_x, y)] = tilebits.zeros(18)
+        self.build_tile_grid()
 
     def setup_empty_lm4k(self):
         self.clear()
@@ -116,19 +152,20 @@ class iceconfig:
             for y in range(1, self.max_y):
                 if x in (6, 19):
                     if y % 2 == 1:
-                        self.ramb_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramb_tiles[(x, y)] = tilebits.zeros(42)
                     else:
-                        self.ramt_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramt_tiles[(x, y)] = tilebits.zeros(42)
                 else:
-                    self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
 
         for y in range(1, self.max_y):
-            self.io_tiles[(0, y)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(self.max_x, y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(0, y)] = tilebits.zeros(18)
+            self.io_tiles[(self.max_x, y)] = tilebits.zeros(18)
+        self.build_tile_grid()
 
     def setup_empty_u4k(self):
         self.clear()
@@ -140,28 +177,29 @@ class iceconfig:
             for y in range(1, self.max_y):
                 if x in (6, 19):
                     if y % 2 == 1:
-                        self.ramb_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramb_tiles[(x, y)] = tilebits.zeros(42)
                     else:
-                        self.ramt_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramt_tiles[(x, y)] = tilebits.zeros(42)
                 else:
-                    self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
 
         for x in [0, self.max_x]:
             for y in range(1, self.max_y):
                 if y in [5, 13]:
-                    self.dsp_tiles[0][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[0][(x, y)] = tilebits.zeros(54)
                 elif y in [6, 14]:
-                    self.dsp_tiles[1][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[1][(x, y)] = tilebits.zeros(54)
                 elif y in [7, 15]:
-                    self.dsp_tiles[2][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[2][(x, y)] = tilebits.zeros(54)
                 elif y in [8, 16]:
-                    self.dsp_tiles[3][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[3][(x, y)] = tilebits.zeros(54)
                 else:
-                    self.ipcon_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.ipcon_tiles[(x, y)] = tilebits.zeros(54)
+        self.build_tile_grid()
 
     def setup_empty_5k(self):
         self.clear()
@@ -173,27 +211,29 @@ class iceconfig:
             for y in range(1, self.max_y):
                 if x in (6, 19):
                     if y % 2 == 1:
-                        self.ramb_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramb_tiles[(x, y)] = tilebits.zeros(42)
                     else:
-                        self.ramt_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramt_tiles[(x, y)] = tilebits.zeros(42)
                 else:
-                    self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
         for x in [0, self.max_x]:
             for y in range(1, self.max_y):
                 if y in [5, 10, 15, 23]:
-                    self.dsp_tiles[0][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[0][(x, y)] = tilebits.zeros(54)
                 elif y in [6, 11, 16, 24]:
-                    self.dsp_tiles[1][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[1][(x, y)] = tilebits.zeros(54)
                 elif y in [7, 12, 17, 25]:
-                    self.dsp_tiles[2][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[2][(x, y)] = tilebits.zeros(54)
                 elif y in [8, 13, 18, 26]:
-                    self.dsp_tiles[3][(x, y)] = ["0" * 54 for i in range(16)]
+                    self.dsp_tiles[3][(x, y)] = tilebits.zeros(54)
                 else:
-                    self.ipcon_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.ipcon_tiles[(x, y)] = tilebits.zeros(54)
+        self.build_tile_grid()
+
     def setup_empty_8k(self):
         self.clear()
         self.device = "8k"
@@ -204,19 +244,20 @@ class iceconfig:
             for y in range(1, self.max_y):
                 if x in (8, 25):
                     if y % 2 == 1:
-                        self.ramb_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramb_tiles[(x, y)] = tilebits.zeros(42)
                     else:
-                        self.ramt_tiles[(x, y)] = ["0" * 42 for i in range(16)]
+                        self.ramt_tiles[(x, y)] = tilebits.zeros(42)
                 else:
-                    self.logic_tiles[(x, y)] = ["0" * 54 for i in range(16)]
+                    self.logic_tiles[(x, y)] = tilebits.zeros(54)
 
         for x in range(1, self.max_x):
-            self.io_tiles[(x, 0)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(x, self.max_y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(x, 0)] = tilebits.zeros(18)
+            self.io_tiles[(x, self.max_y)] = tilebits.zeros(18)
 
         for y in range(1, self.max_y):
-            self.io_tiles[(0, y)] = ["0" * 18 for i in range(16)]
-            self.io_tiles[(self.max_x, y)] = ["0" * 18 for i in range(16)]
+            self.io_tiles[(0, y)] = tilebits.zeros(18)
+            self.io_tiles[(self.max_x, y)] = tilebits.zeros(18)
+        self.build_tile_grid()
 
     def lookup_extra_bit(self, bit):
         assert self.device in extra_bits_db
@@ -224,26 +265,81 @@ class iceconfig:
             return extra_bits_db[self.device][bit]
         return ("UNKNOWN_FUNCTION",)
 
-    def tile(self, x, y):
-        if (x, y) in self.io_tiles: return self.io_tiles[(x, y)]
-        if (x, y) in self.logic_tiles: return self.logic_tiles[(x, y)]
-        if (x, y) in self.ramb_tiles: return self.ramb_tiles[(x, y)]
-        if (x, y) in self.ramt_tiles: return self.ramt_tiles[(x, y)]
-        for i in range(4):
-            if (x, y) in self.dsp_tiles[i]: return self.dsp_tiles[i][(x, y)]
-        if (x, y) in self.ipcon_tiles: return self.ipcon_tiles[(x, y)]            
+    # Return (kind, tiles) for each per-kind tile dict, kind being the
+    # tile statement name used in .asc files ("io", "logic", ...).
+    def tile_kinds(self):
+        return [("io", self.io_tiles), ("logic", self.logic_tiles),
+                ("ramb", self.ramb_tiles), ("ramt", self.ramt_tiles)] + \
+               [("dsp%d" % i, self.dsp_tiles[i]) for i in range(4)] + \
+               [("ipcon", self.ipcon_tiles)]
+
+    # Build the dense (max_x+1)*(max_y+1) grid of tile records that
+    # backs tile(), tile_db() and tile_type(). The per-kind tile dicts
+    # hold the same tile objects and drop the grid when modified.
+    def build_tile_grid(self):
+        grid = [None] * ((self.max_x + 1) * (self.max_y + 1))
+        for kind, tiles in reversed(self.tile_kinds()):
+            for (x, y), data in tiles.items():
+                if 0 <= x <= self.max_x and 0 <= y <= self.max_y:
+                    grid[x * (self.max_y + 1) + y] = tilerecord(kind, x, y, data, self.tile_pos(x, y))
+        self.tile_grid = grid
+        return grid
+
+    def tile_record(self, x, y):
+        grid = self.tile_grid
+        if grid is None:
+            grid = self.build_tile_grid()
+        if 0 <= x <= self.max_x and 0 <= y <= self.max_y:
+            return grid[x * (self.max_y + 1) + y]
         return None
 
+    # All tile records in column-major order.
+    def tile_records(self):
+        grid = self.tile_grid
+        if grid is None:
+            grid = self.build_tile_grid()
+        return [rec for rec in grid if rec is not None]
+
+    # All tiles of one kind as a NumPy array (NumPy is optional and only
+    # needed here). Returns the sorted tile positions and a bool array
+    # shaped (tiles, rows, cols), or with packed=True an uint8 array
+    # shaped (tiles, bytes) holding bit B<row>[<col>] of each tile at bit
+    # position row*width+col, LSB first. See also match_array().
+    def as_array(self, kind="logic", packed=False):
+        import numpy
+        tiles = dict(self.tile_kinds())[kind]
+        coords = sorted(tiles)
+        width = height = 0
+        data = list()
+        for xy in coords:
+            tile = as_tilebits(tiles[xy])
+            assert not data or (tile.width, tile.height) == (width, height)
+            width, height = tile.width, tile.height
+            data.append(tile.bits)
+        nbytes = (width * height + 7) // 8
+        buf = b"".join(bits.to_bytes(nbytes, "little") for bits in data)
+        packed_tiles = numpy.frombuffer(buf, dtype=numpy.uint8).reshape(len(coords), nbytes)
+        if packed:
+            return coords, packed_tiles
+        tile_bits = numpy.unpackbits(packed_tiles, axis=1, count=width * height, bitorder="little")
+        return coords, tile_bits.reshape(len(coords), height, width).astype(bool)
+
+    def tile(self, x, y):
+        rec = self.tile_record(x, y)
+        if rec is None:
+            return None
+        return rec.data
+
     def pinloc_db(self, package = None):
         if package is None:
-            if self.device == "384": return pinloc_db["384-qn32"]
-            if self.device == "1k": return pinloc_db["1k-tq144"]
-            if self.device == "lm4k": return pinloc_db["lm4k-cm49"]
-            if self.device == "u4k": return pinloc_db["u4k-sg48"]
-            if self.device == "5k": return pinloc_db["5k-sg48"]
-            if self.device == "8k": return pinloc_db["8k-ct256"]
+            if self.device == "384": return get_db("pinloc_db")["384-qn32"]
+            if self.device == "1k": return get_db("pinloc_db")["1k-tq144"]
+            if self.device == "lm4k": return get_db("pinloc_db")["lm4k-cm49"]
+            if self.device == "u4k": return get_db("pinloc_db")["u4k-sg48"]
+            if self.device == "5k": return get_db("pinloc_db")["5k-sg48"]
+            if self.device == "8k": return get_db("pinloc_db")["8k-ct256"]
         else:
-            return pinloc_db[self.device + "-" + package]
+            return get_db("pinloc_db")[self.device + "-" + package]
         assert False
 
     def gbufin_db(self):
@@ -261,6 +357,42 @@ class iceconfig:
     def ieren_db(self):
         return ieren_db[self.device]
 
+    # Indexed forms of the tables above, built once per device:
+    # colbuf_map() maps a tile (x, y) to the tile with its column buffer
+    # control bits, pinloc_map() a package pin to its io block (x, y, b)
+    # and pinloc_rmap() an io block to the list of its pins, ieren_map()
+    # an io block to its IeRen block and ieren_rmap() the reverse.
+    def indexed_table(self, name, build, *args):
+        key = (name, self.device) + args
+        table = indexed_tables.get(key)
+        if table is None:
+            table = indexed_tables.setdefault(key, build(*args))
+        return table
+
+    def colbuf_map(self):
+        return self.indexed_table("colbuf", lambda: dict(((dst_x, dst_y), (src_x, src_y))
+                for src_x, src_y, dst_x, dst_y in self.colbuf_db()))
+
+    def pinloc_map(self, package = None):
+        return self.indexed_table("pinloc", lambda package: dict((pin, (x, y, b))
+                for pin, x, y, b in self.pinloc_db(package)), package)
+
+    def pinloc_rmap(self, package = None):
+        def build(package):
+            rmap = dict()
+            for pin, x, y, b in self.pinloc_db(package):
+                rmap.setdefault((x, y, b), list()).append(pin)
+            return rmap
+        return self.indexed_table("pinloc_r", build, package)
+
+    def ieren_map(self):
+        return self.indexed_table("ieren", lambda: dict(((x0, y0, b0), (x1, y1, b1))
+                for x0, y0, b0, x1, y1, b1 in self.ieren_db()))
+
+    def ieren_rmap(self):
+        return self.indexed_table("ieren_r", lambda: dict(((x1, y1, b1), (x0, y0, b0))
+                for x0, y0, b0, x1, y1, b1 in self.ieren_db()))
+
     def pll_list(self):
         if self.device == "1k":
             return ["1k"]
@@ -419,42 +551,53 @@ class iceconfig:
         return merged
     
     def tile_db(self, x, y):
+        rec = self.tile_record(x, y)
+        if rec is None:
+            return self.lookup_tile_db(x, y)
+        if rec.db is None:
+            rec.db = self.lookup_tile_db(x, y)
+        return rec.db
+
+    def lookup_tile_db(self, x, y):
         # Only these devices have IO on the left and right sides.
         if self.device in ["384", "1k", "lm4k", "8k"]:
-          if x == 0: return iotile_l_db
-          if x == self.max_x: return iotile_r_db
+          if x == 0: return get_db("iotile_l_db")
+          if x == self.max_x: return get_db("iotile_r_db")
         # The 5k needs an IO db including the extra bits
         if self.device == "5k" or self.device == "u4k":
-            if y == 0: return iotile_b_5k_db
-            if y == self.max_y: return iotile_t_5k_db
+            if y == 0: return get_db("iotile_b_5k_db")
+            if y == self.max_y: return get_db("iotile_t_5k_db")
         else:
-            if y == 0: return iotile_b_db
-            if y == self.max_y: return iotile_t_db
+            if y == 0: return get_db("iotile_b_db")
+            if y == self.max_y: return get_db("iotile_t_db")
         if self.device == "1k":
-            if (x, y) in self.logic_tiles: return logictile_db
-            if (x, y) in self.ramb_tiles: return rambtile_db
-            if (x, y) in self.ramt_tiles: return ramttile_db
+            if (x, y) in self.logic_tiles: return get_db("logictile_db")
+            if (x, y) in self.ramb_tiles: return get_db("rambtile_db")
+            if (x, y) in self.ramt_tiles: return get_db("ramttile_db")
         elif self.device == "5k" or self.device == "u4k":
-            if (x, y) in self.logic_tiles: return logictile_5k_db
-            if (x, y) in self.ramb_tiles: return rambtile_8k_db
-            if (x, y) in self.ramt_tiles: return ramttile_8k_db
-            if (x, y) in self.ipcon_tiles: return ipcon_5k_db
-            if (x, y) in self.dsp_tiles[0]: return dsp0_5k_db
-            if (x, y) in self.dsp_tiles[1]: return dsp1_5k_db
-            if (x, y) in self.dsp_tiles[2]: return dsp2_5k_db
-            if (x, y) in self.dsp_tiles[3]: return dsp3_5k_db
+            if (x, y) in self.logic_tiles: return get_db("logictile_5k_db")
+            if (x, y) in self.ramb_tiles: return get_db("rambtile_8k_db")
+            if (x, y) in self.ramt_tiles: return get_db("ramttile_8k_db")
+            if (x, y) in self.ipcon_tiles: return get_db("ipcon_5k_db")
+            if (x, y) in self.dsp_tiles[0]: return get_db("dsp0_5k_db")
+            if (x, y) in self.dsp_tiles[1]: return get_db("dsp1_5k_db")
+            if (x, y) in self.dsp_tiles[2]: return get_db("dsp2_5k_db")
+            if (x, y) in self.dsp_tiles[3]: return get_db("dsp3_5k_db")
 
         elif self.device == "8k" or self.device == "lm4k":
-            if (x, y) in self.logic_tiles: return logictile_8k_db
-            if (x, y) in self.ramb_tiles: return rambtile_8k_db
-            if (x, y) in self.ramt_tiles: return ramttile_8k_db
+            if (x, y) in self.logic_tiles: return get_db("logictile_8k_db")
+            if (x, y) in self.ramb_tiles: return get_db("rambtile_8k_db")
+            if (x, y) in self.ramt_tiles: return get_db("ramttile_8k_db")
         elif self.device == "384":
-            if (x, y) in self.logic_tiles: return logictile_384_db
+            if (x, y) in self.logic_tiles: return get_db("logictile_384_db")
 
         print("Tile type unknown at (%d, %d)" % (x, y))
         assert False
 
     def tile_type(self, x, y):
+        rec = self.tile_record(x, y)
+        if rec is not None:
+            return rec.kind.upper()
         if x == 0 and (not self.is_ultra()): return "IO"
         if y == 0: return "IO"
         if x == self.max_x and (not self.is_ultra()): return "IO"
@@ -478,13 +621,55 @@ class iceconfig:
         if 0 < x < self.max_x and 0 < y < self.max_y: return "x"
         return None
 
+    # Return the entries of the tile's database that match its current
+    # configuration, skipping routing entries for nets the tile lacks.
+    def match_entries(self, x, y):
+        return [entry for entry in match_entries(self.tile(x, y), self.tile_db(x, y)) if self.tile_has_entry(x, y, entry)]
+
     def tile_has_entry(self, x, y, entry):
         if entry[1] in ("routing", "buffer"):
             return self.tile_has_net(x, y, entry[2]) and self.tile_has_net(x, y, entry[3])
         return True
 
-    @functools.lru_cache(maxsize=2**16)
+    # Names that are not interned yet (e.g. names that no database or
+    # wire uses) are not interned here: their masks go to a bounded
+    # cache instead, so arbitrary queries cannot fill the netname table.
     def tile_has_net(self, x, y, netname):
+        nid = self.netname_table().ids.get(netname)
+        if nid is not None:
+            mask = self.tile_has_net_mask(nid)
+        else:
+            masks = tile_has_net_name_masks.get(self.device)
+            if masks is None:
+                masks = tile_has_net_name_masks.setdefault(self.device, bounded_cache(2**12))
+            mask = masks.get(netname)
+            if mask is None:
+                mask = masks[netname] = self.compute_tile_has_net_mask(netname)
+        return (mask >> (7 * coord_class(x, self.max_x) + coord_class(y, self.max_y))) & 1 == 1
+
+    # tile_has_net() for an interned net name. The answer only depends on
+    # the net name and on the position class of x and y (see
+    # coord_class()), so it is looked up in a per-device table of one
+    # 7x7 bit mask per net name, filled in on first use of the name.
+    def tile_has_net_id(self, x, y, nid):
+        return (self.tile_has_net_mask(nid) >> (7 * coord_class(x, self.max_x) + coord_class(y, self.max_y))) & 1 == 1
+
+    def tile_has_net_mask(self, nid):
+        masks = tile_has_net_masks.setdefault(self.device, dict())
+        mask = masks.get(nid)
+        if mask is None:
+            mask = masks[nid] = self.compute_tile_has_net_mask(self.netname_table().names[nid])
+        return mask
+
+    def compute_tile_has_net_mask(self, netname):
+        mask = 0
+        for i, cx in enumerate(class_coords(self.max_x)):
+            for j, cy in enumerate(class_coords(self.max_y)):
+                if self.compute_tile_has_net(cx, cy, netname):
+                    mask |= 1 << (7 * i + j)
+        return mask
+
+    def compute_tile_has_net(self, x, y, netname):
         if netname.startswith("logic_op_"):
             if netname.startswith("logic_op_bot_"):
                 if y == self.max_y and 0 < x < self.max_x: return True
@@ -604,29 +789,28 @@ class iceconfig:
             for net in self.follow_funcnet(x, y, 3) | self.follow_funcnet(x, y, 7):
                 if self.tile_pos(net[0], net[1]) == "x": funcnets.add(net)
 
-        match = re_match_cached(r"lutff_(\d+)/out", netname)
-        if match:
-            funcnets |= self.follow_funcnet(x, y, int(match.group(1)))
+        r = parse_netname(netname)
+        if r.family == "lutff" and r.orient == "out":
+            funcnets |= self.follow_funcnet(x, y, r.index)
 
-        match = re_match_cached(r"ram/RDATA_(\d+)", netname)
-        if match:
+        if r.family == "ram_rdata":
             if self.device == "1k":
-                funcnets |= self.follow_funcnet(x, y, int(match.group(1)) % 8)
+                funcnets |= self.follow_funcnet(x, y, r.index % 8)
             elif self.device == "5k" or self.device == "u4k":
-                funcnets |= self.follow_funcnet(x, y, 7 - int(match.group(1)) % 8)
+                funcnets |= self.follow_funcnet(x, y, 7 - r.index % 8)
             elif self.device == "8k" or self.device == "lm4k":
-                funcnets |= self.follow_funcnet(x, y, 7 - int(match.group(1)) % 8)
+                funcnets |= self.follow_funcnet(x, y, 7 - r.index % 8)
             else:
                 assert False
 
         return funcnets
     
     def ultraplus_follow_corner(self, corner, direction, netname):
-        m = re_match_cached("span4_(horz|vert)_([lrtb])_(\d+)$", netname)
-        if not m:
+        r = parse_netname(netname)
+        if r.family != "span4" or r.side == "":
             return None
-        cur_edge = m.group(2)
-        cur_index = int(m.group(3))
+        cur_edge = r.side
+        cur_index = r.index
         if direction not in corner:
             return None
         if direction != cur_edge:
@@ -686,8 +870,17 @@ class iceconfig:
         return corner
     
     def follow_net(self, netspec):
+        if self.device in routing_graphs:
+            netnames = self.netname_table()
+            neighbours = routing_graphs[self.device].neighbours(netnames.pack(netspec))
+            if neighbours is not None:
+                return set(netnames.unpack(s) for s in neighbours)
+        return self.compute_follow_net(netspec)
+
+    def compute_follow_net(self, netspec):
         x, y, netname = netspec
         neighbours = self.rlookup_funcnet(x, y, netname)
+        r = parse_netname(netname)
 
         #print(netspec)
         #print('\t', neighbours)
@@ -699,35 +892,34 @@ class iceconfig:
             neighbours.add((x, y+1, "carry_in"))
 
         if netname.startswith("glb_netwk_"):
+            # Every tile but the corners (see tile_pos()).
             for nx in range(self.max_x+1):
                 for ny in range(self.max_y+1):
-                    if self.tile_pos(nx, ny) is not None:
-                        neighbours.add((nx, ny, netname))
+                    if (nx == 0 or nx == self.max_x) and (ny == 0 or ny == self.max_y):
+                        continue
+                    neighbours.add((nx, ny, netname))
 
-        match = re_match_cached(r"sp4_r_v_b_(\d+)", netname)
-        if match and ((0 < x < self.max_x-1) or (self.is_ultra() and (x < self.max_x))):
-            neighbours.add((x+1, y, sp4v_normalize("sp4_v_b_" + match.group(1))))
+        if r.family == "sp4_r" and ((0 < x < self.max_x-1) or (self.is_ultra() and (x < self.max_x))):
+            neighbours.add((x+1, y, sp4v_normalize("sp4_v_b_%d" % r.index)))
         #print('\tafter r_v_b', neighbours)
 
-        match = re_match_cached(r"sp4_v_[bt]_(\d+)", netname)
-        if match and (1 < x < self.max_x or (self.is_ultra() and (x > 0))):
+        if r.family == "sp4" and r.orient == "v" and (1 < x < self.max_x or (self.is_ultra() and (x > 0))):
             n = sp4v_normalize(netname, "b")
             if n is not None:
                 n = n.replace("sp4_", "sp4_r_")
                 neighbours.add((x-1, y, n))
         #print('\tafter v_[bt]', neighbours)
 
-        match = re_match_cached(r"(logic|neigh)_op_(...)_(\d+)", netname)
-        if match:
-            if match.group(2) == "bot": nx, ny = (x,   y-1)
-            if match.group(2) == "bnl": nx, ny = (x-1, y-1)
-            if match.group(2) == "bnr": nx, ny = (x+1, y-1)
-            if match.group(2) == "top": nx, ny = (x,   y+1)
-            if match.group(2) == "tnl": nx, ny = (x-1, y+1)
-            if match.group(2) == "tnr": nx, ny = (x+1, y+1)
-            if match.group(2) == "lft": nx, ny = (x-1, y  )
-            if match.group(2) == "rgt": nx, ny = (x+1, y  )
-            n = self.lookup_funcnet(nx, ny, x, y, int(match.group(3)))
+        if r.family in ("logic_op", "neigh_op"):
+            if r.orient == "bot": nx, ny = (x,   y-1)
+            if r.orient == "bnl": nx, ny = (x-1, y-1)
+            if r.orient == "bnr": nx, ny = (x+1, y-1)
+            if r.orient == "top": nx, ny = (x,   y+1)
+            if r.orient == "tnl": nx, ny = (x-1, y+1)
+            if r.orient == "tnr": nx, ny = (x+1, y+1)
+            if r.orient == "lft": nx, ny = (x-1, y  )
+            if r.orient == "rgt": nx, ny = (x+1, y  )
+            n = self.lookup_funcnet(nx, ny, x, y, r.index)
             if n is not None:
                 neighbours.add(n)
 
@@ -744,8 +936,7 @@ class iceconfig:
                         s = self.ultraplus_follow_corner(self.get_corner(s[0], s[1]), direction, n)
                         if s is None:
                             continue
-                    elif re_match_cached("span4_(vert|horz)_[lrtb]_\d+$", n) and not self.is_ultra():
-                        m = re_match_cached("span4_(vert|horz)_([lrtb])_\d+$", n)
+                    elif parse_netname(n).family == "span4" and parse_netname(n).side != "" and not self.is_ultra():
 
                         vert_net = n.replace("_l_", "_t_").replace("_r_", "_b_").replace("_horz_", "_vert_")
                         horz_net = n.replace("_t_", "_l_").replace("_b_", "_r_").replace("_vert_", "_horz_")
@@ -775,129 +966,427 @@ class iceconfig:
         #print('\tafter directions', neighbours)
         return neighbours
 
+    def netname_table(self):
+        return get_netname_table(self.device)
+
     def get_net_number(self, segment):
-        if not hasattr(self, 'net_map') or self.net_map is None:
+        if self.net_map is None:
             self.net_map = {}
-            for netidx, group in enumerate(sorted(self.all_group_segments())):
+            for netidx, group in enumerate(self.sorted_groups(self.all_group_segments())):
                 for seg in group:
                     self.net_map[seg] = netidx
 
         return self.net_map[segment]
 
+    # Return sorted(groups). The groups of all_group_segments() are
+    # disjoint, so they sort by their first segment, and segment_groups
+    # knows the precomputed rank of that segment (see
+    # routing_graph.segment_ranks()): it puts the groups in place in one
+    # pass instead of comparing tuples of strings.
+    def sorted_groups(self, groups):
+        if groups is self.all_groups and self.segment_groups is not None and self.segment_groups.usable:
+            return self.segment_groups.sorted_groups()
+        return sorted(groups)
+
+    # group_segments() over all tiles, without global buffer connections.
+    # Kept up to date by segment_groups, which after tile edits only
+    # decodes the changed tiles and merges or splits the groups they
+    # touch.
+    # Without the routing graph at hand (see grouping_routing_graph()) the
+    # first call is a plain group_segments() call. A config that is
+    # grouped again after an edit builds the graph then, so a loop of
+    # edits and queries does not group the whole device each time.
     def all_group_segments(self):
-        if not hasattr(self, 'all_groups') or self.all_groups is None:
-            all_tiles = set()
-            for x in range(self.max_x + 1):
-                for y in range(self.max_y + 1):
-                    if self.tile(x, y) is not None:
-                        all_tiles.add((x, y))
-
+        if self.all_groups is None and self.segment_groups is None:
+            if self.grouped_without_graph:
+                self.routing_graph()
+            if self.grouping_routing_graph() is not None:
+                self.segment_groups = segment_groups(self)
+        if self.all_groups is None and self.segment_groups is not None:
+            self.all_groups = self.segment_groups.update()
+        if self.all_groups is None:
+            all_tiles = set((rec.x, rec.y) for rec in self.tile_records())
             self.all_groups = self.group_segments(all_tiles, connect_gb=False)
+            self.grouped_without_graph = True
         return self.all_groups
 
-    def group_segments(self, all_from_tiles=set(), extra_connections=list(), extra_segments=list(), connect_gb=True):
-        seed_segments = set()
+    # Return the static routing graph of the device, building it first
+    # if this is the first use in this process (with the given number of
+    # worker processes, see build_routing_graph()).
+    def routing_graph(self, jobs=None):
+        return get_routing_graph(self.device, jobs)
+
+    # The routing graph if it is already built in this process or cached
+    # on disk, else None. Building the graph costs about as much as one
+    # breadth-first grouping of the whole device, so the grouping
+    # functions only use a graph they get for free: a tool that groups
+    # once is no slower than without the graph.
+    def cached_routing_graph(self):
+        return get_routing_graph(self.device, build=False)
+
+    # The routing graph a grouping of the whole device uses: the cached
+    # one, or, when $ICEBOX_JOBS asks for more than one worker process
+    # (see default_jobs()), the graph built in that many processes.
+    def grouping_routing_graph(self):
+        if default_jobs() > 1:
+            return self.routing_graph()
+        return self.cached_routing_graph()
+
+    def group_segments(self, all_from_tiles=set(), extra_connections=list(), extra_segments=list(), connect_gb=True, jobs=None):
+        if jobs is not None:
+            self.routing_graph(jobs)
+        elif len(all_from_tiles) >= len(self.tile_records()):
+            self.grouping_routing_graph()
+
+        seed_segments, connected_segments = self.group_segment_seeds(all_from_tiles, extra_connections, extra_segments, connect_gb)
+
+        grouped_segments = None
+        if self.device in routing_graphs:
+            grouped_segments = self.union_find_groups(seed_segments, connected_segments)
+        if grouped_segments is None or check_group_segments:
+            bfs_grouped_segments = self.bfs_groups(set(seed_segments), connected_segments)
+            if grouped_segments is not None and grouped_segments != bfs_grouped_segments:
+                for group in grouped_segments ^ bfs_grouped_segments:
+                    print("//", "union-find" if group in grouped_segments else "BFS", "only:", group)
+                assert False
+            grouped_segments = bfs_grouped_segments
+        return grouped_segments
+
+    # Group the seed segments by following static wire adjacency
+    # (expand_segment()) and configured connections, one seed at a time.
+    def bfs_groups(self, seed_segments, connected_segments):
         seen_segments = set()
-        connected_segments = dict()
         grouped_segments = set()
+        unpack = self.netname_table().unpack
+
+        while seed_segments:
+            queue = set()
+            segments = set()
+            queue.add(seed_segments.pop())
+            while queue:
+                next_segment = queue.pop()
+                expanded = self.expand_segment(next_segment)
+                for s in expanded:
+                    if s not in segments:
+                        segments.add(s)
+                        if s in seen_segments:
+                          print("//", unpack(s), "has already been seen. Check your bitmapping.")
+                          assert False
+                        seen_segments.add(s)
+                        seed_segments.discard(s)
+                        if s in connected_segments:
+                            for cs in connected_segments[s]:
+                                if not cs in segments:
+                                    queue.add(cs)
+            for s in segments:
+                assert s not in seed_segments
+            grouped_segments.add(tuple(sorted(unpack(s) for s in segments)))
+
+        return grouped_segments
+
+    # Same result as bfs_groups(), but starting from the static components
+    # of the routing graph: only the configured connections are merged,
+    # with a disjoint-set forest over component numbers. Returns None if
+    # a segment is not part of the routing graph.
+    def union_find_groups(self, seed_segments, connected_segments):
+        groups = self.union_find_components(seed_segments, connected_segments)
+        if groups is None:
+            return None
+        graph = routing_graphs[self.device]
+        unpack = self.netname_table().unpack
+        grouped_segments = set()
+        for group in groups[1].values():
+            segments = []
+            for c in group:
+                segments.extend(unpack(s) for s in graph.component_segments(c))
+            grouped_segments.add(tuple(sorted(segments)))
+        return grouped_segments
+
+    # The disjoint-set forest of union_find_groups(): returns a dict from
+    # seed segment to its group and a dict from group to the components
+    # in it, or None.
+    def union_find_components(self, seed_segments, connected_segments):
+        graph = routing_graphs[self.device]
+        components = graph.static_components()
+
+        component = dict()
+        for s in seed_segments:
+            i = graph.index(s)
+            if i is None:
+                return None
+            component[s] = components[i]
+
+        parent = dict((c, c) for c in component.values())
+        def find(c):
+            while parent[c] != c:
+                parent[c] = parent[parent[c]]
+                c = parent[c]
+            return c
+        for s1, targets in connected_segments.items():
+            for s2 in targets:
+                if s1 not in component or s2 not in component:
+                    return None
+                c1, c2 = find(component[s1]), find(component[s2])
+                if c1 != c2:
+                    parent[c1] = c2
+
+        groups = dict()
+        for c in parent:
+            groups.setdefault(find(c), []).append(c)
+        return dict((s, find(c)) for s, c in component.items()), groups
+
+    # Like group_segments(), but yields the groups one at a time instead
+    # of returning the set of all of them. The groups come in the order of
+    # their first seed segment, by tile (x, y) and then net name, which
+    # does not depend on the order of the netname table.
+    def iter_group_segments(self, all_from_tiles=set(), extra_connections=list(), extra_segments=list(), connect_gb=True):
+        if len(all_from_tiles) >= len(self.tile_records()):
+            self.grouping_routing_graph()
+
+        seed_segments, connected_segments = self.group_segment_seeds(all_from_tiles, extra_connections, extra_segments, connect_gb)
+        unpack = self.netname_table().unpack
+        order = sorted(seed_segments, key=lambda s: (s >> 16, unpack(s)[2]))
+
+        groups = None
+        if self.device in routing_graphs:
+            groups = self.union_find_components(seed_segments, connected_segments)
+
+        if groups is not None:
+            graph = routing_graphs[self.device]
+            group_of, members = groups
+            for s in order:
+                group = members.pop(group_of[s], None)
+                if group is not None:
+                    segments = []
+                    for c in group:
+                        segments.extend(unpack(k) for k in graph.component_segments(c))
+                    yield tuple(sorted(segments))
+            return
+
+        seen_segments = set()
+        for s in order:
+            if s in seen_segments:
+                continue
+            queue = [s]
+            segments = set()
+            while queue:
+                for k in self.expand_segment(queue.pop()):
+                    if k not in segments:
+                        segments.add(k)
+                        queue.extend(cs for cs in connected_segments.get(k, ()) if cs not in segments)
+            seen_segments |= segments
+            yield tuple(sorted(unpack(k) for k in segments))
+
+    # Return the packed segments group_segments() starts from and the
+    # configured connections between packed segments.
+    def group_segment_seeds(self, all_from_tiles=set(), extra_connections=list(), extra_segments=list(), connect_gb=True):
+        seed_segments = set()
+        connected_segments = dict()
+        pack = self.netname_table().pack
 
         for seg in extra_segments:
-            seed_segments.add(seg)
+            seed_segments.add(pack(seg))
 
         for conn in extra_connections:
-            s1, s2 = conn
+            s1, s2 = pack(conn[0]), pack(conn[1])
             connected_segments.setdefault(s1, set()).add(s2)
             connected_segments.setdefault(s2, set()).add(s1)
             seed_segments.add(s1)
             seed_segments.add(s2)
 
         for idx, tile in self.io_tiles.items():
-            tc = tileconfig(tile)
             pintypes = [ list("000000"), list("000000") ]
-            for entry in self.tile_db(idx[0], idx[1]):
-                if entry[1].startswith("IOB_") and entry[2].startswith("PINTYPE_") and tc.match(entry[0]):
+            for entry in match_entries(tile, self.tile_db(idx[0], idx[1])):
+                if entry[1].startswith("IOB_") and entry[2].startswith("PINTYPE_"):
                     pintypes[int(entry[1][-1])][int(entry[2][-1])] = "1"
             if "".join(pintypes[0][2:6]) != "0000":
-                seed_segments.add((idx[0], idx[1], "io_0/D_OUT_0"))
+                seed_segments.add(pack((idx[0], idx[1], "io_0/D_OUT_0")))
             if "".join(pintypes[1][2:6]) != "0000":
-                seed_segments.add((idx[0], idx[1], "io_1/D_OUT_0"))
+                seed_segments.add(pack((idx[0], idx[1], "io_1/D_OUT_0")))
+
+        has_net_masks = tile_has_net_masks.setdefault(self.device, dict())
 
         def add_seed_segments(idx, tile, db):
-            tc = tileconfig(tile)
-            for entry in db:
-                if entry[1] in ("routing", "buffer"):
-                    config_match = tc.match(entry[0])
-                    if idx in all_from_tiles or config_match:
-                        if not self.tile_has_net(idx[0], idx[1], entry[2]): continue
-                        if not self.tile_has_net(idx[0], idx[1], entry[3]): continue
-                        s1 = (idx[0], idx[1], entry[2])
-                        s2 = (idx[0], idx[1], entry[3])
-                        if config_match:
-                            connected_segments.setdefault(s1, set()).add(s2)
-                            connected_segments.setdefault(s2, set()).add(s1)
-                        seed_segments.add(s1)
-                        seed_segments.add(s2)
+            tile = as_tilebits(tile)
+            x, y = idx
+            pos_bit = 1 << (7 * coord_class(x, self.max_x) + coord_class(y, self.max_y))
+            from_tile = idx in all_from_tiles
+            entries = compile_routing_db(db, tile.width, self.netname_table())
+            if not from_tile:
+                entries = get_bit_index(entries).matches(tile.bits)
+            for mask, value, n1, n2 in entries:
+                config_match = tile.bits & mask == value
+                if from_tile or config_match:
+                    m1, m2 = has_net_masks.get(n1), has_net_masks.get(n2)
+                    if m1 is None: m1 = self.tile_has_net_mask(n1)
+                    if m2 is None: m2 = self.tile_has_net_mask(n2)
+                    if not m1 & pos_bit: continue
+                    if not m2 & pos_bit: continue
+                    s1 = x << 24 | y << 16 | n1
+                    s2 = x << 24 | y << 16 | n2
+                    if config_match:
+                        connected_segments.setdefault(s1, set()).add(s2)
+                        connected_segments.setdefault(s2, set()).add(s1)
+                    seed_segments.add(s1)
+                    seed_segments.add(s2)
 
-        for idx, tile in self.io_tiles.items():
-            add_seed_segments(idx, tile, self.tile_db(idx[0], idx[1]))
+        for kind, tiles in self.tile_kinds():
+            for idx, tile in tiles.items():
+                if kind == "logic" and idx in all_from_tiles:
+                    seed_segments.add(pack((idx[0], idx[1], "lutff_7/cout")))
+                db = self.routing_tile_db(kind, idx[0], idx[1])
+                if db is not None:
+                    add_seed_segments(idx, tile, db)
 
-        for idx, tile in self.logic_tiles.items():
-            if idx in all_from_tiles:
-                seed_segments.add((idx[0], idx[1], "lutff_7/cout"))
-            if self.device == "1k":
-                add_seed_segments(idx, tile, logictile_db)
-            elif self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, logictile_5k_db)
-            elif self.device == "8k" or self.device == "lm4k":
-                add_seed_segments(idx, tile, logictile_8k_db)
-            elif self.device == "384":
-                add_seed_segments(idx, tile, logictile_384_db)
-            else:
-                assert False
+        def connect(s1, s2):
+            connected_segments.setdefault(s1, set()).add(s2)
+            connected_segments.setdefault(s2, set()).add(s1)
+            seed_segments.add(s1)
+            seed_segments.add(s2)
+        self.add_special_connections(seed_segments.__contains__, connect, all_from_tiles, connect_gb)
 
-        for idx, tile in self.ramb_tiles.items():
-            if self.device == "1k":
-                add_seed_segments(idx, tile, rambtile_db)
-            elif self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, rambtile_8k_db)
-            elif self.device == "8k" or self.device == "lm4k":
-                add_seed_segments(idx, tile, rambtile_8k_db)
-            else:
-                assert False
+        return seed_segments, connected_segments
 
-        for idx, tile in self.ramt_tiles.items():
+    # The tile database group_segments() reads the routing and buffer
+    # entries of a tile of the given kind from, or None.
+    def routing_tile_db(self, kind, x, y):
+        if kind == "io":
+            return self.tile_db(x, y)
+        if kind == "logic":
             if self.device == "1k":
-                add_seed_segments(idx, tile, ramttile_db)
+                return get_db("logictile_db")
             elif self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, ramttile_8k_db)
+                return get_db("logictile_5k_db")
             elif self.device == "8k" or self.device == "lm4k":
-                add_seed_segments(idx, tile, ramttile_8k_db)
-            else:
-                assert False
+                return get_db("logictile_8k_db")
+            elif self.device == "384":
+                return get_db("logictile_384_db")
+            assert False
+        if kind in ("ramb", "ramt"):
+            if self.device == "1k":
+                return get_db(kind + "tile_db")
+            elif self.device in ("5k", "u4k", "8k", "lm4k"):
+                return get_db(kind + "tile_8k_db")
+            assert False
+        if self.device == "5k" or self.device == "u4k":
+            return get_db(kind + "_5k_db")
+        return None
 
-        for idx, tile in self.dsp_tiles[0].items():
-            if self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, dsp0_5k_db)
-        for idx, tile in self.dsp_tiles[1].items():
-            if self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, dsp1_5k_db)
-        for idx, tile in self.dsp_tiles[2].items():
-            if self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, dsp2_5k_db)
-        for idx, tile in self.dsp_tiles[3].items():
-            if self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, dsp3_5k_db)
-        for idx, tile in self.ipcon_tiles.items():
-            if self.device == "5k" or self.device == "u4k":
-                add_seed_segments(idx, tile, ipcon_5k_db)
-        for padin, pio in enumerate(self.padin_pio_db()):
-            s1 = (pio[0], pio[1], "padin_%d" % pio[2])
-            s2 = (pio[0], pio[1], "glb_netwk_%d" % padin)
-            if s1 in seed_segments or (pio[0], pio[1]) in all_from_tiles:
-                connected_segments.setdefault(s1, set()).add(s2)
-                connected_segments.setdefault(s2, set()).add(s1)
-                seed_segments.add(s1)
-                seed_segments.add(s2)
+    # Demand-driven connectivity: trace() and nets_touching() only decode
+    # the tiles a net passes through. tile_connections() returns the
+    # configured connections of one tile as group_segments() sees them,
+    # a dict from packed segment to the set of connected packed segments,
+    # plus the packed segments of the tile that group_segments() always
+    # starts from. Both are kept until the tile bits change.
+    def tile_connections(self, x, y):
+        rec = self.tile_record(x, y)
+        if rec is None:
+            return dict(), set()
+        tile = as_tilebits(rec.data)
+        cached = self.tile_connection_cache.get((x, y))
+        if cached is not None and cached[0] is rec.data and cached[1] == tile.bits:
+            return cached[2], cached[3]
+        connections = dict()
+        seeds = set()
+        for s1, s2 in self.tile_pips(x, y):
+            connections.setdefault(s1, set()).add(s2)
+            connections.setdefault(s2, set()).add(s1)
+        db = self.routing_tile_db(rec.kind, x, y)
+        if rec.kind == "io":
+            pack = self.netname_table().pack
+            pintypes = [ list("000000"), list("000000") ]
+            for entry in match_entries(tile, db):
+                if entry[1].startswith("IOB_") and entry[2].startswith("PINTYPE_"):
+                    pintypes[int(entry[1][-1])][int(entry[2][-1])] = "1"
+            for b in range(2):
+                if "".join(pintypes[b][2:6]) != "0000":
+                    seeds.add(pack((x, y, "io_%d/D_OUT_0" % b)))
+        self.tile_connection_cache[(x, y)] = (rec.data, tile.bits, connections, seeds)
+        return connections, seeds
+
+    # The routing and buffer switches turned on in tile (x, y), as pairs
+    # of packed (source, destination) segments.
+    def tile_pips(self, x, y):
+        rec = self.tile_record(x, y)
+        db = self.routing_tile_db(rec.kind, x, y) if rec is not None else None
+        if db is None:
+            return []
+        tile = as_tilebits(rec.data)
+        pos_bit = 1 << (7 * coord_class(x, self.max_x) + coord_class(y, self.max_y))
+        entries = compile_routing_db(db, tile.width, self.netname_table())
+        return [(x << 24 | y << 16 | n1, x << 24 | y << 16 | n2)
+                for mask, value, n1, n2 in get_bit_index(entries).matches(tile.bits)
+                if self.tile_has_net_mask(n1) & pos_bit and self.tile_has_net_mask(n2) & pos_bit]
+
+    # The packed segments group_segments() starts from for a tile in
+    # all_from_tiles, apart from those of tile_connections().
+    def tile_seed_segments(self, x, y):
+        rec = self.tile_record(x, y)
+        if rec is None:
+            return set()
+        key = (x, y)
+        seeds = self.tile_seed_cache.get(key)
+        if seeds is None:
+            seeds = set()
+            db = self.routing_tile_db(rec.kind, x, y)
+            if db is not None:
+                pos_bit = 1 << (7 * coord_class(x, self.max_x) + coord_class(y, self.max_y))
+                for mask, value, n1, n2 in compile_routing_db(db, as_tilebits(rec.data).width, self.netname_table()):
+                    if self.tile_has_net_mask(n1) & pos_bit and self.tile_has_net_mask(n2) & pos_bit:
+                        seeds.add(x << 24 | y << 16 | n1)
+                        seeds.add(x << 24 | y << 16 | n2)
+            if rec.kind == "logic":
+                seeds.add(self.netname_table().pack((x, y, "lutff_7/cout")))
+            self.tile_seed_cache[key] = seeds
+        return seeds
+
+    # The packed segments of all wires in a tile: its seed segments and
+    # the wires of the tile adjacent to seed segments of the tile and its
+    # neighbours (e.g. neigh_op_* in RAM tiles).
+    def tile_wire_segments(self, x, y):
+        key = (x, y, "wires")
+        wires = self.tile_seed_cache.get(key)
+        if wires is None:
+            wires = set(self.tile_seed_segments(x, y))
+            for nx in range(x - 1, x + 2):
+                for ny in range(y - 1, y + 2):
+                    for s in self.tile_seed_segments(nx, ny):
+                        for k in self.follow_segment(s):
+                            if k >> 16 == x << 8 | y:
+                                wires.add(k)
+            self.tile_seed_cache[key] = wires
+        return wires
+
+    # The padin, io latch and global buffer connections group_segments()
+    # would make for the given all_from_tiles and connect_gb, and the
+    # segments they add to the seeds.
+    def special_connections(self, all_from_tiles=set(), connect_gb=True):
+        connected_segments = dict()
+        added = set()
+        def is_seed(s):
+            x, y = s >> 24, (s >> 16) & 0xff
+            connections, seeds = self.tile_connections(x, y)
+            return s in added or s in connections or s in seeds or \
+                    ((x, y) in all_from_tiles and s in self.tile_seed_segments(x, y))
+        def connect(s1, s2):
+            connected_segments.setdefault(s1, set()).add(s2)
+            connected_segments.setdefault(s2, set()).add(s1)
+            added.add(s1)
+            added.add(s2)
+        self.add_special_connections(is_seed, connect, all_from_tiles, connect_gb)
+        return connected_segments, added
+
+    # Make the padin, io latch and global buffer connections: is_seed(s)
+    # tells whether packed segment s is a seed so far, connect(s1, s2)
+    # records a connection and adds both segments to the seeds.
+    def add_special_connections(self, is_seed, connect, all_from_tiles, connect_gb):
+        pack = self.netname_table().pack
+        padin_pio = self.padin_pio_db()
+        for padin, pio in enumerate(padin_pio):
+            s1 = pack((pio[0], pio[1], "padin_%d" % pio[2]))
+            s2 = pack((pio[0], pio[1], "glb_netwk_%d" % padin))
+            if is_seed(s1) or (pio[0], pio[1]) in all_from_tiles:
+                connect(s1, s2)
 
         for entry in self.iolatch_db():
             if entry[0] == 0 or entry[0] == self.max_x:
@@ -905,66 +1394,199 @@ class iceconfig:
             if entry[1] == 0 or entry[1] == self.max_y:
                 iocells = [(i, entry[1]) for i in range(1, self.max_x)]
             for cell in iocells:
-                s1 = (entry[0], entry[1], "fabout")
-                s2 = (cell[0], cell[1], "io_global/latch")
-                if s1 in seed_segments or s2 in seed_segments or \
+                s1 = pack((entry[0], entry[1], "fabout"))
+                s2 = pack((cell[0], cell[1], "io_global/latch"))
+                if is_seed(s1) or is_seed(s2) or \
                         (entry[0], entry[1]) in all_from_tiles or (cell[0], cell[1]) in all_from_tiles:
-                    connected_segments.setdefault(s1, set()).add(s2)
-                    connected_segments.setdefault(s2, set()).add(s1)
-                    seed_segments.add(s1)
-                    seed_segments.add(s2)
+                    connect(s1, s2)
 
         if connect_gb:
+            # The original grouping tests the tile of the last padin pio
+            # here rather than that of the global buffer; keep it so the
+            # nets stay the same as before.
+            last_pio = padin_pio[-1]
             for entry in self.gbufin_db():
-                s1 = (entry[0], entry[1], "fabout")
-                s2 = (entry[0], entry[1], "glb_netwk_%d" % entry[2])
-                if s1 in seed_segments or (pio[0], pio[1]) in all_from_tiles:
-                    connected_segments.setdefault(s1, set()).add(s2)
-                    connected_segments.setdefault(s2, set()).add(s1)
-                    seed_segments.add(s1)
-                    seed_segments.add(s2)
-
-        while seed_segments:
-            queue = set()
+                s1 = pack((entry[0], entry[1], "fabout"))
+                s2 = pack((entry[0], entry[1], "glb_netwk_%d" % entry[2]))
+                if is_seed(s1) or (last_pio[0], last_pio[1]) in all_from_tiles:
+                    connect(s1, s2)
+
+    # Expand packed segments to their nets, decoding tiles on the way.
+    # Returns a list of sets of packed segments. The static wires
+    # connected to a segment are those of its component in the routing
+    # graph (loaded from the cache or built on first use).
+    def trace_segments(self, seed_segments, special_connections=dict()):
+        graph = self.routing_graph()
+        components = graph.static_components()
+        def expand(segment):
+            i = graph.index(segment)
+            if i is not None:
+                return graph.component_segments(components[i])
+            return self.expand_segment(segment)
+
+        grouped = list()
+        seen = set()
+        decoded = dict()
+        for seed in seed_segments:
+            if seed in seen:
+                continue
             segments = set()
-            queue.add(seed_segments.pop())
+            queue = [seed]
             while queue:
-                next_segment = queue.pop()
-                expanded = self.expand_net(next_segment)
-                for s in expanded:
+                for s in expand(queue.pop()):
                     if s not in segments:
                         segments.add(s)
-                        if s in seen_segments:
-                          print("//", s, "has already been seen. Check your bitmapping.")
-                          assert False
-                        seen_segments.add(s)
-                        seed_segments.discard(s)
-                        if s in connected_segments:
-                            for cs in connected_segments[s]:
-                                if not cs in segments:
-                                    queue.add(cs)
+                        connections = decoded.get(s >> 16)
+                        if connections is None:
+                            connections = self.tile_connections(s >> 24, (s >> 16) & 0xff)[0]
+                            decoded[s >> 16] = connections
+                        for cs in connections.get(s, ()):
+                            if cs not in segments:
+                                queue.append(cs)
+                        for cs in special_connections.get(s, ()):
+                            if cs not in segments:
+                                queue.append(cs)
+            seen |= segments
+            grouped.append(segments)
+        return grouped
+
+    # The net of a segment (x, y, netname), as a sorted tuple of segments
+    # like the groups of group_segments().
+    def trace(self, segment):
+        netnames = self.netname_table()
+        special_connections = self.special_connections()[0]
+        segments, = self.trace_segments([netnames.pack(segment)], special_connections)
+        return tuple(sorted(netnames.unpack(s) for s in segments))
+
+    # The nets with a segment in tile (x, y): the groups of
+    # group_segments(set([(x, y)])) touching the tile, found without
+    # decoding the whole device.
+    def nets_touching(self, x, y):
+        netnames = self.netname_table()
+        self.routing_graph()
+        special_connections, added = self.special_connections(set([(x, y)]))
+        seed_segments = self.tile_seed_segments(x, y) | added
+        def has_seed(segments):
             for s in segments:
-                assert s not in seed_segments
-            grouped_segments.add(tuple(sorted(segments)))
-
+                connections, seeds = self.tile_connections(s >> 24, (s >> 16) & 0xff)
+                if s in seed_segments or s in connections or s in seeds:
+                    return True
+            return False
+        grouped_segments = set()
+        for segments in self.trace_segments(sorted(self.tile_wire_segments(x, y) | added), special_connections):
+            if any(s >> 16 == x << 8 | y for s in segments) and has_seed(segments):
+                grouped_segments.add(tuple(sorted(netnames.unpack(s) for s in segments)))
         return grouped_segments
 
+    # Spatial index of the nets of all_group_segments(): the numbers (see
+    # get_net_number()) of the nets with a segment in each tile.
+    def net_index(self):
+        if self.tile_nets is None:
+            tile_nets = dict()
+            for netidx, group in enumerate(self.sorted_groups(self.all_group_segments())):
+                for x, y, netname in group:
+                    nets = tile_nets.setdefault((x, y), [])
+                    if not nets or nets[-1] != netidx:
+                        nets.append(netidx)
+            self.tile_nets = tile_nets
+        return self.tile_nets
+
+    # The numbers of the nets with a segment in the tiles x0 <= x <= x1,
+    # y0 <= y <= y1, in ascending order.
+    def nets_in_region(self, x0, y0, x1, y1):
+        tile_nets = self.net_index()
+        nets = set()
+        for x in range(max(x0, 0), min(x1, self.max_x) + 1):
+            for y in range(max(y0, 0), min(y1, self.max_y) + 1):
+                nets.update(tile_nets.get((x, y), ()))
+        return sorted(nets)
+
+    # The switches turned on in the tiles x0 <= x <= x1, y0 <= y <= y1,
+    # as (x, y, source, destination).
+    def pips_in_region(self, x0, y0, x1, y1):
+        unpack = self.netname_table().unpack
+        pips = list()
+        for x in range(max(x0, 0), min(x1, self.max_x) + 1):
+            for y in range(max(y0, 0), min(y1, self.max_y) + 1):
+                pips.extend(sorted((x, y, unpack(s1)[2], unpack(s2)[2]) for s1, s2 in self.tile_pips(x, y)))
+        return pips
+
     def expand_net(self, netspec):
-        queue = set()
-        segments = set()
-        queue.add(netspec)
+        netnames = self.netname_table()
+        return set(netnames.unpack(s) for s in self.expand_segment(netnames.pack(netspec)))
+
+    # Like follow_net() and expand_net(), but on packed segments.
+    def follow_segment(self, segment):
+        if self.device in routing_graphs:
+            neighbours = routing_graphs[self.device].neighbours(segment)
+            if neighbours is not None:
+                return neighbours
+        return self.compute_follow_segment(segment)
+
+    # Like follow_segment() for a list of packed segments: the packed
+    # neighbours of segments[i] are neighbours[offsets[i]:offsets[i+1]].
+    # With the routing graph at hand (and use_graph true) the rows are
+    # copied from it: the segments are looked up from the last position
+    # on when they come in ascending order, and a row shared by several
+    # segments (see routing_graph) is translated into segments only
+    # once. Other segments are followed once each.
+    def follow_net_many(self, segments, use_graph=True):
+        graph = routing_graphs.get(self.device) if use_graph else None
+        offsets = array("I", [0])
+        neighbours = array("I")
+        if graph is None:
+            for segment in segments:
+                neighbours.extend(self.compute_follow_segment(segment))
+                offsets.append(len(neighbours))
+            return offsets, neighbours
+
+        graph_segments, graph_offsets, targets = graph.segments, graph.offsets, graph.targets
+        rows = dict()
+        lo, last = 0, -1
+        for segment in segments:
+            if segment < last:
+                lo = 0
+            i = bisect.bisect_left(graph_segments, segment, lo)
+            lo, last = i, segment
+            if i < len(graph_segments) and graph_segments[i] == segment:
+                start, end = graph_offsets[2*i], graph_offsets[2*i+1]
+                row = rows.get((start, end))
+                if row is None:
+                    row = rows[(start, end)] = array("I", map(graph_segments.__getitem__, targets[start:end]))
+                neighbours.extend(row)
+            else:
+                neighbours.extend(self.compute_follow_segment(segment))
+            offsets.append(len(neighbours))
+        return offsets, neighbours
+
+    def compute_follow_segment(self, segment):
+        netnames = self.netname_table()
+        ids, intern = netnames.ids, netnames.intern
+        neighbours = []
+        for x, y, netname in self.compute_follow_net(netnames.unpack(segment)):
+            nid = ids.get(netname)
+            if nid is None:
+                nid = intern(netname)
+            neighbours.append(x << 24 | y << 16 | nid)
+        return neighbours
+
+    def expand_segment(self, segment):
+        queue = [segment]
+        segments = set(queue)
         while queue:
-            n = queue.pop()
-            segments.add(n)
-            for k in self.follow_net(n):
+            for k in self.follow_segment(queue.pop()):
                 if k not in segments:
-                    queue.add(k)
+                    segments.add(k)
+                    queue.append(k)
         return segments
 
     def read_file(self, filename):
         self.clear()
         current_data = None
         expected_data_lines = 0
+        # Identical data lines (and identical tile contents, see below)
+        # share one object: most lines of a sparse design are all zeros.
+        contents = dict()
         with open(filename, "r") as f:
             for linenum, linetext in enumerate(f):
                 # print("DEBUG: input line %d: %s" % (linenum, linetext.strip()))
@@ -980,7 +1602,7 @@ class iceconfig:
                         expected_data_lines = 0
                         continue
                     assert expected_data_lines != 0
-                    current_data.append(line[0])
+                    current_data.append(contents.setdefault(line[0], line[0]))
                     expected_data_lines -= 1
                     continue
                 assert expected_data_lines <= 0
@@ -1031,6 +1653,13 @@ class iceconfig:
                 print("Warning: ignoring line %d: %s" % (linenum, linetext.strip()))
                 expected_data_lines = -1
 
+        for kind, tiles in self.tile_kinds():
+            for idx, rows in tiles.items():
+                tile = tilebits(rows)
+                tile.bits = contents.setdefault(tile.bits, tile.bits)
+                tiles[idx] = tile
+        self.build_tile_grid()
+
     def write_file(self, filename):
         with open(filename, "w") as f:
             print(".device %s" % self.device, file=f)
@@ -1051,20 +1680,1117 @@ class iceconfig:
             for net in sorted(self.symbols.keys()):
                 for sym_key in self.symbols[net]:
                     print(".sym %s %s" % (net, sym_key), file=f)
+
+    # Tile edits through set_tile_bits(), set_bit() and set_row() record
+    # the tile in dirty_tiles, append (x, y, old bits) to the journal
+    # for undo() and drop the connectivity derived from the tile bits
+    # (all_groups, net_map). Writes to a tile object bypass all this.
+    # A tile stored as a list of row strings is replaced by a tilebits
+    # object with the same rows on its first edit (see edit_tile()).
+    #
+    # Between begin_batch() and end_batch() (or in a "with ic.batch():"
+    # block) the connectivity is dropped only once, when the outermost
+    # batch ends, so queries inside a batch see the connectivity as it
+    # was when first computed. With journal=False the edits of the batch
+    # are not journaled and cannot be undone.
+    def set_tile_bits(self, x, y, bits):
+        tile = self.edit_tile(x, y)
+        if tile.bits == bits:
+            return
+        if all(self.batches):
+            self.journal.append((x, y, tile.bits))
+        tile.bits = bits
+        self.dirty_tiles.add((x, y))
+        if self.batches:
+            self.batch_edited = True
+        else:
+            self.invalidate_connectivity()
+
+    # The tile at (x, y) as a tilebits object, converting a tile stored
+    # in another form in place. The contents stay the same, so this does
+    # not count as an edit.
+    def edit_tile(self, x, y):
+        rec = self.tile_record(x, y)
+        assert rec is not None, "no tile at (%d, %d)" % (x, y)
+        if not isinstance(rec.data, tilebits):
+            tile = as_tilebits(rec.data)
+            dict.__setitem__(dict(self.tile_kinds())[rec.kind], (x, y), tile)
+            rec.data = tile
+        return rec.data
+
+    def begin_batch(self, journal=True):
+        self.batches.append(journal)
+
+    def end_batch(self):
+        assert self.batches
+        self.batches.pop()
+        if not self.batches and self.batch_edited:
+            self.batch_edited = False
+            self.invalidate_connectivity()
+
+    @contextlib.contextmanager
+    def batch(self, journal=True):
+        self.begin_batch(journal)
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def set_bit(self, x, y, row, col, value=True):
+        tile = self.edit_tile(x, y)
+        assert 0 <= row < tile.height and 0 <= col < tile.width
+        mask = 1 << (row * tile.width + col)
+        self.set_tile_bits(x, y, tile.bits | mask if value else tile.bits & ~mask)
+
+    def set_row(self, x, y, row, line):
+        tile = self.edit_tile(x, y)
+        if row < 0:
+            row += tile.height
+        assert 0 <= row < tile.height and len(line) == tile.width
+        shift = row * tile.width
+        mask = ((1 << tile.width) - 1) << shift
+        self.set_tile_bits(x, y, tile.bits & ~mask | int(line[::-1], 2) << shift)
+
+    # Undo the edits recorded after the journal had the given length
+    # (as returned by len(ic.journal)), or only the last edit. Edits of
+    # tiles removed from the tile dicts since are dropped.
+    def undo(self, mark=None):
+        if mark is None:
+            mark = len(self.journal) - 1
+        assert 0 <= mark <= len(self.journal)
+        while len(self.journal) > mark:
+            x, y, bits = self.journal.pop()
+            if self.tile(x, y) is None:
+                continue
+            self.edit_tile(x, y).bits = bits
+            self.dirty_tiles.add((x, y))
+        if self.batches:
+            self.batch_edited = True
+        else:
+            self.invalidate_connectivity()
+
+    def invalidate_connectivity(self):
+        self.all_groups = None
+        self.net_map = None
+        self.tile_nets = None
+
+    # Snapshots and clones. Tile contents are immutable integers (see
+    # tilebits), so these only allocate a small handle per tile and share
+    # the contents, which are never modified in place. snapshot() copies
+    # the handles once, restore() reuses the handles of the tiles this
+    # config already has and copies only the missing ones, so the
+    # snapshot can be restored again. restore() also takes another
+    # iceconfig, which is how clone() copies each tile only once.
+    def snapshot(self):
+        return configsnapshot(self)
+
+    def restore(self, snapshot):
+        if (self.device, self.max_x, self.max_y) != (snapshot.device, snapshot.max_x, snapshot.max_y):
+            self.tile_grid = None
+        self.device = snapshot.device
+        self.max_x = snapshot.max_x
+        self.max_y = snapshot.max_y
+        self.warmboot = snapshot.warmboot
+        saved_kinds = dict(snapshot.tile_kinds())
+        for kind, tiles in self.tile_kinds():
+            saved = saved_kinds[kind]
+            for idx in [idx for idx in tiles if idx not in saved]:
+                del tiles[idx]
+                self.dirty_tiles.add(idx)
+            for idx, tile in saved.items():
+                current = tiles.get(idx)
+                if not isinstance(tile, tilebits):
+                    tiles[idx] = tilebits(tile)
+                    self.dirty_tiles.add(idx)
+                elif isinstance(current, tilebits) and current.width == tile.width and current.height == tile.height:
+                    # keep the handle, it may be referenced by the tile grid
+                    if current.bits != tile.bits:
+                        current.bits = tile.bits
+                        self.dirty_tiles.add(idx)
+                else:
+                    tiles[idx] = tile.copy()
+                    self.dirty_tiles.add(idx)
+        self.ram_data = {idx: list(data) for idx, data in snapshot.ram_data.items()}
+        self.extra_bits = set(snapshot.extra_bits)
+        self.symbols = {net: set(keys) for net, keys in snapshot.symbols.items()}
+        self.journal = list()
+        self.invalidate_connectivity()
+
+    def clone(self):
+        ic = iceconfig()
+        ic.restore(self)
+        ic.dirty_tiles = set(self.dirty_tiles)
+        return ic
+
+# Configuration bits of a single tile, packed into one integer. Bit
+# B<row>[<col>] is stored at position row*width+col. For compatibility
+# a tilebits object also behaves like the list of '0'/'1' row strings
+# that icebox used to store per tile: tile[row] returns the row as a
+# string, tile[row] = "0101..." replaces a row, and iterating yields
+# the rows in order. These writes change only the tile: only the edit
+# methods of iceconfig (set_tile_bits(), set_bit(), set_row()) record
+# dirty tiles and keep the connectivity derived from the tiles current.
+#
+# The integer holding the bits is immutable and every write replaces
+# it, so tiles with identical contents can share one integer (read_file
+# interns them) and a modified tile never affects the others.
+class tilebits:
+    __slots__ = ("width", "height", "bits")
+
+    def __init__(self, rows=(), width=None):
+        rows = list(rows)
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else (width or 0)
+        for row in rows:
+            assert len(row) == self.width
+        # Reversing the concatenated rows puts B0[0] in the LSB.
+        self.bits = int("".join(rows)[::-1], 2) if rows else 0
+
+    @classmethod
+    def zeros(cls, width, height=16):
+        tile = cls.__new__(cls)
+        tile.width = width
+        tile.height = height
+        tile.bits = 0
+        return tile
+
+    def copy(self):
+        tile = tilebits.__new__(tilebits)
+        tile.width = self.width
+        tile.height = self.height
+        tile.bits = self.bits
+        return tile
+
+    def get_bit(self, row, col):
+        assert 0 <= row < self.height and 0 <= col < self.width
+        return (self.bits >> (row * self.width + col)) & 1 == 1
+
+    def set_bit(self, row, col, value=True):
+        assert 0 <= row < self.height and 0 <= col < self.width
+        mask = 1 << (row * self.width + col)
+        if value:
+            self.bits |= mask
+        else:
+            self.bits &= ~mask
+
+    def row_bits(self, row):
+        assert 0 <= row < self.height
+        return (self.bits >> (row * self.width)) & ((1 << self.width) - 1)
+
+    def set_row_bits(self, row, value):
+        assert 0 <= row < self.height and 0 <= value < (1 << self.width)
+        shift = row * self.width
+        self.bits = (self.bits & ~(((1 << self.width) - 1) << shift)) | (value << shift)
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[k] for k in range(*row.indices(self.height))]
+        if row < 0:
+            row += self.height
+        return format(self.row_bits(row), "0%db" % self.width)[::-1]
+
+    def __setitem__(self, row, line):
+        if row < 0:
+            row += self.height
+        assert len(line) == self.width
+        self.set_row_bits(row, int(line[::-1], 2))
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self[row]
+
+    def __eq__(self, other):
+        if isinstance(other, tilebits):
+            return self.width == other.width and self.height == other.height and self.bits == other.bits
+        return list(self) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "tilebits(%r)" % list(self)
+
+def as_tilebits(tile):
+    if isinstance(tile, tilebits):
+        return tile
+    return tilebits(tile)
+
+# A dict for the module-level caches below that are keyed by object
+# identity or by arbitrary strings: it empties itself when it would grow
+# beyond maxsize entries (as the caches of the re module do), so a long
+# session that keeps passing new databases or net names does not keep
+# them all alive. Readers must not expect an entry to stay: they take
+# the value they stored or found into a local.
+class bounded_cache(dict):
+    __slots__ = ("maxsize",)
+
+    def __init__(self, maxsize):
+        dict.__init__(self)
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        if len(self) >= self.maxsize and key not in self:
+            self.clear()
+        dict.__setitem__(self, key, value)
+
+# Compile a config bit pattern such as ["B1[2]", "!B3[4]"] into a
+# (mask, value) pair for a tile of the given width: a tile matches the
+# pattern iff tile.bits & mask == value.
+compiled_patterns = bounded_cache(2**16)
+
+def compile_pattern(pattern, width):
+    key = (tuple(pattern), width)
+    compiled = compiled_patterns.get(key)
+    if compiled is None:
+        mask, value = 0, 0
+        for bit in pattern:
+            match = re_match_cached(r"(!?)B(\d+)\[(\d+)\]$", bit)
+            assert match
+            pos = 1 << (int(match.group(2)) * width + int(match.group(3)))
+            mask |= pos
+            if not match.group(1):
+                value |= pos
+        compiled = compiled_patterns[key] = (mask, value)
+    return compiled
+
+# Tile databases compiled for a given tile width: a list of
+# (mask, value, entry) triples in database order.
+compiled_dbs = bounded_cache(256)
+
+def compile_db(db, width):
+    key = (id(db), width)
+    compiled = compiled_dbs.get(key)
+    if compiled is None or compiled[0] is not db or len(compiled[1]) != len(db):
+        compiled = compiled_dbs[key] = (db, [compile_pattern(entry[0], width) + (entry,) for entry in db])
+    return compiled[1]
+
+# The routing and buffer entries of a compiled tile database, as
+# (mask, value, src, dst) with the two net names interned in netnames.
+compiled_routing_dbs = bounded_cache(256)
+
+def compile_routing_db(db, width, netnames):
+    key = (id(db), width, id(netnames))
+    compiled = compiled_routing_dbs.get(key)
+    if compiled is None or compiled[0] is not db or compiled[1] is not netnames or compiled[2] != len(db):
+        entries = [(mask, value, netnames.intern(entry[2]), netnames.intern(entry[3]))
+                   for mask, value, entry in compile_db(db, width) if entry[1] in ("routing", "buffer")]
+        compiled = compiled_routing_dbs[key] = (db, netnames, len(db), entries)
+    return compiled[3]
+
+# Inverted index over a compiled entry list (tuples starting with mask
+# and value): each entry is filed under the lowest bit it requires to be
+# set, so only the entries reachable from the set bits of a tile need
+# to be tested.  Entries requiring no set bit at all are always tested.
+class bit_index:
+    __slots__ = ("entries", "by_bit", "negatives")
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.by_bit = dict()
+        self.negatives = list()
+        for i, entry in enumerate(entries):
+            value = entry[1]
+            if value:
+                self.by_bit.setdefault(value & -value, list()).append(i)
+            else:
+                self.negatives.append(i)
+
+    # Indices of the matching entries, in list order.
+    def match_indices(self, bits):
+        entries, by_bit = self.entries, self.by_bit
+        indices = [i for i in self.negatives if bits & entries[i][0] == entries[i][1]]
+        rest = bits
+        while rest:
+            low = rest & -rest
+            for i in by_bit.get(low, ()):
+                if bits & entries[i][0] == entries[i][1]:
+                    indices.append(i)
+            rest ^= low
+        indices.sort()
+        return indices
+
+    def matches(self, bits):
+        entries = self.entries
+        return [entries[i] for i in self.match_indices(bits)]
+
+bit_indexes = bounded_cache(512)
+
+def get_bit_index(entries):
+    key = id(entries)
+    index = bit_indexes.get(key)
+    if index is None or index.entries is not entries:
+        index = bit_indexes[key] = bit_index(entries)
+    return index
+
+# Return the entries of db whose config bit patterns match the tile.
+def match_entries(tile, db):
+    tile = as_tilebits(tile)
+    return [entry for mask, value, entry in get_bit_index(compile_db(db, tile.width)).matches(tile.bits)]
+
+# Batched counterparts of match_entries() etc. for a bool array of tiles
+# shaped (tiles, rows, cols) as returned by iceconfig.as_array().
+
+# The bits each entry of db requires to be set and to be clear, as two
+# bool arrays shaped (entries, rows*cols).
+def db_arrays(db, width, height=16):
+    import numpy
+    nbits = width * height
+    nbytes = (nbits + 7) // 8
+    def unpack(masks):
+        buf = b"".join(mask.to_bytes(nbytes, "little") for mask in masks)
+        packed_masks = numpy.frombuffer(buf, dtype=numpy.uint8).reshape(len(masks), nbytes)
+        return numpy.unpackbits(packed_masks, axis=1, count=nbits, bitorder="little").astype(bool)
+    compiled = compile_db(db, width)
+    return unpack([value for mask, value, entry in compiled]), \
+           unpack([mask & ~value for mask, value, entry in compiled])
+
+# A bool array shaped (tiles, entries): entry k of db matches tile i.
+def match_array(tiles, db):
+    import numpy
+    count, height, width = tiles.shape
+    required, forbidden = db_arrays(db, width, height)
+    # Bit counts are exact in float32 and its matrix product is fast.
+    flat = tiles.reshape(count, height * width).astype(numpy.float32)
+    hits = flat @ required.T.astype(numpy.float32)
+    misses = flat @ forbidden.T.astype(numpy.float32)
+    return (hits == required.sum(axis=1)) & (misses == 0)
+
+# The number of set bits of each tile.
+def count_bits_array(tiles):
+    return tiles.reshape(tiles.shape[0], -1).sum(axis=1)
+
+# A bool array shaped like tiles: the bits required to be set by some
+# entry of db that matches the tile, i.e. the bits explained by db.
+def usage_array(tiles, db):
+    import numpy
+    count, height, width = tiles.shape
+    required, forbidden = db_arrays(db, width, height)
+    used = match_array(tiles, db).astype(numpy.float32) @ required.astype(numpy.float32)
+    return (used > 0).reshape(count, height, width)
+
 class tileconfig:
     def __init__(self, tile):
-        self.bits = set()
-        for k, line in enumerate(tile):
-            for i in range(len(line)):
-                if line[i] == "1":
-                    self.bits.add("B%d[%d]" % (k, i))
-                else:
-                    self.bits.add("!B%d[%d]" % (k, i))
+        self.tile = as_tilebits(tile)
     def match(self, pattern):
-        for bit in pattern:
-            if not bit in self.bits:
-                return False
-        return True
+        mask, value = compile_pattern(pattern, self.tile.width)
+        return self.tile.bits & mask == value
+
+# Per-kind tile dict of an iceconfig: any change to the set of tiles
+# drops the iceconfig's tile grid so it is rebuilt on next use, and the
+# connectivity derived from the tiles. The iceconfig is held through a
+# weak reference, and a pickled tiledict is a plain dict of tiles: the
+# owner is attached again by iceconfig.__setstate__().
+class tiledict(dict):
+    __slots__ = ("owner",)
+
+    def __init__(self, *args, ic=None, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.owner = weakref.ref(ic) if ic is not None else None
+
+    def __reduce__(self):
+        return (tiledict, (), None, None, iter(dict.items(self)))
+
+    def invalidate(self):
+        ic = self.owner() if self.owner is not None else None
+        if ic is None:
+            return
+        ic.tile_grid = None
+        ic.tile_seed_cache = dict()
+        ic.invalidate_connectivity()
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.invalidate()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.invalidate()
+
+    def clear(self):
+        dict.clear(self)
+        self.invalidate()
+
+    def pop(self, *args):
+        self.invalidate()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self.invalidate()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.invalidate()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.invalidate()
+
+# One cell of the iceconfig tile grid: the tile kind ("io", "logic",
+# "ramb", "ramt", "dsp0".."dsp3" or "ipcon"), its position, its config
+# bits, its tile_pos() and (filled in on first use) its tile database.
+class tilerecord:
+    __slots__ = ("kind", "x", "y", "data", "pos", "db")
+
+    def __init__(self, kind, x, y, data, pos):
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.data = data
+        self.pos = pos
+        self.db = None
+
+# The state of an iceconfig as returned by iceconfig.snapshot(), for
+# iceconfig.restore() and iceconfig.clone().
+class configsnapshot:
+    __slots__ = ("device", "max_x", "max_y", "warmboot", "tiles", "ram_data", "extra_bits", "symbols")
+
+    def __init__(self, ic):
+        self.device = ic.device
+        self.max_x = ic.max_x
+        self.max_y = ic.max_y
+        self.warmboot = ic.warmboot
+        self.tiles = {kind: {idx: as_tilebits(tile).copy() for idx, tile in tiles.items()}
+                      for kind, tiles in ic.tile_kinds()}
+        self.ram_data = {idx: tuple(data) for idx, data in ic.ram_data.items()}
+        self.extra_bits = frozenset(ic.extra_bits)
+        self.symbols = {net: frozenset(keys) for net, keys in ic.symbols.items()}
+
+    def tile_kinds(self):
+        return list(self.tiles.items())
+
+# Per-device table of interned net names. Inside the connectivity engine
+# a segment (x, y, netname) is packed into one int, x << 24 | y << 16 |
+# id, where id is the index of netname in the table. Names are never
+# dropped: a table holds the names of the device's databases and wires,
+# plus any other name a caller passes in a segment to pack(), e.g. to
+# trace() or as an extra segment of group_segments().
+class netname_table:
+    __slots__ = ("names", "ids", "lock")
+
+    def __init__(self):
+        self.names = []
+        self.ids = dict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, netname):
+        nid = self.ids.get(netname)
+        if nid is None:
+            with self.lock:
+                nid = self.ids.get(netname)
+                if nid is None:
+                    nid = len(self.names)
+                    assert nid < 1 << 16
+                    self.names.append(netname)
+                    self.ids[netname] = nid
+        return nid
+
+    def pack(self, segment):
+        x, y, netname = segment
+        assert 0 <= x < 256 and 0 <= y < 256
+        return x << 24 | y << 16 | self.intern(netname)
+
+    def unpack(self, segment):
+        return (segment >> 24, (segment >> 16) & 0xff, self.names[segment & 0xffff])
+
+netname_tables = dict()
+
+def get_netname_table(device):
+    table = netname_tables.get(device)
+    if table is None:
+        table = netname_tables.setdefault(device, netname_table())
+    return table
+
+# Static wire adjacency of a device: follow_net() for every segment of
+# an unconfigured device, in compressed sparse row form. segments holds
+# the packed segments in ascending order, and the neighbours of
+# segments[i] are segments[k] for k in
+# targets[offsets[2*i]:offsets[2*i+1]]. Segments with the same
+# neighbours (e.g. all segments of one global network) share one row.
+class routing_graph:
+    __slots__ = ("device", "segments", "offsets", "targets", "components", "component_offsets", "component_members", "ranks", "first_ranks")
+
+    def __init__(self, device, segments, offsets, targets):
+        self.device = device
+        self.segments = segments
+        self.offsets = offsets
+        self.targets = targets
+        self.components = None
+        self.component_offsets = None
+        self.component_members = None
+        self.ranks = None
+        self.first_ranks = None
+
+    def __len__(self):
+        return len(self.segments)
+
+    def index(self, segment):
+        i = bisect.bisect_left(self.segments, segment)
+        if i < len(self.segments) and self.segments[i] == segment:
+            return i
+        return None
+
+    # Return the packed neighbours of a packed segment, or None if the
+    # segment is not a wire of the device.
+    def neighbours(self, segment):
+        i = self.index(segment)
+        if i is None:
+            return None
+        segments = self.segments
+        return [segments[k] for k in self.targets[self.offsets[2*i]:self.offsets[2*i+1]]]
+
+    # Number the connected components of the graph, i.e. the nets of an
+    # unconfigured device. components[i] is the component of segments[i]
+    # and the members of component c are the segment indices
+    # component_members[component_offsets[c]:component_offsets[c+1]].
+    def static_components(self):
+        if self.components is not None:
+            return self.components
+        parent = list(range(len(self.segments)))
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        seen_rows = set()
+        offsets, targets = self.offsets, self.targets
+        for i in range(len(self.segments)):
+            start, end = offsets[2*i], offsets[2*i+1]
+            if start == end:
+                continue
+            # All targets of a row are neighbours of segment i, so a
+            # shared row only needs to be merged once.
+            if start not in seen_rows:
+                seen_rows.add(start)
+                root = find(targets[start])
+                for k in targets[start+1:end]:
+                    r = find(k)
+                    if r != root:
+                        parent[r] = root
+            r1, r2 = find(i), find(targets[start])
+            if r1 != r2:
+                parent[r1] = r2
+
+        numbers = dict()
+        components = array("I")
+        for i in range(len(self.segments)):
+            components.append(numbers.setdefault(find(i), len(numbers)))
+        members = [[] for c in range(len(numbers))]
+        for i, c in enumerate(components):
+            members[c].append(i)
+        component_offsets = array("I", [0])
+        component_members = array("I")
+        for m in members:
+            component_members.extend(m)
+            component_offsets.append(len(component_members))
+        # Publish complete arrays only, components last: another thread
+        # may be reading them.
+        self.component_offsets = component_offsets
+        self.component_members = component_members
+        self.components = components
+        return components
+
+    # ranks[i] is the position of segments[i] among all segments of the
+    # device sorted by (x, y, net name), i.e. by their unpacked form.
+    def segment_ranks(self):
+        if self.ranks is None:
+            unpack = get_netname_table(self.device).unpack
+            segments = self.segments
+            order = sorted(range(len(segments)), key=lambda i: unpack(segments[i]))
+            ranks = array("I", bytes(4 * len(order)))
+            for rank, i in enumerate(order):
+                ranks[i] = rank
+            self.ranks = ranks
+        return self.ranks
+
+    # The rank of the first segment of each static component.
+    def component_ranks(self):
+        if self.first_ranks is None:
+            ranks = self.segment_ranks()
+            components = self.static_components()
+            first_ranks = array("I", [len(ranks)]) * (max(components) + 1 if components else 0)
+            for i, c in enumerate(components):
+                if ranks[i] < first_ranks[c]:
+                    first_ranks[c] = ranks[i]
+            self.first_ranks = first_ranks
+        return self.first_ranks
+
+    def component_segments(self, c):
+        segments = self.segments
+        return [segments[k] for k in self.component_members[self.component_offsets[c]:self.component_offsets[c+1]]]
+
+# The groups of iceconfig.all_group_segments(): the static components of
+# the routing graph, merged by the configured connections of each tile
+# (and the padin and io latch connections). update() decodes the tiles
+# whose bits changed since the last update, and only re-partitions the
+# groups that lost a connection. It returns None if the configuration
+# uses segments that are not in the routing graph. The iceconfig owns
+# its segment_groups, which only holds a weak reference back.
+class segment_groups:
+    def __init__(self, ic):
+        self.ic = weakref.ref(ic)
+        self.graph = ic.routing_graph()
+        self.components = self.graph.static_components()
+        self.tiles = None
+        self.usable = True
+        self.tile_state = dict()
+        self.edges = dict()
+        self.seeded = dict()
+        self.group_of = dict()
+        self.members = dict()
+        self.tuples = dict()
+        self.singletons = dict()
+        self.ranked = list()
+        self.next_group = 0
+
+    def component(self, segment):
+        i = self.graph.index(segment)
+        if i is None:
+            raise KeyError(segment)
+        return self.components[i]
+
+    def connection_edges(self, connections):
+        edges = list()
+        for s1, targets in connections.items():
+            c1 = self.component(s1)
+            for s2 in targets:
+                c2 = self.component(s2)
+                if c1 < c2:
+                    edges.append((c1, c2))
+        return edges
+
+    def count(self, counts, key, delta):
+        n = counts.get(key, 0) + delta
+        if n:
+            counts[key] = n
+        else:
+            del counts[key]
+
+    def group(self, c):
+        g = self.group_of.get(c)
+        if g is None:
+            g = self.new_group(set([c]))
+        return g
+
+    def new_group(self, components):
+        g = self.next_group
+        self.next_group += 1
+        self.members[g] = components
+        for c in components:
+            self.group_of[c] = g
+        return g
+
+    def add_edge(self, c1, c2):
+        self.count(self.edges.setdefault(c1, dict()), c2, 1)
+        self.count(self.edges.setdefault(c2, dict()), c1, 1)
+        g1, g2 = self.group(c1), self.group(c2)
+        if g1 == g2:
+            return
+        if len(self.members[g1]) < len(self.members[g2]):
+            g1, g2 = g2, g1
+        self.tuples.pop(g1, None)
+        self.tuples.pop(g2, None)
+        for c in self.members.pop(g2):
+            self.group_of[c] = g1
+            self.members[g1].add(c)
+
+    # Remove an edge, returning the group that may have fallen apart.
+    def remove_edge(self, c1, c2):
+        self.count(self.edges[c1], c2, -1)
+        self.count(self.edges[c2], c1, -1)
+        if c2 not in self.edges[c1]:
+            return self.group_of[c1]
+        return None
+
+    # Split group g into the parts connected by the current edges.
+    # Components without edges are left out: they are their own group.
+    def partition(self, g):
+        self.tuples.pop(g, None)
+        remaining = self.members.pop(g)
+        for c in remaining:
+            del self.group_of[c]
+        while remaining:
+            c = remaining.pop()
+            part = set([c])
+            queue = [c]
+            while queue:
+                for k in self.edges.get(queue.pop(), ()):
+                    if k not in part:
+                        part.add(k)
+                        queue.append(k)
+            remaining -= part
+            if len(part) > 1:
+                self.new_group(part)
+
+    def update(self):
+        if not self.usable:
+            return None
+        ic = self.ic()
+        records = ic.tile_records()
+        tiles = set((rec.x, rec.y) for rec in records)
+        if self.tiles is not None and self.tiles != tiles:
+            ic.segment_groups = segment_groups(ic)
+            return ic.segment_groups.update()
+
+        try:
+            added = list()
+            if self.tiles is None:
+                self.tiles = tiles
+                connections, special_segments = ic.special_connections(tiles, connect_gb=False)
+                added.extend(self.connection_edges(connections))
+                for s in special_segments:
+                    self.count(self.seeded, self.component(s), 1)
+                for x, y in tiles:
+                    for s in ic.tile_seed_segments(x, y):
+                        self.count(self.seeded, self.component(s), 1)
+
+            # Remove the connections of the changed tiles and split the
+            # groups that lost one, then add the new connections.
+            split = set()
+            for rec in records:
+                bits = as_tilebits(rec.data).bits
+                state = self.tile_state.get((rec.x, rec.y))
+                if state is not None and state[0] is rec.data and state[1] == bits:
+                    continue
+                connections, seeds = ic.tile_connections(rec.x, rec.y)
+                edges = self.connection_edges(connections)
+                seeded = [self.component(s) for s in seeds]
+                if state is not None:
+                    for c1, c2 in state[2]:
+                        split.add(self.remove_edge(c1, c2))
+                    for c in state[3]:
+                        self.count(self.seeded, c, -1)
+                for c in seeded:
+                    self.count(self.seeded, c, 1)
+                added.extend(edges)
+                self.tile_state[(rec.x, rec.y)] = (rec.data, bits, edges, seeded)
+            split.discard(None)
+            for g in split:
+                self.partition(g)
+            for c1, c2 in added:
+                self.add_edge(c1, c2)
+        except KeyError:
+            # The groups are half updated: group_segments() has to do.
+            self.usable = False
+            return None
+
+        graph = self.graph
+        ranks = graph.component_ranks()
+        unpack = ic.netname_table().unpack
+        self.ranked = list()
+        for g, components in self.members.items():
+            if not any(c in self.seeded for c in components):
+                continue
+            group = self.tuples.get(g)
+            if group is None:
+                segments = list()
+                for c in components:
+                    segments.extend(unpack(s) for s in graph.component_segments(c))
+                group = self.tuples[g] = (min(ranks[c] for c in components), tuple(sorted(segments)))
+            self.ranked.append(group)
+        for c in self.seeded:
+            if c not in self.group_of:
+                group = self.singletons.get(c)
+                if group is None:
+                    group = self.singletons[c] = (ranks[c], tuple(sorted(unpack(s) for s in graph.component_segments(c))))
+                self.ranked.append(group)
+        return set(group for rank, group in self.ranked)
+
+    # The groups of the last update() in sorted() order, placed by the
+    # rank of their first segment.
+    def sorted_groups(self):
+        slots = [None] * len(self.graph)
+        for rank, group in self.ranked:
+            slots[rank] = group
+        return [group for group in slots if group is not None]
+
+# The tables from here on are keyed by device, and the per-device
+# tables by net name id or hold a bounded_cache. They grow with the
+# number of devices a process works on and with the netname table of
+# each device (see netname_table), not with the queries made.
+routing_graphs = dict()
+routing_graph_locks = dict()
+routing_graph_cache_misses = set()
+
+# See iceconfig.indexed_table().
+indexed_tables = dict()
+
+# Per-device tile_has_net() masks, indexed by interned net name, and
+# bounded caches of the masks of names that are not interned, indexed
+# by the net name itself.
+tile_has_net_masks = dict()
+tile_has_net_name_masks = dict()
+
+# Classify a tile coordinate c of a device with maximum coordinate m as
+# below range, 0, 1, inside, m-1, m or above range. class_coords(m)
+# returns one coordinate of each class.
+def coord_class(c, m):
+    if c <= 1:
+        return 0 if c < 0 else c + 1
+    if c >= m - 1:
+        return 6 if c > m else c - m + 5
+    return 3
+
+def class_coords(m):
+    return (-1, 0, 1, 2, m - 1, m, m + 1)
+
+# Set to True to have group_segments() check its union-find result
+# against a plain breadth-first search.
+check_group_segments = False
+
+# The number of worker processes build_routing_graph() uses unless told
+# otherwise: $ICEBOX_JOBS, parsed on first use, or 1 if it is unset or
+# empty. Values below 1 count as 1.
+default_jobs_state = dict()
+
+def default_jobs():
+    jobs = default_jobs_state.get("jobs")
+    if jobs is None:
+        value = os.environ.get("ICEBOX_JOBS", "").strip()
+        try:
+            jobs = int(value) if value else 1
+        except ValueError:
+            raise ValueError("$ICEBOX_JOBS must be a number of worker processes, not %r" % value) from None
+        jobs = default_jobs_state["jobs"] = max(jobs, 1)
+    return jobs
+
+# Build the static routing graph of a device. With jobs > 1 the columns
+# of the device are split into that many bands, and a worker process
+# follows the wires of each band; segments of a band that are only
+# reached from another band are followed afterwards. The graph is the
+# same for any number of jobs. jobs defaults to default_jobs().
+def build_routing_graph(device, jobs=None):
+    if jobs is None:
+        jobs = default_jobs()
+    ic = iceconfig()
+    getattr(ic, "setup_empty_" + device)()
+    all_tiles = set((rec.x, rec.y) for rec in ic.tile_records())
+    seed_segments, connected_segments = ic.group_segment_seeds(all_tiles)
+
+    adjacency = dict()
+    queue = list(seed_segments)
+    if jobs > 1:
+        import multiprocessing, concurrent.futures
+    # The workers are forked: the command line tools are scripts without
+    # a __main__ guard, which other start methods would run again. With
+    # other threads running, a fork could copy db_lock or a netname
+    # table lock while they hold it and leave the worker stuck, so the
+    # graph is then built in this process.
+    if jobs > 1 and "fork" in multiprocessing.get_all_start_methods() and threading.active_count() == 1:
+        jobs = min(jobs, ic.max_x + 1)
+        bands = [(ic.max_x + 1) * i // jobs for i in range(jobs + 1)]
+        pack = ic.netname_table().pack
+        with concurrent.futures.ProcessPoolExecutor(jobs, multiprocessing.get_context("fork")) as pool:
+            for band in pool.map(follow_routing_band, [device] * jobs, bands[:-1], bands[1:]):
+                for segment, targets in band:
+                    adjacency[pack(segment)] = [pack(k) for k in targets]
+        queue = [k for targets in adjacency.values() for k in targets if k not in adjacency]
+        queue.extend(s for s in seed_segments if s not in adjacency)
+
+    while queue:
+        segment = queue.pop()
+        if segment in adjacency:
+            continue
+        adjacency[segment] = ic.compute_follow_segment(segment)
+        queue.extend(k for k in adjacency[segment] if k not in adjacency)
+
+    segments = array("I", sorted(adjacency))
+    index = dict((segment, i) for i, segment in enumerate(segments))
+    offsets = array("I")
+    targets = array("I")
+    rows = dict()
+    for segment in segments:
+        row = tuple(sorted(index[k] for k in adjacency[segment]))
+        if row not in rows:
+            rows[row] = len(targets)
+            targets.extend(row)
+        offsets.append(rows[row])
+        offsets.append(rows[row] + len(row))
+    return routing_graph(device, segments, offsets, targets)
+
+# Worker of build_routing_graph(): follow the wires of the tiles in
+# columns x0 <= x < x1, starting from the seeds of these tiles. Returns
+# (segment, neighbours) pairs of unpacked segments, since the packed
+# numbers of this process mean nothing to the caller.
+def follow_routing_band(device, x0, x1):
+    ic = iceconfig()
+    getattr(ic, "setup_empty_" + device)()
+    all_tiles = set((rec.x, rec.y) for rec in ic.tile_records())
+    seed_segments, connected_segments = ic.group_segment_seeds(all_tiles)
+    unpack = ic.netname_table().unpack
+
+    adjacency = dict()
+    queue = [s for s in seed_segments if x0 <= s >> 24 < x1]
+    while queue:
+        segment = queue.pop()
+        if segment in adjacency:
+            continue
+        adjacency[segment] = ic.compute_follow_segment(segment)
+        queue.extend(k for k in adjacency[segment] if x0 <= k >> 24 < x1 and k not in adjacency)
+    return [(unpack(s), [unpack(k) for k in targets]) for s, targets in adjacency.items()]
+
+# Return the routing graph of a device from memory, from the disk cache
+# or, if build is true, by building (and caching) it. Otherwise returns
+# None, and the disk cache is not looked at again for this device.
+def get_routing_graph(device, jobs=None, build=True):
+    graph = routing_graphs.get(device)
+    if graph is None and (build or device not in routing_graph_cache_misses):
+        with routing_graph_locks.setdefault(device, threading.Lock()):
+            graph = routing_graphs.get(device)
+            if graph is None and device not in routing_graph_cache_misses:
+                graph = load_routing_graph(device)
+                if graph is None:
+                    routing_graph_cache_misses.add(device)
+            if graph is None and build:
+                graph = build_routing_graph(device, jobs)
+                save_routing_graph(graph)
+            if graph is not None:
+                routing_graphs[device] = graph
+    return graph
+
+# On-disk cache of the routing graphs, with their static components and
+# segment ranks, in $ICEBOX_CACHE_DIR (default $XDG_CACHE_HOME/icebox or
+# ~/.cache/icebox; an empty $ICEBOX_CACHE_DIR turns the cache off). A
+# file holds a magic number, the length of a JSON header, the header,
+# and then, 4-byte aligned, the arrays as raw native uint32. It is named
+# after a hash of the tile databases, of this file and of
+# routing_graph_cache_version, so a change to either invalidates it;
+# saving a graph removes the files of the device under other keys.
+# Loading maps the file into memory and the graph uses the arrays in
+# place. Packed segments are only meaningful with the netname table of
+# the process that packed them: the header holds those names, and the
+# segments are packed again (and the arrays permuted to keep them in
+# order) when loading into a table that numbers the names differently.
+routing_graph_cache_version = 2
+routing_graph_cache_magic = b"ICRG"
+routing_graph_cache_state = dict()
+
+def routing_graph_cache_filename(device):
+    cache_dir = os.environ.get("ICEBOX_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "icebox")
+    if not cache_dir:
+        return None
+    key = routing_graph_cache_state.get("key")
+    if key is None:
+        digest = hashlib.sha1(("icebox routing graph %d\n" % routing_graph_cache_version).encode())
+        digest.update(iceboxdb_digest().encode())
+        with open(__file__, "rb") as f:
+            digest.update(f.read())
+        key = routing_graph_cache_state["key"] = digest.hexdigest()
+    return os.path.join(cache_dir, "routing-graph-%s-%s.bin" % (device, key[:16]))
+
+routing_graph_cache_arrays = ("segments", "offsets", "targets", "components", "component_offsets", "component_members", "ranks", "first_ranks")
+
+def save_routing_graph(graph):
+    import json, struct
+    try:
+        filename = routing_graph_cache_filename(graph.device)
+    except OSError:
+        return
+    if filename is None:
+        return
+    tmpname = filename + ".%d.new" % os.getpid()
+    try:
+        graph.static_components()
+        graph.component_ranks()
+        arrays = [getattr(graph, name) for name in routing_graph_cache_arrays]
+        header = json.dumps({"device": graph.device, "names": list(get_netname_table(graph.device).names),
+                             "sizes": [len(a) for a in arrays], "byteorder": sys.byteorder,
+                             "itemsize": arrays[0].itemsize}).encode()
+        header += b" " * (-len(header) % 4)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(tmpname, "wb") as f:
+            f.write(routing_graph_cache_magic + struct.pack("<I", len(header)) + header)
+            for a in arrays:
+                f.write(memoryview(a).cast("B"))
+        os.replace(tmpname, filename)
+    except (OSError, ImportError):
+        # The cache is an optimization: a read-only or missing cache
+        # directory just means building the graph next time again.
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+        return
+    remove_stale_routing_graphs(filename, graph.device)
+
+# Remove the cached routing graphs of device that were written under
+# another key (by another version of icebox or other tile databases),
+# keeping filename.
+def remove_stale_routing_graphs(filename, device):
+    cache_dir, current = os.path.split(filename)
+    prefix = "routing-graph-%s-" % device
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        key = name[len(prefix):-len(".bin")]
+        if name != current and name.startswith(prefix) and name.endswith(".bin") and \
+                len(key) == 16 and all(c in "0123456789abcdef" for c in key):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+def load_routing_graph(device):
+    import json, mmap, struct
+    try:
+        filename = routing_graph_cache_filename(device)
+        if filename is None:
+            return None
+        with open(filename, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:4] != routing_graph_cache_magic:
+            return None
+        start = 8 + struct.unpack("<I", data[4:8])[0]
+        header = json.loads(data[8:start].decode())
+        sizes = header["sizes"]
+        words = memoryview(data)[start:].cast("I")
+        if header["device"] != device or header["byteorder"] != sys.byteorder or header["itemsize"] != words.itemsize or \
+                not isinstance(header["names"], list) or len(sizes) != len(routing_graph_cache_arrays) or \
+                words.itemsize * sum(sizes) != len(data) - start:
+            return None
+        arrays = dict()
+        for name, size in zip(routing_graph_cache_arrays, sizes):
+            arrays[name] = words[:size]
+            words = words[size:]
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        # A missing, unreadable, truncated or foreign file: build the
+        # graph again.
+        return None
+
+    netnames = get_netname_table(device)
+    ids = [netnames.intern(name) for name in header["names"]]
+    segments = arrays["segments"]
+    if ids != list(range(len(ids))):
+        packed = [s & ~0xffff | ids[s & 0xffff] for s in segments]
+        order = sorted(range(len(packed)), key=packed.__getitem__)
+        position = array("I", bytes(4 * len(order)))
+        for i, k in enumerate(order):
+            position[k] = i
+        segments = array("I", (packed[k] for k in order))
+        offsets = arrays["offsets"]
+        arrays["offsets"] = array("I", (offsets[2*k + j] for k in order for j in (0, 1)))
+        arrays["targets"] = array("I", (position[k] for k in arrays["targets"]))
+        arrays["component_members"] = array("I", (position[k] for k in arrays["component_members"]))
+        for name in ("components", "ranks"):
+            old = arrays[name]
+            arrays[name] = array("I", (old[k] for k in order))
+
+    graph = routing_graph(device, segments, arrays["offsets"], arrays["targets"])
+    graph.component_offsets = arrays["component_offsets"]
+    graph.component_members = arrays["component_members"]
+    graph.components = arrays["components"]
+    graph.ranks = arrays["ranks"]
+    graph.first_ranks = arrays["first_ranks"]
+    return graph
 
 if False:
     ## Lattice span net name normalization
@@ -1096,12 +2822,65 @@ else:
     valid_sp12_v_t = set(range(22, 24))
     valid_sp12_v_b = set(range(24))
 
+# Structured form of a net name, parsed once per distinct name:
+#
+#   sp4_h_r_12        family "sp4",      orient "h",   side "r", index 12
+#   sp4_r_v_b_7       family "sp4_r",    orient "v",   side "b", index 7
+#   span4_vert_t_3    family "span4",    orient "v",   side "t", index 3
+#   span12_horz_5     family "span12",   orient "h",   side "",  index 5
+#   neigh_op_bnl_2    family "neigh_op", orient "bnl", side "",  index 2
+#   lutff_3/out       family "lutff",    orient "out", side "",  index 3
+#   ram/RDATA_9       family "ram_rdata",                        index 9
+#   glb_netwk_4       family "glb_netwk",                        index 4
+#
+# Other net names get family None.
+class netname_record:
+    __slots__ = ("name", "family", "orient", "side", "index")
+
+    def __init__(self, name, family=None, orient="", side="", index=None):
+        self.name = name
+        self.family = family
+        self.orient = orient
+        self.side = side
+        self.index = index
+
+    def __repr__(self):
+        return "netname_record(%r, %r, %r, %r, %r)" % (self.name, self.family, self.orient, self.side, self.index)
+
+netname_tokens = re.compile(r"(sp4|sp12)_([hv])_([lrtb])_(\d+)$|sp4_r_v_b_(\d+)$|(span4|span12)_(horz|vert)(?:_([lrtb]))?_(\d+)$|" +
+                            r"(logic|neigh)_op_(...)_(\d+)$|lutff_(\d+)/(.*)$|ram/RDATA_(\d+)$|glb_netwk_(\d+)$")
+
+netname_records = bounded_cache(2**16)
+
+def parse_netname(netname):
+    record = netname_records.get(netname)
+    if record is not None:
+        return record
+    m = netname_tokens.match(netname)
+    if m is None:
+        record = netname_record(netname)
+    elif m.group(1):
+        record = netname_record(netname, m.group(1), m.group(2), m.group(3), int(m.group(4)))
+    elif m.group(5):
+        record = netname_record(netname, "sp4_r", "v", "b", int(m.group(5)))
+    elif m.group(6):
+        record = netname_record(netname, m.group(6), m.group(7)[0], m.group(8) or "", int(m.group(9)))
+    elif m.group(10):
+        record = netname_record(netname, m.group(10) + "_op", m.group(11), "", int(m.group(12)))
+    elif m.group(13):
+        record = netname_record(netname, "lutff", m.group(14), "", int(m.group(13)))
+    elif m.group(15):
+        record = netname_record(netname, "ram_rdata", "", "", int(m.group(15)))
+    else:
+        record = netname_record(netname, "glb_netwk", "", "", int(m.group(16)))
+    netname_records[netname] = record
+    return record
+
 def sp4h_normalize(netname, edge=""):
-    m = re_match_cached("sp4_h_([lr])_(\d+)$", netname)
-    assert m
-    if not m: return None
-    cur_edge = m.group(1)
-    cur_index = int(m.group(2))
+    r = parse_netname(netname)
+    assert r.family == "sp4" and r.orient == "h" and r.side in ("l", "r")
+    cur_edge = r.side
+    cur_index = r.index
 
     if cur_edge == edge:
         return netname
@@ -1120,11 +2899,10 @@ def sp4h_normalize(netname, edge=""):
 # "Normalization" of span4 (not just sp4) is needed during Ultra/UltraPlus
 # corner tracing
 def ultra_span4_horz_normalize(netname, edge=""):
-    m = re_match_cached("span4_horz_([rl])_(\d+)$", netname)
-    assert m
-    if not m: return None
-    cur_edge = m.group(1)
-    cur_index = int(m.group(2))
+    r = parse_netname(netname)
+    assert r.family == "span4" and r.orient == "h" and r.side in ("l", "r")
+    cur_edge = r.side
+    cur_index = r.index
     if cur_edge == edge:
         return netname
     if edge == "":
@@ -1146,11 +2924,10 @@ def ultra_span4_horz_normalize(netname, edge=""):
     assert False
     
 def sp4v_normalize(netname, edge=""):
-    m = re_match_cached("sp4_v_([bt])_(\d+)$", netname)
-    assert m
-    if not m: return None
-    cur_edge = m.group(1)
-    cur_index = int(m.group(2))
+    r = parse_netname(netname)
+    assert r.family == "sp4" and r.orient == "v" and r.side in ("b", "t")
+    cur_edge = r.side
+    cur_index = r.index
 
     if cur_edge == edge:
         return netname
@@ -1168,11 +2945,10 @@ def sp4v_normalize(netname, edge=""):
     return netname
 
 def sp12h_normalize(netname, edge=""):
-    m = re_match_cached("sp12_h_([lr])_(\d+)$", netname)
-    assert m
-    if not m: return None
-    cur_edge = m.group(1)
-    cur_index = int(m.group(2))
+    r = parse_netname(netname)
+    assert r.family == "sp12" and r.orient == "h" and r.side in ("l", "r")
+    cur_edge = r.side
+    cur_index = r.index
 
     if cur_edge == edge:
         return netname
@@ -1190,11 +2966,10 @@ def sp12h_normalize(netname, edge=""):
     return netname
 
 def sp12v_normalize(netname, edge=""):
-    m = re_match_cached("sp12_v_([bt])_(\d+)$", netname)
-    assert m
-    if not m: return None
-    cur_edge = m.group(1)
-    cur_index = int(m.group(2))
+    r = parse_netname(netname)
+    assert r.family == "sp12" and r.orient == "v" and r.side in ("b", "t")
+    cur_edge = r.side
+    cur_index = r.index
 
     if cur_edge == edge:
         return netname
@@ -1231,128 +3006,116 @@ def netname_normalize(netname, edge="", ramb=False, ramt=False, ramb_8k=False, r
         if ramt: netname="ram/RADDR_%d" % (idx1*4 + idx2)
         if ramb_8k: netname="ram/RADDR_%d" % ([7, 6, 5, 4, 3, 2, 1, 0, -1, -1, -1, -1, -1, 10, 9, 8][idx1*4 + idx2])
         if ramt_8k: netname="ram/WADDR_%d" % ([7, 6, 5, 4, 3, 2, 1, 0, -1, -1, -1, -1, -1, 10, 9, 8][idx1*4 + idx2])
-    match = re_match_cached(r"(...)_op_(.*)", netname)
-    if match and (match.group(1) != "slf"):
-        netname = "neigh_op_%s_%s" % (match.group(1), match.group(2))
-    if re_match_cached(r"lutff_7/(cen|clk|s_r)", netname):
+    if netname[3:7] == "_op_" and netname[:3] != "slf":
+        netname = "neigh_op_" + netname[:3] + netname[6:]
+    if netname.startswith(("lutff_7/cen", "lutff_7/clk", "lutff_7/s_r")):
         netname = netname.replace("lutff_7/", "lutff_global/")
-    if re_match_cached(r"io_1/(cen|inclk|outclk)", netname):
+    if netname.startswith(("io_1/cen", "io_1/inclk", "io_1/outclk")):
         netname = netname.replace("io_1/", "io_global/")
     if netname == "carry_in_mux/cout":
         return "carry_in_mux"
     return netname
 
 def pos_has_net(pos, netname):
+    r = parse_netname(netname)
     if pos in ("l", "r"):
-        if re_search_cached(r"_vert_\d+$", netname): return False
-        if re_search_cached(r"_horz_[rl]_\d+$", netname): return False
+        if r.family in ("span4", "span12") and r.orient == "v" and r.side == "": return False
+        if r.family in ("span4", "span12") and r.orient == "h" and r.side in ("l", "r"): return False
     if pos in ("t", "b"):
-        if re_search_cached(r"_horz_\d+$", netname): return False
-        if re_search_cached(r"_vert_[bt]_\d+$", netname): return False
+        if r.family in ("span4", "span12") and r.orient == "h" and r.side == "": return False
+        if r.family in ("span4", "span12") and r.orient == "v" and r.side in ("b", "t"): return False
     return True
 
 def pos_follow_net(pos, direction, netname, is_ultra):
+    r = parse_netname(netname)
     if pos == "x" or ((pos in ("l", "r")) and is_ultra):
-            m = re_match_cached("sp4_h_[lr]_(\d+)$", netname)
-            if m and direction in ("l", "L"):
+            if r.family == "sp4" and r.orient == "h" and direction in ("l", "L"):
                 n = sp4h_normalize(netname, "l")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "l" or is_ultra:
-                        n = re_sub_cached("_l_", "_r_", n)
-                        n = sp4h_normalize(n)
+                        n = sp4h_normalize("sp4_h_r_%d" % index)
                     else:
-                        n = re_sub_cached("_l_", "_", n)
-                        n = re_sub_cached("sp4_h_", "span4_horz_", n)
+                        n = "span4_horz_%d" % index
                     return n
-            if m and direction in ("r", "R"):
+            if r.family == "sp4" and r.orient == "h" and direction in ("r", "R"):
                 n = sp4h_normalize(netname, "r")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "r" or is_ultra:
-                        n = re_sub_cached("_r_", "_l_", n)
-                        n = sp4h_normalize(n)
+                        n = sp4h_normalize("sp4_h_l_%d" % index)
                     else:
-                        n = re_sub_cached("_r_", "_", n)
-                        n = re_sub_cached("sp4_h_", "span4_horz_", n)
+                        n = "span4_horz_%d" % index
                     return n
 
-            m = re_match_cached("sp4_v_[tb]_(\d+)$", netname)
-            if m and direction in ("t", "T"):
+            if r.family == "sp4" and r.orient == "v" and direction in ("t", "T"):
                 n = sp4v_normalize(netname, "t")
                 if n is not None:
+                    index = parse_netname(n).index
                     if is_ultra and direction == "T" and pos in ("l", "r"):
-                        return re_sub_cached("sp4_v_", "span4_vert_", n)
+                        return "span4_vert_t_%d" % index
                     elif direction == "t":
-                        n = re_sub_cached("_t_", "_b_", n)
-                        n = sp4v_normalize(n)
+                        n = sp4v_normalize("sp4_v_b_%d" % index)
                     else:
-                        n = re_sub_cached("_t_", "_", n)
-                        n = re_sub_cached("sp4_v_", "span4_vert_", n)
+                        n = "span4_vert_%d" % index
                     return n
-            if m and direction in ("b", "B"):
+            if r.family == "sp4" and r.orient == "v" and direction in ("b", "B"):
                 n = sp4v_normalize(netname, "b")
                 if n is not None:
+                    index = parse_netname(n).index
                     if is_ultra and direction == "B" and pos in ("l", "r"):
-                        return re_sub_cached("sp4_v_", "span4_vert_", n)
+                        return "span4_vert_b_%d" % index
                     elif direction == "b":
-                        n = re_sub_cached("_b_", "_t_", n)
-                        n = sp4v_normalize(n)
+                        n = sp4v_normalize("sp4_v_t_%d" % index)
                     else:
-                        n = re_sub_cached("_b_", "_", n)
-                        n = re_sub_cached("sp4_v_", "span4_vert_", n)
+                        n = "span4_vert_%d" % index
                     return n
 
-            m = re_match_cached("sp12_h_[lr]_(\d+)$", netname)
-            if m and direction in ("l", "L"):
+            if r.family == "sp12" and r.orient == "h" and direction in ("l", "L"):
                 n = sp12h_normalize(netname, "l")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "l" or is_ultra:
-                        n = re_sub_cached("_l_", "_r_", n)
-                        n = sp12h_normalize(n)
+                        n = sp12h_normalize("sp12_h_r_%d" % index)
                     else:
-                        n = re_sub_cached("_l_", "_", n)
-                        n = re_sub_cached("sp12_h_", "span12_horz_", n)
+                        n = "span12_horz_%d" % index
                     return n
-            if m and direction in ("r", "R"):
+            if r.family == "sp12" and r.orient == "h" and direction in ("r", "R"):
                 n = sp12h_normalize(netname, "r")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "r" or is_ultra:
-                        n = re_sub_cached("_r_", "_l_", n)
-                        n = sp12h_normalize(n)
+                        n = sp12h_normalize("sp12_h_l_%d" % index)
                     else:
-                        n = re_sub_cached("_r_", "_", n)
-                        n = re_sub_cached("sp12_h_", "span12_horz_", n)
+                        n = "span12_horz_%d" % index
                     return n
 
-            m = re_match_cached("sp12_v_[tb]_(\d+)$", netname)
-            if m and direction in ("t", "T"):
+            if r.family == "sp12" and r.orient == "v" and direction in ("t", "T"):
                 n = sp12v_normalize(netname, "t")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "t":
-                        n = re_sub_cached("_t_", "_b_", n)
-                        n = sp12v_normalize(n)
+                        n = sp12v_normalize("sp12_v_b_%d" % index)
                     elif direction == "T" and pos in ("l", "r"):
                         pass
                     else:
-                        n = re_sub_cached("_t_", "_", n)
-                        n = re_sub_cached("sp12_v_", "span12_vert_", n)
+                        n = "span12_vert_%d" % index
                     return n
-            if m and direction in ("b", "B"):
+            if r.family == "sp12" and r.orient == "v" and direction in ("b", "B"):
                 n = sp12v_normalize(netname, "b")
                 if n is not None:
+                    index = parse_netname(n).index
                     if direction == "b":
-                        n = re_sub_cached("_b_", "_t_", n)
-                        n = sp12v_normalize(n)
+                        n = sp12v_normalize("sp12_v_t_%d" % index)
                     elif direction == "B" and pos in ("l", "r"):
                         pass
                     else:
-                        n = re_sub_cached("_b_", "_", n)
-                        n = re_sub_cached("sp12_v_", "span12_vert_", n)
+                        n = "span12_vert_%d" % index
                     return n
 
     if (pos in ("l", "r" )) and (not is_ultra):
-        m = re_match_cached("span4_vert_([bt])_(\d+)$", netname)
-        if m:
-            case, idx = direction + m.group(1), int(m.group(2))
+        if r.family == "span4" and r.orient == "v" and r.side in ("b", "t"):
+            case, idx = direction + r.side, r.index
             if case == "tt":
                 return "span4_vert_b_%d" % idx
             if case == "tb" and idx >= 4:
@@ -1363,9 +3126,8 @@ def pos_follow_net(pos, direction, netname, is_ultra):
                 return "span4_vert_t_%d" % idx
 
     if pos in ("t", "b" ):
-        m = re_match_cached("span4_horz_([rl])_(\d+)$", netname)
-        if m:
-            case, idx = direction + m.group(1), int(m.group(2))
+        if r.family == "span4" and r.orient == "h" and r.side in ("l", "r"):
+            case, idx = direction + r.side, r.index
             if direction == "L":
                 return ultra_span4_horz_normalize(netname, "l")
             elif direction == "R":
@@ -1380,40 +3142,29 @@ def pos_follow_net(pos, direction, netname, is_ultra):
                 return "span4_horz_l_%d" % idx
 
     if pos == "l" and direction == "r" and (not is_ultra):
-            m = re_match_cached("span4_horz_(\d+)$", netname)
-            if m: return sp4h_normalize("sp4_h_l_%s" % m.group(1))
-            m = re_match_cached("span12_horz_(\d+)$", netname)
-            if m: return sp12h_normalize("sp12_h_l_%s" % m.group(1))
+            if r.family == "span4" and r.orient == "h" and r.side == "": return sp4h_normalize("sp4_h_l_%d" % r.index)
+            if r.family == "span12" and r.orient == "h" and r.side == "": return sp12h_normalize("sp12_h_l_%d" % r.index)
 
     if pos == "r" and direction == "l" and (not is_ultra):
-            m = re_match_cached("span4_horz_(\d+)$", netname)
-            if m: return sp4h_normalize("sp4_h_r_%s" % m.group(1))
-            m = re_match_cached("span12_horz_(\d+)$", netname)
-            if m: return sp12h_normalize("sp12_h_r_%s" % m.group(1))
+            if r.family == "span4" and r.orient == "h" and r.side == "": return sp4h_normalize("sp4_h_r_%d" % r.index)
+            if r.family == "span12" and r.orient == "h" and r.side == "": return sp12h_normalize("sp12_h_r_%d" % r.index)
 
     if pos == "t" and direction == "b":
-            m = re_match_cached("span4_vert_(\d+)$", netname)
-            if m: return sp4v_normalize("sp4_v_t_%s" % m.group(1))
-            m = re_match_cached("span12_vert_(\d+)$", netname)
-            if m: return sp12v_normalize("sp12_v_t_%s" % m.group(1))
+            if r.family == "span4" and r.orient == "v" and r.side == "": return sp4v_normalize("sp4_v_t_%d" % r.index)
+            if r.family == "span12" and r.orient == "v" and r.side == "": return sp12v_normalize("sp12_v_t_%d" % r.index)
 
     if pos == "b" and direction == "t":
-            m = re_match_cached("span4_vert_(\d+)$", netname)
-            if m: return sp4v_normalize("sp4_v_b_%s" % m.group(1))
-            m = re_match_cached("span12_vert_(\d+)$", netname)
-            if m: return sp12v_normalize("sp12_v_b_%s" % m.group(1))
+            if r.family == "span4" and r.orient == "v" and r.side == "": return sp4v_normalize("sp4_v_b_%d" % r.index)
+            if r.family == "span12" and r.orient == "v" and r.side == "": return sp12v_normalize("sp12_v_b_%d" % r.index)
 
     return None
 
 def get_lutff_bits(tile, index):
-    bits = list("--------------------")
-    for k, line in enumerate(tile):
-        for i in range(36, 46):
-            lutff_idx = k // 2
-            lutff_bitnum = (i-36) + 10*(k%2)
-            if lutff_idx == index:
-                bits[lutff_bitnum] = line[i];
-    return bits
+    tile = as_tilebits(tile)
+    # Each LUT/FF uses columns 36..45 of rows 2*index and 2*index+1.
+    lo = (tile.row_bits(2*index) >> 36) & 0x3ff
+    hi = (tile.row_bits(2*index+1) >> 36) & 0x3ff
+    return list(format(hi << 10 | lo, "020b")[::-1])
 
 def get_lutff_lut_bits(tile, index):
     lutff_bits = get_lutff_bits(tile, index)
@@ -1456,7 +3207,7 @@ def run_checks_neigh():
                 all_segments.add((idx[0], idx[1], entry[3]))
 
     for x in range(ic.max_x+1):
-        for y in range(ic.max_x+1):
+        for y in range(ic.max_y+1):
             # Skip the corners.
             if x in (0, ic.max_x) and y in (0, ic.max_y):
                 continue
@@ -1464,18 +3215,34 @@ def run_checks_neigh():
             if (x, y) in ic.logic_tiles:
                 all_segments.add((x, y, "lutff_7/cout"))
 
-    for s1 in all_segments:
-        for s2 in ic.follow_net(s1):
-            # if s1[1] > 4: continue
-            if s1 not in ic.follow_net(s2):
-                print("ERROR: %s -> %s, but not vice versa!" % (s1, s2))
-                print("Neighbours of %s:" % (s1,))
-                for s in ic.follow_net(s1):
-                    print("  ", s)
-                print("Neighbours of %s:" % (s2,))
-                for s in ic.follow_net(s2):
-                    print("  ", s)
-                print()
+    # Follow all segments and their neighbours once. An edge s1 -> s2 is
+    # the integer s1 << 32 | s2, and every edge of all_segments has to
+    # appear reversed among the followed edges. The neighbours are
+    # computed afresh, not taken from a (possibly cached) routing graph.
+    netnames = ic.netname_table()
+    segments = sorted(netnames.pack(s) for s in all_segments)
+    offsets, neighbours = ic.follow_net_many(segments, use_graph=False)
+    others = sorted(set(neighbours).difference(segments))
+    other_offsets, other_neighbours = ic.follow_net_many(others, use_graph=False)
+
+    followed = set()
+    for segs, offs, neighs in ((segments, offsets, neighbours), (others, other_offsets, other_neighbours)):
+        for i, s1 in enumerate(segs):
+            followed.update(s1 << 32 | s2 for s2 in neighs[offs[i]:offs[i+1]])
+    reversed_edges = set()
+    for i, s1 in enumerate(segments):
+        reversed_edges.update(s2 << 32 | s1 for s2 in neighbours[offsets[i]:offsets[i+1]])
+
+    for e in sorted(reversed_edges - followed):
+        s1, s2 = netnames.unpack(e & 0xffffffff), netnames.unpack(e >> 32)
+        print("ERROR: %s -> %s, but not vice versa!" % (s1, s2))
+        print("Neighbours of %s:" % (s1,))
+        for s in ic.compute_follow_net(s1):
+            print("  ", s)
+        print("Neighbours of %s:" % (s2,))
+        for s in ic.compute_follow_net(s2):
+            print("  ", s)
+        print()
 
 def run_checks():
     run_checks_neigh()
@@ -1506,6 +3273,118 @@ def parse_db(text, device="1k"):
         db.append(line)
     return db
 
+# The tile databases and the large static tables are only built when they
+# are first used, so that importing icebox stays cheap. Inside this module
+# they are accessed through get_db(name); for other modules, icebox.<name>
+# loads them on demand via the module __getattr__.
+db_loaders = dict()
+loaded_dbs = dict()
+
+# Register a function building the named tables. With more than one name
+# the function returns a tuple of tables in the same order.
+def db_loader(*names):
+    def register(loader):
+        for name in names:
+            db_loaders[name] = (names, loader)
+        return loader
+    return register
+
+# Shared tables are built under a lock, so that concurrent first uses
+# from several threads build them once, and are only published when
+# complete. They are never modified afterwards.
+db_lock = threading.RLock()
+
+def get_db(name):
+    db = loaded_dbs.get(name)
+    if db is not None:
+        return db
+    with db_lock:
+        if name not in loaded_dbs and name in db_artifact_names:
+            load_db_artifact()
+        if name not in loaded_dbs:
+            names, loader = db_loaders[name]
+            dbs = loader()
+            if len(names) == 1:
+                dbs = (dbs,)
+            for n, db in zip(names, dbs):
+                loaded_dbs[n] = db
+                globals()[n] = db
+        return loaded_dbs[name]
+
+def __getattr__(name):
+    if name in db_loaders:
+        return get_db(name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+# The tile databases can also be read, fully processed, from a pickle
+# next to iceboxdb.py. Only the iceboxdb.pickle target of the icebox
+# Makefile writes it (see write_db_artifact()), so that it is built and
+# installed together with the icebox.py that reads it; icefuzz/export.py
+# only writes iceboxdb.py. The artifact is keyed on its inputs, the
+# database texts of iceboxdb.py and db_artifact_version, and is only
+# used if they match; otherwise the text path above is used. Bump
+# db_artifact_version when the loaders change what they build from the
+# texts.
+db_artifact_version = 1
+
+db_artifact_names = ("iotile_full_db", "iotile_l_db", "iotile_r_db", "iotile_t_db", "iotile_b_db", "iotile_t_5k_db", "iotile_b_5k_db",
+                     "logictile_db", "logictile_5k_db", "logictile_8k_db", "logictile_384_db",
+                     "rambtile_db", "ramttile_db", "rambtile_8k_db", "ramttile_8k_db",
+                     "ipcon_5k_db", "dsp0_5k_db", "dsp1_5k_db", "dsp2_5k_db", "dsp3_5k_db")
+
+db_artifact_state = dict()
+
+def db_artifact_filename():
+    import iceboxdb
+    return os.path.splitext(iceboxdb.__file__)[0] + ".pickle"
+
+def iceboxdb_digest():
+    if "digest" not in db_artifact_state:
+        import iceboxdb
+        digest = hashlib.sha1(("icebox db artifact %d\n" % db_artifact_version).encode())
+        for name in sorted(dir(iceboxdb)):
+            if name.startswith("database_") and name.endswith("_txt"):
+                digest.update(("%s\n" % name).encode())
+                digest.update(getattr(iceboxdb, name).encode())
+        db_artifact_state["digest"] = digest.hexdigest()
+    return db_artifact_state["digest"]
+
+def write_db_artifact(filename=None):
+    if filename is None:
+        filename = db_artifact_filename()
+    dbs = dict()
+    for name in db_artifact_names:
+        names, loader = db_loaders[name]
+        if name not in dbs:
+            loaded = loader()
+            dbs.update(zip(names, loaded if len(names) > 1 else (loaded,)))
+    with open(filename + ".new", "wb") as f:
+        pickle.dump({"digest": iceboxdb_digest(), "dbs": dbs}, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(filename + ".new", filename)
+
+# Try once to load all tile databases from the artifact. Returns True
+# if they were loaded. Called with db_lock held.
+def load_db_artifact():
+    if "loaded" not in db_artifact_state:
+        db_artifact_state["loaded"] = False
+        try:
+            with open(db_artifact_filename(), "rb") as f:
+                artifact = pickle.load(f)
+        except Exception:
+            # A missing, unreadable or corrupt artifact just means the
+            # text path. Unpickling damaged data can raise almost any
+            # exception.
+            return False
+        if not isinstance(artifact, dict) or artifact.get("digest") != iceboxdb_digest() or \
+                not isinstance(artifact.get("dbs"), dict) or not all(name in artifact["dbs"] for name in db_artifact_names):
+            return False
+        for name in db_artifact_names:
+            if name not in loaded_dbs:
+                loaded_dbs[name] = artifact["dbs"][name]
+                globals()[name] = loaded_dbs[name]
+        db_artifact_state["loaded"] = True
+    return db_artifact_state["loaded"]
+
 extra_bits_db = {
     "1k": {
         (0, 330, 142): ("padin_glb_netwk", "0"),
@@ -1723,549 +3602,551 @@ noplls_db = {
     "384-qn32": [ "384" ],
 }
 
-pllinfo_db = {
-    "1k": {
-        "LOC" : (6, 0),
-
-        # 3'b000 = "DISABLED"
-        # 3'b010 = "SB_PLL40_PAD"
-        # 3'b100 = "SB_PLL40_2_PAD"
-        # 3'b110 = "SB_PLL40_2F_PAD"
-        # 3'b011 = "SB_PLL40_CORE"
-        # 3'b111 = "SB_PLL40_2F_CORE"
-        "PLLTYPE_0":            ( 0,  3, "PLLCONFIG_5"),
-        "PLLTYPE_1":            ( 0,  5, "PLLCONFIG_1"),
-        "PLLTYPE_2":            ( 0,  5, "PLLCONFIG_3"),
-
-        # 3'b000 = "DELAY"
-        # 3'b001 = "SIMPLE"
-        # 3'b010 = "PHASE_AND_DELAY"
-        # 3'b110 = "EXTERNAL"
-        "FEEDBACK_PATH_0":      ( 0,  5, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      ( 0,  2, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      ( 0,  3, "PLLCONFIG_1"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
-        "DELAY_ADJMODE_FB":     ( 0,  4, "PLLCONFIG_4"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
-        "DELAY_ADJMODE_REL":    ( 0,  4, "PLLCONFIG_9"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_A_0":    ( 0,  3, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    ( 0,  3, "PLLCONFIG_7"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_B_0":    ( 0,  3, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    ( 0,  3, "PLLCONFIG_3"),
-
-        # Numeric Parameters
-        "SHIFTREG_DIV_MODE":    ( 0,  3, "PLLCONFIG_4"),
-        "FDA_FEEDBACK_0":       ( 0,  3, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       ( 0,  4, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       ( 0,  4, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       ( 0,  4, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       ( 0,  4, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       ( 0,  4, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       ( 0,  4, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       ( 0,  4, "PLLCONFIG_8"),
-        "DIVR_0":               ( 0,  1, "PLLCONFIG_1"),
-        "DIVR_1":               ( 0,  1, "PLLCONFIG_2"),
-        "DIVR_2":               ( 0,  1, "PLLCONFIG_3"),
-        "DIVR_3":               ( 0,  1, "PLLCONFIG_4"),
-        "DIVF_0":               ( 0,  1, "PLLCONFIG_5"),
-        "DIVF_1":               ( 0,  1, "PLLCONFIG_6"),
-        "DIVF_2":               ( 0,  1, "PLLCONFIG_7"),
-        "DIVF_3":               ( 0,  1, "PLLCONFIG_8"),
-        "DIVF_4":               ( 0,  1, "PLLCONFIG_9"),
-        "DIVF_5":               ( 0,  2, "PLLCONFIG_1"),
-        "DIVF_6":               ( 0,  2, "PLLCONFIG_2"),
-        "DIVQ_0":               ( 0,  2, "PLLCONFIG_3"),
-        "DIVQ_1":               ( 0,  2, "PLLCONFIG_4"),
-        "DIVQ_2":               ( 0,  2, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       ( 0,  2, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       ( 0,  2, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       ( 0,  2, "PLLCONFIG_8"),
-        "TEST_MODE":            ( 0,  3, "PLLCONFIG_8"),
-        "ENABLE_ICEGATE_PORTA": ( 0,  5, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": ( 0,  5, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        "PLLOUT_A":             ( 6,  0, 1),
-        "PLLOUT_B":             ( 7,  0, 0),
-        "REFERENCECLK":         ( 0,  1, "fabout"),
-        "EXTFEEDBACK":          ( 0,  2, "fabout"),
-        "DYNAMICDELAY_0":       ( 0,  4, "fabout"),
-        "DYNAMICDELAY_1":       ( 0,  5, "fabout"),
-        "DYNAMICDELAY_2":       ( 0,  6, "fabout"),
-        "DYNAMICDELAY_3":       ( 0, 10, "fabout"),
-        "DYNAMICDELAY_4":       ( 0, 11, "fabout"),
-        "DYNAMICDELAY_5":       ( 0, 12, "fabout"),
-        "DYNAMICDELAY_6":       ( 0, 13, "fabout"),
-        "DYNAMICDELAY_7":       ( 0, 14, "fabout"),
-        "LOCK":                 ( 1,  1, "neigh_op_bnl_1"),
-        "BYPASS":               ( 1,  0, "fabout"),
-        "RESETB":               ( 2,  0, "fabout"),
-        "LATCHINPUTVALUE":      ( 5,  0, "fabout"),
-        "SDO":                  (12,  1, "neigh_op_bnr_3"),
-        "SDI":                  ( 4,  0, "fabout"),
-        "SCLK":                 ( 3,  0, "fabout"),
-    },
-    "lm4k": {
-        "LOC" : (12, 0),
-
-        # 3'b000 = "DISABLED"
-        # 3'b010 = "SB_PLL40_PAD"
-        # 3'b100 = "SB_PLL40_2_PAD"
-        # 3'b110 = "SB_PLL40_2F_PAD"
-        # 3'b011 = "SB_PLL40_CORE"
-        # 3'b111 = "SB_PLL40_2F_CORE"
-        "PLLTYPE_0":            (12,  0, "PLLCONFIG_5"),
-        "PLLTYPE_1":            (14,  0, "PLLCONFIG_1"),
-        "PLLTYPE_2":            (14,  0, "PLLCONFIG_3"),
-
-        # 3'b000 = "DELAY"
-        # 3'b001 = "SIMPLE"
-        # 3'b010 = "PHASE_AND_DELAY"
-        # 3'b110 = "EXTERNAL"
-        "FEEDBACK_PATH_0":      (14,  0, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      (11,  0, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      (12,  0, "PLLCONFIG_1"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
-        "DELAY_ADJMODE_FB":     (13,  0, "PLLCONFIG_4"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
-        "DELAY_ADJMODE_REL":    (13,  0, "PLLCONFIG_9"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_A_0":    (12,  0, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    (12,  0, "PLLCONFIG_7"),
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_B_0":    (12,  0, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    (12,  0, "PLLCONFIG_3"),
-
-        # Numeric Parameters
-        "SHIFTREG_DIV_MODE":    (12,  0, "PLLCONFIG_4"),
-        "FDA_FEEDBACK_0":       (12,  0, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       (13,  0, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       (13,  0, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       (13,  0, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       (13,  0, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       (13,  0, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       (13,  0, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       (13,  0, "PLLCONFIG_8"),
-        "DIVR_0":               (10,  0, "PLLCONFIG_1"),
-        "DIVR_1":               (10,  0, "PLLCONFIG_2"),
-        "DIVR_2":               (10,  0, "PLLCONFIG_3"),
-        "DIVR_3":               (10,  0, "PLLCONFIG_4"),
-        "DIVF_0":               (10,  0, "PLLCONFIG_5"),
-        "DIVF_1":               (10,  0, "PLLCONFIG_6"),
-        "DIVF_2":               (10,  0, "PLLCONFIG_7"),
-        "DIVF_3":               (10,  0, "PLLCONFIG_8"),
-        "DIVF_4":               (10,  0, "PLLCONFIG_9"),
-        "DIVF_5":               (11,  0, "PLLCONFIG_1"),
-        "DIVF_6":               (11,  0, "PLLCONFIG_2"),
-        "DIVQ_0":               (11,  0, "PLLCONFIG_3"),
-        "DIVQ_1":               (11,  0, "PLLCONFIG_4"),
-        "DIVQ_2":               (11,  0, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       (11,  0, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       (11,  0, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       (11,  0, "PLLCONFIG_8"),
-        "TEST_MODE":            (12,  0, "PLLCONFIG_8"),
-        "ENABLE_ICEGATE_PORTA": (14,  0, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": (14,  0, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        # TODO(awygle) confirm these
-        "PLLOUT_A":             ( 12,  0, 1), 
-        "PLLOUT_B":             ( 13,  0, 0), 
-        "REFERENCECLK":         ( 10,  0, "fabout"),
-        "EXTFEEDBACK":          ( 11,  0, "fabout"), 
-        "DYNAMICDELAY_0":       (  1,  0, "fabout"), 
-        "DYNAMICDELAY_1":       (  2,  0, "fabout"), 
-        "DYNAMICDELAY_2":       (  3,  0, "fabout"), 
-        "DYNAMICDELAY_3":       (  4,  0, "fabout"), 
-        "DYNAMICDELAY_4":       (  5,  0, "fabout"), 
-        "DYNAMICDELAY_5":       (  7,  0, "fabout"), 
-        "DYNAMICDELAY_6":       (  8,  0, "fabout"), 
-        "DYNAMICDELAY_7":       (  9,  0, "fabout"), 
-        "LOCK":                 (  1,  1, "neigh_op_bnl_1"), #check?
-        "BYPASS":               ( 15,  0, "fabout"),
-        "RESETB":               ( 16,  0, "fabout"),
-        "LATCHINPUTVALUE":      ( 14,  0, "fabout"),
-        "SDO":                  ( 24,  1, "neigh_op_bnr_3"), #check?
-        "SDI":                  ( 18,  0, "fabout"),
-        "SCLK":                 ( 17,  0, "fabout"),
-    },
-    "5k": {
-        "LOC" : (12, 31),
-
-        # 3'b000 = "DISABLED"
-        # 3'b010 = "SB_PLL40_PAD"
-        # 3'b100 = "SB_PLL40_2_PAD"
-        # 3'b110 = "SB_PLL40_2F_PAD"
-        # 3'b011 = "SB_PLL40_CORE"
-        # 3'b111 = "SB_PLL40_2F_CORE"
-        "PLLTYPE_0":            (12, 31, "PLLCONFIG_5"),
-        "PLLTYPE_1":            (14, 31, "PLLCONFIG_1"),
-        "PLLTYPE_2":            (14, 31, "PLLCONFIG_3"),
-
-        # 3'b000 = "DELAY"
-        # 3'b001 = "SIMPLE"
-        # 3'b010 = "PHASE_AND_DELAY"
-        # 3'b110 = "EXTERNAL"
-        "FEEDBACK_PATH_0":      (14, 31, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      (11, 31, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      (12, 31, "PLLCONFIG_1"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
-        "DELAY_ADJMODE_FB":     (13, 31, "PLLCONFIG_4"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
-        "DELAY_ADJMODE_REL":    (13, 31, "PLLCONFIG_9"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_A_0":    (12, 31, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    (12, 31, "PLLCONFIG_7"),
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_B_0":    (12, 31, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    (12, 31, "PLLCONFIG_3"),
-
-        # Numeric Parameters
-        "SHIFTREG_DIV_MODE_0":  (12, 31, "PLLCONFIG_4"),
-        "SHIFTREG_DIV_MODE_1":  (14, 31, "PLLCONFIG_6"),
-        "FDA_FEEDBACK_0":       (12, 31, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       (13, 31, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       (13, 31, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       (13, 31, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       (13, 31, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       (13, 31, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       (13, 31, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       (13, 31, "PLLCONFIG_8"),
-        "DIVR_0":               (10, 31, "PLLCONFIG_1"),
-        "DIVR_1":               (10, 31, "PLLCONFIG_2"),
-        "DIVR_2":               (10, 31, "PLLCONFIG_3"),
-        "DIVR_3":               (10, 31, "PLLCONFIG_4"),
-        "DIVF_0":               (10, 31, "PLLCONFIG_5"),
-        "DIVF_1":               (10, 31, "PLLCONFIG_6"),
-        "DIVF_2":               (10, 31, "PLLCONFIG_7"),
-        "DIVF_3":               (10, 31, "PLLCONFIG_8"),
-        "DIVF_4":               (10, 31, "PLLCONFIG_9"),
-        "DIVF_5":               (11, 31, "PLLCONFIG_1"),
-        "DIVF_6":               (11, 31, "PLLCONFIG_2"),
-        "DIVQ_0":               (11, 31, "PLLCONFIG_3"),
-        "DIVQ_1":               (11, 31, "PLLCONFIG_4"),
-        "DIVQ_2":               (11, 31, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       (11, 31, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       (11, 31, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       (11, 31, "PLLCONFIG_8"),
-        "TEST_MODE":            (12, 31, "PLLCONFIG_8"),
-        "ENABLE_ICEGATE_PORTA": (14, 31, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": (14, 31, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        "PLLOUT_A":             ( 12, 31, 1), 
-        "PLLOUT_B":             ( 13, 31, 0), 
-        "REFERENCECLK":         ( 10, 31, "fabout"),
-        "EXTFEEDBACK":          ( 11, 31, "fabout"), 
-        "DYNAMICDELAY_0":       (  1, 31, "fabout"), 
-        "DYNAMICDELAY_1":       (  2, 31, "fabout"), 
-        "DYNAMICDELAY_2":       (  3, 31, "fabout"), 
-        "DYNAMICDELAY_3":       (  4, 31, "fabout"), 
-        "DYNAMICDELAY_4":       (  5, 31, "fabout"), 
-        "DYNAMICDELAY_5":       (  7, 31, "fabout"), 
-        "DYNAMICDELAY_6":       (  8, 31, "fabout"), 
-        "DYNAMICDELAY_7":       (  9, 31, "fabout"), 
-        "LOCK":                 (  1, 30, "neigh_op_tnl_1"), #check?
-        "BYPASS":               ( 15, 31, "fabout"),
-        "RESETB":               ( 16, 31, "fabout"),
-        "LATCHINPUTVALUE":      ( 14, 31, "fabout"),
-        "SDO":                  ( 24, 30, "neigh_op_tnr_1"), #check?
-        "SDI":                  ( 18, 31, "fabout"),
-        "SCLK":                 ( 17, 31, "fabout"),
-    },
-    "u4k": {
-        "LOC" : (12, 21),
-
-        "PLLTYPE_1":            (14, 21, "PLLCONFIG_1"),
-        "PLLTYPE_2":            (14, 21, "PLLCONFIG_3"),
-        "PLLTYPE_0":            (12, 21, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_0":      (14, 21, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      (11, 21, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      (12, 21, "PLLCONFIG_1"),
-        "PLLOUT_SELECT_A_0":    (12, 21, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    (12, 21, "PLLCONFIG_7"),
-        "PLLOUT_SELECT_B_0":    (12, 21, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    (12, 21, "PLLCONFIG_3"),
-        "SHIFTREG_DIV_MODE":    (12, 21, "PLLCONFIG_4"),
-        "FDA_FEEDBACK_0":       (12, 21, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       (13, 21, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       (13, 21, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       (13, 21, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       (13, 21, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       (13, 21, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       (13, 21, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       (13, 21, "PLLCONFIG_8"),
-        "DIVR_0":               (10, 21, "PLLCONFIG_1"),
-        "DIVR_1":               (10, 21, "PLLCONFIG_2"),
-        "DIVR_2":               (10, 21, "PLLCONFIG_3"),
-        "DIVR_3":               (10, 21, "PLLCONFIG_4"),
-        "DIVF_0":               (10, 21, "PLLCONFIG_5"),
-        "DIVF_1":               (10, 21, "PLLCONFIG_6"),
-        "DIVF_2":               (10, 21, "PLLCONFIG_7"),
-        "DIVF_3":               (10, 21, "PLLCONFIG_8"),
-        "DIVF_4":               (10, 21, "PLLCONFIG_9"),
-        "DIVF_5":               (11, 21, "PLLCONFIG_1"),
-        "DIVF_6":               (11, 21, "PLLCONFIG_2"),
-        "DIVQ_0":               (11, 21, "PLLCONFIG_3"),
-        "DIVQ_1":               (11, 21, "PLLCONFIG_4"),
-        "DIVQ_2":               (11, 21, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       (11, 21, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       (11, 21, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       (11, 21, "PLLCONFIG_8"),
-        "TEST_MODE":            (12, 21, "PLLCONFIG_8"),
-        "DELAY_ADJMODE_FB":     (13, 21, "PLLCONFIG_4"),
-        "DELAY_ADJMODE_REL":    (13, 21, "PLLCONFIG_9"),
-        "ENABLE_ICEGATE_PORTA": (14, 21, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": (14, 21, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        "PLLOUT_A":             ( 12, 21, 1),
-        "PLLOUT_B":             ( 13, 21, 0),
-        "REFERENCECLK":         ( 10, 21, "fabout"),
-        "EXTFEEDBACK":          ( 11, 21, "fabout"),
-        "DYNAMICDELAY_0":       (  1, 21, "fabout"),
-        "DYNAMICDELAY_1":       (  2, 21, "fabout"),
-        "DYNAMICDELAY_2":       (  3, 21, "fabout"),
-        "DYNAMICDELAY_3":       (  4, 21, "fabout"),
-        "DYNAMICDELAY_4":       (  5, 21, "fabout"),
-        "DYNAMICDELAY_5":       (  7, 21, "fabout"),
-        "DYNAMICDELAY_6":       (  8, 21, "fabout"),
-        "DYNAMICDELAY_7":       (  9, 21, "fabout"),
-        "LOCK":                 (  1, 20, "neigh_op_tnl_1"), #check?
-        "BYPASS":               ( 15, 21, "fabout"),
-        "RESETB":               ( 16, 21, "fabout"),
-        "LATCHINPUTVALUE":      ( 14, 21, "fabout"),
-        "SDO":                  ( 24, 20, "neigh_op_tnr_1"), #check?
-        "SDI":                  ( 18, 21, "fabout"),
-        "SCLK":                 ( 17, 21, "fabout"),
-    },
-    "8k_0": {
-        "LOC" : (16, 0),
-
-        # 3'b000 = "DISABLED"
-        # 3'b010 = "SB_PLL40_PAD"
-        # 3'b100 = "SB_PLL40_2_PAD"
-        # 3'b110 = "SB_PLL40_2F_PAD"
-        # 3'b011 = "SB_PLL40_CORE"
-        # 3'b111 = "SB_PLL40_2F_CORE"
-        "PLLTYPE_0":            ( 16, 0, "PLLCONFIG_5"),
-        "PLLTYPE_1":            ( 18, 0, "PLLCONFIG_1"),
-        "PLLTYPE_2":            ( 18, 0, "PLLCONFIG_3"),
-
-        # 3'b000 = "DELAY"
-        # 3'b001 = "SIMPLE"
-        # 3'b010 = "PHASE_AND_DELAY"
-        # 3'b110 = "EXTERNAL"
-        "FEEDBACK_PATH_0":      ( 18, 0, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      ( 15, 0, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      ( 16, 0, "PLLCONFIG_1"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
-        "DELAY_ADJMODE_FB":     ( 17, 0, "PLLCONFIG_4"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
-        "DELAY_ADJMODE_REL":    ( 17, 0, "PLLCONFIG_9"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_A_0":    ( 16, 0, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    ( 16, 0, "PLLCONFIG_7"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_B_0":    ( 16, 0, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    ( 16, 0, "PLLCONFIG_3"),
-
-        # Numeric Parameters
-        "SHIFTREG_DIV_MODE":    ( 16, 0, "PLLCONFIG_4"),
-        "FDA_FEEDBACK_0":       ( 16, 0, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       ( 17, 0, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       ( 17, 0, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       ( 17, 0, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       ( 17, 0, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       ( 17, 0, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       ( 17, 0, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       ( 17, 0, "PLLCONFIG_8"),
-        "DIVR_0":               ( 14, 0, "PLLCONFIG_1"),
-        "DIVR_1":               ( 14, 0, "PLLCONFIG_2"),
-        "DIVR_2":               ( 14, 0, "PLLCONFIG_3"),
-        "DIVR_3":               ( 14, 0, "PLLCONFIG_4"),
-        "DIVF_0":               ( 14, 0, "PLLCONFIG_5"),
-        "DIVF_1":               ( 14, 0, "PLLCONFIG_6"),
-        "DIVF_2":               ( 14, 0, "PLLCONFIG_7"),
-        "DIVF_3":               ( 14, 0, "PLLCONFIG_8"),
-        "DIVF_4":               ( 14, 0, "PLLCONFIG_9"),
-        "DIVF_5":               ( 15, 0, "PLLCONFIG_1"),
-        "DIVF_6":               ( 15, 0, "PLLCONFIG_2"),
-        "DIVQ_0":               ( 15, 0, "PLLCONFIG_3"),
-        "DIVQ_1":               ( 15, 0, "PLLCONFIG_4"),
-        "DIVQ_2":               ( 15, 0, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       ( 15, 0, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       ( 15, 0, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       ( 15, 0, "PLLCONFIG_8"),
-        "TEST_MODE":            ( 16, 0, "PLLCONFIG_8"),
-        "ENABLE_ICEGATE_PORTA": ( 18, 0, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": ( 18, 0, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        "PLLOUT_A":             ( 16, 0, 1),
-        "PLLOUT_B":             ( 17, 0, 0),
-        "REFERENCECLK":         ( 13, 0, "fabout"),
-        "EXTFEEDBACK":          ( 14, 0, "fabout"),
-        "DYNAMICDELAY_0":       (  5, 0, "fabout"),
-        "DYNAMICDELAY_1":       (  6, 0, "fabout"),
-        "DYNAMICDELAY_2":       (  7, 0, "fabout"),
-        "DYNAMICDELAY_3":       (  8, 0, "fabout"),
-        "DYNAMICDELAY_4":       (  9, 0, "fabout"),
-        "DYNAMICDELAY_5":       ( 10, 0, "fabout"),
-        "DYNAMICDELAY_6":       ( 11, 0, "fabout"),
-        "DYNAMICDELAY_7":       ( 12, 0, "fabout"),
-        "LOCK":                 (  1, 1, "neigh_op_bnl_1"),
-        "BYPASS":               ( 19, 0, "fabout"),
-        "RESETB":               ( 20, 0, "fabout"),
-        "LATCHINPUTVALUE":      ( 15, 0, "fabout"),
-        "SDO":                  ( 32, 1, "neigh_op_bnr_3"),
-        "SDI":                  ( 22, 0, "fabout"),
-        "SCLK":                 ( 21, 0, "fabout"),
-    },
-    "8k_1": {
-        "LOC" : (16, 33),
-
-        # 3'b000 = "DISABLED"
-        # 3'b010 = "SB_PLL40_PAD"
-        # 3'b100 = "SB_PLL40_2_PAD"
-        # 3'b110 = "SB_PLL40_2F_PAD"
-        # 3'b011 = "SB_PLL40_CORE"
-        # 3'b111 = "SB_PLL40_2F_CORE"
-        "PLLTYPE_0":            ( 16, 33, "PLLCONFIG_5"),
-        "PLLTYPE_1":            ( 18, 33, "PLLCONFIG_1"),
-        "PLLTYPE_2":            ( 18, 33, "PLLCONFIG_3"),
-
-        # 3'b000 = "DELAY"
-        # 3'b001 = "SIMPLE"
-        # 3'b010 = "PHASE_AND_DELAY"
-        # 3'b110 = "EXTERNAL"
-        "FEEDBACK_PATH_0":      ( 18, 33, "PLLCONFIG_5"),
-        "FEEDBACK_PATH_1":      ( 15, 33, "PLLCONFIG_9"),
-        "FEEDBACK_PATH_2":      ( 16, 33, "PLLCONFIG_1"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
-        "DELAY_ADJMODE_FB":     ( 17, 33, "PLLCONFIG_4"),
-
-        # 1'b0 = "FIXED"
-        # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
-        "DELAY_ADJMODE_REL":    ( 17, 33, "PLLCONFIG_9"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_A_0":    ( 16, 33, "PLLCONFIG_6"),
-        "PLLOUT_SELECT_A_1":    ( 16, 33, "PLLCONFIG_7"),
-
-        # 2'b00 = "GENCLK"
-        # 2'b01 = "GENCLK_HALF"
-        # 2'b10 = "SHIFTREG_90deg"
-        # 2'b11 = "SHIFTREG_0deg"
-        "PLLOUT_SELECT_B_0":    ( 16, 33, "PLLCONFIG_2"),
-        "PLLOUT_SELECT_B_1":    ( 16, 33, "PLLCONFIG_3"),
-
-        # Numeric Parameters
-        "SHIFTREG_DIV_MODE":    ( 16, 33, "PLLCONFIG_4"),
-        "FDA_FEEDBACK_0":       ( 16, 33, "PLLCONFIG_9"),
-        "FDA_FEEDBACK_1":       ( 17, 33, "PLLCONFIG_1"),
-        "FDA_FEEDBACK_2":       ( 17, 33, "PLLCONFIG_2"),
-        "FDA_FEEDBACK_3":       ( 17, 33, "PLLCONFIG_3"),
-        "FDA_RELATIVE_0":       ( 17, 33, "PLLCONFIG_5"),
-        "FDA_RELATIVE_1":       ( 17, 33, "PLLCONFIG_6"),
-        "FDA_RELATIVE_2":       ( 17, 33, "PLLCONFIG_7"),
-        "FDA_RELATIVE_3":       ( 17, 33, "PLLCONFIG_8"),
-        "DIVR_0":               ( 14, 33, "PLLCONFIG_1"),
-        "DIVR_1":               ( 14, 33, "PLLCONFIG_2"),
-        "DIVR_2":               ( 14, 33, "PLLCONFIG_3"),
-        "DIVR_3":               ( 14, 33, "PLLCONFIG_4"),
-        "DIVF_0":               ( 14, 33, "PLLCONFIG_5"),
-        "DIVF_1":               ( 14, 33, "PLLCONFIG_6"),
-        "DIVF_2":               ( 14, 33, "PLLCONFIG_7"),
-        "DIVF_3":               ( 14, 33, "PLLCONFIG_8"),
-        "DIVF_4":               ( 14, 33, "PLLCONFIG_9"),
-        "DIVF_5":               ( 15, 33, "PLLCONFIG_1"),
-        "DIVF_6":               ( 15, 33, "PLLCONFIG_2"),
-        "DIVQ_0":               ( 15, 33, "PLLCONFIG_3"),
-        "DIVQ_1":               ( 15, 33, "PLLCONFIG_4"),
-        "DIVQ_2":               ( 15, 33, "PLLCONFIG_5"),
-        "FILTER_RANGE_0":       ( 15, 33, "PLLCONFIG_6"),
-        "FILTER_RANGE_1":       ( 15, 33, "PLLCONFIG_7"),
-        "FILTER_RANGE_2":       ( 15, 33, "PLLCONFIG_8"),
-        "TEST_MODE":            ( 16, 33, "PLLCONFIG_8"),
-        "ENABLE_ICEGATE_PORTA": ( 18, 33, "PLLCONFIG_2"), # Controls global output only !
-        "ENABLE_ICEGATE_PORTB": ( 18, 33, "PLLCONFIG_4"), # Controls global output only !
-
-        # PLL Ports
-        "PLLOUT_A":             ( 16, 33, 1),
-        "PLLOUT_B":             ( 17, 33, 0),
-        "REFERENCECLK":         ( 13, 33, "fabout"),
-        "EXTFEEDBACK":          ( 14, 33, "fabout"),
-        "DYNAMICDELAY_0":       (  5, 33, "fabout"),
-        "DYNAMICDELAY_1":       (  6, 33, "fabout"),
-        "DYNAMICDELAY_2":       (  7, 33, "fabout"),
-        "DYNAMICDELAY_3":       (  8, 33, "fabout"),
-        "DYNAMICDELAY_4":       (  9, 33, "fabout"),
-        "DYNAMICDELAY_5":       ( 10, 33, "fabout"),
-        "DYNAMICDELAY_6":       ( 11, 33, "fabout"),
-        "DYNAMICDELAY_7":       ( 12, 33, "fabout"),
-        "LOCK":                 (  1, 32, "neigh_op_tnl_1"),
-        "BYPASS":               ( 19, 33, "fabout"),
-        "RESETB":               ( 20, 33, "fabout"),
-        "LATCHINPUTVALUE":      ( 15, 33, "fabout"),
-        "SDO":                  ( 32, 32, "neigh_op_tnr_1"),
-        "SDI":                  ( 22, 33, "fabout"),
-        "SCLK":                 ( 21, 33, "fabout"),
-    },
-}
+@db_loader("pllinfo_db")
+def load_pllinfo_db():
+    return {
+        "1k": {
+            "LOC" : (6, 0),
+
+            # 3'b000 = "DISABLED"
+            # 3'b010 = "SB_PLL40_PAD"
+            # 3'b100 = "SB_PLL40_2_PAD"
+            # 3'b110 = "SB_PLL40_2F_PAD"
+            # 3'b011 = "SB_PLL40_CORE"
+            # 3'b111 = "SB_PLL40_2F_CORE"
+            "PLLTYPE_0":            ( 0,  3, "PLLCONFIG_5"),
+            "PLLTYPE_1":            ( 0,  5, "PLLCONFIG_1"),
+            "PLLTYPE_2":            ( 0,  5, "PLLCONFIG_3"),
+
+            # 3'b000 = "DELAY"
+            # 3'b001 = "SIMPLE"
+            # 3'b010 = "PHASE_AND_DELAY"
+            # 3'b110 = "EXTERNAL"
+            "FEEDBACK_PATH_0":      ( 0,  5, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      ( 0,  2, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      ( 0,  3, "PLLCONFIG_1"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
+            "DELAY_ADJMODE_FB":     ( 0,  4, "PLLCONFIG_4"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
+            "DELAY_ADJMODE_REL":    ( 0,  4, "PLLCONFIG_9"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_A_0":    ( 0,  3, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    ( 0,  3, "PLLCONFIG_7"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_B_0":    ( 0,  3, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    ( 0,  3, "PLLCONFIG_3"),
+
+            # Numeric Parameters
+            "SHIFTREG_DIV_MODE":    ( 0,  3, "PLLCONFIG_4"),
+            "FDA_FEEDBACK_0":       ( 0,  3, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       ( 0,  4, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       ( 0,  4, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       ( 0,  4, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       ( 0,  4, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       ( 0,  4, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       ( 0,  4, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       ( 0,  4, "PLLCONFIG_8"),
+            "DIVR_0":               ( 0,  1, "PLLCONFIG_1"),
+            "DIVR_1":               ( 0,  1, "PLLCONFIG_2"),
+            "DIVR_2":               ( 0,  1, "PLLCONFIG_3"),
+            "DIVR_3":               ( 0,  1, "PLLCONFIG_4"),
+            "DIVF_0":               ( 0,  1, "PLLCONFIG_5"),
+            "DIVF_1":               ( 0,  1, "PLLCONFIG_6"),
+            "DIVF_2":               ( 0,  1, "PLLCONFIG_7"),
+            "DIVF_3":               ( 0,  1, "PLLCONFIG_8"),
+            "DIVF_4":               ( 0,  1, "PLLCONFIG_9"),
+            "DIVF_5":               ( 0,  2, "PLLCONFIG_1"),
+            "DIVF_6":               ( 0,  2, "PLLCONFIG_2"),
+            "DIVQ_0":               ( 0,  2, "PLLCONFIG_3"),
+            "DIVQ_1":               ( 0,  2, "PLLCONFIG_4"),
+            "DIVQ_2":               ( 0,  2, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       ( 0,  2, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       ( 0,  2, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       ( 0,  2, "PLLCONFIG_8"),
+            "TEST_MODE":            ( 0,  3, "PLLCONFIG_8"),
+            "ENABLE_ICEGATE_PORTA": ( 0,  5, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": ( 0,  5, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            "PLLOUT_A":             ( 6,  0, 1),
+            "PLLOUT_B":             ( 7,  0, 0),
+            "REFERENCECLK":         ( 0,  1, "fabout"),
+            "EXTFEEDBACK":          ( 0,  2, "fabout"),
+            "DYNAMICDELAY_0":       ( 0,  4, "fabout"),
+            "DYNAMICDELAY_1":       ( 0,  5, "fabout"),
+            "DYNAMICDELAY_2":       ( 0,  6, "fabout"),
+            "DYNAMICDELAY_3":       ( 0, 10, "fabout"),
+            "DYNAMICDELAY_4":       ( 0, 11, "fabout"),
+            "DYNAMICDELAY_5":       ( 0, 12, "fabout"),
+            "DYNAMICDELAY_6":       ( 0, 13, "fabout"),
+            "DYNAMICDELAY_7":       ( 0, 14, "fabout"),
+            "LOCK":                 ( 1,  1, "neigh_op_bnl_1"),
+            "BYPASS":               ( 1,  0, "fabout"),
+            "RESETB":               ( 2,  0, "fabout"),
+            "LATCHINPUTVALUE":      ( 5,  0, "fabout"),
+            "SDO":                  (12,  1, "neigh_op_bnr_3"),
+            "SDI":                  ( 4,  0, "fabout"),
+            "SCLK":                 ( 3,  0, "fabout"),
+        },
+        "lm4k": {
+            "LOC" : (12, 0),
+
+            # 3'b000 = "DISABLED"
+            # 3'b010 = "SB_PLL40_PAD"
+            # 3'b100 = "SB_PLL40_2_PAD"
+            # 3'b110 = "SB_PLL40_2F_PAD"
+            # 3'b011 = "SB_PLL40_CORE"
+            # 3'b111 = "SB_PLL40_2F_CORE"
+            "PLLTYPE_0":            (12,  0, "PLLCONFIG_5"),
+            "PLLTYPE_1":            (14,  0, "PLLCONFIG_1"),
+            "PLLTYPE_2":            (14,  0, "PLLCONFIG_3"),
+
+            # 3'b000 = "DELAY"
+            # 3'b001 = "SIMPLE"
+            # 3'b010 = "PHASE_AND_DELAY"
+            # 3'b110 = "EXTERNAL"
+            "FEEDBACK_PATH_0":      (14,  0, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      (11,  0, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      (12,  0, "PLLCONFIG_1"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
+            "DELAY_ADJMODE_FB":     (13,  0, "PLLCONFIG_4"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
+            "DELAY_ADJMODE_REL":    (13,  0, "PLLCONFIG_9"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_A_0":    (12,  0, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    (12,  0, "PLLCONFIG_7"),
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_B_0":    (12,  0, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    (12,  0, "PLLCONFIG_3"),
+
+            # Numeric Parameters
+            "SHIFTREG_DIV_MODE":    (12,  0, "PLLCONFIG_4"),
+            "FDA_FEEDBACK_0":       (12,  0, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       (13,  0, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       (13,  0, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       (13,  0, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       (13,  0, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       (13,  0, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       (13,  0, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       (13,  0, "PLLCONFIG_8"),
+            "DIVR_0":               (10,  0, "PLLCONFIG_1"),
+            "DIVR_1":               (10,  0, "PLLCONFIG_2"),
+            "DIVR_2":               (10,  0, "PLLCONFIG_3"),
+            "DIVR_3":               (10,  0, "PLLCONFIG_4"),
+            "DIVF_0":               (10,  0, "PLLCONFIG_5"),
+            "DIVF_1":               (10,  0, "PLLCONFIG_6"),
+            "DIVF_2":               (10,  0, "PLLCONFIG_7"),
+            "DIVF_3":               (10,  0, "PLLCONFIG_8"),
+            "DIVF_4":               (10,  0, "PLLCONFIG_9"),
+            "DIVF_5":               (11,  0, "PLLCONFIG_1"),
+            "DIVF_6":               (11,  0, "PLLCONFIG_2"),
+            "DIVQ_0":               (11,  0, "PLLCONFIG_3"),
+            "DIVQ_1":               (11,  0, "PLLCONFIG_4"),
+            "DIVQ_2":               (11,  0, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       (11,  0, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       (11,  0, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       (11,  0, "PLLCONFIG_8"),
+            "TEST_MODE":            (12,  0, "PLLCONFIG_8"),
+            "ENABLE_ICEGATE_PORTA": (14,  0, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": (14,  0, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            # TODO(awygle) confirm these
+            "PLLOUT_A":             ( 12,  0, 1), 
+            "PLLOUT_B":             ( 13,  0, 0), 
+            "REFERENCECLK":         ( 10,  0, "fabout"),
+            "EXTFEEDBACK":          ( 11,  0, "fabout"), 
+            "DYNAMICDELAY_0":       (  1,  0, "fabout"), 
+            "DYNAMICDELAY_1":       (  2,  0, "fabout"), 
+            "DYNAMICDELAY_2":       (  3,  0, "fabout"), 
+            "DYNAMICDELAY_3":       (  4,  0, "fabout"), 
+            "DYNAMICDELAY_4":       (  5,  0, "fabout"), 
+            "DYNAMICDELAY_5":       (  7,  0, "fabout"), 
+            "DYNAMICDELAY_6":       (  8,  0, "fabout"), 
+            "DYNAMICDELAY_7":       (  9,  0, "fabout"), 
+            "LOCK":                 (  1,  1, "neigh_op_bnl_1"), #check?
+            "BYPASS":               ( 15,  0, "fabout"),
+            "RESETB":               ( 16,  0, "fabout"),
+            "LATCHINPUTVALUE":      ( 14,  0, "fabout"),
+            "SDO":                  ( 24,  1, "neigh_op_bnr_3"), #check?
+            "SDI":                  ( 18,  0, "fabout"),
+            "SCLK":                 ( 17,  0, "fabout"),
+        },
+        "5k": {
+            "LOC" : (12, 31),
+
+            # 3'b000 = "DISABLED"
+            # 3'b010 = "SB_PLL40_PAD"
+            # 3'b100 = "SB_PLL40_2_PAD"
+            # 3'b110 = "SB_PLL40_2F_PAD"
+            # 3'b011 = "SB_PLL40_CORE"
+            # 3'b111 = "SB_PLL40_2F_CORE"
+            "PLLTYPE_0":            (12, 31, "PLLCONFIG_5"),
+            "PLLTYPE_1":            (14, 31, "PLLCONFIG_1"),
+            "PLLTYPE_2":            (14, 31, "PLLCONFIG_3"),
+
+            # 3'b000 = "DELAY"
+            # 3'b001 = "SIMPLE"
+            # 3'b010 = "PHASE_AND_DELAY"
+            # 3'b110 = "EXTERNAL"
+            "FEEDBACK_PATH_0":      (14, 31, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      (11, 31, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      (12, 31, "PLLCONFIG_1"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
+            "DELAY_ADJMODE_FB":     (13, 31, "PLLCONFIG_4"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
+            "DELAY_ADJMODE_REL":    (13, 31, "PLLCONFIG_9"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_A_0":    (12, 31, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    (12, 31, "PLLCONFIG_7"),
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_B_0":    (12, 31, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    (12, 31, "PLLCONFIG_3"),
+
+            # Numeric Parameters
+            "SHIFTREG_DIV_MODE_0":  (12, 31, "PLLCONFIG_4"),
+            "SHIFTREG_DIV_MODE_1":  (14, 31, "PLLCONFIG_6"),
+            "FDA_FEEDBACK_0":       (12, 31, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       (13, 31, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       (13, 31, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       (13, 31, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       (13, 31, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       (13, 31, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       (13, 31, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       (13, 31, "PLLCONFIG_8"),
+            "DIVR_0":               (10, 31, "PLLCONFIG_1"),
+            "DIVR_1":               (10, 31, "PLLCONFIG_2"),
+            "DIVR_2":               (10, 31, "PLLCONFIG_3"),
+            "DIVR_3":               (10, 31, "PLLCONFIG_4"),
+            "DIVF_0":               (10, 31, "PLLCONFIG_5"),
+            "DIVF_1":               (10, 31, "PLLCONFIG_6"),
+            "DIVF_2":               (10, 31, "PLLCONFIG_7"),
+            "DIVF_3":               (10, 31, "PLLCONFIG_8"),
+            "DIVF_4":               (10, 31, "PLLCONFIG_9"),
+            "DIVF_5":               (11, 31, "PLLCONFIG_1"),
+            "DIVF_6":               (11, 31, "PLLCONFIG_2"),
+            "DIVQ_0":               (11, 31, "PLLCONFIG_3"),
+            "DIVQ_1":               (11, 31, "PLLCONFIG_4"),
+            "DIVQ_2":               (11, 31, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       (11, 31, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       (11, 31, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       (11, 31, "PLLCONFIG_8"),
+            "TEST_MODE":            (12, 31, "PLLCONFIG_8"),
+            "ENABLE_ICEGATE_PORTA": (14, 31, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": (14, 31, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            "PLLOUT_A":             ( 12, 31, 1), 
+            "PLLOUT_B":             ( 13, 31, 0), 
+            "REFERENCECLK":         ( 10, 31, "fabout"),
+            "EXTFEEDBACK":          ( 11, 31, "fabout"), 
+            "DYNAMICDELAY_0":       (  1, 31, "fabout"), 
+            "DYNAMICDELAY_1":       (  2, 31, "fabout"), 
+            "DYNAMICDELAY_2":       (  3, 31, "fabout"), 
+            "DYNAMICDELAY_3":       (  4, 31, "fabout"), 
+            "DYNAMICDELAY_4":       (  5, 31, "fabout"), 
+            "DYNAMICDELAY_5":       (  7, 31, "fabout"), 
+            "DYNAMICDELAY_6":       (  8, 31, "fabout"), 
+            "DYNAMICDELAY_7":       (  9, 31, "fabout"), 
+            "LOCK":                 (  1, 30, "neigh_op_tnl_1"), #check?
+            "BYPASS":               ( 15, 31, "fabout"),
+            "RESETB":               ( 16, 31, "fabout"),
+            "LATCHINPUTVALUE":      ( 14, 31, "fabout"),
+            "SDO":                  ( 24, 30, "neigh_op_tnr_1"), #check?
+            "SDI":                  ( 18, 31, "fabout"),
+            "SCLK":                 ( 17, 31, "fabout"),
+        },
+        "u4k": {
+            "LOC" : (12, 21),
+
+            "PLLTYPE_1":            (14, 21, "PLLCONFIG_1"),
+            "PLLTYPE_2":            (14, 21, "PLLCONFIG_3"),
+            "PLLTYPE_0":            (12, 21, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_0":      (14, 21, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      (11, 21, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      (12, 21, "PLLCONFIG_1"),
+            "PLLOUT_SELECT_A_0":    (12, 21, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    (12, 21, "PLLCONFIG_7"),
+            "PLLOUT_SELECT_B_0":    (12, 21, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    (12, 21, "PLLCONFIG_3"),
+            "SHIFTREG_DIV_MODE":    (12, 21, "PLLCONFIG_4"),
+            "FDA_FEEDBACK_0":       (12, 21, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       (13, 21, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       (13, 21, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       (13, 21, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       (13, 21, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       (13, 21, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       (13, 21, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       (13, 21, "PLLCONFIG_8"),
+            "DIVR_0":               (10, 21, "PLLCONFIG_1"),
+            "DIVR_1":               (10, 21, "PLLCONFIG_2"),
+            "DIVR_2":               (10, 21, "PLLCONFIG_3"),
+            "DIVR_3":               (10, 21, "PLLCONFIG_4"),
+            "DIVF_0":               (10, 21, "PLLCONFIG_5"),
+            "DIVF_1":               (10, 21, "PLLCONFIG_6"),
+            "DIVF_2":               (10, 21, "PLLCONFIG_7"),
+            "DIVF_3":               (10, 21, "PLLCONFIG_8"),
+            "DIVF_4":               (10, 21, "PLLCONFIG_9"),
+            "DIVF_5":               (11, 21, "PLLCONFIG_1"),
+            "DIVF_6":               (11, 21, "PLLCONFIG_2"),
+            "DIVQ_0":               (11, 21, "PLLCONFIG_3"),
+            "DIVQ_1":               (11, 21, "PLLCONFIG_4"),
+            "DIVQ_2":               (11, 21, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       (11, 21, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       (11, 21, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       (11, 21, "PLLCONFIG_8"),
+            "TEST_MODE":            (12, 21, "PLLCONFIG_8"),
+            "DELAY_ADJMODE_FB":     (13, 21, "PLLCONFIG_4"),
+            "DELAY_ADJMODE_REL":    (13, 21, "PLLCONFIG_9"),
+            "ENABLE_ICEGATE_PORTA": (14, 21, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": (14, 21, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            "PLLOUT_A":             ( 12, 21, 1),
+            "PLLOUT_B":             ( 13, 21, 0),
+            "REFERENCECLK":         ( 10, 21, "fabout"),
+            "EXTFEEDBACK":          ( 11, 21, "fabout"),
+            "DYNAMICDELAY_0":       (  1, 21, "fabout"),
+            "DYNAMICDELAY_1":       (  2, 21, "fabout"),
+            "DYNAMICDELAY_2":       (  3, 21, "fabout"),
+            "DYNAMICDELAY_3":       (  4, 21, "fabout"),
+            "DYNAMICDELAY_4":       (  5, 21, "fabout"),
+            "DYNAMICDELAY_5":       (  7, 21, "fabout"),
+            "DYNAMICDELAY_6":       (  8, 21, "fabout"),
+            "DYNAMICDELAY_7":       (  9, 21, "fabout"),
+            "LOCK":                 (  1, 20, "neigh_op_tnl_1"), #check?
+            "BYPASS":               ( 15, 21, "fabout"),
+            "RESETB":               ( 16, 21, "fabout"),
+            "LATCHINPUTVALUE":      ( 14, 21, "fabout"),
+            "SDO":                  ( 24, 20, "neigh_op_tnr_1"), #check?
+            "SDI":                  ( 18, 21, "fabout"),
+            "SCLK":                 ( 17, 21, "fabout"),
+        },
+        "8k_0": {
+            "LOC" : (16, 0),
+
+            # 3'b000 = "DISABLED"
+            # 3'b010 = "SB_PLL40_PAD"
+            # 3'b100 = "SB_PLL40_2_PAD"
+            # 3'b110 = "SB_PLL40_2F_PAD"
+            # 3'b011 = "SB_PLL40_CORE"
+            # 3'b111 = "SB_PLL40_2F_CORE"
+            "PLLTYPE_0":            ( 16, 0, "PLLCONFIG_5"),
+            "PLLTYPE_1":            ( 18, 0, "PLLCONFIG_1"),
+            "PLLTYPE_2":            ( 18, 0, "PLLCONFIG_3"),
+
+            # 3'b000 = "DELAY"
+            # 3'b001 = "SIMPLE"
+            # 3'b010 = "PHASE_AND_DELAY"
+            # 3'b110 = "EXTERNAL"
+            "FEEDBACK_PATH_0":      ( 18, 0, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      ( 15, 0, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      ( 16, 0, "PLLCONFIG_1"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
+            "DELAY_ADJMODE_FB":     ( 17, 0, "PLLCONFIG_4"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
+            "DELAY_ADJMODE_REL":    ( 17, 0, "PLLCONFIG_9"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_A_0":    ( 16, 0, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    ( 16, 0, "PLLCONFIG_7"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_B_0":    ( 16, 0, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    ( 16, 0, "PLLCONFIG_3"),
+
+            # Numeric Parameters
+            "SHIFTREG_DIV_MODE":    ( 16, 0, "PLLCONFIG_4"),
+            "FDA_FEEDBACK_0":       ( 16, 0, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       ( 17, 0, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       ( 17, 0, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       ( 17, 0, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       ( 17, 0, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       ( 17, 0, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       ( 17, 0, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       ( 17, 0, "PLLCONFIG_8"),
+            "DIVR_0":               ( 14, 0, "PLLCONFIG_1"),
+            "DIVR_1":               ( 14, 0, "PLLCONFIG_2"),
+            "DIVR_2":               ( 14, 0, "PLLCONFIG_3"),
+            "DIVR_3":               ( 14, 0, "PLLCONFIG_4"),
+            "DIVF_0":               ( 14, 0, "PLLCONFIG_5"),
+            "DIVF_1":               ( 14, 0, "PLLCONFIG_6"),
+            "DIVF_2":               ( 14, 0, "PLLCONFIG_7"),
+            "DIVF_3":               ( 14, 0, "PLLCONFIG_8"),
+            "DIVF_4":               ( 14, 0, "PLLCONFIG_9"),
+            "DIVF_5":               ( 15, 0, "PLLCONFIG_1"),
+            "DIVF_6":               ( 15, 0, "PLLCONFIG_2"),
+            "DIVQ_0":               ( 15, 0, "PLLCONFIG_3"),
+            "DIVQ_1":               ( 15, 0, "PLLCONFIG_4"),
+            "DIVQ_2":               ( 15, 0, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       ( 15, 0, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       ( 15, 0, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       ( 15, 0, "PLLCONFIG_8"),
+            "TEST_MODE":            ( 16, 0, "PLLCONFIG_8"),
+            "ENABLE_ICEGATE_PORTA": ( 18, 0, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": ( 18, 0, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            "PLLOUT_A":             ( 16, 0, 1),
+            "PLLOUT_B":             ( 17, 0, 0),
+            "REFERENCECLK":         ( 13, 0, "fabout"),
+            "EXTFEEDBACK":          ( 14, 0, "fabout"),
+            "DYNAMICDELAY_0":       (  5, 0, "fabout"),
+            "DYNAMICDELAY_1":       (  6, 0, "fabout"),
+            "DYNAMICDELAY_2":       (  7, 0, "fabout"),
+            "DYNAMICDELAY_3":       (  8, 0, "fabout"),
+            "DYNAMICDELAY_4":       (  9, 0, "fabout"),
+            "DYNAMICDELAY_5":       ( 10, 0, "fabout"),
+            "DYNAMICDELAY_6":       ( 11, 0, "fabout"),
+            "DYNAMICDELAY_7":       ( 12, 0, "fabout"),
+            "LOCK":                 (  1, 1, "neigh_op_bnl_1"),
+            "BYPASS":               ( 19, 0, "fabout"),
+            "RESETB":               ( 20, 0, "fabout"),
+            "LATCHINPUTVALUE":      ( 15, 0, "fabout"),
+            "SDO":                  ( 32, 1, "neigh_op_bnr_3"),
+            "SDI":                  ( 22, 0, "fabout"),
+            "SCLK":                 ( 21, 0, "fabout"),
+        },
+        "8k_1": {
+            "LOC" : (16, 33),
+
+            # 3'b000 = "DISABLED"
+            # 3'b010 = "SB_PLL40_PAD"
+            # 3'b100 = "SB_PLL40_2_PAD"
+            # 3'b110 = "SB_PLL40_2F_PAD"
+            # 3'b011 = "SB_PLL40_CORE"
+            # 3'b111 = "SB_PLL40_2F_CORE"
+            "PLLTYPE_0":            ( 16, 33, "PLLCONFIG_5"),
+            "PLLTYPE_1":            ( 18, 33, "PLLCONFIG_1"),
+            "PLLTYPE_2":            ( 18, 33, "PLLCONFIG_3"),
+
+            # 3'b000 = "DELAY"
+            # 3'b001 = "SIMPLE"
+            # 3'b010 = "PHASE_AND_DELAY"
+            # 3'b110 = "EXTERNAL"
+            "FEEDBACK_PATH_0":      ( 18, 33, "PLLCONFIG_5"),
+            "FEEDBACK_PATH_1":      ( 15, 33, "PLLCONFIG_9"),
+            "FEEDBACK_PATH_2":      ( 16, 33, "PLLCONFIG_1"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_FEEDBACK=4'b1111)
+            "DELAY_ADJMODE_FB":     ( 17, 33, "PLLCONFIG_4"),
+
+            # 1'b0 = "FIXED"
+            # 1'b1 = "DYNAMIC" (also set FDA_RELATIVE=4'b1111)
+            "DELAY_ADJMODE_REL":    ( 17, 33, "PLLCONFIG_9"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_A_0":    ( 16, 33, "PLLCONFIG_6"),
+            "PLLOUT_SELECT_A_1":    ( 16, 33, "PLLCONFIG_7"),
+
+            # 2'b00 = "GENCLK"
+            # 2'b01 = "GENCLK_HALF"
+            # 2'b10 = "SHIFTREG_90deg"
+            # 2'b11 = "SHIFTREG_0deg"
+            "PLLOUT_SELECT_B_0":    ( 16, 33, "PLLCONFIG_2"),
+            "PLLOUT_SELECT_B_1":    ( 16, 33, "PLLCONFIG_3"),
+
+            # Numeric Parameters
+            "SHIFTREG_DIV_MODE":    ( 16, 33, "PLLCONFIG_4"),
+            "FDA_FEEDBACK_0":       ( 16, 33, "PLLCONFIG_9"),
+            "FDA_FEEDBACK_1":       ( 17, 33, "PLLCONFIG_1"),
+            "FDA_FEEDBACK_2":       ( 17, 33, "PLLCONFIG_2"),
+            "FDA_FEEDBACK_3":       ( 17, 33, "PLLCONFIG_3"),
+            "FDA_RELATIVE_0":       ( 17, 33, "PLLCONFIG_5"),
+            "FDA_RELATIVE_1":       ( 17, 33, "PLLCONFIG_6"),
+            "FDA_RELATIVE_2":       ( 17, 33, "PLLCONFIG_7"),
+            "FDA_RELATIVE_3":       ( 17, 33, "PLLCONFIG_8"),
+            "DIVR_0":               ( 14, 33, "PLLCONFIG_1"),
+            "DIVR_1":               ( 14, 33, "PLLCONFIG_2"),
+            "DIVR_2":               ( 14, 33, "PLLCONFIG_3"),
+            "DIVR_3":               ( 14, 33, "PLLCONFIG_4"),
+            "DIVF_0":               ( 14, 33, "PLLCONFIG_5"),
+            "DIVF_1":               ( 14, 33, "PLLCONFIG_6"),
+            "DIVF_2":               ( 14, 33, "PLLCONFIG_7"),
+            "DIVF_3":               ( 14, 33, "PLLCONFIG_8"),
+            "DIVF_4":               ( 14, 33, "PLLCONFIG_9"),
+            "DIVF_5":               ( 15, 33, "PLLCONFIG_1"),
+            "DIVF_6":               ( 15, 33, "PLLCONFIG_2"),
+            "DIVQ_0":               ( 15, 33, "PLLCONFIG_3"),
+            "DIVQ_1":               ( 15, 33, "PLLCONFIG_4"),
+            "DIVQ_2":               ( 15, 33, "PLLCONFIG_5"),
+            "FILTER_RANGE_0":       ( 15, 33, "PLLCONFIG_6"),
+            "FILTER_RANGE_1":       ( 15, 33, "PLLCONFIG_7"),
+            "FILTER_RANGE_2":       ( 15, 33, "PLLCONFIG_8"),
+            "TEST_MODE":            ( 16, 33, "PLLCONFIG_8"),
+            "ENABLE_ICEGATE_PORTA": ( 18, 33, "PLLCONFIG_2"), # Controls global output only !
+            "ENABLE_ICEGATE_PORTB": ( 18, 33, "PLLCONFIG_4"), # Controls global output only !
+
+            # PLL Ports
+            "PLLOUT_A":             ( 16, 33, 1),
+            "PLLOUT_B":             ( 17, 33, 0),
+            "REFERENCECLK":         ( 13, 33, "fabout"),
+            "EXTFEEDBACK":          ( 14, 33, "fabout"),
+            "DYNAMICDELAY_0":       (  5, 33, "fabout"),
+            "DYNAMICDELAY_1":       (  6, 33, "fabout"),
+            "DYNAMICDELAY_2":       (  7, 33, "fabout"),
+            "DYNAMICDELAY_3":       (  8, 33, "fabout"),
+            "DYNAMICDELAY_4":       (  9, 33, "fabout"),
+            "DYNAMICDELAY_5":       ( 10, 33, "fabout"),
+            "DYNAMICDELAY_6":       ( 11, 33, "fabout"),
+            "DYNAMICDELAY_7":       ( 12, 33, "fabout"),
+            "LOCK":                 (  1, 32, "neigh_op_tnl_1"),
+            "BYPASS":               ( 19, 33, "fabout"),
+            "RESETB":               ( 20, 33, "fabout"),
+            "LATCHINPUTVALUE":      ( 15, 33, "fabout"),
+            "SDO":                  ( 32, 32, "neigh_op_tnr_1"),
+            "SDI":                  ( 22, 33, "fabout"),
+            "SCLK":                 ( 21, 33, "fabout"),
+        },
+    }
 
 padin_pio_db = {
     "1k": [
@@ -2833,2395 +4714,2397 @@ ieren_db = {
 # This dictionary maps package variants to a table of pin names and their
 # corresponding grid location (x, y, block). This is most easily found through
 # the package view in iCEcube2 by hovering the mouse over each pin.
-pinloc_db = {
-    "1k-swg16tr": [
-        ( "A2",  6, 17, 1),
-        ( "A4",  2, 17, 0),
-        ( "B1", 11, 17, 1),
-        ( "B2",  0,  8, 1),
-        ( "B3",  0,  9, 0),
-        ( "C1", 12,  0, 0),
-        ( "C2", 11,  0, 1),
-        ( "C3", 11,  0, 0),
-        ( "D1", 12,  0, 1),
-        ( "D3",  6,  0, 1),
-    ],
-    "1k-cm36": [
-        ( "A1",  0, 13, 0),
-        ( "A2",  4, 17, 1),
-        ( "A3",  7, 17, 0),
-        ( "B1",  0, 13, 1),
-        ( "B3",  6, 17, 1),
-        ( "B4", 13,  9, 0),
-        ( "B5", 13, 11, 0),
-        ( "B6", 13, 11, 1),
-        ( "C1",  0,  9, 0),
-        ( "C2",  0,  9, 1),
-        ( "C3",  4, 17, 0),
-        ( "C5", 13,  8, 1),
-        ( "C6", 13, 12, 0),
-        ( "D1",  0,  8, 1),
-        ( "D5", 12,  0, 1),
-        ( "D6", 13,  6, 0),
-        ( "E1",  0,  8, 0),
-        ( "E2",  6,  0, 0),
-        ( "E3", 10,  0, 0),
-        ( "E4", 11,  0, 0),
-        ( "E5", 12,  0, 0),
-        ( "E6", 13,  4, 1),
-        ( "F2",  6,  0, 1),
-        ( "F3", 10,  0, 1),
-        ( "F5", 11,  0, 1),
-    ],
-    "1k-cm49": [
-        ( "A1",  0, 11, 1),
-        ( "A2",  3, 17, 1),
-        ( "A3",  8, 17, 1),
-        ( "A4",  8, 17, 0),
-        ( "A5",  9, 17, 1),
-        ( "A6", 10, 17, 0),
-        ( "A7",  9, 17, 0),
-        ( "B1",  0, 11, 0),
-        ( "B2",  0, 13, 0),
-        ( "B3",  4, 17, 0),
-        ( "B4",  6, 17, 1),
-        ( "C1",  0,  5, 0),
-        ( "C2",  0, 13, 1),
-        ( "C4",  7, 17, 0),
-        ( "C5", 13, 12, 0),
-        ( "C6", 13, 11, 1),
-        ( "C7", 13, 11, 0),
-        ( "D1",  0,  5, 1),
-        ( "D2",  0,  9, 0),
-        ( "D3",  0,  9, 1),
-        ( "D4",  4, 17, 1),
-        ( "D6", 13,  8, 1),
-        ( "D7", 13,  9, 0),
-        ( "E2",  0,  8, 1),
-        ( "E6", 12,  0, 1),
-        ( "E7", 13,  4, 1),
-        ( "F2",  0,  8, 0),
-        ( "F3",  6,  0, 0),
-        ( "F4", 10,  0, 0),
-        ( "F5", 11,  0, 0),
-        ( "F6", 12,  0, 0),
-        ( "F7", 13,  6, 0),
-        ( "G3",  6,  0, 1),
-        ( "G4", 10,  0, 1),
-        ( "G6", 11,  0, 1),
-    ],
-    "1k-cm81": [
-        ( "A1",  1, 17, 1),
-        ( "A2",  4, 17, 0),
-        ( "A3",  5, 17, 0),
-        ( "A4",  6, 17, 0),
-        ( "A6",  8, 17, 1),
-        ( "A7",  9, 17, 0),
-        ( "A8", 10, 17, 0),
-        ( "A9", 13, 14, 1),
-        ( "B1",  0, 13, 0),
-        ( "B2",  0, 14, 0),
-        ( "B3",  2, 17, 1),
-        ( "B4",  4, 17, 1),
-        ( "B5",  8, 17, 0),
-        ( "B6",  9, 17, 1),
-        ( "B7", 10, 17, 1),
-        ( "B8", 11, 17, 0),
-        ( "B9", 13, 11, 1),
-        ( "C1",  0, 13, 1),
-        ( "C2",  0, 14, 1),
-        ( "C3",  0, 12, 1),
-        ( "C4",  6, 17, 1),
-        ( "C5",  7, 17, 0),
-        ( "C9", 13, 12, 0),
-        ( "D1",  0, 11, 1),
-        ( "D2",  0, 12, 0),
-        ( "D3",  0,  9, 0),
-        ( "D5",  3, 17, 1),
-        ( "D6", 13,  6, 0),
-        ( "D7", 13,  7, 0),
-        ( "D8", 13,  9, 0),
-        ( "D9", 13, 11, 0),
-        ( "E1",  0, 10, 1),
-        ( "E2",  0, 10, 0),
-        ( "E3",  0,  8, 1),
-        ( "E4",  0, 11, 0),
-        ( "E5",  5, 17, 1),
-        ( "E7", 13,  6, 1),
-        ( "E8", 13,  8, 1),
-        ( "F1",  0,  8, 0),
-        ( "F3",  0,  9, 1),
-        ( "F7", 12,  0, 1),
-        ( "F8", 13,  4, 0),
-        ( "G1",  0,  5, 1),
-        ( "G3",  0,  5, 0),
-        ( "G4",  6,  0, 0),
-        ( "G5", 10,  0, 0),
-        ( "G6", 11,  0, 0),
-        ( "G7", 12,  0, 0),
-        ( "G8", 13,  4, 1),
-        ( "G9", 13,  2, 1),
-        ( "H1",  2,  0, 0),
-        ( "H4",  6,  0, 1),
-        ( "H5", 10,  0, 1),
-        ( "H7", 11,  0, 1),
-        ( "H9", 13,  2, 0),
-        ( "J1",  3,  0, 0),
-        ( "J2",  2,  0, 1),
-        ( "J3",  3,  0, 1),
-        ( "J4",  5,  0, 0),
-        ( "J6",  7,  0, 0),
-        ( "J7",  9,  0, 1),
-        ( "J8", 13,  1, 0),
-        ( "J9", 13,  1, 1),
-    ],
-    "1k-cm121": [
-        ( "A1",  0, 14, 0),
-        ( "A2",  2, 17, 1),
-        ( "A3",  3, 17, 0),
-        ( "A5",  5, 17, 1),
-        ( "A7",  8, 17, 0),
-        ( "A8", 10, 17, 1),
-        ( "A9", 11, 17, 0),
-        ("A10", 12, 17, 0),
-        ("A11", 13, 15, 0),
-        ( "B1",  0, 13, 0),
-        ( "B2",  1, 17, 1),
-        ( "B3",  2, 17, 0),
-        ( "B4",  3, 17, 1),
-        ( "B5",  4, 17, 1),
-        ( "B7",  9, 17, 0),
-        ( "B8", 11, 17, 1),
-        ( "B9", 12, 17, 1),
-        ("B10", 13, 15, 1),
-        ("B11", 13, 14, 1),
-        ( "C1",  0, 12, 0),
-        ( "C2",  0, 13, 1),
-        ( "C3",  0, 14, 1),
-        ( "C4",  1, 17, 0),
-        ( "C5",  4, 17, 0),
-        ( "C6",  7, 17, 1),
-        ( "C7",  8, 17, 1),
-        ( "C8",  9, 17, 1),
-        ( "C9", 10, 17, 0),
-        ("C10", 13, 14, 0),
-        ("C11", 13, 13, 1),
-        ( "D1",  0, 11, 0),
-        ( "D2",  0, 12, 1),
-        ( "D3",  0, 11, 1),
-        ( "D4",  0, 10, 1),
-        ( "D5",  6, 17, 1),
-        ( "D6",  7, 17, 0),
-        ("D10", 13, 12, 1),
-        ("D11", 13, 11, 1),
-        ( "E2",  0, 10, 0),
-        ( "E3",  0,  9, 1),
-        ( "E4",  0,  9, 0),
-        ( "E6",  5, 17, 0),
-        ( "E7", 13, 12, 0),
-        ( "E8", 13, 13, 0),
-        ( "E9", 13,  9, 0),
-        ("E10", 13,  9, 1),
-        ( "F2",  0,  6, 0),
-        ( "F3",  0,  5, 0),
-        ( "F4",  0,  8, 1),
-        ( "F5",  0,  8, 0),
-        ( "F6",  6, 17, 0),
-        ( "F8", 13, 11, 0),
-        ( "F9", 13,  8, 1),
-        ("F11", 13,  7, 1),
-        ( "G2",  0,  5, 1),
-        ( "G4",  0,  3, 0),
-        ( "G8", 12,  0, 1),
-        ( "G9", 13,  8, 0),
-        ("G11", 13,  7, 0),
-        ( "H1",  0,  6, 1),
-        ( "H2",  0,  4, 1),
-        ( "H4",  0,  2, 0),
-        ( "H5",  6,  0, 0),
-        ( "H6", 10,  0, 0),
-        ( "H7", 11,  0, 0),
-        ( "H8", 12,  0, 0),
-        ( "H9", 13,  6, 1),
-        ("H10", 13,  2, 1),
-        ("H11", 13,  4, 1),
-        ( "J1",  0,  4, 0),
-        ( "J2",  1,  0, 1),
-        ( "J5",  6,  0, 1),
-        ( "J6", 10,  0, 1),
-        ( "J8", 11,  0, 1),
-        ("J10", 13,  2, 0),
-        ("J11", 13,  6, 0),
-        ( "K1",  0,  3, 1),
-        ( "K2",  2,  0, 0),
-        ( "K3",  2,  0, 1),
-        ( "K4",  4,  0, 0),
-        ( "K5",  5,  0, 0),
-        ( "K7",  7,  0, 1),
-        ( "K8",  9,  0, 0),
-        ( "K9", 13,  1, 0),
-        ("K10", 13,  1, 1),
-        ("K11", 13,  3, 1),
-        ( "L1",  0,  2, 1),
-        ( "L2",  3,  0, 0),
-        ( "L3",  3,  0, 1),
-        ( "L4",  4,  0, 1),
-        ( "L5",  7,  0, 0),
-        ( "L7",  8,  0, 0),
-        ( "L9",  8,  0, 1),
-        ("L10",  9,  0, 1),
-        ("L11", 13,  4, 0),
-    ],
-    "1k-cb81": [
-        ( "A2",  2, 17, 1),
-        ( "A3",  3, 17, 1),
-        ( "A4",  6, 17, 1),
-        ( "A7", 11, 17, 0),
-        ( "A8", 12, 17, 1),
-        ( "B1",  0, 13, 1),
-        ( "B2",  0, 14, 0),
-        ( "B3",  0, 13, 0),
-        ( "B4",  5, 17, 1),
-        ( "B5",  8, 17, 1),
-        ( "B6",  9, 17, 1),
-        ( "B7", 11, 17, 1),
-        ( "B8", 12, 17, 0),
-        ( "C1",  0, 12, 0),
-        ( "C2",  0, 10, 0),
-        ( "C3",  0, 14, 1),
-        ( "C4",  1, 17, 1),
-        ( "C5",  8, 17, 0),
-        ( "C6", 10, 17, 0),
-        ( "C7", 13, 15, 0),
-        ( "C8", 13, 15, 1),
-        ( "C9", 13, 14, 1),
-        ( "D1",  0,  9, 0),
-        ( "D2",  0, 10, 1),
-        ( "D3",  0, 12, 1),
-        ( "D4",  5, 17, 0),
-        ( "D5",  4, 17, 0),
-        ( "D6",  7, 17, 0),
-        ( "D7", 13, 13, 0),
-        ( "D8", 13, 13, 1),
-        ( "E1",  0,  8, 1),
-        ( "E2",  0,  8, 0),
-        ( "E3",  0,  9, 1),
-        ( "E6", 10, 17, 1),
-        ( "E7", 13, 12, 0),
-        ( "E8", 13, 11, 0),
-        ( "E9", 13, 11, 1),
-        ( "F2",  0,  6, 1),
-        ( "F3",  0,  6, 0),
-        ( "F6", 13,  8, 0),
-        ( "F7", 13,  9, 0),
-        ( "F8", 13,  8, 1),
-        ( "F9", 13,  7, 1),
-        ( "G1",  0,  4, 1),
-        ( "G2",  0,  2, 1),
-        ( "G3",  3,  0, 1),
-        ( "G4",  4,  0, 0),
-        ( "G5", 10,  0, 0),
-        ( "G6", 13,  4, 0),
-        ( "G7", 13,  4, 1),
-        ( "G8", 13,  6, 1),
-        ( "G9", 13,  7, 0),
-        ( "H2",  0,  4, 0),
-        ( "H3",  2,  0, 1),
-        ( "H4",  6,  0, 0),
-        ( "H5", 10,  0, 1),
-        ( "H7", 11,  0, 0),
-        ( "H8", 12,  0, 1),
-        ( "J2",  2,  0, 0),
-        ( "J3",  6,  0, 1),
-        ( "J7", 11,  0, 1),
-        ( "J8", 12,  0, 0),
-    ],
-    "1k-cb121": [
-        ( "A2",  1, 17, 1),
-        ( "A3",  2, 17, 0),
-        ( "A4",  4, 17, 0),
-        ( "A5",  3, 17, 1),
-        ( "A6",  4, 17, 1),
-        ( "A8", 10, 17, 0),
-        ("A10", 12, 17, 1),
-        ("A11", 13, 15, 0),
-        ( "B1",  0, 14, 0),
-        ( "B3",  1, 17, 0),
-        ( "B4",  2, 17, 1),
-        ( "B5",  3, 17, 0),
-        ( "B8", 10, 17, 1),
-        ( "B9", 12, 17, 0),
-        ("B11", 13, 15, 1),
-        ( "C1",  0, 14, 1),
-        ( "C2",  0, 11, 1),
-        ( "C3",  0, 13, 1),
-        ( "C4",  0, 13, 0),
-        ( "C5",  5, 17, 0),
-        ( "C6",  7, 17, 0),
-        ( "C7",  8, 17, 1),
-        ( "C8", 11, 17, 0),
-        ( "C9", 11, 17, 1),
-        ("C11", 13, 14, 1),
-        ( "D1",  0, 10, 1),
-        ( "D2",  0, 11, 0),
-        ( "D3",  0,  9, 0),
-        ( "D4",  0, 12, 0),
-        ( "D5",  5, 17, 1),
-        ( "D6",  6, 17, 1),
-        ( "D7",  8, 17, 0),
-        ( "D8", 13, 12, 0),
-        ( "D9", 13, 13, 0),
-        ("D10", 13, 13, 1),
-        ("D11", 13, 14, 0),
-        ( "E2",  0, 10, 0),
-        ( "E3",  0,  9, 1),
-        ( "E4",  0, 12, 1),
-        ( "E5",  6, 17, 0),
-        ( "E6",  7, 17, 1),
-        ( "E7",  9, 17, 0),
-        ( "E8", 13, 11, 0),
-        ( "E9", 13, 11, 1),
-        ("E11", 13, 12, 1),
-        ( "F2",  0,  6, 1),
-        ( "F3",  0,  5, 1),
-        ( "F4",  0,  8, 1),
-        ( "F7",  9, 17, 1),
-        ( "F8", 13,  8, 1),
-        ( "F9", 13,  9, 0),
-        ("F10", 13,  9, 1),
-        ( "G1",  0,  6, 0),
-        ( "G3",  0,  5, 0),
-        ( "G4",  0,  8, 0),
-        ( "G7", 13,  6, 1),
-        ( "G8", 13,  7, 0),
-        ( "G9", 13,  7, 1),
-        ("G10", 13,  8, 0),
-        ( "H1",  0,  3, 1),
-        ( "H2",  0,  4, 1),
-        ( "H3",  0,  4, 0),
-        ( "H4",  4,  0, 0),
-        ( "H5",  4,  0, 1),
-        ( "H6", 10,  0, 0),
-        ( "H7", 13,  4, 1),
-        ( "H8", 13,  6, 0),
-        ( "H9", 13,  4, 0),
-        ("H10", 13,  3, 1),
-        ("H11",  9,  0, 1),
-        ( "J1",  0,  3, 0),
-        ( "J2",  0,  2, 0),
-        ( "J3",  0,  2, 1),
-        ( "J4",  2,  0, 1),
-        ( "J5",  3,  0, 0),
-        ( "J6", 10,  0, 1),
-        ( "J8", 11,  0, 0),
-        ( "J9", 12,  0, 1),
-        ("J11",  8,  0, 1),
-        ( "K3",  1,  0, 0),
-        ( "K4",  1,  0, 1),
-        ( "K8", 11,  0, 1),
-        ( "K9", 12,  0, 0),
-        ("K11",  9,  0, 0),
-        ( "L2",  2,  0, 0),
-        ( "L3",  3,  0, 1),
-        ( "L4",  5,  0, 0),
-        ( "L5",  5,  0, 1),
-        ( "L8",  7,  0, 0),
-        ( "L9",  6,  0, 1),
-        ("L10",  7,  0, 1),
-        ("L11",  8,  0, 0),
-    ],
-    "1k-cb132": [
-        ( "A1",  1, 17, 1),
-        ( "A2",  2, 17, 1),
-        ( "A4",  4, 17, 0),
-        ( "A5",  4, 17, 1),
-        ( "A6",  6, 17, 1),
-        ( "A7",  7, 17, 0),
-        ("A10", 10, 17, 0),
-        ("A12", 12, 17, 0),
-        ( "B1",  0, 14, 1),
-        ("B14", 13, 15, 0),
-        ( "C1",  0, 14, 0),
-        ( "C3",  0, 13, 1),
-        ( "C4",  1, 17, 0),
-        ( "C5",  3, 17, 0),
-        ( "C6",  5, 17, 0),
-        ( "C7",  6, 17, 0),
-        ( "C8",  8, 17, 0),
-        ( "C9",  9, 17, 0),
-        ("C10", 11, 17, 0),
-        ("C11", 11, 17, 1),
-        ("C12", 12, 17, 1),
-        ("C14", 13, 14, 0),
-        ( "D1",  0, 11, 1),
-        ( "D3",  0, 13, 0),
-        ( "D4",  0, 12, 1),
-        ( "D5",  2, 17, 0),
-        ( "D6",  3, 17, 1),
-        ( "D7",  5, 17, 1),
-        ( "D8",  7, 17, 1),
-        ( "D9",  8, 17, 1),
-        ("D10",  9, 17, 1),
-        ("D11", 10, 17, 1),
-        ("D12", 13, 15, 1),
-        ("D14", 13, 13, 1),
-        ( "E1",  0, 11, 0),
-        ( "E4",  0, 12, 0),
-        ("E11", 13, 14, 1),
-        ("E12", 13, 13, 0),
-        ("E14", 13, 12, 0),
-        ( "F3",  0, 10, 0),
-        ( "F4",  0, 10, 1),
-        ("F11", 13, 12, 1),
-        ("F12", 13, 11, 1),
-        ("F14", 13,  8, 1),
-        ( "G1",  0,  8, 1),
-        ( "G3",  0,  8, 0),
-        ( "G4",  0,  6, 1),
-        ("G11", 13, 11, 0),
-        ("G12", 13,  9, 1),
-        ("G14", 13,  9, 0),
-        ( "H1",  0,  9, 0),
-        ( "H3",  0,  9, 1),
-        ( "H4",  0,  6, 0),
-        ("H11", 13,  8, 0),
-        ("H12", 13,  7, 1),
-        ( "J1",  0,  5, 1),
-        ( "J3",  0,  5, 0),
-        ("J11", 13,  7, 0),
-        ("J12", 13,  6, 1),
-        ( "K3",  0,  3, 0),
-        ( "K4",  0,  3, 1),
-        ("K11", 13,  4, 1),
-        ("K12", 13,  4, 0),
-        ("K14", 13,  6, 0),
-        ( "L1",  0,  2, 0),
-        ( "L4",  1,  0, 1),
-        ( "L5",  3,  0, 1),
-        ( "L6",  4,  0, 1),
-        ( "L7",  8,  0, 0),
-        ( "L8",  9,  0, 0),
-        ( "L9", 10,  0, 0),
-        ("L12", 13,  2, 0),
-        ("L14", 13,  3, 1),
-        ( "M1",  0,  2, 1),
-        ( "M3",  1,  0, 0),
-        ( "M4",  3,  0, 0),
-        ( "M6",  5,  0, 1),
-        ( "M7",  6,  0, 0),
-        ( "M8",  8,  0, 1),
-        ( "M9",  9,  0, 1),
-        ("M11", 11,  0, 0),
-        ("M12", 13,  1, 0),
-        ("N14", 13,  2, 1),
-        ( "P2",  2,  0, 0),
-        ( "P3",  2,  0, 1),
-        ( "P4",  4,  0, 0),
-        ( "P5",  5,  0, 0),
-        ( "P7",  6,  0, 1),
-        ( "P8",  7,  0, 0),
-        ( "P9",  7,  0, 1),
-        ("P10", 10,  0, 1),
-        ("P11", 11,  0, 1),
-        ("P12", 12,  0, 0),
-        ("P13", 12,  0, 1),
-        ("P14", 13,  1, 1),
-    ],
-    "1k-qn84": [
-        ( "A1",  0, 14, 0),
-        ( "A2",  0, 13, 0),
-        ( "A3",  0, 12, 0),
-        ( "A4",  0, 11, 0),
-        ( "A5",  0, 10, 0),
-        ( "A8",  0,  9, 0),
-        ( "A9",  0,  8, 1),
-        ("A10",  0,  5, 1),
-        ("A11",  0,  4, 0),
-        ("A12",  0,  2, 0),
-        ("A13",  4,  0, 0),
-        ("A14",  6,  0, 1),
-        ("A16",  6,  0, 0),
-        ("A19",  9,  0, 1),
-        ("A20", 10,  0, 1),
-        ("A22", 11,  0, 1),
-        ("A23", 12,  0, 0),
-        ("A25", 13,  4, 0),
-        ("A26", 13,  6, 0),
-        ("A27", 13,  7, 1),
-        ("A29", 13,  8, 1),
-        ("A31", 13, 11, 1),
-        ("A32", 13, 12, 1),
-        ("A33", 13, 13, 1),
-        ("A34", 13, 14, 0),
-        ("A35", 13, 15, 0),
-        ("A38", 11, 17, 0),
-        ("A39", 10, 17, 0),
-        ("A40",  9, 17, 0),
-        ("A41",  8, 17, 0),
-        ("A43",  7, 17, 0),
-        ("A44",  6, 17, 0),
-        ("A45",  5, 17, 0),
-        ("A46",  4, 17, 0),
-        ("A47",  3, 17, 0),
-        ("A48",  1, 17, 1),
-        ( "B1",  0, 13, 1),
-        ( "B2",  0, 12, 1),
-        ( "B3",  0, 11, 1),
-        ( "B4",  0, 10, 1),
-        ( "B5",  0,  9, 1),
-        ( "B7",  0,  8, 0),
-        ( "B8",  0,  5, 0),
-        ( "B9",  0,  3, 0),
-        ("B10",  5,  0, 0),
-        ("B11",  5,  0, 1),
-        ("B12",  7,  0, 0),
-        ("B13",  8,  0, 0),
-        ("B14",  9,  0, 0),
-        ("B15", 10,  0, 0),
-        ("B17", 11,  0, 0),
-        ("B18", 12,  0, 1),
-        ("B19", 13,  3, 1),
-        ("B20", 13,  6, 1),
-        ("B21", 13,  7, 0),
-        ("B22", 13,  9, 0),
-        ("B23", 13, 11, 0),
-        ("B24", 13, 12, 0),
-        ("B26", 13, 14, 1),
-        ("B27", 13, 15, 1),
-        ("B29", 10, 17, 1),
-        ("B30",  9, 17, 1),
-        ("B31",  8, 17, 1),
-        ("B32",  6, 17, 1),
-        ("B34",  4, 17, 1),
-        ("B35",  3, 17, 1),
-        ("B36",  2, 17, 1),
-    ],
-    "1k-tq144": [
-        (  "1",  0, 14, 1),
-        (  "2",  0, 14, 0),
-        (  "3",  0, 13, 1),
-        (  "4",  0, 13, 0),
-        (  "7",  0, 12, 1),
-        (  "8",  0, 12, 0),
-        (  "9",  0, 11, 1),
-        ( "10",  0, 11, 0),
-        ( "11",  0, 10, 1),
-        ( "12",  0, 10, 0),
-        ( "19",  0,  9, 1),
-        ( "20",  0,  9, 0),
-        ( "21",  0,  8, 1),
-        ( "22",  0,  8, 0),
-        ( "23",  0,  6, 1),
-        ( "24",  0,  6, 0),
-        ( "25",  0,  5, 1),
-        ( "26",  0,  5, 0),
-        ( "28",  0,  4, 1),
-        ( "29",  0,  4, 0),
-        ( "31",  0,  3, 1),
-        ( "32",  0,  3, 0),
-        ( "33",  0,  2, 1),
-        ( "34",  0,  2, 0),
-        ( "37",  1,  0, 0),
-        ( "38",  1,  0, 1),
-        ( "39",  2,  0, 0),
-        ( "41",  2,  0, 1),
-        ( "42",  3,  0, 0),
-        ( "43",  3,  0, 1),
-        ( "44",  4,  0, 0),
-        ( "45",  4,  0, 1),
-        ( "47",  5,  0, 0),
-        ( "48",  5,  0, 1),
-        ( "49",  6,  0, 1),
-        ( "50",  7,  0, 0),
-        ( "52",  6,  0, 0),
-        ( "56",  7,  0, 1),
-        ( "58",  8,  0, 0),
-        ( "60",  8,  0, 1),
-        ( "61",  9,  0, 0),
-        ( "62",  9,  0, 1),
-        ( "63", 10,  0, 0),
-        ( "64", 10,  0, 1),
-        ( "67", 11,  0, 0),
-        ( "68", 11,  0, 1),
-        ( "70", 12,  0, 0),
-        ( "71", 12,  0, 1),
-        ( "73", 13,  1, 0),
-        ( "74", 13,  1, 1),
-        ( "75", 13,  2, 0),
-        ( "76", 13,  2, 1),
-        ( "78", 13,  3, 1),
-        ( "79", 13,  4, 0),
-        ( "80", 13,  4, 1),
-        ( "81", 13,  6, 0),
-        ( "87", 13,  6, 1),
-        ( "88", 13,  7, 0),
-        ( "90", 13,  7, 1),
-        ( "91", 13,  8, 0),
-        ( "93", 13,  8, 1),
-        ( "94", 13,  9, 0),
-        ( "95", 13,  9, 1),
-        ( "96", 13, 11, 0),
-        ( "97", 13, 11, 1),
-        ( "98", 13, 12, 0),
-        ( "99", 13, 12, 1),
-        ("101", 13, 13, 0),
-        ("102", 13, 13, 1),
-        ("104", 13, 14, 0),
-        ("105", 13, 14, 1),
-        ("106", 13, 15, 0),
-        ("107", 13, 15, 1),
-        ("112", 12, 17, 1),
-        ("113", 12, 17, 0),
-        ("114", 11, 17, 1),
-        ("115", 11, 17, 0),
-        ("116", 10, 17, 1),
-        ("117", 10, 17, 0),
-        ("118",  9, 17, 1),
-        ("119",  9, 17, 0),
-        ("120",  8, 17, 1),
-        ("121",  8, 17, 0),
-        ("122",  7, 17, 1),
-        ("128",  7, 17, 0),
-        ("129",  6, 17, 1),
-        ("134",  5, 17, 1),
-        ("135",  5, 17, 0),
-        ("136",  4, 17, 1),
-        ("137",  4, 17, 0),
-        ("138",  3, 17, 1),
-        ("139",  3, 17, 0),
-        ("141",  2, 17, 1),
-        ("142",  2, 17, 0),
-        ("143",  1, 17, 1),
-        ("144",  1, 17, 0),
-    ],
-    "1k-vq100": [
-        (  "1",  0, 14, 1),
-        (  "2",  0, 14, 0),
-        (  "3",  0, 13, 1),
-        (  "4",  0, 13, 0),
-        (  "7",  0, 12, 1),
-        (  "8",  0, 12, 0),
-        (  "9",  0, 10, 1),
-        ( "10",  0, 10, 0),
-        ( "12",  0,  9, 1),
-        ( "13",  0,  9, 0),
-        ( "15",  0,  8, 1),
-        ( "16",  0,  8, 0),
-        ( "18",  0,  6, 1),
-        ( "19",  0,  6, 0),
-        ( "20",  0,  4, 1),
-        ( "21",  0,  4, 0),
-        ( "24",  0,  2, 1),
-        ( "25",  0,  2, 0),
-        ( "26",  2,  0, 0),
-        ( "27",  2,  0, 1),
-        ( "28",  3,  0, 0),
-        ( "29",  3,  0, 1),
-        ( "30",  4,  0, 0),
-        ( "33",  6,  0, 1),
-        ( "34",  7,  0, 0),
-        ( "36",  6,  0, 0),
-        ( "37",  7,  0, 1),
-        ( "40",  9,  0, 1),
-        ( "41", 10,  0, 0),
-        ( "42", 10,  0, 1),
-        ( "45", 11,  0, 0),
-        ( "46", 11,  0, 1),
-        ( "48", 12,  0, 0),
-        ( "49", 12,  0, 1),
-        ( "51", 13,  3, 1),
-        ( "52", 13,  4, 0),
-        ( "53", 13,  4, 1),
-        ( "54", 13,  6, 0),
-        ( "56", 13,  6, 1),
-        ( "57", 13,  7, 0),
-        ( "59", 13,  7, 1),
-        ( "60", 13,  8, 0),
-        ( "62", 13,  8, 1),
-        ( "63", 13,  9, 0),
-        ( "64", 13, 11, 0),
-        ( "65", 13, 11, 1),
-        ( "66", 13, 12, 0),
-        ( "68", 13, 13, 0),
-        ( "69", 13, 13, 1),
-        ( "71", 13, 14, 0),
-        ( "72", 13, 14, 1),
-        ( "73", 13, 15, 0),
-        ( "74", 13, 15, 1),
-        ( "78", 12, 17, 1),
-        ( "79", 12, 17, 0),
-        ( "80", 11, 17, 1),
-        ( "81", 10, 17, 1),
-        ( "82", 10, 17, 0),
-        ( "83",  9, 17, 1),
-        ( "85",  9, 17, 0),
-        ( "86",  8, 17, 1),
-        ( "87",  8, 17, 0),
-        ( "89",  7, 17, 0),
-        ( "90",  6, 17, 1),
-        ( "91",  6, 17, 0),
-        ( "93",  5, 17, 1),
-        ( "94",  5, 17, 0),
-        ( "95",  4, 17, 1),
-        ( "96",  4, 17, 0),
-        ( "97",  3, 17, 1),
-        ( "99",  2, 17, 1),
-        ("100",  1, 17, 1),
-    ],
-    "8k-cb132:4k": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 0),
-        ( "A3",  3, 33, 1),
-        ( "A4",  5, 33, 0),
-        ( "A5", 10, 33, 1),
-        ( "A6", 16, 33, 1),
-        ( "A7", 17, 33, 0),
-        ("A10", 25, 33, 0),
-        ("A11", 26, 33, 0),
-        ("A12", 30, 33, 1),
-        ( "B1",  0, 30, 1),
-        ("B14", 33, 28, 0),
-        ( "C1",  0, 30, 0),
-        ( "C3",  0, 27, 1),
-        ( "C4",  4, 33, 0),
-        ( "C5",  8, 33, 1),
-        ( "C6", 11, 33, 1),
-        ( "C7", 14, 33, 1),
-        ( "C9", 20, 33, 1),
-        ("C10", 22, 33, 1),
-        ("C11", 28, 33, 1),
-        ("C12", 29, 33, 1),
-        ("C14", 33, 24, 1),
-        ( "D1",  0, 25, 1),
-        ( "D3",  0, 27, 0),
-        ( "D4",  0, 22, 1),
-        ( "D5",  9, 33, 0),
-        ( "D6", 11, 33, 0),
-        ( "D7", 13, 33, 1),
-        ( "D9", 21, 33, 1),
-        ("D10", 27, 33, 0),
-        ("D11", 26, 33, 1),
-        ("D12", 33, 27, 1),
-        ("D14", 33, 23, 1),
-        ( "E1",  0, 25, 0),
-        ( "E4",  0, 22, 0),
-        ("E11", 33, 20, 1),
-        ("E12", 33, 21, 0),
-        ("E14", 33, 21, 1),
-        ( "F3",  0, 21, 0),
-        ( "F4",  0, 21, 1),
-        ("F11", 33, 19, 1),
-        ("F12", 33, 15, 0),
-        ("F14", 33, 16, 1),
-        ( "G1",  0, 17, 0),
-        ( "G3",  0, 17, 1),
-        ( "G4",  0, 20, 0),
-        ("G11", 33, 14, 1),
-        ("G12", 33, 11, 0),
-        ("G14", 33, 17, 0),
-        ( "H1",  0, 16, 1),
-        ( "H3",  0, 16, 0),
-        ( "H4",  0, 20, 1),
-        ("H11", 33, 10, 1),
-        ("H12", 33,  6, 1),
-        ( "J1",  0, 18, 0),
-        ( "J3",  0, 18, 1),
-        ("J11", 33,  6, 0),
-        ("J12", 33,  5, 1),
-        ( "K3",  0, 11, 1),
-        ( "K4",  0, 11, 0),
-        ("K11", 33,  4, 1),
-        ("K12", 33,  4, 0),
-        ("K14", 33,  5, 0),
-        ( "L1",  0,  6, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 11,  0, 1),
-        ( "L6", 15,  0, 0),
-        ( "L8", 20,  0, 1),
-        ( "L9", 29,  0, 0),
-        ("L12", 33,  2, 0),
-        ("L14", 33,  3, 1),
-        ( "M1",  0,  6, 0),
-        ( "M3",  8,  0, 0),
-        ( "M4",  7,  0, 1),
-        ( "M6", 14,  0, 1),
-        ( "M7", 15,  0, 1),
-        ( "M9", 22,  0, 1),
-        ("M11", 30,  0, 0),
-        ("M12", 33,  1, 0),
-        ( "N1",  0,  4, 1),
-        ("N14", 33,  2, 1),
-        ( "P1",  0,  4, 0),
-        ( "P2",  4,  0, 0),
-        ( "P3",  5,  0, 1),
-        ( "P4", 12,  0, 1),
-        ( "P5", 13,  0, 0),
-        ( "P7", 16,  0, 1),
-        ( "P8", 17,  0, 0),
-        ( "P9", 21,  0, 1),
-        ("P10", 29,  0, 1),
-        ("P11", 30,  0, 1),
-        ("P12", 31,  0, 0),
-        ("P13", 31,  0, 1),
-        ("P14", 33,  1, 1),
-    ],
-    "8k-tq144:4k": [
-        (  "1",  0, 30, 1),
-        (  "2",  0, 30, 0),
-        (  "3",  0, 28, 1),
-        (  "4",  0, 28, 0),
-        (  "7",  0, 27, 1),
-        (  "8",  0, 27, 0),
-        (  "9",  0, 25, 1),
-        ( "10",  0, 25, 0),
-        ( "11",  0, 22, 1),
-        ( "12",  0, 22, 0),
-        ( "15",  0, 20, 1),
-        ( "16",  0, 20, 0),
-        ( "17",  0, 18, 1),
-        ( "18",  0, 18, 0),
-        ( "19",  0, 17, 1),
-        ( "20",  0, 17, 0),
-        ( "21",  0, 16, 1),
-        ( "22",  0, 16, 0),
-        ( "23",  0, 12, 1),
-        ( "24",  0, 12, 0),
-        ( "25",  0, 11, 1),
-        ( "26",  0, 11, 0),
-        ( "28",  0,  6, 1),
-        ( "29",  0,  6, 0),
-        ( "31",  0,  5, 1),
-        ( "32",  0,  5, 0),
-        ( "33",  0,  4, 1),
-        ( "34",  0,  4, 0),
-        ( "37",  4,  0, 0),
-        ( "38",  4,  0, 1),
-        ( "39",  6,  0, 1),
-        ( "41",  7,  0, 1),
-        ( "42",  8,  0, 0),
-        ( "43", 11,  0, 1),
-        ( "44", 12,  0, 0),
-        ( "45", 12,  0, 1),
-        ( "47", 15,  0, 1),
-        ( "48", 16,  0, 0),
-        ( "49", 16,  0, 1),
-        ( "52", 17,  0, 0),
-        ( "55", 22,  0, 1),
-        ( "56", 24,  0, 0),
-        ( "60", 24,  0, 1),
-        ( "61", 25,  0, 0),
-        ( "62", 28,  0, 0),
-        ( "63", 29,  0, 0),
-        ( "64", 29,  0, 1),
-        ( "67", 30,  0, 0),
-        ( "68", 30,  0, 1),
-        ( "70", 31,  0, 0),
-        ( "71", 31,  0, 1),
-        ( "73", 33,  1, 0),
-        ( "74", 33,  1, 1),
-        ( "75", 33,  2, 0),
-        ( "76", 33,  2, 1),
-        ( "78", 33,  3, 1),
-        ( "79", 33,  4, 0),
-        ( "80", 33,  4, 1),
-        ( "81", 33,  5, 0),
-        ( "82", 33,  5, 1),
-        ( "83", 33,  6, 0),
-        ( "84", 33,  6, 1),
-        ( "85", 33, 10, 1),
-        ( "87", 33, 14, 1),
-        ( "88", 33, 15, 0),
-        ( "90", 33, 15, 1),
-        ( "91", 33, 16, 0),
-        ( "93", 33, 16, 1),
-        ( "94", 33, 17, 0),
-        ( "95", 33, 19, 1),
-        ( "96", 33, 20, 1),
-        ( "97", 33, 21, 0),
-        ( "98", 33, 21, 1),
-        ( "99", 33, 23, 1),
-        ("101", 33, 27, 1),
-        ("102", 33, 28, 0),
-        ("104", 33, 29, 1),
-        ("105", 33, 30, 0),
-        ("106", 33, 30, 1),
-        ("107", 33, 31, 0),
-        ("110", 31, 33, 1),
-        ("112", 31, 33, 0),
-        ("113", 30, 33, 1),
-        ("114", 30, 33, 0),
-        ("115", 29, 33, 1),
-        ("116", 29, 33, 0),
-        ("117", 28, 33, 1),
-        ("118", 27, 33, 0),
-        ("119", 26, 33, 1),
-        ("120", 26, 33, 0),
-        ("121", 25, 33, 0),
-        ("122", 20, 33, 1),
-        ("124", 20, 33, 0),
-        ("125", 19, 33, 1),
-        ("128", 17, 33, 0),
-        ("129", 16, 33, 1),
-        ("130", 11, 33, 1),
-        ("134",  8, 33, 1),
-        ("135",  8, 33, 0),
-        ("136",  7, 33, 1),
-        ("137",  7, 33, 0),
-        ("138",  6, 33, 1),
-        ("139",  6, 33, 0),
-        ("141",  5, 33, 0),
-        ("142",  4, 33, 1),
-        ("143",  4, 33, 0),
-        ("144",  3, 33, 1),
-    ],
-    "8k-cm81:4k": [
-        ( "A1",  2, 33, 1),
-        ( "A2",  4, 33, 0),
-        ( "A3",  6, 33, 0),
-        ( "A4", 10, 33, 1),
-        ( "A6", 23, 33, 0),
-        ( "A7", 27, 33, 0),
-        ( "A8", 28, 33, 1),
-        ( "A9", 33,  4, 1),
-        ( "B1",  0, 28, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  5, 33, 1),
-        ( "B4",  9, 33, 0),
-        ( "B5", 21, 33, 1),
-        ( "B6", 24, 33, 0),
-        ( "B7", 25, 33, 1),
-        ( "B8", 30, 33, 1),
-        ( "B9", 33,  6, 1),
-        ( "C1",  0, 28, 0),
-        ( "C2",  0, 30, 1),
-        ( "C3",  0, 23, 0),
-        ( "C4", 16, 33, 1),
-        ( "C5", 17, 33, 0),
-        ( "C9", 33, 21, 1),
-        ( "D1",  0, 20, 1),
-        ( "D2",  0, 23, 1),
-        ( "D3",  0, 17, 0),
-        ( "D5",  8, 33, 1),
-        ( "D6", 33,  4, 0),
-        ( "D7", 33,  5, 0),
-        ( "D8", 33, 17, 0),
-        ( "D9", 33,  6, 0),
-        ( "E1",  0, 20, 0),
-        ( "E2",  0, 17, 1),
-        ( "E3",  0, 16, 1),
-        ( "E4",  0, 16, 0),
-        ( "E5",  7, 33, 1),
-        ( "E7", 33,  5, 1),
-        ( "E8", 33, 16, 1),
-        ( "F1",  0,  7, 1),
-        ( "F3",  0,  7, 0),
-        ( "F7", 31,  0, 1),
-        ( "F8", 33,  3, 0),
-        ( "G1",  0,  5, 0),
-        ( "G2",  0,  3, 1),
-        ( "G3",  0,  5, 1),
-        ( "G4", 16,  0, 1),
-        ( "G5", 29,  0, 0),
-        ( "G6", 30,  0, 0),
-        ( "G7", 31,  0, 0),
-        ( "G8", 33,  3, 1),
-        ( "G9", 33,  2, 1),
-        ( "H1",  3,  0, 0),
-        ( "H2",  0,  3, 0),
-        ( "H4", 17,  0, 0),
-        ( "H5", 29,  0, 1),
-        ( "H7", 30,  0, 1),
-        ( "H9", 33,  2, 0),
-        ( "J1",  3,  0, 1),
-        ( "J2",  4,  0, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4", 11,  0, 0),
-        ( "J8", 33,  1, 0),
-        ( "J9", 33,  1, 1),
-    ],
-    "8k-cm121:4k": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 1),
-        ( "A3",  3, 33, 0),
-        ( "A4",  9, 33, 0),
-        ( "A5", 11, 33, 0),
-        ( "A6", 11, 33, 1),
-        ( "A7", 19, 33, 1),
-        ( "A8", 20, 33, 1),
-        ( "A9", 26, 33, 1),
-        ("A10", 30, 33, 1),
-        ("A11", 31, 33, 1),
-        ( "B1",  0, 30, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  4, 33, 0),
-        ( "B4",  5, 33, 0),
-        ( "B5", 10, 33, 1),
-        ( "B6", 16, 33, 1),
-        ( "B7", 17, 33, 0),
-        ( "B8", 27, 33, 0),
-        ( "B9", 28, 33, 1),
-        ("B11", 33, 28, 0),
-        ( "C1",  0, 25, 0),
-        ( "C2",  0, 25, 1),
-        ( "C3",  0, 27, 0),
-        ( "C4",  0, 27, 1),
-        ( "C7", 20, 33, 0),
-        ( "C8", 26, 33, 0),
-        ( "C9", 29, 33, 1),
-        ("C11", 33, 27, 1),
-        ( "D1",  0, 22, 0),
-        ( "D2",  0, 21, 1),
-        ( "D3",  0, 21, 0),
-        ( "D5",  8, 33, 1),
-        ( "D7", 25, 33, 0),
-        ( "D9", 33, 21, 0),
-        ("D10", 33, 24, 1),
-        ("D11", 33, 23, 1),
-        ( "E1",  0, 22, 1),
-        ( "E2",  0, 20, 1),
-        ( "E3",  0, 20, 0),
-        ( "E8", 33, 20, 1),
-        ( "E9", 33, 19, 1),
-        ("E10", 33, 17, 0),
-        ("E11", 33, 21, 1),
-        ( "F1",  0, 18, 1),
-        ( "F2",  0, 18, 0),
-        ( "F3",  0, 17, 0),
-        ( "F4",  0, 17, 1),
-        ( "F9", 33, 15, 0),
-        ("F10", 33, 14, 1),
-        ("F11", 33, 16, 1),
-        ( "G1",  0, 16, 1),
-        ( "G2",  0, 16, 0),
-        ( "G3",  0, 12, 1),
-        ( "G8", 33,  5, 1),
-        ( "G9", 33, 10, 1),
-        ("G10", 33,  6, 1),
-        ("G11", 33, 11, 0),
-        ( "H1",  0, 11, 1),
-        ( "H2",  0, 11, 0),
-        ( "H3",  0, 12, 0),
-        ( "H7", 20,  0, 1),
-        ( "H9", 29,  0, 1),
-        ("H10", 33,  4, 1),
-        ("H11", 33,  6, 0),
-        ( "J1",  0,  6, 1),
-        ( "J2",  0,  4, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4",  8,  0, 0),
-        ( "J5", 15,  0, 0),
-        ( "J7", 20,  0, 0),
-        ( "J8", 22,  0, 1),
-        ( "J9", 30,  0, 1),
-        ("J10", 33,  5, 0),
-        ("J11", 33,  3, 1),
-        ( "K1",  0,  6, 0),
-        ( "K2",  0,  4, 1),
-        ( "K3",  7,  0, 1),
-        ( "K4", 12,  0, 1),
-        ( "K5", 15,  0, 1),
-        ( "K6", 17,  0, 0),
-        ( "K7", 21,  0, 1),
-        ( "K9", 30,  0, 0),
-        ("K10", 31,  0, 1),
-        ("K11", 33,  4, 0),
-        ( "L1",  4,  0, 0),
-        ( "L2",  6,  0, 1),
-        ( "L3", 11,  0, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 16,  0, 1),
-        ( "L7", 24,  0, 0),
-        ( "L8", 29,  0, 0),
-        ("L10", 31,  0, 0),
-    ],
-	"8k-bg121:4k": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 1),
-        ( "A3",  3, 33, 0),
-        ( "A4",  9, 33, 0),
-        ( "A5", 11, 33, 0),
-        ( "A6", 11, 33, 1),
-        ( "A7", 19, 33, 1),
-        ( "A8", 20, 33, 1),
-        ( "A9", 26, 33, 1),
-        ("A10", 30, 33, 1),
-        ("A11", 31, 33, 1),
-        ( "B1",  0, 30, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  4, 33, 0),
-        ( "B4",  5, 33, 0),
-        ( "B5", 10, 33, 1),
-        ( "B6", 16, 33, 1),
-        ( "B7", 17, 33, 0),
-        ( "B8", 27, 33, 0),
-        ( "B9", 28, 33, 1),
-        ("B11", 33, 28, 0),
-        ( "C1",  0, 25, 0),
-        ( "C2",  0, 25, 1),
-        ( "C3",  0, 27, 0),
-        ( "C4",  0, 27, 1),
-        ( "C7", 20, 33, 0),
-        ( "C8", 26, 33, 0),
-        ( "C9", 29, 33, 1),
-        ("C11", 33, 27, 1),
-        ( "D1",  0, 22, 0),
-        ( "D2",  0, 21, 1),
-        ( "D3",  0, 21, 0),
-        ( "D5",  8, 33, 1),
-        ( "D7", 25, 33, 0),
-        ( "D9", 33, 21, 0),
-        ("D10", 33, 24, 1),
-        ("D11", 33, 23, 1),
-        ( "E1",  0, 22, 1),
-        ( "E2",  0, 20, 1),
-        ( "E3",  0, 20, 0),
-        ( "E8", 33, 20, 1),
-        ( "E9", 33, 19, 1),
-        ("E10", 33, 17, 0),
-        ("E11", 33, 21, 1),
-        ( "F1",  0, 18, 1),
-        ( "F2",  0, 18, 0),
-        ( "F3",  0, 17, 0),
-        ( "F4",  0, 17, 1),
-        ( "F9", 33, 15, 0),
-        ("F10", 33, 14, 1),
-        ("F11", 33, 16, 1),
-        ( "G1",  0, 16, 1),
-        ( "G2",  0, 16, 0),
-        ( "G3",  0, 12, 1),
-        ( "G8", 33,  5, 1),
-        ( "G9", 33, 10, 1),
-        ("G10", 33,  6, 1),
-        ("G11", 33, 11, 0),
-        ( "H1",  0, 11, 1),
-        ( "H2",  0, 11, 0),
-        ( "H3",  0, 12, 0),
-        ( "H7", 20,  0, 1),
-        ( "H9", 29,  0, 1),
-        ("H10", 33,  4, 1),
-        ("H11", 33,  6, 0),
-        ( "J1",  0,  6, 1),
-        ( "J2",  0,  4, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4",  8,  0, 0),
-        ( "J5", 15,  0, 0),
-        ( "J7", 20,  0, 0),
-        ( "J8", 22,  0, 1),
-        ( "J9", 30,  0, 1),
-        ("J10", 33,  5, 0),
-        ("J11", 33,  3, 1),
-        ( "K1",  0,  6, 0),
-        ( "K2",  0,  4, 1),
-        ( "K3",  7,  0, 1),
-        ( "K4", 12,  0, 1),
-        ( "K5", 15,  0, 1),
-        ( "K6", 17,  0, 0),
-        ( "K7", 21,  0, 1),
-        ( "K9", 30,  0, 0),
-        ("K10", 31,  0, 1),
-        ("K11", 33,  4, 0),
-        ( "L1",  4,  0, 0),
-        ( "L2",  6,  0, 1),
-        ( "L3", 11,  0, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 16,  0, 1),
-        ( "L7", 24,  0, 0),
-        ( "L8", 29,  0, 0),
-        ("L10", 31,  0, 0),
-    ],
-    "8k-cm225:4k": [
-        ( "A1",  1, 33, 1),
-        ( "A2",  3, 33, 1),
-        ( "A5",  6, 33, 1),
-        ( "A6", 11, 33, 0),
-        ( "A7", 12, 33, 0),
-        ( "A8", 17, 33, 1),
-        ( "A9", 18, 33, 1),
-        ("A11", 23, 33, 1),
-        ("A15", 31, 33, 0),
-        ( "B2",  2, 33, 1),
-        ( "B3",  4, 33, 1),
-        ( "B4",  5, 33, 1),
-        ( "B5",  7, 33, 1),
-        ( "B6", 10, 33, 0),
-        ( "B7", 14, 33, 0),
-        ( "B8", 19, 33, 1),
-        ( "B9", 18, 33, 0),
-        ("B10", 22, 33, 0),
-        ("B11", 23, 33, 0),
-        ("B12", 25, 33, 1),
-        ("B13", 27, 33, 1),
-        ("B14", 31, 33, 1),
-        ("B15", 33, 31, 0),
-        ( "C1",  0, 28, 0),
-        ( "C3",  2, 33, 0),
-        ( "C4",  3, 33, 0),
-        ( "C5",  5, 33, 0),
-        ( "C6", 13, 33, 0),
-        ( "C7", 11, 33, 1),
-        ( "C8", 19, 33, 0),
-        ( "C9", 17, 33, 0),
-        ("C10", 20, 33, 0),
-        ("C11", 24, 33, 1),
-        ("C12", 30, 33, 1),
-        ("C13", 30, 33, 0),
-        ("C14", 33, 30, 0),
-        ( "D1",  0, 25, 0),
-        ( "D2",  0, 24, 1),
-        ( "D3",  0, 27, 0),
-        ( "D4",  0, 30, 0),
-        ( "D5",  4, 33, 0),
-        ( "D6",  9, 33, 0),
-        ( "D7", 10, 33, 1),
-        ( "D8", 16, 33, 1),
-        ( "D9", 26, 33, 1),
-        ("D10", 25, 33, 0),
-        ("D11", 28, 33, 1),
-        ("D13", 33, 27, 1),
-        ("D14", 33, 25, 0),
-        ("D15", 33, 27, 0),
-        ( "E2",  0, 24, 0),
-        ( "E3",  0, 28, 1),
-        ( "E4",  0, 30, 1),
-        ( "E5",  0, 27, 1),
-        ( "E6",  0, 25, 1),
-        ( "E9", 26, 33, 0),
-        ("E10", 27, 33, 0),
-        ("E11", 29, 33, 1),
-        ("E13", 33, 28, 0),
-        ("E14", 33, 24, 0),
-        ( "F1",  0, 20, 0),
-        ( "F2",  0, 21, 0),
-        ( "F3",  0, 21, 1),
-        ( "F4",  0, 22, 0),
-        ( "F5",  0, 22, 1),
-        ( "F7",  8, 33, 1),
-        ( "F9", 20, 33, 1),
-        ("F11", 33, 24, 1),
-        ("F12", 33, 23, 1),
-        ("F13", 33, 23, 0),
-        ("F14", 33, 21, 0),
-        ("F15", 33, 22, 0),
-        ( "G2",  0, 20, 1),
-        ( "G4",  0, 17, 0),
-        ( "G5",  0, 18, 1),
-        ("G10", 33, 20, 1),
-        ("G11", 33, 19, 1),
-        ("G12", 33, 21, 1),
-        ("G13", 33, 17, 0),
-        ("G14", 33, 20, 0),
-        ("G15", 33, 19, 0),
-        ( "H1",  0, 16, 0),
-        ( "H2",  0, 18, 0),
-        ( "H3",  0, 14, 1),
-        ( "H4",  0, 13, 1),
-        ( "H5",  0, 16, 1),
-        ( "H6",  0, 17, 1),
-        ("H11", 33, 14, 1),
-        ("H12", 33, 16, 1),
-        ("H13", 33, 15, 1),
-        ("H14", 33, 15, 0),
-        ( "J1",  0, 13, 0),
-        ( "J2",  0, 12, 0),
-        ( "J3",  0, 14, 0),
-        ( "J4",  0, 11, 1),
-        ( "J5",  0, 12, 1),
-        ("J10", 33,  5, 1),
-        ("J11", 33, 10, 1),
-        ("J12", 33,  6, 1),
-        ("J14", 33, 14, 0),
-        ("J15", 33, 13, 0),
-        ( "K1",  0, 11, 0),
-        ( "K4",  0,  4, 0),
-        ( "K5",  0,  6, 1),
-        ( "K9", 20,  0, 1),
-        ("K11", 29,  0, 0),
-        ("K12", 33,  4, 1),
-        ("K13", 33,  5, 0),
-        ("K15", 33,  9, 0),
-        ( "L3",  0,  7, 1),
-        ( "L4",  0,  3, 0),
-        ( "L5",  4,  0, 0),
-        ( "L6",  7,  0, 0),
-        ( "L7", 12,  0, 0),
-        ( "L9", 17,  0, 0),
-        ("L10", 21,  0, 1),
-        ("L11", 30,  0, 1),
-        ("L12", 33,  3, 1),
-        ("L13", 33,  6, 0),
-        ( "M1",  0,  7, 0),
-        ( "M2",  0,  6, 0),
-        ( "M3",  0,  5, 0),
-        ( "M4",  0,  3, 1),
-        ( "M5",  6,  0, 0),
-        ( "M6",  8,  0, 0),
-        ( "M7", 13,  0, 1),
-        ( "M8", 15,  0, 0),
-        ( "M9", 19,  0, 1),
-        ("M11", 30,  0, 0),
-        ("M12", 31,  0, 1),
-        ("M13", 33,  4, 0),
-        ("M15", 33,  3, 0),
-        ( "N2",  0,  5, 1),
-        ( "N3",  2,  0, 0),
-        ( "N4",  3,  0, 0),
-        ( "N5",  9,  0, 1),
-        ( "N6", 12,  0, 1),
-        ( "N7", 16,  0, 1),
-        ( "N9", 20,  0, 0),
-        ("N10", 22,  0, 1),
-        ("N12", 31,  0, 0),
-        ( "P1",  0,  4, 1),
-        ( "P2",  2,  0, 1),
-        ( "P4",  7,  0, 1),
-        ( "P5", 10,  0, 1),
-        ( "P6", 14,  0, 1),
-        ( "P7", 17,  0, 1),
-        ( "P8", 19,  0, 0),
-        ( "P9", 22,  0, 0),
-        ("P10", 23,  0, 0),
-        ("P11", 25,  0, 0),
-        ("P12", 29,  0, 1),
-        ("P13", 27,  0, 0),
-        ("P14", 33,  2, 1),
-        ("P15", 33,  1, 1),
-        ( "R1",  3,  0, 1),
-        ( "R2",  4,  0, 1),
-        ( "R3",  6,  0, 1),
-        ( "R4",  8,  0, 1),
-        ( "R5", 11,  0, 1),
-        ( "R6", 15,  0, 1),
-        ( "R9", 21,  0, 0),
-        ("R10", 24,  0, 0),
-        ("R11", 26,  0, 0),
-        ("R12", 28,  0, 0),
-        ("R14", 33,  2, 0),
-        ("R15", 33,  1, 0),
-    ],
-    "8k-cm81": [
-        ( "A1",  2, 33, 1),
-        ( "A2",  4, 33, 0),
-        ( "A3",  6, 33, 0),
-        ( "A4", 10, 33, 1),
-        ( "A6", 23, 33, 0),
-        ( "A7", 27, 33, 0),
-        ( "A8", 28, 33, 1),
-        ( "A9", 33,  4, 1),
-        ( "B1",  0, 28, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  5, 33, 1),
-        ( "B4",  9, 33, 0),
-        ( "B5", 21, 33, 1),
-        ( "B6", 24, 33, 0),
-        ( "B7", 25, 33, 1),
-        ( "B8", 30, 33, 1),
-        ( "B9", 33,  6, 1),
-        ( "C1",  0, 28, 0),
-        ( "C2",  0, 30, 1),
-        ( "C3",  0, 23, 0),
-        ( "C4", 16, 33, 1),
-        ( "C5", 17, 33, 0),
-        ( "C9", 33, 21, 1),
-        ( "D1",  0, 20, 1),
-        ( "D2",  0, 23, 1),
-        ( "D3",  0, 17, 0),
-        ( "D5",  8, 33, 1),
-        ( "D6", 33,  4, 0),
-        ( "D7", 33,  5, 0),
-        ( "D8", 33, 17, 0),
-        ( "D9", 33,  6, 0),
-        ( "E1",  0, 20, 0),
-        ( "E2",  0, 17, 1),
-        ( "E3",  0, 16, 1),
-        ( "E4",  0, 16, 0),
-        ( "E5",  7, 33, 1),
-        ( "E7", 33,  5, 1),
-        ( "E8", 33, 16, 1),
-        ( "F1",  0,  7, 1),
-        ( "F3",  0,  7, 0),
-        ( "F7", 31,  0, 1),
-        ( "F8", 33,  3, 0),
-        ( "G1",  0,  5, 0),
-        ( "G2",  0,  3, 1),
-        ( "G3",  0,  5, 1),
-        ( "G4", 16,  0, 1),
-        ( "G5", 29,  0, 0),
-        ( "G6", 30,  0, 0),
-        ( "G7", 31,  0, 0),
-        ( "G8", 33,  3, 1),
-        ( "G9", 33,  2, 1),
-        ( "H1",  3,  0, 0),
-        ( "H2",  0,  3, 0),
-        ( "H4", 17,  0, 0),
-        ( "H5", 29,  0, 1),
-        ( "H7", 30,  0, 1),
-        ( "H9", 33,  2, 0),
-        ( "J1",  3,  0, 1),
-        ( "J2",  4,  0, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4", 11,  0, 0),
-        ( "J8", 33,  1, 0),
-        ( "J9", 33,  1, 1),
-    ],
-    "8k-cm121": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 1),
-        ( "A3",  3, 33, 0),
-        ( "A4",  9, 33, 0),
-        ( "A5", 11, 33, 0),
-        ( "A6", 11, 33, 1),
-        ( "A7", 19, 33, 1),
-        ( "A8", 20, 33, 1),
-        ( "A9", 26, 33, 1),
-        ("A10", 30, 33, 1),
-        ("A11", 31, 33, 1),
-        ( "B1",  0, 30, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  4, 33, 0),
-        ( "B4",  5, 33, 0),
-        ( "B5", 10, 33, 1),
-        ( "B6", 16, 33, 1),
-        ( "B7", 17, 33, 0),
-        ( "B8", 27, 33, 0),
-        ( "B9", 28, 33, 1),
-        ("B11", 33, 28, 0),
-        ( "C1",  0, 25, 0),
-        ( "C2",  0, 25, 1),
-        ( "C3",  0, 27, 0),
-        ( "C4",  0, 27, 1),
-        ( "C7", 20, 33, 0),
-        ( "C8", 26, 33, 0),
-        ( "C9", 29, 33, 1),
-        ("C11", 33, 27, 1),
-        ( "D1",  0, 22, 0),
-        ( "D2",  0, 21, 1),
-        ( "D3",  0, 21, 0),
-        ( "D5",  8, 33, 1),
-        ( "D7", 25, 33, 0),
-        ( "D9", 33, 21, 0),
-        ("D10", 33, 24, 1),
-        ("D11", 33, 23, 1),
-        ( "E1",  0, 22, 1),
-        ( "E2",  0, 20, 1),
-        ( "E3",  0, 20, 0),
-        ( "E8", 33, 20, 1),
-        ( "E9", 33, 19, 1),
-        ("E10", 33, 17, 0),
-        ("E11", 33, 21, 1),
-        ( "F1",  0, 18, 1),
-        ( "F2",  0, 18, 0),
-        ( "F3",  0, 17, 0),
-        ( "F4",  0, 17, 1),
-        ( "F9", 33, 15, 0),
-        ("F10", 33, 14, 1),
-        ("F11", 33, 16, 1),
-        ( "G1",  0, 16, 1),
-        ( "G2",  0, 16, 0),
-        ( "G3",  0, 12, 1),
-        ( "G8", 33,  5, 1),
-        ( "G9", 33, 10, 1),
-        ("G10", 33,  6, 1),
-        ("G11", 33, 11, 0),
-        ( "H1",  0, 11, 1),
-        ( "H2",  0, 11, 0),
-        ( "H3",  0, 12, 0),
-        ( "H7", 20,  0, 1),
-        ( "H9", 29,  0, 1),
-        ("H10", 33,  4, 1),
-        ("H11", 33,  6, 0),
-        ( "J1",  0,  6, 1),
-        ( "J2",  0,  4, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4",  8,  0, 0),
-        ( "J5", 15,  0, 0),
-        ( "J7", 20,  0, 0),
-        ( "J8", 22,  0, 1),
-        ( "J9", 30,  0, 1),
-        ("J10", 33,  5, 0),
-        ("J11", 33,  3, 1),
-        ( "K1",  0,  6, 0),
-        ( "K2",  0,  4, 1),
-        ( "K3",  7,  0, 1),
-        ( "K4", 12,  0, 1),
-        ( "K5", 15,  0, 1),
-        ( "K6", 17,  0, 0),
-        ( "K7", 21,  0, 1),
-        ( "K9", 30,  0, 0),
-        ("K10", 31,  0, 1),
-        ("K11", 33,  4, 0),
-        ( "L1",  4,  0, 0),
-        ( "L2",  6,  0, 1),
-        ( "L3", 11,  0, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 16,  0, 1),
-        ( "L7", 24,  0, 0),
-        ( "L8", 29,  0, 0),
-        ("L10", 31,  0, 0),
-    ],
-	"8k-bg121": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 1),
-        ( "A3",  3, 33, 0),
-        ( "A4",  9, 33, 0),
-        ( "A5", 11, 33, 0),
-        ( "A6", 11, 33, 1),
-        ( "A7", 19, 33, 1),
-        ( "A8", 20, 33, 1),
-        ( "A9", 26, 33, 1),
-        ("A10", 30, 33, 1),
-        ("A11", 31, 33, 1),
-        ( "B1",  0, 30, 1),
-        ( "B2",  0, 30, 0),
-        ( "B3",  4, 33, 0),
-        ( "B4",  5, 33, 0),
-        ( "B5", 10, 33, 1),
-        ( "B6", 16, 33, 1),
-        ( "B7", 17, 33, 0),
-        ( "B8", 27, 33, 0),
-        ( "B9", 28, 33, 1),
-        ("B11", 33, 28, 0),
-        ( "C1",  0, 25, 0),
-        ( "C2",  0, 25, 1),
-        ( "C3",  0, 27, 0),
-        ( "C4",  0, 27, 1),
-        ( "C7", 20, 33, 0),
-        ( "C8", 26, 33, 0),
-        ( "C9", 29, 33, 1),
-        ("C11", 33, 27, 1),
-        ( "D1",  0, 22, 0),
-        ( "D2",  0, 21, 1),
-        ( "D3",  0, 21, 0),
-        ( "D5",  8, 33, 1),
-        ( "D7", 25, 33, 0),
-        ( "D9", 33, 21, 0),
-        ("D10", 33, 24, 1),
-        ("D11", 33, 23, 1),
-        ( "E1",  0, 22, 1),
-        ( "E2",  0, 20, 1),
-        ( "E3",  0, 20, 0),
-        ( "E8", 33, 20, 1),
-        ( "E9", 33, 19, 1),
-        ("E10", 33, 17, 0),
-        ("E11", 33, 21, 1),
-        ( "F1",  0, 18, 1),
-        ( "F2",  0, 18, 0),
-        ( "F3",  0, 17, 0),
-        ( "F4",  0, 17, 1),
-        ( "F9", 33, 15, 0),
-        ("F10", 33, 14, 1),
-        ("F11", 33, 16, 1),
-        ( "G1",  0, 16, 1),
-        ( "G2",  0, 16, 0),
-        ( "G3",  0, 12, 1),
-        ( "G8", 33,  5, 1),
-        ( "G9", 33, 10, 1),
-        ("G10", 33,  6, 1),
-        ("G11", 33, 11, 0),
-        ( "H1",  0, 11, 1),
-        ( "H2",  0, 11, 0),
-        ( "H3",  0, 12, 0),
-        ( "H7", 20,  0, 1),
-        ( "H9", 29,  0, 1),
-        ("H10", 33,  4, 1),
-        ("H11", 33,  6, 0),
-        ( "J1",  0,  6, 1),
-        ( "J2",  0,  4, 0),
-        ( "J3",  4,  0, 1),
-        ( "J4",  8,  0, 0),
-        ( "J5", 15,  0, 0),
-        ( "J7", 20,  0, 0),
-        ( "J8", 22,  0, 1),
-        ( "J9", 30,  0, 1),
-        ("J10", 33,  5, 0),
-        ("J11", 33,  3, 1),
-        ( "K1",  0,  6, 0),
-        ( "K2",  0,  4, 1),
-        ( "K3",  7,  0, 1),
-        ( "K4", 12,  0, 1),
-        ( "K5", 15,  0, 1),
-        ( "K6", 17,  0, 0),
-        ( "K7", 21,  0, 1),
-        ( "K9", 30,  0, 0),
-        ("K10", 31,  0, 1),
-        ("K11", 33,  4, 0),
-        ( "L1",  4,  0, 0),
-        ( "L2",  6,  0, 1),
-        ( "L3", 11,  0, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 16,  0, 1),
-        ( "L7", 24,  0, 0),
-        ( "L8", 29,  0, 0),
-        ("L10", 31,  0, 0),
-    ],
-    "8k-cm225": [
-        ( "A1",  1, 33, 1),
-        ( "A2",  3, 33, 1),
-        ( "A5",  6, 33, 1),
-        ( "A6", 11, 33, 0),
-        ( "A7", 12, 33, 0),
-        ( "A8", 17, 33, 1),
-        ( "A9", 18, 33, 1),
-        ("A10", 21, 33, 0),
-        ("A11", 23, 33, 1),
-        ("A15", 31, 33, 0),
-        ( "B1",  0, 31, 0),
-        ( "B2",  2, 33, 1),
-        ( "B3",  4, 33, 1),
-        ( "B4",  5, 33, 1),
-        ( "B5",  7, 33, 1),
-        ( "B6", 10, 33, 0),
-        ( "B7", 14, 33, 0),
-        ( "B8", 19, 33, 1),
-        ( "B9", 18, 33, 0),
-        ("B10", 22, 33, 0),
-        ("B11", 23, 33, 0),
-        ("B12", 25, 33, 1),
-        ("B13", 27, 33, 1),
-        ("B14", 31, 33, 1),
-        ("B15", 33, 31, 0),
-        ( "C1",  0, 28, 0),
-        ( "C2",  0, 31, 1),
-        ( "C3",  2, 33, 0),
-        ( "C4",  3, 33, 0),
-        ( "C5",  5, 33, 0),
-        ( "C6", 13, 33, 0),
-        ( "C7", 11, 33, 1),
-        ( "C8", 19, 33, 0),
-        ( "C9", 17, 33, 0),
-        ("C10", 20, 33, 0),
-        ("C11", 24, 33, 1),
-        ("C12", 30, 33, 1),
-        ("C13", 30, 33, 0),
-        ("C14", 33, 30, 0),
-        ( "D1",  0, 25, 0),
-        ( "D2",  0, 24, 1),
-        ( "D3",  0, 27, 0),
-        ( "D4",  0, 30, 0),
-        ( "D5",  4, 33, 0),
-        ( "D6",  9, 33, 0),
-        ( "D7", 10, 33, 1),
-        ( "D8", 16, 33, 1),
-        ( "D9", 26, 33, 1),
-        ("D10", 25, 33, 0),
-        ("D11", 28, 33, 1),
-        ("D13", 33, 27, 1),
-        ("D14", 33, 25, 0),
-        ("D15", 33, 27, 0),
-        ( "E2",  0, 24, 0),
-        ( "E3",  0, 28, 1),
-        ( "E4",  0, 30, 1),
-        ( "E5",  0, 27, 1),
-        ( "E6",  0, 25, 1),
-        ( "E9", 26, 33, 0),
-        ("E10", 27, 33, 0),
-        ("E11", 29, 33, 1),
-        ("E13", 33, 28, 0),
-        ("E14", 33, 24, 0),
-        ( "F1",  0, 20, 0),
-        ( "F2",  0, 21, 0),
-        ( "F3",  0, 21, 1),
-        ( "F4",  0, 22, 0),
-        ( "F5",  0, 22, 1),
-        ( "F7",  8, 33, 1),
-        ( "F9", 20, 33, 1),
-        ("F11", 33, 24, 1),
-        ("F12", 33, 23, 1),
-        ("F13", 33, 23, 0),
-        ("F14", 33, 21, 0),
-        ("F15", 33, 22, 0),
-        ( "G1",  0, 19, 0),
-        ( "G2",  0, 20, 1),
-        ( "G3",  0, 19, 1),
-        ( "G4",  0, 17, 0),
-        ( "G5",  0, 18, 1),
-        ("G10", 33, 20, 1),
-        ("G11", 33, 19, 1),
-        ("G12", 33, 21, 1),
-        ("G13", 33, 17, 0),
-        ("G14", 33, 20, 0),
-        ("G15", 33, 19, 0),
-        ( "H1",  0, 16, 0),
-        ( "H2",  0, 18, 0),
-        ( "H3",  0, 14, 1),
-        ( "H4",  0, 13, 1),
-        ( "H5",  0, 16, 1),
-        ( "H6",  0, 17, 1),
-        ("H11", 33, 14, 1),
-        ("H12", 33, 16, 1),
-        ("H13", 33, 15, 1),
-        ("H14", 33, 15, 0),
-        ( "J1",  0, 13, 0),
-        ( "J2",  0, 12, 0),
-        ( "J3",  0, 14, 0),
-        ( "J4",  0, 11, 1),
-        ( "J5",  0, 12, 1),
-        ("J10", 33,  5, 1),
-        ("J11", 33, 10, 1),
-        ("J12", 33,  6, 1),
-        ("J13", 33, 11, 0),
-        ("J14", 33, 14, 0),
-        ("J15", 33, 13, 0),
-        ( "K1",  0, 11, 0),
-        ( "K3",  0,  9, 1),
-        ( "K4",  0,  4, 0),
-        ( "K5",  0,  6, 1),
-        ( "K9", 20,  0, 1),
-        ("K11", 29,  0, 0),
-        ("K12", 33,  4, 1),
-        ("K13", 33,  5, 0),
-        ("K14", 33, 12, 0),
-        ("K15", 33,  9, 0),
-        ( "L1",  0,  9, 0),
-        ( "L3",  0,  7, 1),
-        ( "L4",  0,  3, 0),
-        ( "L5",  4,  0, 0),
-        ( "L6",  7,  0, 0),
-        ( "L7", 12,  0, 0),
-        ( "L9", 17,  0, 0),
-        ("L10", 21,  0, 1),
-        ("L11", 30,  0, 1),
-        ("L12", 33,  3, 1),
-        ("L13", 33,  6, 0),
-        ("L14", 33,  7, 0),
-        ( "M1",  0,  7, 0),
-        ( "M2",  0,  6, 0),
-        ( "M3",  0,  5, 0),
-        ( "M4",  0,  3, 1),
-        ( "M5",  6,  0, 0),
-        ( "M6",  8,  0, 0),
-        ( "M7", 13,  0, 1),
-        ( "M8", 15,  0, 0),
-        ( "M9", 19,  0, 1),
-        ("M11", 30,  0, 0),
-        ("M12", 31,  0, 1),
-        ("M13", 33,  4, 0),
-        ("M14", 33,  8, 0),
-        ("M15", 33,  3, 0),
-        ( "N2",  0,  5, 1),
-        ( "N3",  2,  0, 0),
-        ( "N4",  3,  0, 0),
-        ( "N5",  9,  0, 1),
-        ( "N6", 12,  0, 1),
-        ( "N7", 16,  0, 1),
-        ( "N9", 20,  0, 0),
-        ("N10", 22,  0, 1),
-        ("N12", 31,  0, 0),
-        ( "P1",  0,  4, 1),
-        ( "P2",  2,  0, 1),
-        ( "P4",  7,  0, 1),
-        ( "P5", 10,  0, 1),
-        ( "P6", 14,  0, 1),
-        ( "P7", 17,  0, 1),
-        ( "P8", 19,  0, 0),
-        ( "P9", 22,  0, 0),
-        ("P10", 23,  0, 0),
-        ("P11", 25,  0, 0),
-        ("P12", 29,  0, 1),
-        ("P13", 27,  0, 0),
-        ("P14", 33,  2, 1),
-        ("P15", 33,  1, 1),
-        ( "R1",  3,  0, 1),
-        ( "R2",  4,  0, 1),
-        ( "R3",  6,  0, 1),
-        ( "R4",  8,  0, 1),
-        ( "R5", 11,  0, 1),
-        ( "R6", 15,  0, 1),
-        ( "R9", 21,  0, 0),
-        ("R10", 24,  0, 0),
-        ("R11", 26,  0, 0),
-        ("R12", 28,  0, 0),
-        ("R14", 33,  2, 0),
-        ("R15", 33,  1, 0),
-    ],
-    "8k-cb132": [
-        ( "A1",  2, 33, 0),
-        ( "A2",  3, 33, 0),
-        ( "A3",  3, 33, 1),
-        ( "A4",  5, 33, 0),
-        ( "A5", 10, 33, 1),
-        ( "A6", 16, 33, 1),
-        ( "A7", 17, 33, 0),
-        ("A10", 25, 33, 0),
-        ("A11", 26, 33, 0),
-        ("A12", 30, 33, 1),
-        ( "B1",  0, 30, 1),
-        ("B14", 33, 28, 0),
-        ( "C1",  0, 30, 0),
-        ( "C3",  0, 27, 1),
-        ( "C4",  4, 33, 0),
-        ( "C5",  8, 33, 1),
-        ( "C6", 11, 33, 1),
-        ( "C7", 14, 33, 1),
-        ( "C9", 20, 33, 1),
-        ("C10", 22, 33, 1),
-        ("C11", 28, 33, 1),
-        ("C12", 29, 33, 1),
-        ("C14", 33, 24, 1),
-        ( "D1",  0, 25, 1),
-        ( "D3",  0, 27, 0),
-        ( "D4",  0, 22, 1),
-        ( "D5",  9, 33, 0),
-        ( "D6", 11, 33, 0),
-        ( "D7", 13, 33, 1),
-        ( "D9", 21, 33, 1),
-        ("D10", 27, 33, 0),
-        ("D11", 26, 33, 1),
-        ("D12", 33, 27, 1),
-        ("D14", 33, 23, 1),
-        ( "E1",  0, 25, 0),
-        ( "E4",  0, 22, 0),
-        ("E11", 33, 20, 1),
-        ("E12", 33, 21, 0),
-        ("E14", 33, 21, 1),
-        ( "F3",  0, 21, 0),
-        ( "F4",  0, 21, 1),
-        ("F11", 33, 19, 1),
-        ("F12", 33, 15, 0),
-        ("F14", 33, 16, 1),
-        ( "G1",  0, 17, 0),
-        ( "G3",  0, 17, 1),
-        ( "G4",  0, 20, 0),
-        ("G11", 33, 14, 1),
-        ("G12", 33, 11, 0),
-        ("G14", 33, 17, 0),
-        ( "H1",  0, 16, 1),
-        ( "H3",  0, 16, 0),
-        ( "H4",  0, 20, 1),
-        ("H11", 33, 10, 1),
-        ("H12", 33,  6, 1),
-        ( "J1",  0, 18, 0),
-        ( "J3",  0, 18, 1),
-        ("J11", 33,  6, 0),
-        ("J12", 33,  5, 1),
-        ( "K3",  0, 11, 1),
-        ( "K4",  0, 11, 0),
-        ("K11", 33,  4, 1),
-        ("K12", 33,  4, 0),
-        ("K14", 33,  5, 0),
-        ( "L1",  0,  6, 1),
-        ( "L4", 12,  0, 0),
-        ( "L5", 11,  0, 1),
-        ( "L6", 15,  0, 0),
-        ( "L8", 20,  0, 1),
-        ( "L9", 29,  0, 0),
-        ("L12", 33,  2, 0),
-        ("L14", 33,  3, 1),
-        ( "M1",  0,  6, 0),
-        ( "M3",  8,  0, 0),
-        ( "M4",  7,  0, 1),
-        ( "M6", 14,  0, 1),
-        ( "M7", 15,  0, 1),
-        ( "M9", 22,  0, 1),
-        ("M11", 30,  0, 0),
-        ("M12", 33,  1, 0),
-        ( "N1",  0,  4, 1),
-        ("N14", 33,  2, 1),
-        ( "P1",  0,  4, 0),
-        ( "P2",  4,  0, 0),
-        ( "P3",  5,  0, 1),
-        ( "P4", 12,  0, 1),
-        ( "P5", 13,  0, 0),
-        ( "P7", 16,  0, 1),
-        ( "P8", 17,  0, 0),
-        ( "P9", 21,  0, 1),
-        ("P10", 29,  0, 1),
-        ("P11", 30,  0, 1),
-        ("P12", 31,  0, 0),
-        ("P13", 31,  0, 1),
-        ("P14", 33,  1, 1),
-    ],
-    "8k-ct256": [
-        ( "A1",  4, 33, 1),
-        ( "A2",  5, 33, 1),
-        ( "A5",  8, 33, 0),
-        ( "A6",  9, 33, 0),
-        ( "A7", 12, 33, 0),
-        ( "A9", 18, 33, 1),
-        ("A10", 22, 33, 1),
-        ("A11", 22, 33, 0),
-        ("A15", 27, 33, 0),
-        ("A16", 27, 33, 1),
-        ( "B1",  0, 30, 0),
-        ( "B2",  0, 31, 0),
-        ( "B3",  3, 33, 0),
-        ( "B4",  6, 33, 1),
-        ( "B5",  7, 33, 1),
-        ( "B6", 10, 33, 1),
-        ( "B7", 11, 33, 0),
-        ( "B8", 13, 33, 0),
-        ( "B9", 16, 33, 0),
-        ("B10", 24, 33, 0),
-        ("B11", 23, 33, 1),
-        ("B12", 24, 33, 1),
-        ("B13", 26, 33, 1),
-        ("B14", 30, 33, 0),
-        ("B15", 31, 33, 0),
-        ("B16", 33, 30, 0),
-        ( "C1",  0, 28, 1),
-        ( "C2",  0, 28, 0),
-        ( "C3",  1, 33, 0),
-        ( "C4",  3, 33, 1),
-        ( "C5",  4, 33, 0),
-        ( "C6", 10, 33, 0),
-        ( "C7", 11, 33, 1),
-        ( "C8", 17, 33, 0),
-        ( "C9", 20, 33, 0),
-        ("C10", 23, 33, 0),
-        ("C11", 25, 33, 1),
-        ("C12", 29, 33, 1),
-        ("C13", 28, 33, 1),
-        ("C14", 31, 33, 1),
-        ("C16", 33, 28, 0),
-        ( "D1",  0, 25, 0),
-        ( "D2",  0, 27, 0),
-        ( "D3",  1, 33, 1),
-        ( "D4",  2, 33, 1),
-        ( "D5",  5, 33, 0),
-        ( "D6",  8, 33, 1),
-        ( "D7",  9, 33, 1),
-        ( "D8", 14, 33, 1),
-        ( "D9", 19, 33, 0),
-        ("D10", 20, 33, 1),
-        ("D11", 25, 33, 0),
-        ("D13", 30, 33, 1),
-        ("D14", 33, 31, 0),
-        ("D15", 33, 26, 0),
-        ("D16", 33, 24, 0),
-        ( "E2",  0, 23, 0),
-        ( "E3",  0, 24, 0),
-        ( "E4",  0, 31, 1),
-        ( "E5",  2, 33, 0),
-        ( "E6",  7, 33, 0),
-        ( "E9", 19, 33, 1),
-        ("E10", 26, 33, 0),
-        ("E11", 29, 33, 0),
-        ("E13", 33, 30, 1),
-        ("E14", 33, 27, 1),
-        ("E16", 33, 23, 0),
-        ( "F1",  0, 20, 0),
-        ( "F2",  0, 21, 0),
-        ( "F3",  0, 22, 0),
-        ( "F4",  0, 27, 1),
-        ( "F5",  0, 30, 1),
-        ( "F7", 16, 33, 1),
-        ( "F9", 17, 33, 1),
-        ("F11", 33, 26, 1),
-        ("F12", 33, 25, 1),
-        ("F13", 33, 28, 1),
-        ("F14", 33, 25, 0),
-        ("F15", 33, 22, 0),
-        ("F16", 33, 21, 0),
-        ( "G1",  0, 17, 0),
-        ( "G2",  0, 19, 0),
-        ( "G3",  0, 22, 1),
-        ( "G4",  0, 24, 1),
-        ( "G5",  0, 25, 1),
-        ("G10", 33, 20, 1),
-        ("G11", 33, 21, 1),
-        ("G12", 33, 24, 1),
-        ("G13", 33, 23, 1),
-        ("G14", 33, 22, 1),
-        ("G15", 33, 20, 0),
-        ("G16", 33, 19, 0),
-        ( "H1",  0, 16, 0),
-        ( "H2",  0, 18, 0),
-        ( "H3",  0, 21, 1),
-        ( "H4",  0, 19, 1),
-        ( "H5",  0, 23, 1),
-        ( "H6",  0, 20, 1),
-        ("H11", 33, 16, 1),
-        ("H12", 33, 19, 1),
-        ("H13", 33, 16, 0),
-        ("H14", 33, 17, 1),
-        ("H16", 33, 17, 0),
-        ( "J1",  0, 14, 0),
-        ( "J2",  0, 14, 1),
-        ( "J3",  0, 16, 1),
-        ( "J4",  0, 18, 1),
-        ( "J5",  0, 17, 1),
-        ("J10", 33,  7, 1),
-        ("J11", 33,  9, 1),
-        ("J12", 33, 14, 1),
-        ("J13", 33, 15, 0),
-        ("J14", 33, 13, 1),
-        ("J15", 33, 11, 1),
-        ("J16", 33, 15, 1),
-        ( "K1",  0, 13, 1),
-        ( "K3",  0, 13, 0),
-        ( "K4",  0, 11, 1),
-        ( "K5",  0,  9, 1),
-        ( "K9", 17,  0, 0),
-        ("K11", 29,  0, 0),
-        ("K12", 33,  6, 1),
-        ("K13", 33, 10, 1),
-        ("K14", 33, 11, 0),
-        ("K15", 33, 12, 0),
-        ("K16", 33, 13, 0),
-        ( "L1",  0, 12, 0),
-        ( "L3",  0, 10, 0),
-        ( "L4",  0, 12, 1),
-        ( "L5",  0,  6, 1),
-        ( "L6",  0, 10, 1),
-        ( "L7",  0,  8, 1),
-        ( "L9", 13,  0, 0),
-        ("L10", 19,  0, 1),
-        ("L11", 26,  0, 1),
-        ("L12", 33,  4, 1),
-        ("L13", 33,  5, 1),
-        ("L14", 33,  6, 0),
-        ("L16", 33, 10, 0),
-        ( "M1",  0, 11, 0),
-        ( "M2",  0,  9, 0),
-        ( "M3",  0,  7, 0),
-        ( "M4",  0,  5, 0),
-        ( "M5",  0,  4, 0),
-        ( "M6",  0,  7, 1),
-        ( "M7",  8,  0, 0),
-        ( "M8", 10,  0, 0),
-        ( "M9", 16,  0, 0),
-        ("M11", 23,  0, 1),
-        ("M12", 27,  0, 1),
-        ("M13", 33,  3, 1),
-        ("M14", 33,  4, 0),
-        ("M15", 33,  8, 0),
-        ("M16", 33,  7, 0),
-        ( "N2",  0,  8, 0),
-        ( "N3",  0,  6, 0),
-        ( "N4",  0,  3, 0),
-        ( "N5",  4,  0, 0),
-        ( "N6",  2,  0, 0),
-        ( "N7",  9,  0, 0),
-        ( "N9", 15,  0, 0),
-        ("N10", 20,  0, 1),
-        ("N12", 26,  0, 0),
-        ("N16", 33,  5, 0),
-        ( "P1",  0,  5, 1),
-        ( "P2",  0,  4, 1),
-        ( "P4",  3,  0, 0),
-        ( "P5",  5,  0, 0),
-        ( "P6",  9,  0, 1),
-        ( "P7", 14,  0, 1),
-        ( "P8", 12,  0, 0),
-        ( "P9", 17,  0, 1),
-        ("P10", 20,  0, 0),
-        ("P11", 30,  0, 1),
-        ("P12", 30,  0, 0),
-        ("P13", 29,  0, 1),
-        ("P14", 33,  2, 0),
-        ("P15", 33,  2, 1),
-        ("P16", 33,  3, 0),
-        ( "R1",  0,  3, 1),
-        ( "R2",  3,  0, 1),
-        ( "R3",  5,  0, 1),
-        ( "R4",  7,  0, 1),
-        ( "R5",  6,  0, 0),
-        ( "R6", 11,  0, 1),
-        ( "R9", 16,  0, 1),
-        ("R10", 19,  0, 0),
-        ("R11", 31,  0, 0),
-        ("R12", 31,  0, 1),
-        ("R14", 33,  1, 0),
-        ("R15", 33,  1, 1),
-        ("R16", 28,  0, 0),
-        ( "T1",  2,  0, 1),
-        ( "T2",  4,  0, 1),
-        ( "T3",  6,  0, 1),
-        ( "T5", 10,  0, 1),
-        ( "T6", 12,  0, 1),
-        ( "T7", 13,  0, 1),
-        ( "T8", 14,  0, 0),
-        ( "T9", 15,  0, 1),
-        ("T10", 21,  0, 0),
-        ("T11", 21,  0, 1),
-        ("T13", 24,  0, 0),
-        ("T14", 23,  0, 0),
-        ("T15", 22,  0, 1),
-        ("T16", 27,  0, 0),
-    ],
-    "384-qn32": [
-        (  "1",  0,  7, 0),
-        (  "2",  0,  7, 1),
-        (  "5",  0,  5, 1),
-        (  "6",  0,  5, 0),
-        (  "7",  0,  4, 0),
-        (  "8",  0,  4, 1),
-        ( "12",  5,  0, 0),
-        ( "13",  5,  0, 1),
-        ( "14",  6,  0, 1),
-        ( "15",  6,  0, 0),
-        ( "18",  7,  4, 0),
-        ( "19",  7,  4, 1),
-        ( "20",  7,  5, 0),
-        ( "22",  7,  6, 0),
-        ( "23",  7,  6, 1),
-        ( "26",  6,  9, 0),
-        ( "27",  5,  9, 0),
-        ( "29",  4,  9, 0),
-        ( "30",  3,  9, 1),
-        ( "31",  2,  9, 0),
-        ( "32",  2,  9, 1),
-    ],
-    "384-cm36": [
-        ( "A1",  0,  7, 0),
-        ( "A2",  2,  9, 1),
-        ( "A3",  3,  9, 1),
-        ( "B1",  0,  7, 1),
-        ( "B3",  4,  9, 0),
-        ( "B4",  7,  5, 0),
-        ( "B5",  7,  5, 1),
-        ( "B6",  7,  6, 0),
-        ( "C1",  0,  5, 0),
-        ( "C2",  0,  5, 1),
-        ( "C3",  2,  9, 0),
-        ( "C5",  7,  4, 1),
-        ( "C6",  7,  6, 1),
-        ( "D1",  0,  4, 1),
-        ( "D5",  6,  0, 1),
-        ( "D6",  7,  4, 0),
-        ( "E1",  0,  4, 0),
-        ( "E2",  3,  0, 1),
-        ( "E3",  4,  0, 0),
-        ( "E4",  5,  0, 0),
-        ( "E5",  6,  0, 0),
-        ( "E6",  7,  3, 1),
-        ( "F2",  3,  0, 0),
-        ( "F3",  4,  0, 1),
-        ( "F5",  5,  0, 1),
-    ],
-    "384-cm49": [
-        ( "A1",  0,  7, 1),
-        ( "A2",  2,  9, 1),
-        ( "A3",  3,  9, 0),
-        ( "A4",  4,  9, 1),
-        ( "A5",  5,  9, 0),
-        ( "A6",  6,  9, 0),
-        ( "A7",  6,  9, 1),
-        ( "B1",  0,  7, 0),
-        ( "B2",  0,  6, 0),
-        ( "B3",  2,  9, 0),
-        ( "B4",  4,  9, 0),
-        ( "C1",  0,  5, 1),
-        ( "C2",  0,  6, 1),
-        ( "C4",  3,  9, 1),
-        ( "C5",  7,  6, 1),
-        ( "C6",  7,  5, 1),
-        ( "C7",  7,  6, 0),
-        ( "D1",  0,  4, 0),
-        ( "D2",  0,  5, 0),
-        ( "D3",  0,  2, 0),
-        ( "D4",  5,  9, 1),
-        ( "D6",  7,  4, 1),
-        ( "D7",  7,  5, 0),
-        ( "E2",  0,  4, 1),
-        ( "E6",  6,  0, 1),
-        ( "E7",  7,  4, 0),
-        ( "F1",  0,  2, 1),
-        ( "F2",  0,  1, 0),
-        ( "F3",  3,  0, 1),
-        ( "F4",  4,  0, 0),
-        ( "F5",  5,  0, 0),
-        ( "F6",  6,  0, 0),
-        ( "F7",  7,  3, 1),
-        ( "G1",  0,  1, 1),
-        ( "G3",  3,  0, 0),
-        ( "G4",  4,  0, 1),
-        ( "G6",  5,  0, 1),
-    ],
-    "5k-sg48": [
-        (  "2",  8,  0, 0),
-        (  "3",  9,  0, 1),
-        (  "4",  9,  0, 0),
-        (  "6", 13,  0, 1),
-        (  "9", 15,  0, 0),
-        ( "10", 16,  0, 0),
-        ( "11", 17,  0, 0),
-        ( "12", 18,  0, 0),
-        ( "13", 19,  0, 0),
-        ( "14", 23,  0, 0),
-        ( "15", 24,  0, 0),
-        ( "16", 24,  0, 1),
-        ( "17", 23,  0, 1),
-        ( "18", 22,  0, 1),
-        ( "19", 21,  0, 1),
-        ( "20", 19,  0, 1),
-        ( "21", 18,  0, 1),
-        ( "23", 19, 31, 0),
-        ( "25", 19, 31, 1),
-        ( "26", 18, 31, 0),
-        ( "27", 18, 31, 1),
-        ( "28", 17, 31, 0),
-        ( "31", 16, 31, 1),
-        ( "32", 16, 31, 0),
-        ( "34", 13, 31, 1),
-        ( "35", 12, 31, 1),
-        ( "36",  9, 31, 1),
-        ( "37", 13, 31, 0),
-        ( "38",  8, 31, 1),
-        ( "39",  4, 31, 0),
-        ( "40",  5, 31, 0),
-        ( "41",  6, 31, 0),
-        ( "42",  8, 31, 0),
-        ( "43",  9, 31, 0),
-        ( "44",  6,  0, 1),
-        ( "45",  7,  0, 1),
-        ( "46",  5,  0, 0),
-        ( "47",  6,  0, 0),
-        ( "48",  7,  0, 0),
-    ],
-    "u4k-sg48": [
-        (  "2",  8,  0, 0),
-        (  "3",  9,  0, 1),
-        (  "4",  9,  0, 0),
-        (  "6", 13,  0, 1),
-        (  "9", 15,  0, 0),
-        ( "10", 16,  0, 0),
-        ( "11", 17,  0, 0),
-        ( "12", 18,  0, 0),
-        ( "13", 19,  0, 0),
-        ( "14", 23,  0, 0),
-        ( "15", 24,  0, 0),
-        ( "16", 24,  0, 1),
-        ( "17", 23,  0, 1),
-        ( "18", 22,  0, 1),
-        ( "19", 21,  0, 1),
-        ( "20", 19,  0, 1),
-        ( "21", 18,  0, 1),
-        ( "23", 19, 21, 0),
-        ( "25", 19, 21, 1),
-        ( "26", 18, 21, 0),
-        ( "27", 18, 21, 1),
-        ( "28", 17, 21, 0),
-        ( "31", 16, 21, 1),
-        ( "32", 16, 21, 0),
-        ( "34", 13, 21, 1),
-        ( "35", 12, 21, 1),
-        ( "36",  9, 21, 1),
-        ( "37", 13, 21, 0),
-        ( "38",  8, 21, 1),
-        ( "39",  6, 21, 0),
-        ( "40",  5, 21, 0),
-        ( "41",  4, 21, 0),
-        ( "42",  8, 21, 0),
-        ( "43",  9, 21, 0),
-        ( "44",  6,  0, 1),
-        ( "45",  7,  0, 1),
-        ( "46",  5,  0, 0),
-        ( "47",  6,  0, 0),
-        ( "48",  7,  0, 0),
-    ],
-    "5k-uwg30": [
-        ( "A1", 19, 31, 1),
-        ( "A2", 19, 31, 0),
-        ( "A4", 12, 31, 0),
-        ( "A5",  4, 31, 0),
-        ( "B1", 19,  0, 0),
-        ( "B3", 12, 31, 1),
-        ( "B5",  5, 31, 0),
-        ( "C1", 24,  0, 1),
-        ( "C3", 12,  0, 0),
-        ( "C5",  6, 31, 0),
-        ( "D1", 24,  0, 0),
-        ( "D3", 13,  0, 0),
-        ( "D5",  6,  0, 0),
-        ( "E1", 23,  0, 1),
-        ( "E3", 13,  0, 1),
-        ( "E4",  9,  0, 1),
-        ( "E5",  5,  0, 0),
-        ( "F1", 23,  0, 0),
-        ( "F2", 19,  0, 1),
-        ( "F4", 12,  0, 1),
-        ( "F5",  6,  0, 1),
-    ],
-    "lm4k-cm49": [
-        ( "A1",  5,  21, 1),
-        ( "A2",  6,  21, 0),
-        ( "A3",  12, 21, 1),
-        ( "A4",  13, 21, 0),
-        ( "A5",  17, 21, 1),
-        ( "A6",  19, 21, 1),
-        ( "A7",  22, 21, 1),
-        ( "B1",  4, 21, 1),
-        ( "B2",  7, 21, 1),
-        ( "B4",  15, 21, 0),
-        ( "B6",  18, 21, 0),
-        ( "B7",  23, 21, 1),
-        ( "C1",  4, 21, 0),
-        ( "C3",  9, 21, 0),
-        ( "C4",  19, 21, 0),
-        ( "C6",  21, 21, 1),
-        ( "C7",  23, 21, 0),
-        ( "D1",  7,  0, 1),
-        ( "D2",  6,  0, 1),
-        ( "D3", 10,  0, 0),
-        ( "D6", 19,  0, 1),
-        ( "D7", 21,  0, 0),
-        ( "E1",  6,  0, 0),
-        ( "E2", 12,  0, 1),
-        ( "E3",  7,  0, 0),
-        ( "E4", 12,  0, 0),
-        ( "E5", 19,  0, 0),
-        ( "E6", 24,  0, 1),
-        ( "E7", 22,  0, 0),
-        ( "F2",  8,  0, 1),
-        ( "F3",  8,  0, 0),
-        ( "F4", 13,  0, 1),
-        ( "F5", 23,  0, 0),
-        ( "F6", 24,  0, 0),
-        ( "F7", 21,  0, 1),
-        ( "G3", 13,  0, 0),
-        ( "G6", 23,  0, 1),
-    ],
-    "lm4k-cm36": [
-        ( "A1",  5, 21, 1),
-        ( "A2",  7, 21, 1),
-        ( "A3",  9, 21, 1),
-        ( "A4", 16, 21, 1),
-        ( "A5", 19, 21, 1),
-        ( "A6", 22, 21, 1),
-        ( "B1",  4, 21, 1),
-        ( "B2",  6, 21, 0),
-        ( "B3", 12, 21, 1),
-        ( "B4", 13, 21, 0),
-        ( "B5", 21, 21, 1),
-        ( "B6", 23, 21, 1),
-        ( "C1",  7,  0, 1),
-        ( "C5", 23, 21, 0),
-        ( "C6", 23,  0, 0),
-        ( "D1",  6,  0, 1),
-        ( "D6", 24,  0, 0),
-        ( "E1",  7,  0, 0),
-        ( "E2", 13,  0, 0),
-        ( "E3", 14,  0, 1),
-        ( "E5", 22,  0, 1),
-        ( "E6", 24,  0, 1),
-        ( "F1",  6,  0, 0),
-        ( "F2", 10,  0, 0),
-        ( "F3", 12,  0, 1),
-        ( "F4", 19,  0, 0),
-        ( "F5", 22,  0, 0),
-        ( "F6", 23,  0, 1),
-    ],
-    "lm4k-swg25tr": [
-        ( "A1", 22, 21, 1),
-        ( "A3", 13, 21, 0),
-        ( "A4", 12, 21, 1),
-        ( "A5",  5, 21, 1),
-        ( "B1", 21, 21, 1),
-        ( "B5",  6, 21, 0),
-        ( "C1", 23,  0, 1),
-        ( "C2", 19, 21, 1),
-        ( "C4", 13,  0, 0),
-        ( "C5",  7,  0, 1),
-        ( "D1", 24,  0, 0),
-        ( "D2", 23,  0, 0),
-        ( "D3", 19,  0, 0),
-        ( "D5",  6,  0, 1),
-        ( "E1", 24,  0, 1),
-        ( "E3", 12,  0, 1),
-        ( "E4",  7,  0, 0),
-        ( "E5",  6,  0, 0),
-    ]
-}
+@db_loader("pinloc_db")
+def load_pinloc_db():
+    return {
+        "1k-swg16tr": [
+            ( "A2",  6, 17, 1),
+            ( "A4",  2, 17, 0),
+            ( "B1", 11, 17, 1),
+            ( "B2",  0,  8, 1),
+            ( "B3",  0,  9, 0),
+            ( "C1", 12,  0, 0),
+            ( "C2", 11,  0, 1),
+            ( "C3", 11,  0, 0),
+            ( "D1", 12,  0, 1),
+            ( "D3",  6,  0, 1),
+        ],
+        "1k-cm36": [
+            ( "A1",  0, 13, 0),
+            ( "A2",  4, 17, 1),
+            ( "A3",  7, 17, 0),
+            ( "B1",  0, 13, 1),
+            ( "B3",  6, 17, 1),
+            ( "B4", 13,  9, 0),
+            ( "B5", 13, 11, 0),
+            ( "B6", 13, 11, 1),
+            ( "C1",  0,  9, 0),
+            ( "C2",  0,  9, 1),
+            ( "C3",  4, 17, 0),
+            ( "C5", 13,  8, 1),
+            ( "C6", 13, 12, 0),
+            ( "D1",  0,  8, 1),
+            ( "D5", 12,  0, 1),
+            ( "D6", 13,  6, 0),
+            ( "E1",  0,  8, 0),
+            ( "E2",  6,  0, 0),
+            ( "E3", 10,  0, 0),
+            ( "E4", 11,  0, 0),
+            ( "E5", 12,  0, 0),
+            ( "E6", 13,  4, 1),
+            ( "F2",  6,  0, 1),
+            ( "F3", 10,  0, 1),
+            ( "F5", 11,  0, 1),
+        ],
+        "1k-cm49": [
+            ( "A1",  0, 11, 1),
+            ( "A2",  3, 17, 1),
+            ( "A3",  8, 17, 1),
+            ( "A4",  8, 17, 0),
+            ( "A5",  9, 17, 1),
+            ( "A6", 10, 17, 0),
+            ( "A7",  9, 17, 0),
+            ( "B1",  0, 11, 0),
+            ( "B2",  0, 13, 0),
+            ( "B3",  4, 17, 0),
+            ( "B4",  6, 17, 1),
+            ( "C1",  0,  5, 0),
+            ( "C2",  0, 13, 1),
+            ( "C4",  7, 17, 0),
+            ( "C5", 13, 12, 0),
+            ( "C6", 13, 11, 1),
+            ( "C7", 13, 11, 0),
+            ( "D1",  0,  5, 1),
+            ( "D2",  0,  9, 0),
+            ( "D3",  0,  9, 1),
+            ( "D4",  4, 17, 1),
+            ( "D6", 13,  8, 1),
+            ( "D7", 13,  9, 0),
+            ( "E2",  0,  8, 1),
+            ( "E6", 12,  0, 1),
+            ( "E7", 13,  4, 1),
+            ( "F2",  0,  8, 0),
+            ( "F3",  6,  0, 0),
+            ( "F4", 10,  0, 0),
+            ( "F5", 11,  0, 0),
+            ( "F6", 12,  0, 0),
+            ( "F7", 13,  6, 0),
+            ( "G3",  6,  0, 1),
+            ( "G4", 10,  0, 1),
+            ( "G6", 11,  0, 1),
+        ],
+        "1k-cm81": [
+            ( "A1",  1, 17, 1),
+            ( "A2",  4, 17, 0),
+            ( "A3",  5, 17, 0),
+            ( "A4",  6, 17, 0),
+            ( "A6",  8, 17, 1),
+            ( "A7",  9, 17, 0),
+            ( "A8", 10, 17, 0),
+            ( "A9", 13, 14, 1),
+            ( "B1",  0, 13, 0),
+            ( "B2",  0, 14, 0),
+            ( "B3",  2, 17, 1),
+            ( "B4",  4, 17, 1),
+            ( "B5",  8, 17, 0),
+            ( "B6",  9, 17, 1),
+            ( "B7", 10, 17, 1),
+            ( "B8", 11, 17, 0),
+            ( "B9", 13, 11, 1),
+            ( "C1",  0, 13, 1),
+            ( "C2",  0, 14, 1),
+            ( "C3",  0, 12, 1),
+            ( "C4",  6, 17, 1),
+            ( "C5",  7, 17, 0),
+            ( "C9", 13, 12, 0),
+            ( "D1",  0, 11, 1),
+            ( "D2",  0, 12, 0),
+            ( "D3",  0,  9, 0),
+            ( "D5",  3, 17, 1),
+            ( "D6", 13,  6, 0),
+            ( "D7", 13,  7, 0),
+            ( "D8", 13,  9, 0),
+            ( "D9", 13, 11, 0),
+            ( "E1",  0, 10, 1),
+            ( "E2",  0, 10, 0),
+            ( "E3",  0,  8, 1),
+            ( "E4",  0, 11, 0),
+            ( "E5",  5, 17, 1),
+            ( "E7", 13,  6, 1),
+            ( "E8", 13,  8, 1),
+            ( "F1",  0,  8, 0),
+            ( "F3",  0,  9, 1),
+            ( "F7", 12,  0, 1),
+            ( "F8", 13,  4, 0),
+            ( "G1",  0,  5, 1),
+            ( "G3",  0,  5, 0),
+            ( "G4",  6,  0, 0),
+            ( "G5", 10,  0, 0),
+            ( "G6", 11,  0, 0),
+            ( "G7", 12,  0, 0),
+            ( "G8", 13,  4, 1),
+            ( "G9", 13,  2, 1),
+            ( "H1",  2,  0, 0),
+            ( "H4",  6,  0, 1),
+            ( "H5", 10,  0, 1),
+            ( "H7", 11,  0, 1),
+            ( "H9", 13,  2, 0),
+            ( "J1",  3,  0, 0),
+            ( "J2",  2,  0, 1),
+            ( "J3",  3,  0, 1),
+            ( "J4",  5,  0, 0),
+            ( "J6",  7,  0, 0),
+            ( "J7",  9,  0, 1),
+            ( "J8", 13,  1, 0),
+            ( "J9", 13,  1, 1),
+        ],
+        "1k-cm121": [
+            ( "A1",  0, 14, 0),
+            ( "A2",  2, 17, 1),
+            ( "A3",  3, 17, 0),
+            ( "A5",  5, 17, 1),
+            ( "A7",  8, 17, 0),
+            ( "A8", 10, 17, 1),
+            ( "A9", 11, 17, 0),
+            ("A10", 12, 17, 0),
+            ("A11", 13, 15, 0),
+            ( "B1",  0, 13, 0),
+            ( "B2",  1, 17, 1),
+            ( "B3",  2, 17, 0),
+            ( "B4",  3, 17, 1),
+            ( "B5",  4, 17, 1),
+            ( "B7",  9, 17, 0),
+            ( "B8", 11, 17, 1),
+            ( "B9", 12, 17, 1),
+            ("B10", 13, 15, 1),
+            ("B11", 13, 14, 1),
+            ( "C1",  0, 12, 0),
+            ( "C2",  0, 13, 1),
+            ( "C3",  0, 14, 1),
+            ( "C4",  1, 17, 0),
+            ( "C5",  4, 17, 0),
+            ( "C6",  7, 17, 1),
+            ( "C7",  8, 17, 1),
+            ( "C8",  9, 17, 1),
+            ( "C9", 10, 17, 0),
+            ("C10", 13, 14, 0),
+            ("C11", 13, 13, 1),
+            ( "D1",  0, 11, 0),
+            ( "D2",  0, 12, 1),
+            ( "D3",  0, 11, 1),
+            ( "D4",  0, 10, 1),
+            ( "D5",  6, 17, 1),
+            ( "D6",  7, 17, 0),
+            ("D10", 13, 12, 1),
+            ("D11", 13, 11, 1),
+            ( "E2",  0, 10, 0),
+            ( "E3",  0,  9, 1),
+            ( "E4",  0,  9, 0),
+            ( "E6",  5, 17, 0),
+            ( "E7", 13, 12, 0),
+            ( "E8", 13, 13, 0),
+            ( "E9", 13,  9, 0),
+            ("E10", 13,  9, 1),
+            ( "F2",  0,  6, 0),
+            ( "F3",  0,  5, 0),
+            ( "F4",  0,  8, 1),
+            ( "F5",  0,  8, 0),
+            ( "F6",  6, 17, 0),
+            ( "F8", 13, 11, 0),
+            ( "F9", 13,  8, 1),
+            ("F11", 13,  7, 1),
+            ( "G2",  0,  5, 1),
+            ( "G4",  0,  3, 0),
+            ( "G8", 12,  0, 1),
+            ( "G9", 13,  8, 0),
+            ("G11", 13,  7, 0),
+            ( "H1",  0,  6, 1),
+            ( "H2",  0,  4, 1),
+            ( "H4",  0,  2, 0),
+            ( "H5",  6,  0, 0),
+            ( "H6", 10,  0, 0),
+            ( "H7", 11,  0, 0),
+            ( "H8", 12,  0, 0),
+            ( "H9", 13,  6, 1),
+            ("H10", 13,  2, 1),
+            ("H11", 13,  4, 1),
+            ( "J1",  0,  4, 0),
+            ( "J2",  1,  0, 1),
+            ( "J5",  6,  0, 1),
+            ( "J6", 10,  0, 1),
+            ( "J8", 11,  0, 1),
+            ("J10", 13,  2, 0),
+            ("J11", 13,  6, 0),
+            ( "K1",  0,  3, 1),
+            ( "K2",  2,  0, 0),
+            ( "K3",  2,  0, 1),
+            ( "K4",  4,  0, 0),
+            ( "K5",  5,  0, 0),
+            ( "K7",  7,  0, 1),
+            ( "K8",  9,  0, 0),
+            ( "K9", 13,  1, 0),
+            ("K10", 13,  1, 1),
+            ("K11", 13,  3, 1),
+            ( "L1",  0,  2, 1),
+            ( "L2",  3,  0, 0),
+            ( "L3",  3,  0, 1),
+            ( "L4",  4,  0, 1),
+            ( "L5",  7,  0, 0),
+            ( "L7",  8,  0, 0),
+            ( "L9",  8,  0, 1),
+            ("L10",  9,  0, 1),
+            ("L11", 13,  4, 0),
+        ],
+        "1k-cb81": [
+            ( "A2",  2, 17, 1),
+            ( "A3",  3, 17, 1),
+            ( "A4",  6, 17, 1),
+            ( "A7", 11, 17, 0),
+            ( "A8", 12, 17, 1),
+            ( "B1",  0, 13, 1),
+            ( "B2",  0, 14, 0),
+            ( "B3",  0, 13, 0),
+            ( "B4",  5, 17, 1),
+            ( "B5",  8, 17, 1),
+            ( "B6",  9, 17, 1),
+            ( "B7", 11, 17, 1),
+            ( "B8", 12, 17, 0),
+            ( "C1",  0, 12, 0),
+            ( "C2",  0, 10, 0),
+            ( "C3",  0, 14, 1),
+            ( "C4",  1, 17, 1),
+            ( "C5",  8, 17, 0),
+            ( "C6", 10, 17, 0),
+            ( "C7", 13, 15, 0),
+            ( "C8", 13, 15, 1),
+            ( "C9", 13, 14, 1),
+            ( "D1",  0,  9, 0),
+            ( "D2",  0, 10, 1),
+            ( "D3",  0, 12, 1),
+            ( "D4",  5, 17, 0),
+            ( "D5",  4, 17, 0),
+            ( "D6",  7, 17, 0),
+            ( "D7", 13, 13, 0),
+            ( "D8", 13, 13, 1),
+            ( "E1",  0,  8, 1),
+            ( "E2",  0,  8, 0),
+            ( "E3",  0,  9, 1),
+            ( "E6", 10, 17, 1),
+            ( "E7", 13, 12, 0),
+            ( "E8", 13, 11, 0),
+            ( "E9", 13, 11, 1),
+            ( "F2",  0,  6, 1),
+            ( "F3",  0,  6, 0),
+            ( "F6", 13,  8, 0),
+            ( "F7", 13,  9, 0),
+            ( "F8", 13,  8, 1),
+            ( "F9", 13,  7, 1),
+            ( "G1",  0,  4, 1),
+            ( "G2",  0,  2, 1),
+            ( "G3",  3,  0, 1),
+            ( "G4",  4,  0, 0),
+            ( "G5", 10,  0, 0),
+            ( "G6", 13,  4, 0),
+            ( "G7", 13,  4, 1),
+            ( "G8", 13,  6, 1),
+            ( "G9", 13,  7, 0),
+            ( "H2",  0,  4, 0),
+            ( "H3",  2,  0, 1),
+            ( "H4",  6,  0, 0),
+            ( "H5", 10,  0, 1),
+            ( "H7", 11,  0, 0),
+            ( "H8", 12,  0, 1),
+            ( "J2",  2,  0, 0),
+            ( "J3",  6,  0, 1),
+            ( "J7", 11,  0, 1),
+            ( "J8", 12,  0, 0),
+        ],
+        "1k-cb121": [
+            ( "A2",  1, 17, 1),
+            ( "A3",  2, 17, 0),
+            ( "A4",  4, 17, 0),
+            ( "A5",  3, 17, 1),
+            ( "A6",  4, 17, 1),
+            ( "A8", 10, 17, 0),
+            ("A10", 12, 17, 1),
+            ("A11", 13, 15, 0),
+            ( "B1",  0, 14, 0),
+            ( "B3",  1, 17, 0),
+            ( "B4",  2, 17, 1),
+            ( "B5",  3, 17, 0),
+            ( "B8", 10, 17, 1),
+            ( "B9", 12, 17, 0),
+            ("B11", 13, 15, 1),
+            ( "C1",  0, 14, 1),
+            ( "C2",  0, 11, 1),
+            ( "C3",  0, 13, 1),
+            ( "C4",  0, 13, 0),
+            ( "C5",  5, 17, 0),
+            ( "C6",  7, 17, 0),
+            ( "C7",  8, 17, 1),
+            ( "C8", 11, 17, 0),
+            ( "C9", 11, 17, 1),
+            ("C11", 13, 14, 1),
+            ( "D1",  0, 10, 1),
+            ( "D2",  0, 11, 0),
+            ( "D3",  0,  9, 0),
+            ( "D4",  0, 12, 0),
+            ( "D5",  5, 17, 1),
+            ( "D6",  6, 17, 1),
+            ( "D7",  8, 17, 0),
+            ( "D8", 13, 12, 0),
+            ( "D9", 13, 13, 0),
+            ("D10", 13, 13, 1),
+            ("D11", 13, 14, 0),
+            ( "E2",  0, 10, 0),
+            ( "E3",  0,  9, 1),
+            ( "E4",  0, 12, 1),
+            ( "E5",  6, 17, 0),
+            ( "E6",  7, 17, 1),
+            ( "E7",  9, 17, 0),
+            ( "E8", 13, 11, 0),
+            ( "E9", 13, 11, 1),
+            ("E11", 13, 12, 1),
+            ( "F2",  0,  6, 1),
+            ( "F3",  0,  5, 1),
+            ( "F4",  0,  8, 1),
+            ( "F7",  9, 17, 1),
+            ( "F8", 13,  8, 1),
+            ( "F9", 13,  9, 0),
+            ("F10", 13,  9, 1),
+            ( "G1",  0,  6, 0),
+            ( "G3",  0,  5, 0),
+            ( "G4",  0,  8, 0),
+            ( "G7", 13,  6, 1),
+            ( "G8", 13,  7, 0),
+            ( "G9", 13,  7, 1),
+            ("G10", 13,  8, 0),
+            ( "H1",  0,  3, 1),
+            ( "H2",  0,  4, 1),
+            ( "H3",  0,  4, 0),
+            ( "H4",  4,  0, 0),
+            ( "H5",  4,  0, 1),
+            ( "H6", 10,  0, 0),
+            ( "H7", 13,  4, 1),
+            ( "H8", 13,  6, 0),
+            ( "H9", 13,  4, 0),
+            ("H10", 13,  3, 1),
+            ("H11",  9,  0, 1),
+            ( "J1",  0,  3, 0),
+            ( "J2",  0,  2, 0),
+            ( "J3",  0,  2, 1),
+            ( "J4",  2,  0, 1),
+            ( "J5",  3,  0, 0),
+            ( "J6", 10,  0, 1),
+            ( "J8", 11,  0, 0),
+            ( "J9", 12,  0, 1),
+            ("J11",  8,  0, 1),
+            ( "K3",  1,  0, 0),
+            ( "K4",  1,  0, 1),
+            ( "K8", 11,  0, 1),
+            ( "K9", 12,  0, 0),
+            ("K11",  9,  0, 0),
+            ( "L2",  2,  0, 0),
+            ( "L3",  3,  0, 1),
+            ( "L4",  5,  0, 0),
+            ( "L5",  5,  0, 1),
+            ( "L8",  7,  0, 0),
+            ( "L9",  6,  0, 1),
+            ("L10",  7,  0, 1),
+            ("L11",  8,  0, 0),
+        ],
+        "1k-cb132": [
+            ( "A1",  1, 17, 1),
+            ( "A2",  2, 17, 1),
+            ( "A4",  4, 17, 0),
+            ( "A5",  4, 17, 1),
+            ( "A6",  6, 17, 1),
+            ( "A7",  7, 17, 0),
+            ("A10", 10, 17, 0),
+            ("A12", 12, 17, 0),
+            ( "B1",  0, 14, 1),
+            ("B14", 13, 15, 0),
+            ( "C1",  0, 14, 0),
+            ( "C3",  0, 13, 1),
+            ( "C4",  1, 17, 0),
+            ( "C5",  3, 17, 0),
+            ( "C6",  5, 17, 0),
+            ( "C7",  6, 17, 0),
+            ( "C8",  8, 17, 0),
+            ( "C9",  9, 17, 0),
+            ("C10", 11, 17, 0),
+            ("C11", 11, 17, 1),
+            ("C12", 12, 17, 1),
+            ("C14", 13, 14, 0),
+            ( "D1",  0, 11, 1),
+            ( "D3",  0, 13, 0),
+            ( "D4",  0, 12, 1),
+            ( "D5",  2, 17, 0),
+            ( "D6",  3, 17, 1),
+            ( "D7",  5, 17, 1),
+            ( "D8",  7, 17, 1),
+            ( "D9",  8, 17, 1),
+            ("D10",  9, 17, 1),
+            ("D11", 10, 17, 1),
+            ("D12", 13, 15, 1),
+            ("D14", 13, 13, 1),
+            ( "E1",  0, 11, 0),
+            ( "E4",  0, 12, 0),
+            ("E11", 13, 14, 1),
+            ("E12", 13, 13, 0),
+            ("E14", 13, 12, 0),
+            ( "F3",  0, 10, 0),
+            ( "F4",  0, 10, 1),
+            ("F11", 13, 12, 1),
+            ("F12", 13, 11, 1),
+            ("F14", 13,  8, 1),
+            ( "G1",  0,  8, 1),
+            ( "G3",  0,  8, 0),
+            ( "G4",  0,  6, 1),
+            ("G11", 13, 11, 0),
+            ("G12", 13,  9, 1),
+            ("G14", 13,  9, 0),
+            ( "H1",  0,  9, 0),
+            ( "H3",  0,  9, 1),
+            ( "H4",  0,  6, 0),
+            ("H11", 13,  8, 0),
+            ("H12", 13,  7, 1),
+            ( "J1",  0,  5, 1),
+            ( "J3",  0,  5, 0),
+            ("J11", 13,  7, 0),
+            ("J12", 13,  6, 1),
+            ( "K3",  0,  3, 0),
+            ( "K4",  0,  3, 1),
+            ("K11", 13,  4, 1),
+            ("K12", 13,  4, 0),
+            ("K14", 13,  6, 0),
+            ( "L1",  0,  2, 0),
+            ( "L4",  1,  0, 1),
+            ( "L5",  3,  0, 1),
+            ( "L6",  4,  0, 1),
+            ( "L7",  8,  0, 0),
+            ( "L8",  9,  0, 0),
+            ( "L9", 10,  0, 0),
+            ("L12", 13,  2, 0),
+            ("L14", 13,  3, 1),
+            ( "M1",  0,  2, 1),
+            ( "M3",  1,  0, 0),
+            ( "M4",  3,  0, 0),
+            ( "M6",  5,  0, 1),
+            ( "M7",  6,  0, 0),
+            ( "M8",  8,  0, 1),
+            ( "M9",  9,  0, 1),
+            ("M11", 11,  0, 0),
+            ("M12", 13,  1, 0),
+            ("N14", 13,  2, 1),
+            ( "P2",  2,  0, 0),
+            ( "P3",  2,  0, 1),
+            ( "P4",  4,  0, 0),
+            ( "P5",  5,  0, 0),
+            ( "P7",  6,  0, 1),
+            ( "P8",  7,  0, 0),
+            ( "P9",  7,  0, 1),
+            ("P10", 10,  0, 1),
+            ("P11", 11,  0, 1),
+            ("P12", 12,  0, 0),
+            ("P13", 12,  0, 1),
+            ("P14", 13,  1, 1),
+        ],
+        "1k-qn84": [
+            ( "A1",  0, 14, 0),
+            ( "A2",  0, 13, 0),
+            ( "A3",  0, 12, 0),
+            ( "A4",  0, 11, 0),
+            ( "A5",  0, 10, 0),
+            ( "A8",  0,  9, 0),
+            ( "A9",  0,  8, 1),
+            ("A10",  0,  5, 1),
+            ("A11",  0,  4, 0),
+            ("A12",  0,  2, 0),
+            ("A13",  4,  0, 0),
+            ("A14",  6,  0, 1),
+            ("A16",  6,  0, 0),
+            ("A19",  9,  0, 1),
+            ("A20", 10,  0, 1),
+            ("A22", 11,  0, 1),
+            ("A23", 12,  0, 0),
+            ("A25", 13,  4, 0),
+            ("A26", 13,  6, 0),
+            ("A27", 13,  7, 1),
+            ("A29", 13,  8, 1),
+            ("A31", 13, 11, 1),
+            ("A32", 13, 12, 1),
+            ("A33", 13, 13, 1),
+            ("A34", 13, 14, 0),
+            ("A35", 13, 15, 0),
+            ("A38", 11, 17, 0),
+            ("A39", 10, 17, 0),
+            ("A40",  9, 17, 0),
+            ("A41",  8, 17, 0),
+            ("A43",  7, 17, 0),
+            ("A44",  6, 17, 0),
+            ("A45",  5, 17, 0),
+            ("A46",  4, 17, 0),
+            ("A47",  3, 17, 0),
+            ("A48",  1, 17, 1),
+            ( "B1",  0, 13, 1),
+            ( "B2",  0, 12, 1),
+            ( "B3",  0, 11, 1),
+            ( "B4",  0, 10, 1),
+            ( "B5",  0,  9, 1),
+            ( "B7",  0,  8, 0),
+            ( "B8",  0,  5, 0),
+            ( "B9",  0,  3, 0),
+            ("B10",  5,  0, 0),
+            ("B11",  5,  0, 1),
+            ("B12",  7,  0, 0),
+            ("B13",  8,  0, 0),
+            ("B14",  9,  0, 0),
+            ("B15", 10,  0, 0),
+            ("B17", 11,  0, 0),
+            ("B18", 12,  0, 1),
+            ("B19", 13,  3, 1),
+            ("B20", 13,  6, 1),
+            ("B21", 13,  7, 0),
+            ("B22", 13,  9, 0),
+            ("B23", 13, 11, 0),
+            ("B24", 13, 12, 0),
+            ("B26", 13, 14, 1),
+            ("B27", 13, 15, 1),
+            ("B29", 10, 17, 1),
+            ("B30",  9, 17, 1),
+            ("B31",  8, 17, 1),
+            ("B32",  6, 17, 1),
+            ("B34",  4, 17, 1),
+            ("B35",  3, 17, 1),
+            ("B36",  2, 17, 1),
+        ],
+        "1k-tq144": [
+            (  "1",  0, 14, 1),
+            (  "2",  0, 14, 0),
+            (  "3",  0, 13, 1),
+            (  "4",  0, 13, 0),
+            (  "7",  0, 12, 1),
+            (  "8",  0, 12, 0),
+            (  "9",  0, 11, 1),
+            ( "10",  0, 11, 0),
+            ( "11",  0, 10, 1),
+            ( "12",  0, 10, 0),
+            ( "19",  0,  9, 1),
+            ( "20",  0,  9, 0),
+            ( "21",  0,  8, 1),
+            ( "22",  0,  8, 0),
+            ( "23",  0,  6, 1),
+            ( "24",  0,  6, 0),
+            ( "25",  0,  5, 1),
+            ( "26",  0,  5, 0),
+            ( "28",  0,  4, 1),
+            ( "29",  0,  4, 0),
+            ( "31",  0,  3, 1),
+            ( "32",  0,  3, 0),
+            ( "33",  0,  2, 1),
+            ( "34",  0,  2, 0),
+            ( "37",  1,  0, 0),
+            ( "38",  1,  0, 1),
+            ( "39",  2,  0, 0),
+            ( "41",  2,  0, 1),
+            ( "42",  3,  0, 0),
+            ( "43",  3,  0, 1),
+            ( "44",  4,  0, 0),
+            ( "45",  4,  0, 1),
+            ( "47",  5,  0, 0),
+            ( "48",  5,  0, 1),
+            ( "49",  6,  0, 1),
+            ( "50",  7,  0, 0),
+            ( "52",  6,  0, 0),
+            ( "56",  7,  0, 1),
+            ( "58",  8,  0, 0),
+            ( "60",  8,  0, 1),
+            ( "61",  9,  0, 0),
+            ( "62",  9,  0, 1),
+            ( "63", 10,  0, 0),
+            ( "64", 10,  0, 1),
+            ( "67", 11,  0, 0),
+            ( "68", 11,  0, 1),
+            ( "70", 12,  0, 0),
+            ( "71", 12,  0, 1),
+            ( "73", 13,  1, 0),
+            ( "74", 13,  1, 1),
+            ( "75", 13,  2, 0),
+            ( "76", 13,  2, 1),
+            ( "78", 13,  3, 1),
+            ( "79", 13,  4, 0),
+            ( "80", 13,  4, 1),
+            ( "81", 13,  6, 0),
+            ( "87", 13,  6, 1),
+            ( "88", 13,  7, 0),
+            ( "90", 13,  7, 1),
+            ( "91", 13,  8, 0),
+            ( "93", 13,  8, 1),
+            ( "94", 13,  9, 0),
+            ( "95", 13,  9, 1),
+            ( "96", 13, 11, 0),
+            ( "97", 13, 11, 1),
+            ( "98", 13, 12, 0),
+            ( "99", 13, 12, 1),
+            ("101", 13, 13, 0),
+            ("102", 13, 13, 1),
+            ("104", 13, 14, 0),
+            ("105", 13, 14, 1),
+            ("106", 13, 15, 0),
+            ("107", 13, 15, 1),
+            ("112", 12, 17, 1),
+            ("113", 12, 17, 0),
+            ("114", 11, 17, 1),
+            ("115", 11, 17, 0),
+            ("116", 10, 17, 1),
+            ("117", 10, 17, 0),
+            ("118",  9, 17, 1),
+            ("119",  9, 17, 0),
+            ("120",  8, 17, 1),
+            ("121",  8, 17, 0),
+            ("122",  7, 17, 1),
+            ("128",  7, 17, 0),
+            ("129",  6, 17, 1),
+            ("134",  5, 17, 1),
+            ("135",  5, 17, 0),
+            ("136",  4, 17, 1),
+            ("137",  4, 17, 0),
+            ("138",  3, 17, 1),
+            ("139",  3, 17, 0),
+            ("141",  2, 17, 1),
+            ("142",  2, 17, 0),
+            ("143",  1, 17, 1),
+            ("144",  1, 17, 0),
+        ],
+        "1k-vq100": [
+            (  "1",  0, 14, 1),
+            (  "2",  0, 14, 0),
+            (  "3",  0, 13, 1),
+            (  "4",  0, 13, 0),
+            (  "7",  0, 12, 1),
+            (  "8",  0, 12, 0),
+            (  "9",  0, 10, 1),
+            ( "10",  0, 10, 0),
+            ( "12",  0,  9, 1),
+            ( "13",  0,  9, 0),
+            ( "15",  0,  8, 1),
+            ( "16",  0,  8, 0),
+            ( "18",  0,  6, 1),
+            ( "19",  0,  6, 0),
+            ( "20",  0,  4, 1),
+            ( "21",  0,  4, 0),
+            ( "24",  0,  2, 1),
+            ( "25",  0,  2, 0),
+            ( "26",  2,  0, 0),
+            ( "27",  2,  0, 1),
+            ( "28",  3,  0, 0),
+            ( "29",  3,  0, 1),
+            ( "30",  4,  0, 0),
+            ( "33",  6,  0, 1),
+            ( "34",  7,  0, 0),
+            ( "36",  6,  0, 0),
+            ( "37",  7,  0, 1),
+            ( "40",  9,  0, 1),
+            ( "41", 10,  0, 0),
+            ( "42", 10,  0, 1),
+            ( "45", 11,  0, 0),
+            ( "46", 11,  0, 1),
+            ( "48", 12,  0, 0),
+            ( "49", 12,  0, 1),
+            ( "51", 13,  3, 1),
+            ( "52", 13,  4, 0),
+            ( "53", 13,  4, 1),
+            ( "54", 13,  6, 0),
+            ( "56", 13,  6, 1),
+            ( "57", 13,  7, 0),
+            ( "59", 13,  7, 1),
+            ( "60", 13,  8, 0),
+            ( "62", 13,  8, 1),
+            ( "63", 13,  9, 0),
+            ( "64", 13, 11, 0),
+            ( "65", 13, 11, 1),
+            ( "66", 13, 12, 0),
+            ( "68", 13, 13, 0),
+            ( "69", 13, 13, 1),
+            ( "71", 13, 14, 0),
+            ( "72", 13, 14, 1),
+            ( "73", 13, 15, 0),
+            ( "74", 13, 15, 1),
+            ( "78", 12, 17, 1),
+            ( "79", 12, 17, 0),
+            ( "80", 11, 17, 1),
+            ( "81", 10, 17, 1),
+            ( "82", 10, 17, 0),
+            ( "83",  9, 17, 1),
+            ( "85",  9, 17, 0),
+            ( "86",  8, 17, 1),
+            ( "87",  8, 17, 0),
+            ( "89",  7, 17, 0),
+            ( "90",  6, 17, 1),
+            ( "91",  6, 17, 0),
+            ( "93",  5, 17, 1),
+            ( "94",  5, 17, 0),
+            ( "95",  4, 17, 1),
+            ( "96",  4, 17, 0),
+            ( "97",  3, 17, 1),
+            ( "99",  2, 17, 1),
+            ("100",  1, 17, 1),
+        ],
+        "8k-cb132:4k": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 0),
+            ( "A3",  3, 33, 1),
+            ( "A4",  5, 33, 0),
+            ( "A5", 10, 33, 1),
+            ( "A6", 16, 33, 1),
+            ( "A7", 17, 33, 0),
+            ("A10", 25, 33, 0),
+            ("A11", 26, 33, 0),
+            ("A12", 30, 33, 1),
+            ( "B1",  0, 30, 1),
+            ("B14", 33, 28, 0),
+            ( "C1",  0, 30, 0),
+            ( "C3",  0, 27, 1),
+            ( "C4",  4, 33, 0),
+            ( "C5",  8, 33, 1),
+            ( "C6", 11, 33, 1),
+            ( "C7", 14, 33, 1),
+            ( "C9", 20, 33, 1),
+            ("C10", 22, 33, 1),
+            ("C11", 28, 33, 1),
+            ("C12", 29, 33, 1),
+            ("C14", 33, 24, 1),
+            ( "D1",  0, 25, 1),
+            ( "D3",  0, 27, 0),
+            ( "D4",  0, 22, 1),
+            ( "D5",  9, 33, 0),
+            ( "D6", 11, 33, 0),
+            ( "D7", 13, 33, 1),
+            ( "D9", 21, 33, 1),
+            ("D10", 27, 33, 0),
+            ("D11", 26, 33, 1),
+            ("D12", 33, 27, 1),
+            ("D14", 33, 23, 1),
+            ( "E1",  0, 25, 0),
+            ( "E4",  0, 22, 0),
+            ("E11", 33, 20, 1),
+            ("E12", 33, 21, 0),
+            ("E14", 33, 21, 1),
+            ( "F3",  0, 21, 0),
+            ( "F4",  0, 21, 1),
+            ("F11", 33, 19, 1),
+            ("F12", 33, 15, 0),
+            ("F14", 33, 16, 1),
+            ( "G1",  0, 17, 0),
+            ( "G3",  0, 17, 1),
+            ( "G4",  0, 20, 0),
+            ("G11", 33, 14, 1),
+            ("G12", 33, 11, 0),
+            ("G14", 33, 17, 0),
+            ( "H1",  0, 16, 1),
+            ( "H3",  0, 16, 0),
+            ( "H4",  0, 20, 1),
+            ("H11", 33, 10, 1),
+            ("H12", 33,  6, 1),
+            ( "J1",  0, 18, 0),
+            ( "J3",  0, 18, 1),
+            ("J11", 33,  6, 0),
+            ("J12", 33,  5, 1),
+            ( "K3",  0, 11, 1),
+            ( "K4",  0, 11, 0),
+            ("K11", 33,  4, 1),
+            ("K12", 33,  4, 0),
+            ("K14", 33,  5, 0),
+            ( "L1",  0,  6, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 11,  0, 1),
+            ( "L6", 15,  0, 0),
+            ( "L8", 20,  0, 1),
+            ( "L9", 29,  0, 0),
+            ("L12", 33,  2, 0),
+            ("L14", 33,  3, 1),
+            ( "M1",  0,  6, 0),
+            ( "M3",  8,  0, 0),
+            ( "M4",  7,  0, 1),
+            ( "M6", 14,  0, 1),
+            ( "M7", 15,  0, 1),
+            ( "M9", 22,  0, 1),
+            ("M11", 30,  0, 0),
+            ("M12", 33,  1, 0),
+            ( "N1",  0,  4, 1),
+            ("N14", 33,  2, 1),
+            ( "P1",  0,  4, 0),
+            ( "P2",  4,  0, 0),
+            ( "P3",  5,  0, 1),
+            ( "P4", 12,  0, 1),
+            ( "P5", 13,  0, 0),
+            ( "P7", 16,  0, 1),
+            ( "P8", 17,  0, 0),
+            ( "P9", 21,  0, 1),
+            ("P10", 29,  0, 1),
+            ("P11", 30,  0, 1),
+            ("P12", 31,  0, 0),
+            ("P13", 31,  0, 1),
+            ("P14", 33,  1, 1),
+        ],
+        "8k-tq144:4k": [
+            (  "1",  0, 30, 1),
+            (  "2",  0, 30, 0),
+            (  "3",  0, 28, 1),
+            (  "4",  0, 28, 0),
+            (  "7",  0, 27, 1),
+            (  "8",  0, 27, 0),
+            (  "9",  0, 25, 1),
+            ( "10",  0, 25, 0),
+            ( "11",  0, 22, 1),
+            ( "12",  0, 22, 0),
+            ( "15",  0, 20, 1),
+            ( "16",  0, 20, 0),
+            ( "17",  0, 18, 1),
+            ( "18",  0, 18, 0),
+            ( "19",  0, 17, 1),
+            ( "20",  0, 17, 0),
+            ( "21",  0, 16, 1),
+            ( "22",  0, 16, 0),
+            ( "23",  0, 12, 1),
+            ( "24",  0, 12, 0),
+            ( "25",  0, 11, 1),
+            ( "26",  0, 11, 0),
+            ( "28",  0,  6, 1),
+            ( "29",  0,  6, 0),
+            ( "31",  0,  5, 1),
+            ( "32",  0,  5, 0),
+            ( "33",  0,  4, 1),
+            ( "34",  0,  4, 0),
+            ( "37",  4,  0, 0),
+            ( "38",  4,  0, 1),
+            ( "39",  6,  0, 1),
+            ( "41",  7,  0, 1),
+            ( "42",  8,  0, 0),
+            ( "43", 11,  0, 1),
+            ( "44", 12,  0, 0),
+            ( "45", 12,  0, 1),
+            ( "47", 15,  0, 1),
+            ( "48", 16,  0, 0),
+            ( "49", 16,  0, 1),
+            ( "52", 17,  0, 0),
+            ( "55", 22,  0, 1),
+            ( "56", 24,  0, 0),
+            ( "60", 24,  0, 1),
+            ( "61", 25,  0, 0),
+            ( "62", 28,  0, 0),
+            ( "63", 29,  0, 0),
+            ( "64", 29,  0, 1),
+            ( "67", 30,  0, 0),
+            ( "68", 30,  0, 1),
+            ( "70", 31,  0, 0),
+            ( "71", 31,  0, 1),
+            ( "73", 33,  1, 0),
+            ( "74", 33,  1, 1),
+            ( "75", 33,  2, 0),
+            ( "76", 33,  2, 1),
+            ( "78", 33,  3, 1),
+            ( "79", 33,  4, 0),
+            ( "80", 33,  4, 1),
+            ( "81", 33,  5, 0),
+            ( "82", 33,  5, 1),
+            ( "83", 33,  6, 0),
+            ( "84", 33,  6, 1),
+            ( "85", 33, 10, 1),
+            ( "87", 33, 14, 1),
+            ( "88", 33, 15, 0),
+            ( "90", 33, 15, 1),
+            ( "91", 33, 16, 0),
+            ( "93", 33, 16, 1),
+            ( "94", 33, 17, 0),
+            ( "95", 33, 19, 1),
+            ( "96", 33, 20, 1),
+            ( "97", 33, 21, 0),
+            ( "98", 33, 21, 1),
+            ( "99", 33, 23, 1),
+            ("101", 33, 27, 1),
+            ("102", 33, 28, 0),
+            ("104", 33, 29, 1),
+            ("105", 33, 30, 0),
+            ("106", 33, 30, 1),
+            ("107", 33, 31, 0),
+            ("110", 31, 33, 1),
+            ("112", 31, 33, 0),
+            ("113", 30, 33, 1),
+            ("114", 30, 33, 0),
+            ("115", 29, 33, 1),
+            ("116", 29, 33, 0),
+            ("117", 28, 33, 1),
+            ("118", 27, 33, 0),
+            ("119", 26, 33, 1),
+            ("120", 26, 33, 0),
+            ("121", 25, 33, 0),
+            ("122", 20, 33, 1),
+            ("124", 20, 33, 0),
+            ("125", 19, 33, 1),
+            ("128", 17, 33, 0),
+            ("129", 16, 33, 1),
+            ("130", 11, 33, 1),
+            ("134",  8, 33, 1),
+            ("135",  8, 33, 0),
+            ("136",  7, 33, 1),
+            ("137",  7, 33, 0),
+            ("138",  6, 33, 1),
+            ("139",  6, 33, 0),
+            ("141",  5, 33, 0),
+            ("142",  4, 33, 1),
+            ("143",  4, 33, 0),
+            ("144",  3, 33, 1),
+        ],
+        "8k-cm81:4k": [
+            ( "A1",  2, 33, 1),
+            ( "A2",  4, 33, 0),
+            ( "A3",  6, 33, 0),
+            ( "A4", 10, 33, 1),
+            ( "A6", 23, 33, 0),
+            ( "A7", 27, 33, 0),
+            ( "A8", 28, 33, 1),
+            ( "A9", 33,  4, 1),
+            ( "B1",  0, 28, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  5, 33, 1),
+            ( "B4",  9, 33, 0),
+            ( "B5", 21, 33, 1),
+            ( "B6", 24, 33, 0),
+            ( "B7", 25, 33, 1),
+            ( "B8", 30, 33, 1),
+            ( "B9", 33,  6, 1),
+            ( "C1",  0, 28, 0),
+            ( "C2",  0, 30, 1),
+            ( "C3",  0, 23, 0),
+            ( "C4", 16, 33, 1),
+            ( "C5", 17, 33, 0),
+            ( "C9", 33, 21, 1),
+            ( "D1",  0, 20, 1),
+            ( "D2",  0, 23, 1),
+            ( "D3",  0, 17, 0),
+            ( "D5",  8, 33, 1),
+            ( "D6", 33,  4, 0),
+            ( "D7", 33,  5, 0),
+            ( "D8", 33, 17, 0),
+            ( "D9", 33,  6, 0),
+            ( "E1",  0, 20, 0),
+            ( "E2",  0, 17, 1),
+            ( "E3",  0, 16, 1),
+            ( "E4",  0, 16, 0),
+            ( "E5",  7, 33, 1),
+            ( "E7", 33,  5, 1),
+            ( "E8", 33, 16, 1),
+            ( "F1",  0,  7, 1),
+            ( "F3",  0,  7, 0),
+            ( "F7", 31,  0, 1),
+            ( "F8", 33,  3, 0),
+            ( "G1",  0,  5, 0),
+            ( "G2",  0,  3, 1),
+            ( "G3",  0,  5, 1),
+            ( "G4", 16,  0, 1),
+            ( "G5", 29,  0, 0),
+            ( "G6", 30,  0, 0),
+            ( "G7", 31,  0, 0),
+            ( "G8", 33,  3, 1),
+            ( "G9", 33,  2, 1),
+            ( "H1",  3,  0, 0),
+            ( "H2",  0,  3, 0),
+            ( "H4", 17,  0, 0),
+            ( "H5", 29,  0, 1),
+            ( "H7", 30,  0, 1),
+            ( "H9", 33,  2, 0),
+            ( "J1",  3,  0, 1),
+            ( "J2",  4,  0, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4", 11,  0, 0),
+            ( "J8", 33,  1, 0),
+            ( "J9", 33,  1, 1),
+        ],
+        "8k-cm121:4k": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 1),
+            ( "A3",  3, 33, 0),
+            ( "A4",  9, 33, 0),
+            ( "A5", 11, 33, 0),
+            ( "A6", 11, 33, 1),
+            ( "A7", 19, 33, 1),
+            ( "A8", 20, 33, 1),
+            ( "A9", 26, 33, 1),
+            ("A10", 30, 33, 1),
+            ("A11", 31, 33, 1),
+            ( "B1",  0, 30, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  4, 33, 0),
+            ( "B4",  5, 33, 0),
+            ( "B5", 10, 33, 1),
+            ( "B6", 16, 33, 1),
+            ( "B7", 17, 33, 0),
+            ( "B8", 27, 33, 0),
+            ( "B9", 28, 33, 1),
+            ("B11", 33, 28, 0),
+            ( "C1",  0, 25, 0),
+            ( "C2",  0, 25, 1),
+            ( "C3",  0, 27, 0),
+            ( "C4",  0, 27, 1),
+            ( "C7", 20, 33, 0),
+            ( "C8", 26, 33, 0),
+            ( "C9", 29, 33, 1),
+            ("C11", 33, 27, 1),
+            ( "D1",  0, 22, 0),
+            ( "D2",  0, 21, 1),
+            ( "D3",  0, 21, 0),
+            ( "D5",  8, 33, 1),
+            ( "D7", 25, 33, 0),
+            ( "D9", 33, 21, 0),
+            ("D10", 33, 24, 1),
+            ("D11", 33, 23, 1),
+            ( "E1",  0, 22, 1),
+            ( "E2",  0, 20, 1),
+            ( "E3",  0, 20, 0),
+            ( "E8", 33, 20, 1),
+            ( "E9", 33, 19, 1),
+            ("E10", 33, 17, 0),
+            ("E11", 33, 21, 1),
+            ( "F1",  0, 18, 1),
+            ( "F2",  0, 18, 0),
+            ( "F3",  0, 17, 0),
+            ( "F4",  0, 17, 1),
+            ( "F9", 33, 15, 0),
+            ("F10", 33, 14, 1),
+            ("F11", 33, 16, 1),
+            ( "G1",  0, 16, 1),
+            ( "G2",  0, 16, 0),
+            ( "G3",  0, 12, 1),
+            ( "G8", 33,  5, 1),
+            ( "G9", 33, 10, 1),
+            ("G10", 33,  6, 1),
+            ("G11", 33, 11, 0),
+            ( "H1",  0, 11, 1),
+            ( "H2",  0, 11, 0),
+            ( "H3",  0, 12, 0),
+            ( "H7", 20,  0, 1),
+            ( "H9", 29,  0, 1),
+            ("H10", 33,  4, 1),
+            ("H11", 33,  6, 0),
+            ( "J1",  0,  6, 1),
+            ( "J2",  0,  4, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4",  8,  0, 0),
+            ( "J5", 15,  0, 0),
+            ( "J7", 20,  0, 0),
+            ( "J8", 22,  0, 1),
+            ( "J9", 30,  0, 1),
+            ("J10", 33,  5, 0),
+            ("J11", 33,  3, 1),
+            ( "K1",  0,  6, 0),
+            ( "K2",  0,  4, 1),
+            ( "K3",  7,  0, 1),
+            ( "K4", 12,  0, 1),
+            ( "K5", 15,  0, 1),
+            ( "K6", 17,  0, 0),
+            ( "K7", 21,  0, 1),
+            ( "K9", 30,  0, 0),
+            ("K10", 31,  0, 1),
+            ("K11", 33,  4, 0),
+            ( "L1",  4,  0, 0),
+            ( "L2",  6,  0, 1),
+            ( "L3", 11,  0, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 16,  0, 1),
+            ( "L7", 24,  0, 0),
+            ( "L8", 29,  0, 0),
+            ("L10", 31,  0, 0),
+        ],
+    	"8k-bg121:4k": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 1),
+            ( "A3",  3, 33, 0),
+            ( "A4",  9, 33, 0),
+            ( "A5", 11, 33, 0),
+            ( "A6", 11, 33, 1),
+            ( "A7", 19, 33, 1),
+            ( "A8", 20, 33, 1),
+            ( "A9", 26, 33, 1),
+            ("A10", 30, 33, 1),
+            ("A11", 31, 33, 1),
+            ( "B1",  0, 30, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  4, 33, 0),
+            ( "B4",  5, 33, 0),
+            ( "B5", 10, 33, 1),
+            ( "B6", 16, 33, 1),
+            ( "B7", 17, 33, 0),
+            ( "B8", 27, 33, 0),
+            ( "B9", 28, 33, 1),
+            ("B11", 33, 28, 0),
+            ( "C1",  0, 25, 0),
+            ( "C2",  0, 25, 1),
+            ( "C3",  0, 27, 0),
+            ( "C4",  0, 27, 1),
+            ( "C7", 20, 33, 0),
+            ( "C8", 26, 33, 0),
+            ( "C9", 29, 33, 1),
+            ("C11", 33, 27, 1),
+            ( "D1",  0, 22, 0),
+            ( "D2",  0, 21, 1),
+            ( "D3",  0, 21, 0),
+            ( "D5",  8, 33, 1),
+            ( "D7", 25, 33, 0),
+            ( "D9", 33, 21, 0),
+            ("D10", 33, 24, 1),
+            ("D11", 33, 23, 1),
+            ( "E1",  0, 22, 1),
+            ( "E2",  0, 20, 1),
+            ( "E3",  0, 20, 0),
+            ( "E8", 33, 20, 1),
+            ( "E9", 33, 19, 1),
+            ("E10", 33, 17, 0),
+            ("E11", 33, 21, 1),
+            ( "F1",  0, 18, 1),
+            ( "F2",  0, 18, 0),
+            ( "F3",  0, 17, 0),
+            ( "F4",  0, 17, 1),
+            ( "F9", 33, 15, 0),
+            ("F10", 33, 14, 1),
+            ("F11", 33, 16, 1),
+            ( "G1",  0, 16, 1),
+            ( "G2",  0, 16, 0),
+            ( "G3",  0, 12, 1),
+            ( "G8", 33,  5, 1),
+            ( "G9", 33, 10, 1),
+            ("G10", 33,  6, 1),
+            ("G11", 33, 11, 0),
+            ( "H1",  0, 11, 1),
+            ( "H2",  0, 11, 0),
+            ( "H3",  0, 12, 0),
+            ( "H7", 20,  0, 1),
+            ( "H9", 29,  0, 1),
+            ("H10", 33,  4, 1),
+            ("H11", 33,  6, 0),
+            ( "J1",  0,  6, 1),
+            ( "J2",  0,  4, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4",  8,  0, 0),
+            ( "J5", 15,  0, 0),
+            ( "J7", 20,  0, 0),
+            ( "J8", 22,  0, 1),
+            ( "J9", 30,  0, 1),
+            ("J10", 33,  5, 0),
+            ("J11", 33,  3, 1),
+            ( "K1",  0,  6, 0),
+            ( "K2",  0,  4, 1),
+            ( "K3",  7,  0, 1),
+            ( "K4", 12,  0, 1),
+            ( "K5", 15,  0, 1),
+            ( "K6", 17,  0, 0),
+            ( "K7", 21,  0, 1),
+            ( "K9", 30,  0, 0),
+            ("K10", 31,  0, 1),
+            ("K11", 33,  4, 0),
+            ( "L1",  4,  0, 0),
+            ( "L2",  6,  0, 1),
+            ( "L3", 11,  0, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 16,  0, 1),
+            ( "L7", 24,  0, 0),
+            ( "L8", 29,  0, 0),
+            ("L10", 31,  0, 0),
+        ],
+        "8k-cm225:4k": [
+            ( "A1",  1, 33, 1),
+            ( "A2",  3, 33, 1),
+            ( "A5",  6, 33, 1),
+            ( "A6", 11, 33, 0),
+            ( "A7", 12, 33, 0),
+            ( "A8", 17, 33, 1),
+            ( "A9", 18, 33, 1),
+            ("A11", 23, 33, 1),
+            ("A15", 31, 33, 0),
+            ( "B2",  2, 33, 1),
+            ( "B3",  4, 33, 1),
+            ( "B4",  5, 33, 1),
+            ( "B5",  7, 33, 1),
+            ( "B6", 10, 33, 0),
+            ( "B7", 14, 33, 0),
+            ( "B8", 19, 33, 1),
+            ( "B9", 18, 33, 0),
+            ("B10", 22, 33, 0),
+            ("B11", 23, 33, 0),
+            ("B12", 25, 33, 1),
+            ("B13", 27, 33, 1),
+            ("B14", 31, 33, 1),
+            ("B15", 33, 31, 0),
+            ( "C1",  0, 28, 0),
+            ( "C3",  2, 33, 0),
+            ( "C4",  3, 33, 0),
+            ( "C5",  5, 33, 0),
+            ( "C6", 13, 33, 0),
+            ( "C7", 11, 33, 1),
+            ( "C8", 19, 33, 0),
+            ( "C9", 17, 33, 0),
+            ("C10", 20, 33, 0),
+            ("C11", 24, 33, 1),
+            ("C12", 30, 33, 1),
+            ("C13", 30, 33, 0),
+            ("C14", 33, 30, 0),
+            ( "D1",  0, 25, 0),
+            ( "D2",  0, 24, 1),
+            ( "D3",  0, 27, 0),
+            ( "D4",  0, 30, 0),
+            ( "D5",  4, 33, 0),
+            ( "D6",  9, 33, 0),
+            ( "D7", 10, 33, 1),
+            ( "D8", 16, 33, 1),
+            ( "D9", 26, 33, 1),
+            ("D10", 25, 33, 0),
+            ("D11", 28, 33, 1),
+            ("D13", 33, 27, 1),
+            ("D14", 33, 25, 0),
+            ("D15", 33, 27, 0),
+            ( "E2",  0, 24, 0),
+            ( "E3",  0, 28, 1),
+            ( "E4",  0, 30, 1),
+            ( "E5",  0, 27, 1),
+            ( "E6",  0, 25, 1),
+            ( "E9", 26, 33, 0),
+            ("E10", 27, 33, 0),
+            ("E11", 29, 33, 1),
+            ("E13", 33, 28, 0),
+            ("E14", 33, 24, 0),
+            ( "F1",  0, 20, 0),
+            ( "F2",  0, 21, 0),
+            ( "F3",  0, 21, 1),
+            ( "F4",  0, 22, 0),
+            ( "F5",  0, 22, 1),
+            ( "F7",  8, 33, 1),
+            ( "F9", 20, 33, 1),
+            ("F11", 33, 24, 1),
+            ("F12", 33, 23, 1),
+            ("F13", 33, 23, 0),
+            ("F14", 33, 21, 0),
+            ("F15", 33, 22, 0),
+            ( "G2",  0, 20, 1),
+            ( "G4",  0, 17, 0),
+            ( "G5",  0, 18, 1),
+            ("G10", 33, 20, 1),
+            ("G11", 33, 19, 1),
+            ("G12", 33, 21, 1),
+            ("G13", 33, 17, 0),
+            ("G14", 33, 20, 0),
+            ("G15", 33, 19, 0),
+            ( "H1",  0, 16, 0),
+            ( "H2",  0, 18, 0),
+            ( "H3",  0, 14, 1),
+            ( "H4",  0, 13, 1),
+            ( "H5",  0, 16, 1),
+            ( "H6",  0, 17, 1),
+            ("H11", 33, 14, 1),
+            ("H12", 33, 16, 1),
+            ("H13", 33, 15, 1),
+            ("H14", 33, 15, 0),
+            ( "J1",  0, 13, 0),
+            ( "J2",  0, 12, 0),
+            ( "J3",  0, 14, 0),
+            ( "J4",  0, 11, 1),
+            ( "J5",  0, 12, 1),
+            ("J10", 33,  5, 1),
+            ("J11", 33, 10, 1),
+            ("J12", 33,  6, 1),
+            ("J14", 33, 14, 0),
+            ("J15", 33, 13, 0),
+            ( "K1",  0, 11, 0),
+            ( "K4",  0,  4, 0),
+            ( "K5",  0,  6, 1),
+            ( "K9", 20,  0, 1),
+            ("K11", 29,  0, 0),
+            ("K12", 33,  4, 1),
+            ("K13", 33,  5, 0),
+            ("K15", 33,  9, 0),
+            ( "L3",  0,  7, 1),
+            ( "L4",  0,  3, 0),
+            ( "L5",  4,  0, 0),
+            ( "L6",  7,  0, 0),
+            ( "L7", 12,  0, 0),
+            ( "L9", 17,  0, 0),
+            ("L10", 21,  0, 1),
+            ("L11", 30,  0, 1),
+            ("L12", 33,  3, 1),
+            ("L13", 33,  6, 0),
+            ( "M1",  0,  7, 0),
+            ( "M2",  0,  6, 0),
+            ( "M3",  0,  5, 0),
+            ( "M4",  0,  3, 1),
+            ( "M5",  6,  0, 0),
+            ( "M6",  8,  0, 0),
+            ( "M7", 13,  0, 1),
+            ( "M8", 15,  0, 0),
+            ( "M9", 19,  0, 1),
+            ("M11", 30,  0, 0),
+            ("M12", 31,  0, 1),
+            ("M13", 33,  4, 0),
+            ("M15", 33,  3, 0),
+            ( "N2",  0,  5, 1),
+            ( "N3",  2,  0, 0),
+            ( "N4",  3,  0, 0),
+            ( "N5",  9,  0, 1),
+            ( "N6", 12,  0, 1),
+            ( "N7", 16,  0, 1),
+            ( "N9", 20,  0, 0),
+            ("N10", 22,  0, 1),
+            ("N12", 31,  0, 0),
+            ( "P1",  0,  4, 1),
+            ( "P2",  2,  0, 1),
+            ( "P4",  7,  0, 1),
+            ( "P5", 10,  0, 1),
+            ( "P6", 14,  0, 1),
+            ( "P7", 17,  0, 1),
+            ( "P8", 19,  0, 0),
+            ( "P9", 22,  0, 0),
+            ("P10", 23,  0, 0),
+            ("P11", 25,  0, 0),
+            ("P12", 29,  0, 1),
+            ("P13", 27,  0, 0),
+            ("P14", 33,  2, 1),
+            ("P15", 33,  1, 1),
+            ( "R1",  3,  0, 1),
+            ( "R2",  4,  0, 1),
+            ( "R3",  6,  0, 1),
+            ( "R4",  8,  0, 1),
+            ( "R5", 11,  0, 1),
+            ( "R6", 15,  0, 1),
+            ( "R9", 21,  0, 0),
+            ("R10", 24,  0, 0),
+            ("R11", 26,  0, 0),
+            ("R12", 28,  0, 0),
+            ("R14", 33,  2, 0),
+            ("R15", 33,  1, 0),
+        ],
+        "8k-cm81": [
+            ( "A1",  2, 33, 1),
+            ( "A2",  4, 33, 0),
+            ( "A3",  6, 33, 0),
+            ( "A4", 10, 33, 1),
+            ( "A6", 23, 33, 0),
+            ( "A7", 27, 33, 0),
+            ( "A8", 28, 33, 1),
+            ( "A9", 33,  4, 1),
+            ( "B1",  0, 28, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  5, 33, 1),
+            ( "B4",  9, 33, 0),
+            ( "B5", 21, 33, 1),
+            ( "B6", 24, 33, 0),
+            ( "B7", 25, 33, 1),
+            ( "B8", 30, 33, 1),
+            ( "B9", 33,  6, 1),
+            ( "C1",  0, 28, 0),
+            ( "C2",  0, 30, 1),
+            ( "C3",  0, 23, 0),
+            ( "C4", 16, 33, 1),
+            ( "C5", 17, 33, 0),
+            ( "C9", 33, 21, 1),
+            ( "D1",  0, 20, 1),
+            ( "D2",  0, 23, 1),
+            ( "D3",  0, 17, 0),
+            ( "D5",  8, 33, 1),
+            ( "D6", 33,  4, 0),
+            ( "D7", 33,  5, 0),
+            ( "D8", 33, 17, 0),
+            ( "D9", 33,  6, 0),
+            ( "E1",  0, 20, 0),
+            ( "E2",  0, 17, 1),
+            ( "E3",  0, 16, 1),
+            ( "E4",  0, 16, 0),
+            ( "E5",  7, 33, 1),
+            ( "E7", 33,  5, 1),
+            ( "E8", 33, 16, 1),
+            ( "F1",  0,  7, 1),
+            ( "F3",  0,  7, 0),
+            ( "F7", 31,  0, 1),
+            ( "F8", 33,  3, 0),
+            ( "G1",  0,  5, 0),
+            ( "G2",  0,  3, 1),
+            ( "G3",  0,  5, 1),
+            ( "G4", 16,  0, 1),
+            ( "G5", 29,  0, 0),
+            ( "G6", 30,  0, 0),
+            ( "G7", 31,  0, 0),
+            ( "G8", 33,  3, 1),
+            ( "G9", 33,  2, 1),
+            ( "H1",  3,  0, 0),
+            ( "H2",  0,  3, 0),
+            ( "H4", 17,  0, 0),
+            ( "H5", 29,  0, 1),
+            ( "H7", 30,  0, 1),
+            ( "H9", 33,  2, 0),
+            ( "J1",  3,  0, 1),
+            ( "J2",  4,  0, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4", 11,  0, 0),
+            ( "J8", 33,  1, 0),
+            ( "J9", 33,  1, 1),
+        ],
+        "8k-cm121": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 1),
+            ( "A3",  3, 33, 0),
+            ( "A4",  9, 33, 0),
+            ( "A5", 11, 33, 0),
+            ( "A6", 11, 33, 1),
+            ( "A7", 19, 33, 1),
+            ( "A8", 20, 33, 1),
+            ( "A9", 26, 33, 1),
+            ("A10", 30, 33, 1),
+            ("A11", 31, 33, 1),
+            ( "B1",  0, 30, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  4, 33, 0),
+            ( "B4",  5, 33, 0),
+            ( "B5", 10, 33, 1),
+            ( "B6", 16, 33, 1),
+            ( "B7", 17, 33, 0),
+            ( "B8", 27, 33, 0),
+            ( "B9", 28, 33, 1),
+            ("B11", 33, 28, 0),
+            ( "C1",  0, 25, 0),
+            ( "C2",  0, 25, 1),
+            ( "C3",  0, 27, 0),
+            ( "C4",  0, 27, 1),
+            ( "C7", 20, 33, 0),
+            ( "C8", 26, 33, 0),
+            ( "C9", 29, 33, 1),
+            ("C11", 33, 27, 1),
+            ( "D1",  0, 22, 0),
+            ( "D2",  0, 21, 1),
+            ( "D3",  0, 21, 0),
+            ( "D5",  8, 33, 1),
+            ( "D7", 25, 33, 0),
+            ( "D9", 33, 21, 0),
+            ("D10", 33, 24, 1),
+            ("D11", 33, 23, 1),
+            ( "E1",  0, 22, 1),
+            ( "E2",  0, 20, 1),
+            ( "E3",  0, 20, 0),
+            ( "E8", 33, 20, 1),
+            ( "E9", 33, 19, 1),
+            ("E10", 33, 17, 0),
+            ("E11", 33, 21, 1),
+            ( "F1",  0, 18, 1),
+            ( "F2",  0, 18, 0),
+            ( "F3",  0, 17, 0),
+            ( "F4",  0, 17, 1),
+            ( "F9", 33, 15, 0),
+            ("F10", 33, 14, 1),
+            ("F11", 33, 16, 1),
+            ( "G1",  0, 16, 1),
+            ( "G2",  0, 16, 0),
+            ( "G3",  0, 12, 1),
+            ( "G8", 33,  5, 1),
+            ( "G9", 33, 10, 1),
+            ("G10", 33,  6, 1),
+            ("G11", 33, 11, 0),
+            ( "H1",  0, 11, 1),
+            ( "H2",  0, 11, 0),
+            ( "H3",  0, 12, 0),
+            ( "H7", 20,  0, 1),
+            ( "H9", 29,  0, 1),
+            ("H10", 33,  4, 1),
+            ("H11", 33,  6, 0),
+            ( "J1",  0,  6, 1),
+            ( "J2",  0,  4, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4",  8,  0, 0),
+            ( "J5", 15,  0, 0),
+            ( "J7", 20,  0, 0),
+            ( "J8", 22,  0, 1),
+            ( "J9", 30,  0, 1),
+            ("J10", 33,  5, 0),
+            ("J11", 33,  3, 1),
+            ( "K1",  0,  6, 0),
+            ( "K2",  0,  4, 1),
+            ( "K3",  7,  0, 1),
+            ( "K4", 12,  0, 1),
+            ( "K5", 15,  0, 1),
+            ( "K6", 17,  0, 0),
+            ( "K7", 21,  0, 1),
+            ( "K9", 30,  0, 0),
+            ("K10", 31,  0, 1),
+            ("K11", 33,  4, 0),
+            ( "L1",  4,  0, 0),
+            ( "L2",  6,  0, 1),
+            ( "L3", 11,  0, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 16,  0, 1),
+            ( "L7", 24,  0, 0),
+            ( "L8", 29,  0, 0),
+            ("L10", 31,  0, 0),
+        ],
+    	"8k-bg121": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 1),
+            ( "A3",  3, 33, 0),
+            ( "A4",  9, 33, 0),
+            ( "A5", 11, 33, 0),
+            ( "A6", 11, 33, 1),
+            ( "A7", 19, 33, 1),
+            ( "A8", 20, 33, 1),
+            ( "A9", 26, 33, 1),
+            ("A10", 30, 33, 1),
+            ("A11", 31, 33, 1),
+            ( "B1",  0, 30, 1),
+            ( "B2",  0, 30, 0),
+            ( "B3",  4, 33, 0),
+            ( "B4",  5, 33, 0),
+            ( "B5", 10, 33, 1),
+            ( "B6", 16, 33, 1),
+            ( "B7", 17, 33, 0),
+            ( "B8", 27, 33, 0),
+            ( "B9", 28, 33, 1),
+            ("B11", 33, 28, 0),
+            ( "C1",  0, 25, 0),
+            ( "C2",  0, 25, 1),
+            ( "C3",  0, 27, 0),
+            ( "C4",  0, 27, 1),
+            ( "C7", 20, 33, 0),
+            ( "C8", 26, 33, 0),
+            ( "C9", 29, 33, 1),
+            ("C11", 33, 27, 1),
+            ( "D1",  0, 22, 0),
+            ( "D2",  0, 21, 1),
+            ( "D3",  0, 21, 0),
+            ( "D5",  8, 33, 1),
+            ( "D7", 25, 33, 0),
+            ( "D9", 33, 21, 0),
+            ("D10", 33, 24, 1),
+            ("D11", 33, 23, 1),
+            ( "E1",  0, 22, 1),
+            ( "E2",  0, 20, 1),
+            ( "E3",  0, 20, 0),
+            ( "E8", 33, 20, 1),
+            ( "E9", 33, 19, 1),
+            ("E10", 33, 17, 0),
+            ("E11", 33, 21, 1),
+            ( "F1",  0, 18, 1),
+            ( "F2",  0, 18, 0),
+            ( "F3",  0, 17, 0),
+            ( "F4",  0, 17, 1),
+            ( "F9", 33, 15, 0),
+            ("F10", 33, 14, 1),
+            ("F11", 33, 16, 1),
+            ( "G1",  0, 16, 1),
+            ( "G2",  0, 16, 0),
+            ( "G3",  0, 12, 1),
+            ( "G8", 33,  5, 1),
+            ( "G9", 33, 10, 1),
+            ("G10", 33,  6, 1),
+            ("G11", 33, 11, 0),
+            ( "H1",  0, 11, 1),
+            ( "H2",  0, 11, 0),
+            ( "H3",  0, 12, 0),
+            ( "H7", 20,  0, 1),
+            ( "H9", 29,  0, 1),
+            ("H10", 33,  4, 1),
+            ("H11", 33,  6, 0),
+            ( "J1",  0,  6, 1),
+            ( "J2",  0,  4, 0),
+            ( "J3",  4,  0, 1),
+            ( "J4",  8,  0, 0),
+            ( "J5", 15,  0, 0),
+            ( "J7", 20,  0, 0),
+            ( "J8", 22,  0, 1),
+            ( "J9", 30,  0, 1),
+            ("J10", 33,  5, 0),
+            ("J11", 33,  3, 1),
+            ( "K1",  0,  6, 0),
+            ( "K2",  0,  4, 1),
+            ( "K3",  7,  0, 1),
+            ( "K4", 12,  0, 1),
+            ( "K5", 15,  0, 1),
+            ( "K6", 17,  0, 0),
+            ( "K7", 21,  0, 1),
+            ( "K9", 30,  0, 0),
+            ("K10", 31,  0, 1),
+            ("K11", 33,  4, 0),
+            ( "L1",  4,  0, 0),
+            ( "L2",  6,  0, 1),
+            ( "L3", 11,  0, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 16,  0, 1),
+            ( "L7", 24,  0, 0),
+            ( "L8", 29,  0, 0),
+            ("L10", 31,  0, 0),
+        ],
+        "8k-cm225": [
+            ( "A1",  1, 33, 1),
+            ( "A2",  3, 33, 1),
+            ( "A5",  6, 33, 1),
+            ( "A6", 11, 33, 0),
+            ( "A7", 12, 33, 0),
+            ( "A8", 17, 33, 1),
+            ( "A9", 18, 33, 1),
+            ("A10", 21, 33, 0),
+            ("A11", 23, 33, 1),
+            ("A15", 31, 33, 0),
+            ( "B1",  0, 31, 0),
+            ( "B2",  2, 33, 1),
+            ( "B3",  4, 33, 1),
+            ( "B4",  5, 33, 1),
+            ( "B5",  7, 33, 1),
+            ( "B6", 10, 33, 0),
+            ( "B7", 14, 33, 0),
+            ( "B8", 19, 33, 1),
+            ( "B9", 18, 33, 0),
+            ("B10", 22, 33, 0),
+            ("B11", 23, 33, 0),
+            ("B12", 25, 33, 1),
+            ("B13", 27, 33, 1),
+            ("B14", 31, 33, 1),
+            ("B15", 33, 31, 0),
+            ( "C1",  0, 28, 0),
+            ( "C2",  0, 31, 1),
+            ( "C3",  2, 33, 0),
+            ( "C4",  3, 33, 0),
+            ( "C5",  5, 33, 0),
+            ( "C6", 13, 33, 0),
+            ( "C7", 11, 33, 1),
+            ( "C8", 19, 33, 0),
+            ( "C9", 17, 33, 0),
+            ("C10", 20, 33, 0),
+            ("C11", 24, 33, 1),
+            ("C12", 30, 33, 1),
+            ("C13", 30, 33, 0),
+            ("C14", 33, 30, 0),
+            ( "D1",  0, 25, 0),
+            ( "D2",  0, 24, 1),
+            ( "D3",  0, 27, 0),
+            ( "D4",  0, 30, 0),
+            ( "D5",  4, 33, 0),
+            ( "D6",  9, 33, 0),
+            ( "D7", 10, 33, 1),
+            ( "D8", 16, 33, 1),
+            ( "D9", 26, 33, 1),
+            ("D10", 25, 33, 0),
+            ("D11", 28, 33, 1),
+            ("D13", 33, 27, 1),
+            ("D14", 33, 25, 0),
+            ("D15", 33, 27, 0),
+            ( "E2",  0, 24, 0),
+            ( "E3",  0, 28, 1),
+            ( "E4",  0, 30, 1),
+            ( "E5",  0, 27, 1),
+            ( "E6",  0, 25, 1),
+            ( "E9", 26, 33, 0),
+            ("E10", 27, 33, 0),
+            ("E11", 29, 33, 1),
+            ("E13", 33, 28, 0),
+            ("E14", 33, 24, 0),
+            ( "F1",  0, 20, 0),
+            ( "F2",  0, 21, 0),
+            ( "F3",  0, 21, 1),
+            ( "F4",  0, 22, 0),
+            ( "F5",  0, 22, 1),
+            ( "F7",  8, 33, 1),
+            ( "F9", 20, 33, 1),
+            ("F11", 33, 24, 1),
+            ("F12", 33, 23, 1),
+            ("F13", 33, 23, 0),
+            ("F14", 33, 21, 0),
+            ("F15", 33, 22, 0),
+            ( "G1",  0, 19, 0),
+            ( "G2",  0, 20, 1),
+            ( "G3",  0, 19, 1),
+            ( "G4",  0, 17, 0),
+            ( "G5",  0, 18, 1),
+            ("G10", 33, 20, 1),
+            ("G11", 33, 19, 1),
+            ("G12", 33, 21, 1),
+            ("G13", 33, 17, 0),
+            ("G14", 33, 20, 0),
+            ("G15", 33, 19, 0),
+            ( "H1",  0, 16, 0),
+            ( "H2",  0, 18, 0),
+            ( "H3",  0, 14, 1),
+            ( "H4",  0, 13, 1),
+            ( "H5",  0, 16, 1),
+            ( "H6",  0, 17, 1),
+            ("H11", 33, 14, 1),
+            ("H12", 33, 16, 1),
+            ("H13", 33, 15, 1),
+            ("H14", 33, 15, 0),
+            ( "J1",  0, 13, 0),
+            ( "J2",  0, 12, 0),
+            ( "J3",  0, 14, 0),
+            ( "J4",  0, 11, 1),
+            ( "J5",  0, 12, 1),
+            ("J10", 33,  5, 1),
+            ("J11", 33, 10, 1),
+            ("J12", 33,  6, 1),
+            ("J13", 33, 11, 0),
+            ("J14", 33, 14, 0),
+            ("J15", 33, 13, 0),
+            ( "K1",  0, 11, 0),
+            ( "K3",  0,  9, 1),
+            ( "K4",  0,  4, 0),
+            ( "K5",  0,  6, 1),
+            ( "K9", 20,  0, 1),
+            ("K11", 29,  0, 0),
+            ("K12", 33,  4, 1),
+            ("K13", 33,  5, 0),
+            ("K14", 33, 12, 0),
+            ("K15", 33,  9, 0),
+            ( "L1",  0,  9, 0),
+            ( "L3",  0,  7, 1),
+            ( "L4",  0,  3, 0),
+            ( "L5",  4,  0, 0),
+            ( "L6",  7,  0, 0),
+            ( "L7", 12,  0, 0),
+            ( "L9", 17,  0, 0),
+            ("L10", 21,  0, 1),
+            ("L11", 30,  0, 1),
+            ("L12", 33,  3, 1),
+            ("L13", 33,  6, 0),
+            ("L14", 33,  7, 0),
+            ( "M1",  0,  7, 0),
+            ( "M2",  0,  6, 0),
+            ( "M3",  0,  5, 0),
+            ( "M4",  0,  3, 1),
+            ( "M5",  6,  0, 0),
+            ( "M6",  8,  0, 0),
+            ( "M7", 13,  0, 1),
+            ( "M8", 15,  0, 0),
+            ( "M9", 19,  0, 1),
+            ("M11", 30,  0, 0),
+            ("M12", 31,  0, 1),
+            ("M13", 33,  4, 0),
+            ("M14", 33,  8, 0),
+            ("M15", 33,  3, 0),
+            ( "N2",  0,  5, 1),
+            ( "N3",  2,  0, 0),
+            ( "N4",  3,  0, 0),
+            ( "N5",  9,  0, 1),
+            ( "N6", 12,  0, 1),
+            ( "N7", 16,  0, 1),
+            ( "N9", 20,  0, 0),
+            ("N10", 22,  0, 1),
+            ("N12", 31,  0, 0),
+            ( "P1",  0,  4, 1),
+            ( "P2",  2,  0, 1),
+            ( "P4",  7,  0, 1),
+            ( "P5", 10,  0, 1),
+            ( "P6", 14,  0, 1),
+            ( "P7", 17,  0, 1),
+            ( "P8", 19,  0, 0),
+            ( "P9", 22,  0, 0),
+            ("P10", 23,  0, 0),
+            ("P11", 25,  0, 0),
+            ("P12", 29,  0, 1),
+            ("P13", 27,  0, 0),
+            ("P14", 33,  2, 1),
+            ("P15", 33,  1, 1),
+            ( "R1",  3,  0, 1),
+            ( "R2",  4,  0, 1),
+            ( "R3",  6,  0, 1),
+            ( "R4",  8,  0, 1),
+            ( "R5", 11,  0, 1),
+            ( "R6", 15,  0, 1),
+            ( "R9", 21,  0, 0),
+            ("R10", 24,  0, 0),
+            ("R11", 26,  0, 0),
+            ("R12", 28,  0, 0),
+            ("R14", 33,  2, 0),
+            ("R15", 33,  1, 0),
+        ],
+        "8k-cb132": [
+            ( "A1",  2, 33, 0),
+            ( "A2",  3, 33, 0),
+            ( "A3",  3, 33, 1),
+            ( "A4",  5, 33, 0),
+            ( "A5", 10, 33, 1),
+            ( "A6", 16, 33, 1),
+            ( "A7", 17, 33, 0),
+            ("A10", 25, 33, 0),
+            ("A11", 26, 33, 0),
+            ("A12", 30, 33, 1),
+            ( "B1",  0, 30, 1),
+            ("B14", 33, 28, 0),
+            ( "C1",  0, 30, 0),
+            ( "C3",  0, 27, 1),
+            ( "C4",  4, 33, 0),
+            ( "C5",  8, 33, 1),
+            ( "C6", 11, 33, 1),
+            ( "C7", 14, 33, 1),
+            ( "C9", 20, 33, 1),
+            ("C10", 22, 33, 1),
+            ("C11", 28, 33, 1),
+            ("C12", 29, 33, 1),
+            ("C14", 33, 24, 1),
+            ( "D1",  0, 25, 1),
+            ( "D3",  0, 27, 0),
+            ( "D4",  0, 22, 1),
+            ( "D5",  9, 33, 0),
+            ( "D6", 11, 33, 0),
+            ( "D7", 13, 33, 1),
+            ( "D9", 21, 33, 1),
+            ("D10", 27, 33, 0),
+            ("D11", 26, 33, 1),
+            ("D12", 33, 27, 1),
+            ("D14", 33, 23, 1),
+            ( "E1",  0, 25, 0),
+            ( "E4",  0, 22, 0),
+            ("E11", 33, 20, 1),
+            ("E12", 33, 21, 0),
+            ("E14", 33, 21, 1),
+            ( "F3",  0, 21, 0),
+            ( "F4",  0, 21, 1),
+            ("F11", 33, 19, 1),
+            ("F12", 33, 15, 0),
+            ("F14", 33, 16, 1),
+            ( "G1",  0, 17, 0),
+            ( "G3",  0, 17, 1),
+            ( "G4",  0, 20, 0),
+            ("G11", 33, 14, 1),
+            ("G12", 33, 11, 0),
+            ("G14", 33, 17, 0),
+            ( "H1",  0, 16, 1),
+            ( "H3",  0, 16, 0),
+            ( "H4",  0, 20, 1),
+            ("H11", 33, 10, 1),
+            ("H12", 33,  6, 1),
+            ( "J1",  0, 18, 0),
+            ( "J3",  0, 18, 1),
+            ("J11", 33,  6, 0),
+            ("J12", 33,  5, 1),
+            ( "K3",  0, 11, 1),
+            ( "K4",  0, 11, 0),
+            ("K11", 33,  4, 1),
+            ("K12", 33,  4, 0),
+            ("K14", 33,  5, 0),
+            ( "L1",  0,  6, 1),
+            ( "L4", 12,  0, 0),
+            ( "L5", 11,  0, 1),
+            ( "L6", 15,  0, 0),
+            ( "L8", 20,  0, 1),
+            ( "L9", 29,  0, 0),
+            ("L12", 33,  2, 0),
+            ("L14", 33,  3, 1),
+            ( "M1",  0,  6, 0),
+            ( "M3",  8,  0, 0),
+            ( "M4",  7,  0, 1),
+            ( "M6", 14,  0, 1),
+            ( "M7", 15,  0, 1),
+            ( "M9", 22,  0, 1),
+            ("M11", 30,  0, 0),
+            ("M12", 33,  1, 0),
+            ( "N1",  0,  4, 1),
+            ("N14", 33,  2, 1),
+            ( "P1",  0,  4, 0),
+            ( "P2",  4,  0, 0),
+            ( "P3",  5,  0, 1),
+            ( "P4", 12,  0, 1),
+            ( "P5", 13,  0, 0),
+            ( "P7", 16,  0, 1),
+            ( "P8", 17,  0, 0),
+            ( "P9", 21,  0, 1),
+            ("P10", 29,  0, 1),
+            ("P11", 30,  0, 1),
+            ("P12", 31,  0, 0),
+            ("P13", 31,  0, 1),
+            ("P14", 33,  1, 1),
+        ],
+        "8k-ct256": [
+            ( "A1",  4, 33, 1),
+            ( "A2",  5, 33, 1),
+            ( "A5",  8, 33, 0),
+            ( "A6",  9, 33, 0),
+            ( "A7", 12, 33, 0),
+            ( "A9", 18, 33, 1),
+            ("A10", 22, 33, 1),
+            ("A11", 22, 33, 0),
+            ("A15", 27, 33, 0),
+            ("A16", 27, 33, 1),
+            ( "B1",  0, 30, 0),
+            ( "B2",  0, 31, 0),
+            ( "B3",  3, 33, 0),
+            ( "B4",  6, 33, 1),
+            ( "B5",  7, 33, 1),
+            ( "B6", 10, 33, 1),
+            ( "B7", 11, 33, 0),
+            ( "B8", 13, 33, 0),
+            ( "B9", 16, 33, 0),
+            ("B10", 24, 33, 0),
+            ("B11", 23, 33, 1),
+            ("B12", 24, 33, 1),
+            ("B13", 26, 33, 1),
+            ("B14", 30, 33, 0),
+            ("B15", 31, 33, 0),
+            ("B16", 33, 30, 0),
+            ( "C1",  0, 28, 1),
+            ( "C2",  0, 28, 0),
+            ( "C3",  1, 33, 0),
+            ( "C4",  3, 33, 1),
+            ( "C5",  4, 33, 0),
+            ( "C6", 10, 33, 0),
+            ( "C7", 11, 33, 1),
+            ( "C8", 17, 33, 0),
+            ( "C9", 20, 33, 0),
+            ("C10", 23, 33, 0),
+            ("C11", 25, 33, 1),
+            ("C12", 29, 33, 1),
+            ("C13", 28, 33, 1),
+            ("C14", 31, 33, 1),
+            ("C16", 33, 28, 0),
+            ( "D1",  0, 25, 0),
+            ( "D2",  0, 27, 0),
+            ( "D3",  1, 33, 1),
+            ( "D4",  2, 33, 1),
+            ( "D5",  5, 33, 0),
+            ( "D6",  8, 33, 1),
+            ( "D7",  9, 33, 1),
+            ( "D8", 14, 33, 1),
+            ( "D9", 19, 33, 0),
+            ("D10", 20, 33, 1),
+            ("D11", 25, 33, 0),
+            ("D13", 30, 33, 1),
+            ("D14", 33, 31, 0),
+            ("D15", 33, 26, 0),
+            ("D16", 33, 24, 0),
+            ( "E2",  0, 23, 0),
+            ( "E3",  0, 24, 0),
+            ( "E4",  0, 31, 1),
+            ( "E5",  2, 33, 0),
+            ( "E6",  7, 33, 0),
+            ( "E9", 19, 33, 1),
+            ("E10", 26, 33, 0),
+            ("E11", 29, 33, 0),
+            ("E13", 33, 30, 1),
+            ("E14", 33, 27, 1),
+            ("E16", 33, 23, 0),
+            ( "F1",  0, 20, 0),
+            ( "F2",  0, 21, 0),
+            ( "F3",  0, 22, 0),
+            ( "F4",  0, 27, 1),
+            ( "F5",  0, 30, 1),
+            ( "F7", 16, 33, 1),
+            ( "F9", 17, 33, 1),
+            ("F11", 33, 26, 1),
+            ("F12", 33, 25, 1),
+            ("F13", 33, 28, 1),
+            ("F14", 33, 25, 0),
+            ("F15", 33, 22, 0),
+            ("F16", 33, 21, 0),
+            ( "G1",  0, 17, 0),
+            ( "G2",  0, 19, 0),
+            ( "G3",  0, 22, 1),
+            ( "G4",  0, 24, 1),
+            ( "G5",  0, 25, 1),
+            ("G10", 33, 20, 1),
+            ("G11", 33, 21, 1),
+            ("G12", 33, 24, 1),
+            ("G13", 33, 23, 1),
+            ("G14", 33, 22, 1),
+            ("G15", 33, 20, 0),
+            ("G16", 33, 19, 0),
+            ( "H1",  0, 16, 0),
+            ( "H2",  0, 18, 0),
+            ( "H3",  0, 21, 1),
+            ( "H4",  0, 19, 1),
+            ( "H5",  0, 23, 1),
+            ( "H6",  0, 20, 1),
+            ("H11", 33, 16, 1),
+            ("H12", 33, 19, 1),
+            ("H13", 33, 16, 0),
+            ("H14", 33, 17, 1),
+            ("H16", 33, 17, 0),
+            ( "J1",  0, 14, 0),
+            ( "J2",  0, 14, 1),
+            ( "J3",  0, 16, 1),
+            ( "J4",  0, 18, 1),
+            ( "J5",  0, 17, 1),
+            ("J10", 33,  7, 1),
+            ("J11", 33,  9, 1),
+            ("J12", 33, 14, 1),
+            ("J13", 33, 15, 0),
+            ("J14", 33, 13, 1),
+            ("J15", 33, 11, 1),
+            ("J16", 33, 15, 1),
+            ( "K1",  0, 13, 1),
+            ( "K3",  0, 13, 0),
+            ( "K4",  0, 11, 1),
+            ( "K5",  0,  9, 1),
+            ( "K9", 17,  0, 0),
+            ("K11", 29,  0, 0),
+            ("K12", 33,  6, 1),
+            ("K13", 33, 10, 1),
+            ("K14", 33, 11, 0),
+            ("K15", 33, 12, 0),
+            ("K16", 33, 13, 0),
+            ( "L1",  0, 12, 0),
+            ( "L3",  0, 10, 0),
+            ( "L4",  0, 12, 1),
+            ( "L5",  0,  6, 1),
+            ( "L6",  0, 10, 1),
+            ( "L7",  0,  8, 1),
+            ( "L9", 13,  0, 0),
+            ("L10", 19,  0, 1),
+            ("L11", 26,  0, 1),
+            ("L12", 33,  4, 1),
+            ("L13", 33,  5, 1),
+            ("L14", 33,  6, 0),
+            ("L16", 33, 10, 0),
+            ( "M1",  0, 11, 0),
+            ( "M2",  0,  9, 0),
+            ( "M3",  0,  7, 0),
+            ( "M4",  0,  5, 0),
+            ( "M5",  0,  4, 0),
+            ( "M6",  0,  7, 1),
+            ( "M7",  8,  0, 0),
+            ( "M8", 10,  0, 0),
+            ( "M9", 16,  0, 0),
+            ("M11", 23,  0, 1),
+            ("M12", 27,  0, 1),
+            ("M13", 33,  3, 1),
+            ("M14", 33,  4, 0),
+            ("M15", 33,  8, 0),
+            ("M16", 33,  7, 0),
+            ( "N2",  0,  8, 0),
+            ( "N3",  0,  6, 0),
+            ( "N4",  0,  3, 0),
+            ( "N5",  4,  0, 0),
+            ( "N6",  2,  0, 0),
+            ( "N7",  9,  0, 0),
+            ( "N9", 15,  0, 0),
+            ("N10", 20,  0, 1),
+            ("N12", 26,  0, 0),
+            ("N16", 33,  5, 0),
+            ( "P1",  0,  5, 1),
+            ( "P2",  0,  4, 1),
+            ( "P4",  3,  0, 0),
+            ( "P5",  5,  0, 0),
+            ( "P6",  9,  0, 1),
+            ( "P7", 14,  0, 1),
+            ( "P8", 12,  0, 0),
+            ( "P9", 17,  0, 1),
+            ("P10", 20,  0, 0),
+            ("P11", 30,  0, 1),
+            ("P12", 30,  0, 0),
+            ("P13", 29,  0, 1),
+            ("P14", 33,  2, 0),
+            ("P15", 33,  2, 1),
+            ("P16", 33,  3, 0),
+            ( "R1",  0,  3, 1),
+            ( "R2",  3,  0, 1),
+            ( "R3",  5,  0, 1),
+            ( "R4",  7,  0, 1),
+            ( "R5",  6,  0, 0),
+            ( "R6", 11,  0, 1),
+            ( "R9", 16,  0, 1),
+            ("R10", 19,  0, 0),
+            ("R11", 31,  0, 0),
+            ("R12", 31,  0, 1),
+            ("R14", 33,  1, 0),
+            ("R15", 33,  1, 1),
+            ("R16", 28,  0, 0),
+            ( "T1",  2,  0, 1),
+            ( "T2",  4,  0, 1),
+            ( "T3",  6,  0, 1),
+            ( "T5", 10,  0, 1),
+            ( "T6", 12,  0, 1),
+            ( "T7", 13,  0, 1),
+            ( "T8", 14,  0, 0),
+            ( "T9", 15,  0, 1),
+            ("T10", 21,  0, 0),
+            ("T11", 21,  0, 1),
+            ("T13", 24,  0, 0),
+            ("T14", 23,  0, 0),
+            ("T15", 22,  0, 1),
+            ("T16", 27,  0, 0),
+        ],
+        "384-qn32": [
+            (  "1",  0,  7, 0),
+            (  "2",  0,  7, 1),
+            (  "5",  0,  5, 1),
+            (  "6",  0,  5, 0),
+            (  "7",  0,  4, 0),
+            (  "8",  0,  4, 1),
+            ( "12",  5,  0, 0),
+            ( "13",  5,  0, 1),
+            ( "14",  6,  0, 1),
+            ( "15",  6,  0, 0),
+            ( "18",  7,  4, 0),
+            ( "19",  7,  4, 1),
+            ( "20",  7,  5, 0),
+            ( "22",  7,  6, 0),
+            ( "23",  7,  6, 1),
+            ( "26",  6,  9, 0),
+            ( "27",  5,  9, 0),
+            ( "29",  4,  9, 0),
+            ( "30",  3,  9, 1),
+            ( "31",  2,  9, 0),
+            ( "32",  2,  9, 1),
+        ],
+        "384-cm36": [
+            ( "A1",  0,  7, 0),
+            ( "A2",  2,  9, 1),
+            ( "A3",  3,  9, 1),
+            ( "B1",  0,  7, 1),
+            ( "B3",  4,  9, 0),
+            ( "B4",  7,  5, 0),
+            ( "B5",  7,  5, 1),
+            ( "B6",  7,  6, 0),
+            ( "C1",  0,  5, 0),
+            ( "C2",  0,  5, 1),
+            ( "C3",  2,  9, 0),
+            ( "C5",  7,  4, 1),
+            ( "C6",  7,  6, 1),
+            ( "D1",  0,  4, 1),
+            ( "D5",  6,  0, 1),
+            ( "D6",  7,  4, 0),
+            ( "E1",  0,  4, 0),
+            ( "E2",  3,  0, 1),
+            ( "E3",  4,  0, 0),
+            ( "E4",  5,  0, 0),
+            ( "E5",  6,  0, 0),
+            ( "E6",  7,  3, 1),
+            ( "F2",  3,  0, 0),
+            ( "F3",  4,  0, 1),
+            ( "F5",  5,  0, 1),
+        ],
+        "384-cm49": [
+            ( "A1",  0,  7, 1),
+            ( "A2",  2,  9, 1),
+            ( "A3",  3,  9, 0),
+            ( "A4",  4,  9, 1),
+            ( "A5",  5,  9, 0),
+            ( "A6",  6,  9, 0),
+            ( "A7",  6,  9, 1),
+            ( "B1",  0,  7, 0),
+            ( "B2",  0,  6, 0),
+            ( "B3",  2,  9, 0),
+            ( "B4",  4,  9, 0),
+            ( "C1",  0,  5, 1),
+            ( "C2",  0,  6, 1),
+            ( "C4",  3,  9, 1),
+            ( "C5",  7,  6, 1),
+            ( "C6",  7,  5, 1),
+            ( "C7",  7,  6, 0),
+            ( "D1",  0,  4, 0),
+            ( "D2",  0,  5, 0),
+            ( "D3",  0,  2, 0),
+            ( "D4",  5,  9, 1),
+            ( "D6",  7,  4, 1),
+            ( "D7",  7,  5, 0),
+            ( "E2",  0,  4, 1),
+            ( "E6",  6,  0, 1),
+            ( "E7",  7,  4, 0),
+            ( "F1",  0,  2, 1),
+            ( "F2",  0,  1, 0),
+            ( "F3",  3,  0, 1),
+            ( "F4",  4,  0, 0),
+            ( "F5",  5,  0, 0),
+            ( "F6",  6,  0, 0),
+            ( "F7",  7,  3, 1),
+            ( "G1",  0,  1, 1),
+            ( "G3",  3,  0, 0),
+            ( "G4",  4,  0, 1),
+            ( "G6",  5,  0, 1),
+        ],
+        "5k-sg48": [
+            (  "2",  8,  0, 0),
+            (  "3",  9,  0, 1),
+            (  "4",  9,  0, 0),
+            (  "6", 13,  0, 1),
+            (  "9", 15,  0, 0),
+            ( "10", 16,  0, 0),
+            ( "11", 17,  0, 0),
+            ( "12", 18,  0, 0),
+            ( "13", 19,  0, 0),
+            ( "14", 23,  0, 0),
+            ( "15", 24,  0, 0),
+            ( "16", 24,  0, 1),
+            ( "17", 23,  0, 1),
+            ( "18", 22,  0, 1),
+            ( "19", 21,  0, 1),
+            ( "20", 19,  0, 1),
+            ( "21", 18,  0, 1),
+            ( "23", 19, 31, 0),
+            ( "25", 19, 31, 1),
+            ( "26", 18, 31, 0),
+            ( "27", 18, 31, 1),
+            ( "28", 17, 31, 0),
+            ( "31", 16, 31, 1),
+            ( "32", 16, 31, 0),
+            ( "34", 13, 31, 1),
+            ( "35", 12, 31, 1),
+            ( "36",  9, 31, 1),
+            ( "37", 13, 31, 0),
+            ( "38",  8, 31, 1),
+            ( "39",  4, 31, 0),
+            ( "40",  5, 31, 0),
+            ( "41",  6, 31, 0),
+            ( "42",  8, 31, 0),
+            ( "43",  9, 31, 0),
+            ( "44",  6,  0, 1),
+            ( "45",  7,  0, 1),
+            ( "46",  5,  0, 0),
+            ( "47",  6,  0, 0),
+            ( "48",  7,  0, 0),
+        ],
+        "u4k-sg48": [
+            (  "2",  8,  0, 0),
+            (  "3",  9,  0, 1),
+            (  "4",  9,  0, 0),
+            (  "6", 13,  0, 1),
+            (  "9", 15,  0, 0),
+            ( "10", 16,  0, 0),
+            ( "11", 17,  0, 0),
+            ( "12", 18,  0, 0),
+            ( "13", 19,  0, 0),
+            ( "14", 23,  0, 0),
+            ( "15", 24,  0, 0),
+            ( "16", 24,  0, 1),
+            ( "17", 23,  0, 1),
+            ( "18", 22,  0, 1),
+            ( "19", 21,  0, 1),
+            ( "20", 19,  0, 1),
+            ( "21", 18,  0, 1),
+            ( "23", 19, 21, 0),
+            ( "25", 19, 21, 1),
+            ( "26", 18, 21, 0),
+            ( "27", 18, 21, 1),
+            ( "28", 17, 21, 0),
+            ( "31", 16, 21, 1),
+            ( "32", 16, 21, 0),
+            ( "34", 13, 21, 1),
+            ( "35", 12, 21, 1),
+            ( "36",  9, 21, 1),
+            ( "37", 13, 21, 0),
+            ( "38",  8, 21, 1),
+            ( "39",  6, 21, 0),
+            ( "40",  5, 21, 0),
+            ( "41",  4, 21, 0),
+            ( "42",  8, 21, 0),
+            ( "43",  9, 21, 0),
+            ( "44",  6,  0, 1),
+            ( "45",  7,  0, 1),
+            ( "46",  5,  0, 0),
+            ( "47",  6,  0, 0),
+            ( "48",  7,  0, 0),
+        ],
+        "5k-uwg30": [
+            ( "A1", 19, 31, 1),
+            ( "A2", 19, 31, 0),
+            ( "A4", 12, 31, 0),
+            ( "A5",  4, 31, 0),
+            ( "B1", 19,  0, 0),
+            ( "B3", 12, 31, 1),
+            ( "B5",  5, 31, 0),
+            ( "C1", 24,  0, 1),
+            ( "C3", 12,  0, 0),
+            ( "C5",  6, 31, 0),
+            ( "D1", 24,  0, 0),
+            ( "D3", 13,  0, 0),
+            ( "D5",  6,  0, 0),
+            ( "E1", 23,  0, 1),
+            ( "E3", 13,  0, 1),
+            ( "E4",  9,  0, 1),
+            ( "E5",  5,  0, 0),
+            ( "F1", 23,  0, 0),
+            ( "F2", 19,  0, 1),
+            ( "F4", 12,  0, 1),
+            ( "F5",  6,  0, 1),
+        ],
+        "lm4k-cm49": [
+            ( "A1",  5,  21, 1),
+            ( "A2",  6,  21, 0),
+            ( "A3",  12, 21, 1),
+            ( "A4",  13, 21, 0),
+            ( "A5",  17, 21, 1),
+            ( "A6",  19, 21, 1),
+            ( "A7",  22, 21, 1),
+            ( "B1",  4, 21, 1),
+            ( "B2",  7, 21, 1),
+            ( "B4",  15, 21, 0),
+            ( "B6",  18, 21, 0),
+            ( "B7",  23, 21, 1),
+            ( "C1",  4, 21, 0),
+            ( "C3",  9, 21, 0),
+            ( "C4",  19, 21, 0),
+            ( "C6",  21, 21, 1),
+            ( "C7",  23, 21, 0),
+            ( "D1",  7,  0, 1),
+            ( "D2",  6,  0, 1),
+            ( "D3", 10,  0, 0),
+            ( "D6", 19,  0, 1),
+            ( "D7", 21,  0, 0),
+            ( "E1",  6,  0, 0),
+            ( "E2", 12,  0, 1),
+            ( "E3",  7,  0, 0),
+            ( "E4", 12,  0, 0),
+            ( "E5", 19,  0, 0),
+            ( "E6", 24,  0, 1),
+            ( "E7", 22,  0, 0),
+            ( "F2",  8,  0, 1),
+            ( "F3",  8,  0, 0),
+            ( "F4", 13,  0, 1),
+            ( "F5", 23,  0, 0),
+            ( "F6", 24,  0, 0),
+            ( "F7", 21,  0, 1),
+            ( "G3", 13,  0, 0),
+            ( "G6", 23,  0, 1),
+        ],
+        "lm4k-cm36": [
+            ( "A1",  5, 21, 1),
+            ( "A2",  7, 21, 1),
+            ( "A3",  9, 21, 1),
+            ( "A4", 16, 21, 1),
+            ( "A5", 19, 21, 1),
+            ( "A6", 22, 21, 1),
+            ( "B1",  4, 21, 1),
+            ( "B2",  6, 21, 0),
+            ( "B3", 12, 21, 1),
+            ( "B4", 13, 21, 0),
+            ( "B5", 21, 21, 1),
+            ( "B6", 23, 21, 1),
+            ( "C1",  7,  0, 1),
+            ( "C5", 23, 21, 0),
+            ( "C6", 23,  0, 0),
+            ( "D1",  6,  0, 1),
+            ( "D6", 24,  0, 0),
+            ( "E1",  7,  0, 0),
+            ( "E2", 13,  0, 0),
+            ( "E3", 14,  0, 1),
+            ( "E5", 22,  0, 1),
+            ( "E6", 24,  0, 1),
+            ( "F1",  6,  0, 0),
+            ( "F2", 10,  0, 0),
+            ( "F3", 12,  0, 1),
+            ( "F4", 19,  0, 0),
+            ( "F5", 22,  0, 0),
+            ( "F6", 23,  0, 1),
+        ],
+        "lm4k-swg25tr": [
+            ( "A1", 22, 21, 1),
+            ( "A3", 13, 21, 0),
+            ( "A4", 12, 21, 1),
+            ( "A5",  5, 21, 1),
+            ( "B1", 21, 21, 1),
+            ( "B5",  6, 21, 0),
+            ( "C1", 23,  0, 1),
+            ( "C2", 19, 21, 1),
+            ( "C4", 13,  0, 0),
+            ( "C5",  7,  0, 1),
+            ( "D1", 24,  0, 0),
+            ( "D2", 23,  0, 0),
+            ( "D3", 19,  0, 0),
+            ( "D5",  6,  0, 1),
+            ( "E1", 24,  0, 1),
+            ( "E3", 12,  0, 1),
+            ( "E4",  7,  0, 0),
+            ( "E5",  6,  0, 0),
+        ]
+    }
 
 # This database contains the locations of configuration bits of the DSP tiles
 # The standard configuration is stored under the key  "default". If it is necessary to
@@ -5267,900 +7150,930 @@ dsp_config_db = {
 
 # SPRAM data for UltraPlus devices, use icefuzz/tests/fuzz_spram.py
 # to generate this
-spram_db = { 
-    "5k" : {
-        (0, 0, 1): {
-    		"ADDRESS_0":             (0, 2, "lutff_0/in_1"), 
-    		"ADDRESS_10":            (0, 2, "lutff_2/in_0"), 
-    		"ADDRESS_11":            (0, 2, "lutff_3/in_0"), 
-    		"ADDRESS_12":            (0, 2, "lutff_4/in_0"), 
-    		"ADDRESS_13":            (0, 2, "lutff_5/in_0"), 
-    		"ADDRESS_1":             (0, 2, "lutff_1/in_1"), 
-    		"ADDRESS_2":             (0, 2, "lutff_2/in_1"), 
-    		"ADDRESS_3":             (0, 2, "lutff_3/in_1"), 
-    		"ADDRESS_4":             (0, 2, "lutff_4/in_1"), 
-    		"ADDRESS_5":             (0, 2, "lutff_5/in_1"), 
-    		"ADDRESS_6":             (0, 2, "lutff_6/in_1"), 
-    		"ADDRESS_7":             (0, 2, "lutff_7/in_1"), 
-    		"ADDRESS_8":             (0, 2, "lutff_0/in_0"), 
-    		"ADDRESS_9":             (0, 2, "lutff_1/in_0"), 
-    		"CHIPSELECT":            (0, 3, "lutff_6/in_1"), 
-    		"CLOCK":                 (0, 1, "clk"), 
-    		"DATAIN_0":              (0, 1, "lutff_0/in_3"), 
-    		"DATAIN_10":             (0, 1, "lutff_2/in_1"), 
-    		"DATAIN_11":             (0, 1, "lutff_3/in_1"), 
-    		"DATAIN_12":             (0, 1, "lutff_4/in_1"), 
-    		"DATAIN_13":             (0, 1, "lutff_5/in_1"), 
-    		"DATAIN_14":             (0, 1, "lutff_6/in_1"), 
-    		"DATAIN_15":             (0, 1, "lutff_7/in_1"), 
-    		"DATAIN_1":              (0, 1, "lutff_1/in_3"), 
-    		"DATAIN_2":              (0, 1, "lutff_2/in_3"), 
-    		"DATAIN_3":              (0, 1, "lutff_3/in_3"), 
-    		"DATAIN_4":              (0, 1, "lutff_4/in_3"), 
-    		"DATAIN_5":              (0, 1, "lutff_5/in_3"), 
-    		"DATAIN_6":              (0, 1, "lutff_6/in_3"), 
-    		"DATAIN_7":              (0, 1, "lutff_7/in_3"), 
-    		"DATAIN_8":              (0, 1, "lutff_0/in_1"), 
-    		"DATAIN_9":              (0, 1, "lutff_1/in_1"), 
-    		"DATAOUT_0":             (0, 1, "slf_op_0"), 
-    		"DATAOUT_10":            (0, 2, "slf_op_2"), 
-    		"DATAOUT_11":            (0, 2, "slf_op_3"), 
-    		"DATAOUT_12":            (0, 2, "slf_op_4"), 
-    		"DATAOUT_13":            (0, 2, "slf_op_5"), 
-    		"DATAOUT_14":            (0, 2, "slf_op_6"), 
-    		"DATAOUT_15":            (0, 2, "slf_op_7"), 
-    		"DATAOUT_1":             (0, 1, "slf_op_1"), 
-    		"DATAOUT_2":             (0, 1, "slf_op_2"), 
-    		"DATAOUT_3":             (0, 1, "slf_op_3"), 
-    		"DATAOUT_4":             (0, 1, "slf_op_4"), 
-    		"DATAOUT_5":             (0, 1, "slf_op_5"), 
-    		"DATAOUT_6":             (0, 1, "slf_op_6"), 
-    		"DATAOUT_7":             (0, 1, "slf_op_7"), 
-    		"DATAOUT_8":             (0, 2, "slf_op_0"), 
-    		"DATAOUT_9":             (0, 2, "slf_op_1"), 
-    		"MASKWREN_0":            (0, 3, "lutff_0/in_0"), 
-    		"MASKWREN_1":            (0, 3, "lutff_1/in_0"), 
-    		"MASKWREN_2":            (0, 3, "lutff_2/in_0"), 
-    		"MASKWREN_3":            (0, 3, "lutff_3/in_0"), 
-    		"POWEROFF":              (0, 4, "lutff_4/in_3"), 
-    		"SLEEP":                 (0, 4, "lutff_2/in_3"), 
-    		"SPRAM_EN":              (0, 1, "CBIT_0"), 
-    		"STANDBY":               (0, 4, "lutff_0/in_3"), 
-    		"WREN":                  (0, 3, "lutff_4/in_1"), 
-    	},
-    	(0, 0, 2): {
-    		"ADDRESS_0":             (0, 2, "lutff_6/in_0"), 
-    		"ADDRESS_10":            (0, 3, "lutff_0/in_1"), 
-    		"ADDRESS_11":            (0, 3, "lutff_1/in_1"), 
-    		"ADDRESS_12":            (0, 3, "lutff_2/in_1"), 
-    		"ADDRESS_13":            (0, 3, "lutff_3/in_1"), 
-    		"ADDRESS_1":             (0, 2, "lutff_7/in_0"), 
-    		"ADDRESS_2":             (0, 3, "lutff_0/in_3"), 
-    		"ADDRESS_3":             (0, 3, "lutff_1/in_3"), 
-    		"ADDRESS_4":             (0, 3, "lutff_2/in_3"), 
-    		"ADDRESS_5":             (0, 3, "lutff_3/in_3"), 
-    		"ADDRESS_6":             (0, 3, "lutff_4/in_3"), 
-    		"ADDRESS_7":             (0, 3, "lutff_5/in_3"), 
-    		"ADDRESS_8":             (0, 3, "lutff_6/in_3"), 
-    		"ADDRESS_9":             (0, 3, "lutff_7/in_3"), 
-    		"CHIPSELECT":            (0, 3, "lutff_7/in_1"), 
-    		"CLOCK":                 (0, 2, "clk"), 
-    		"DATAIN_0":              (0, 1, "lutff_0/in_0"), 
-    		"DATAIN_10":             (0, 2, "lutff_2/in_3"), 
-    		"DATAIN_11":             (0, 2, "lutff_3/in_3"), 
-    		"DATAIN_12":             (0, 2, "lutff_4/in_3"), 
-    		"DATAIN_13":             (0, 2, "lutff_5/in_3"), 
-    		"DATAIN_14":             (0, 2, "lutff_6/in_3"), 
-    		"DATAIN_15":             (0, 2, "lutff_7/in_3"), 
-    		"DATAIN_1":              (0, 1, "lutff_1/in_0"), 
-    		"DATAIN_2":              (0, 1, "lutff_2/in_0"), 
-    		"DATAIN_3":              (0, 1, "lutff_3/in_0"), 
-    		"DATAIN_4":              (0, 1, "lutff_4/in_0"), 
-    		"DATAIN_5":              (0, 1, "lutff_5/in_0"), 
-    		"DATAIN_6":              (0, 1, "lutff_6/in_0"), 
-    		"DATAIN_7":              (0, 1, "lutff_7/in_0"), 
-    		"DATAIN_8":              (0, 2, "lutff_0/in_3"), 
-    		"DATAIN_9":              (0, 2, "lutff_1/in_3"), 
-    		"DATAOUT_0":             (0, 3, "slf_op_0"), 
-    		"DATAOUT_10":            (0, 4, "slf_op_2"), 
-    		"DATAOUT_11":            (0, 4, "slf_op_3"), 
-    		"DATAOUT_12":            (0, 4, "slf_op_4"), 
-    		"DATAOUT_13":            (0, 4, "slf_op_5"), 
-    		"DATAOUT_14":            (0, 4, "slf_op_6"), 
-    		"DATAOUT_15":            (0, 4, "slf_op_7"), 
-    		"DATAOUT_1":             (0, 3, "slf_op_1"), 
-    		"DATAOUT_2":             (0, 3, "slf_op_2"), 
-    		"DATAOUT_3":             (0, 3, "slf_op_3"), 
-    		"DATAOUT_4":             (0, 3, "slf_op_4"), 
-    		"DATAOUT_5":             (0, 3, "slf_op_5"), 
-    		"DATAOUT_6":             (0, 3, "slf_op_6"), 
-    		"DATAOUT_7":             (0, 3, "slf_op_7"), 
-    		"DATAOUT_8":             (0, 4, "slf_op_0"), 
-    		"DATAOUT_9":             (0, 4, "slf_op_1"), 
-    		"MASKWREN_0":            (0, 3, "lutff_4/in_0"), 
-    		"MASKWREN_1":            (0, 3, "lutff_5/in_0"), 
-    		"MASKWREN_2":            (0, 3, "lutff_6/in_0"), 
-    		"MASKWREN_3":            (0, 3, "lutff_7/in_0"), 
-    		"POWEROFF":              (0, 4, "lutff_5/in_3"), 
-    		"SLEEP":                 (0, 4, "lutff_3/in_3"), 
-    		"SPRAM_EN":              (0, 1, "CBIT_1"), 
-    		"STANDBY":               (0, 4, "lutff_1/in_3"), 
-    		"WREN":                  (0, 3, "lutff_5/in_1"), 
-    	},
-    	(25, 0, 3): {
-    		"ADDRESS_0":             (25, 2, "lutff_0/in_1"), 
-    		"ADDRESS_10":            (25, 2, "lutff_2/in_0"), 
-    		"ADDRESS_11":            (25, 2, "lutff_3/in_0"), 
-    		"ADDRESS_12":            (25, 2, "lutff_4/in_0"), 
-    		"ADDRESS_13":            (25, 2, "lutff_5/in_0"), 
-    		"ADDRESS_1":             (25, 2, "lutff_1/in_1"), 
-    		"ADDRESS_2":             (25, 2, "lutff_2/in_1"), 
-    		"ADDRESS_3":             (25, 2, "lutff_3/in_1"), 
-    		"ADDRESS_4":             (25, 2, "lutff_4/in_1"), 
-    		"ADDRESS_5":             (25, 2, "lutff_5/in_1"), 
-    		"ADDRESS_6":             (25, 2, "lutff_6/in_1"), 
-    		"ADDRESS_7":             (25, 2, "lutff_7/in_1"), 
-    		"ADDRESS_8":             (25, 2, "lutff_0/in_0"), 
-    		"ADDRESS_9":             (25, 2, "lutff_1/in_0"), 
-    		"CHIPSELECT":            (25, 3, "lutff_6/in_1"), 
-    		"CLOCK":                 (25, 1, "clk"), 
-    		"DATAIN_0":              (25, 1, "lutff_0/in_3"), 
-    		"DATAIN_10":             (25, 1, "lutff_2/in_1"), 
-    		"DATAIN_11":             (25, 1, "lutff_3/in_1"), 
-    		"DATAIN_12":             (25, 1, "lutff_4/in_1"), 
-    		"DATAIN_13":             (25, 1, "lutff_5/in_1"), 
-    		"DATAIN_14":             (25, 1, "lutff_6/in_1"), 
-    		"DATAIN_15":             (25, 1, "lutff_7/in_1"), 
-    		"DATAIN_1":              (25, 1, "lutff_1/in_3"), 
-    		"DATAIN_2":              (25, 1, "lutff_2/in_3"), 
-    		"DATAIN_3":              (25, 1, "lutff_3/in_3"), 
-    		"DATAIN_4":              (25, 1, "lutff_4/in_3"), 
-    		"DATAIN_5":              (25, 1, "lutff_5/in_3"), 
-    		"DATAIN_6":              (25, 1, "lutff_6/in_3"), 
-    		"DATAIN_7":              (25, 1, "lutff_7/in_3"), 
-    		"DATAIN_8":              (25, 1, "lutff_0/in_1"), 
-    		"DATAIN_9":              (25, 1, "lutff_1/in_1"), 
-    		"DATAOUT_0":             (25, 1, "slf_op_0"), 
-    		"DATAOUT_10":            (25, 2, "slf_op_2"), 
-    		"DATAOUT_11":            (25, 2, "slf_op_3"), 
-    		"DATAOUT_12":            (25, 2, "slf_op_4"), 
-    		"DATAOUT_13":            (25, 2, "slf_op_5"), 
-    		"DATAOUT_14":            (25, 2, "slf_op_6"), 
-    		"DATAOUT_15":            (25, 2, "slf_op_7"), 
-    		"DATAOUT_1":             (25, 1, "slf_op_1"), 
-    		"DATAOUT_2":             (25, 1, "slf_op_2"), 
-    		"DATAOUT_3":             (25, 1, "slf_op_3"), 
-    		"DATAOUT_4":             (25, 1, "slf_op_4"), 
-    		"DATAOUT_5":             (25, 1, "slf_op_5"), 
-    		"DATAOUT_6":             (25, 1, "slf_op_6"), 
-    		"DATAOUT_7":             (25, 1, "slf_op_7"), 
-    		"DATAOUT_8":             (25, 2, "slf_op_0"), 
-    		"DATAOUT_9":             (25, 2, "slf_op_1"), 
-    		"MASKWREN_0":            (25, 3, "lutff_0/in_0"), 
-    		"MASKWREN_1":            (25, 3, "lutff_1/in_0"), 
-    		"MASKWREN_2":            (25, 3, "lutff_2/in_0"), 
-    		"MASKWREN_3":            (25, 3, "lutff_3/in_0"), 
-    		"POWEROFF":              (25, 4, "lutff_4/in_3"), 
-    		"SLEEP":                 (25, 4, "lutff_2/in_3"), 
-    		"SPRAM_EN":              (25, 1, "CBIT_0"), 
-    		"STANDBY":               (25, 4, "lutff_0/in_3"), 
-    		"WREN":                  (25, 3, "lutff_4/in_1"), 
-    	},
-    	(25, 0, 4): {
-    		"ADDRESS_0":             (25, 2, "lutff_6/in_0"), 
-    		"ADDRESS_10":            (25, 3, "lutff_0/in_1"), 
-    		"ADDRESS_11":            (25, 3, "lutff_1/in_1"), 
-    		"ADDRESS_12":            (25, 3, "lutff_2/in_1"), 
-    		"ADDRESS_13":            (25, 3, "lutff_3/in_1"), 
-    		"ADDRESS_1":             (25, 2, "lutff_7/in_0"), 
-    		"ADDRESS_2":             (25, 3, "lutff_0/in_3"), 
-    		"ADDRESS_3":             (25, 3, "lutff_1/in_3"), 
-    		"ADDRESS_4":             (25, 3, "lutff_2/in_3"), 
-    		"ADDRESS_5":             (25, 3, "lutff_3/in_3"), 
-    		"ADDRESS_6":             (25, 3, "lutff_4/in_3"), 
-    		"ADDRESS_7":             (25, 3, "lutff_5/in_3"), 
-    		"ADDRESS_8":             (25, 3, "lutff_6/in_3"), 
-    		"ADDRESS_9":             (25, 3, "lutff_7/in_3"), 
-    		"CHIPSELECT":            (25, 3, "lutff_7/in_1"), 
-    		"CLOCK":                 (25, 2, "clk"), 
-    		"DATAIN_0":              (25, 1, "lutff_0/in_0"), 
-    		"DATAIN_10":             (25, 2, "lutff_2/in_3"), 
-    		"DATAIN_11":             (25, 2, "lutff_3/in_3"), 
-    		"DATAIN_12":             (25, 2, "lutff_4/in_3"), 
-    		"DATAIN_13":             (25, 2, "lutff_5/in_3"), 
-    		"DATAIN_14":             (25, 2, "lutff_6/in_3"), 
-    		"DATAIN_15":             (25, 2, "lutff_7/in_3"), 
-    		"DATAIN_1":              (25, 1, "lutff_1/in_0"), 
-    		"DATAIN_2":              (25, 1, "lutff_2/in_0"), 
-    		"DATAIN_3":              (25, 1, "lutff_3/in_0"), 
-    		"DATAIN_4":              (25, 1, "lutff_4/in_0"), 
-    		"DATAIN_5":              (25, 1, "lutff_5/in_0"), 
-    		"DATAIN_6":              (25, 1, "lutff_6/in_0"), 
-    		"DATAIN_7":              (25, 1, "lutff_7/in_0"), 
-    		"DATAIN_8":              (25, 2, "lutff_0/in_3"), 
-    		"DATAIN_9":              (25, 2, "lutff_1/in_3"), 
-    		"DATAOUT_0":             (25, 3, "slf_op_0"), 
-    		"DATAOUT_10":            (25, 4, "slf_op_2"), 
-    		"DATAOUT_11":            (25, 4, "slf_op_3"), 
-    		"DATAOUT_12":            (25, 4, "slf_op_4"), 
-    		"DATAOUT_13":            (25, 4, "slf_op_5"), 
-    		"DATAOUT_14":            (25, 4, "slf_op_6"), 
-    		"DATAOUT_15":            (25, 4, "slf_op_7"), 
-    		"DATAOUT_1":             (25, 3, "slf_op_1"), 
-    		"DATAOUT_2":             (25, 3, "slf_op_2"), 
-    		"DATAOUT_3":             (25, 3, "slf_op_3"), 
-    		"DATAOUT_4":             (25, 3, "slf_op_4"), 
-    		"DATAOUT_5":             (25, 3, "slf_op_5"), 
-    		"DATAOUT_6":             (25, 3, "slf_op_6"), 
-    		"DATAOUT_7":             (25, 3, "slf_op_7"), 
-    		"DATAOUT_8":             (25, 4, "slf_op_0"), 
-    		"DATAOUT_9":             (25, 4, "slf_op_1"), 
-    		"MASKWREN_0":            (25, 3, "lutff_4/in_0"), 
-    		"MASKWREN_1":            (25, 3, "lutff_5/in_0"), 
-    		"MASKWREN_2":            (25, 3, "lutff_6/in_0"), 
-    		"MASKWREN_3":            (25, 3, "lutff_7/in_0"), 
-    		"POWEROFF":              (25, 4, "lutff_5/in_3"), 
-    		"SLEEP":                 (25, 4, "lutff_3/in_3"), 
-    		"SPRAM_EN":              (25, 1, "CBIT_1"), 
-    		"STANDBY":               (25, 4, "lutff_1/in_3"), 
-    		"WREN":                  (25, 3, "lutff_5/in_1"), 
-    	}
+@db_loader("spram_db")
+def load_spram_db():
+    return {
+        "5k" : {
+            (0, 0, 1): {
+        		"ADDRESS_0":             (0, 2, "lutff_0/in_1"), 
+        		"ADDRESS_10":            (0, 2, "lutff_2/in_0"), 
+        		"ADDRESS_11":            (0, 2, "lutff_3/in_0"), 
+        		"ADDRESS_12":            (0, 2, "lutff_4/in_0"), 
+        		"ADDRESS_13":            (0, 2, "lutff_5/in_0"), 
+        		"ADDRESS_1":             (0, 2, "lutff_1/in_1"), 
+        		"ADDRESS_2":             (0, 2, "lutff_2/in_1"), 
+        		"ADDRESS_3":             (0, 2, "lutff_3/in_1"), 
+        		"ADDRESS_4":             (0, 2, "lutff_4/in_1"), 
+        		"ADDRESS_5":             (0, 2, "lutff_5/in_1"), 
+        		"ADDRESS_6":             (0, 2, "lutff_6/in_1"), 
+        		"ADDRESS_7":             (0, 2, "lutff_7/in_1"), 
+        		"ADDRESS_8":             (0, 2, "lutff_0/in_0"), 
+        		"ADDRESS_9":             (0, 2, "lutff_1/in_0"), 
+        		"CHIPSELECT":            (0, 3, "lutff_6/in_1"), 
+        		"CLOCK":                 (0, 1, "clk"), 
+        		"DATAIN_0":              (0, 1, "lutff_0/in_3"), 
+        		"DATAIN_10":             (0, 1, "lutff_2/in_1"), 
+        		"DATAIN_11":             (0, 1, "lutff_3/in_1"), 
+        		"DATAIN_12":             (0, 1, "lutff_4/in_1"), 
+        		"DATAIN_13":             (0, 1, "lutff_5/in_1"), 
+        		"DATAIN_14":             (0, 1, "lutff_6/in_1"), 
+        		"DATAIN_15":             (0, 1, "lutff_7/in_1"), 
+        		"DATAIN_1":              (0, 1, "lutff_1/in_3"), 
+        		"DATAIN_2":              (0, 1, "lutff_2/in_3"), 
+        		"DATAIN_3":              (0, 1, "lutff_3/in_3"), 
+        		"DATAIN_4":              (0, 1, "lutff_4/in_3"), 
+        		"DATAIN_5":              (0, 1, "lutff_5/in_3"), 
+        		"DATAIN_6":              (0, 1, "lutff_6/in_3"), 
+        		"DATAIN_7":              (0, 1, "lutff_7/in_3"), 
+        		"DATAIN_8":              (0, 1, "lutff_0/in_1"), 
+        		"DATAIN_9":              (0, 1, "lutff_1/in_1"), 
+        		"DATAOUT_0":             (0, 1, "slf_op_0"), 
+        		"DATAOUT_10":            (0, 2, "slf_op_2"), 
+        		"DATAOUT_11":            (0, 2, "slf_op_3"), 
+        		"DATAOUT_12":            (0, 2, "slf_op_4"), 
+        		"DATAOUT_13":            (0, 2, "slf_op_5"), 
+        		"DATAOUT_14":            (0, 2, "slf_op_6"), 
+        		"DATAOUT_15":            (0, 2, "slf_op_7"), 
+        		"DATAOUT_1":             (0, 1, "slf_op_1"), 
+        		"DATAOUT_2":             (0, 1, "slf_op_2"), 
+        		"DATAOUT_3":             (0, 1, "slf_op_3"), 
+        		"DATAOUT_4":             (0, 1, "slf_op_4"), 
+        		"DATAOUT_5":             (0, 1, "slf_op_5"), 
+        		"DATAOUT_6":             (0, 1, "slf_op_6"), 
+        		"DATAOUT_7":             (0, 1, "slf_op_7"), 
+        		"DATAOUT_8":             (0, 2, "slf_op_0"), 
+        		"DATAOUT_9":             (0, 2, "slf_op_1"), 
+        		"MASKWREN_0":            (0, 3, "lutff_0/in_0"), 
+        		"MASKWREN_1":            (0, 3, "lutff_1/in_0"), 
+        		"MASKWREN_2":            (0, 3, "lutff_2/in_0"), 
+        		"MASKWREN_3":            (0, 3, "lutff_3/in_0"), 
+        		"POWEROFF":              (0, 4, "lutff_4/in_3"), 
+        		"SLEEP":                 (0, 4, "lutff_2/in_3"), 
+        		"SPRAM_EN":              (0, 1, "CBIT_0"), 
+        		"STANDBY":               (0, 4, "lutff_0/in_3"), 
+        		"WREN":                  (0, 3, "lutff_4/in_1"), 
+        	},
+        	(0, 0, 2): {
+        		"ADDRESS_0":             (0, 2, "lutff_6/in_0"), 
+        		"ADDRESS_10":            (0, 3, "lutff_0/in_1"), 
+        		"ADDRESS_11":            (0, 3, "lutff_1/in_1"), 
+        		"ADDRESS_12":            (0, 3, "lutff_2/in_1"), 
+        		"ADDRESS_13":            (0, 3, "lutff_3/in_1"), 
+        		"ADDRESS_1":             (0, 2, "lutff_7/in_0"), 
+        		"ADDRESS_2":             (0, 3, "lutff_0/in_3"), 
+        		"ADDRESS_3":             (0, 3, "lutff_1/in_3"), 
+        		"ADDRESS_4":             (0, 3, "lutff_2/in_3"), 
+        		"ADDRESS_5":             (0, 3, "lutff_3/in_3"), 
+        		"ADDRESS_6":             (0, 3, "lutff_4/in_3"), 
+        		"ADDRESS_7":             (0, 3, "lutff_5/in_3"), 
+        		"ADDRESS_8":             (0, 3, "lutff_6/in_3"), 
+        		"ADDRESS_9":             (0, 3, "lutff_7/in_3"), 
+        		"CHIPSELECT":            (0, 3, "lutff_7/in_1"), 
+        		"CLOCK":                 (0, 2, "clk"), 
+        		"DATAIN_0":              (0, 1, "lutff_0/in_0"), 
+        		"DATAIN_10":             (0, 2, "lutff_2/in_3"), 
+        		"DATAIN_11":             (0, 2, "lutff_3/in_3"), 
+        		"DATAIN_12":             (0, 2, "lutff_4/in_3"), 
+        		"DATAIN_13":             (0, 2, "lutff_5/in_3"), 
+        		"DATAIN_14":             (0, 2, "lutff_6/in_3"), 
+        		"DATAIN_15":             (0, 2, "lutff_7/in_3"), 
+        		"DATAIN_1":              (0, 1, "lutff_1/in_0"), 
+        		"DATAIN_2":              (0, 1, "lutff_2/in_0"), 
+        		"DATAIN_3":              (0, 1, "lutff_3/in_0"), 
+        		"DATAIN_4":              (0, 1, "lutff_4/in_0"), 
+        		"DATAIN_5":              (0, 1, "lutff_5/in_0"), 
+        		"DATAIN_6":              (0, 1, "lutff_6/in_0"), 
+        		"DATAIN_7":              (0, 1, "lutff_7/in_0"), 
+        		"DATAIN_8":              (0, 2, "lutff_0/in_3"), 
+        		"DATAIN_9":              (0, 2, "lutff_1/in_3"), 
+        		"DATAOUT_0":             (0, 3, "slf_op_0"), 
+        		"DATAOUT_10":            (0, 4, "slf_op_2"), 
+        		"DATAOUT_11":            (0, 4, "slf_op_3"), 
+        		"DATAOUT_12":            (0, 4, "slf_op_4"), 
+        		"DATAOUT_13":            (0, 4, "slf_op_5"), 
+        		"DATAOUT_14":            (0, 4, "slf_op_6"), 
+        		"DATAOUT_15":            (0, 4, "slf_op_7"), 
+        		"DATAOUT_1":             (0, 3, "slf_op_1"), 
+        		"DATAOUT_2":             (0, 3, "slf_op_2"), 
+        		"DATAOUT_3":             (0, 3, "slf_op_3"), 
+        		"DATAOUT_4":             (0, 3, "slf_op_4"), 
+        		"DATAOUT_5":             (0, 3, "slf_op_5"), 
+        		"DATAOUT_6":             (0, 3, "slf_op_6"), 
+        		"DATAOUT_7":             (0, 3, "slf_op_7"), 
+        		"DATAOUT_8":             (0, 4, "slf_op_0"), 
+        		"DATAOUT_9":             (0, 4, "slf_op_1"), 
+        		"MASKWREN_0":            (0, 3, "lutff_4/in_0"), 
+        		"MASKWREN_1":            (0, 3, "lutff_5/in_0"), 
+        		"MASKWREN_2":            (0, 3, "lutff_6/in_0"), 
+        		"MASKWREN_3":            (0, 3, "lutff_7/in_0"), 
+        		"POWEROFF":              (0, 4, "lutff_5/in_3"), 
+        		"SLEEP":                 (0, 4, "lutff_3/in_3"), 
+        		"SPRAM_EN":              (0, 1, "CBIT_1"), 
+        		"STANDBY":               (0, 4, "lutff_1/in_3"), 
+        		"WREN":                  (0, 3, "lutff_5/in_1"), 
+        	},
+        	(25, 0, 3): {
+        		"ADDRESS_0":             (25, 2, "lutff_0/in_1"), 
+        		"ADDRESS_10":            (25, 2, "lutff_2/in_0"), 
+        		"ADDRESS_11":            (25, 2, "lutff_3/in_0"), 
+        		"ADDRESS_12":            (25, 2, "lutff_4/in_0"), 
+        		"ADDRESS_13":            (25, 2, "lutff_5/in_0"), 
+        		"ADDRESS_1":             (25, 2, "lutff_1/in_1"), 
+        		"ADDRESS_2":             (25, 2, "lutff_2/in_1"), 
+        		"ADDRESS_3":             (25, 2, "lutff_3/in_1"), 
+        		"ADDRESS_4":             (25, 2, "lutff_4/in_1"), 
+        		"ADDRESS_5":             (25, 2, "lutff_5/in_1"), 
+        		"ADDRESS_6":             (25, 2, "lutff_6/in_1"), 
+        		"ADDRESS_7":             (25, 2, "lutff_7/in_1"), 
+        		"ADDRESS_8":             (25, 2, "lutff_0/in_0"), 
+        		"ADDRESS_9":             (25, 2, "lutff_1/in_0"), 
+        		"CHIPSELECT":            (25, 3, "lutff_6/in_1"), 
+        		"CLOCK":                 (25, 1, "clk"), 
+        		"DATAIN_0":              (25, 1, "lutff_0/in_3"), 
+        		"DATAIN_10":             (25, 1, "lutff_2/in_1"), 
+        		"DATAIN_11":             (25, 1, "lutff_3/in_1"), 
+        		"DATAIN_12":             (25, 1, "lutff_4/in_1"), 
+        		"DATAIN_13":             (25, 1, "lutff_5/in_1"), 
+        		"DATAIN_14":             (25, 1, "lutff_6/in_1"), 
+        		"DATAIN_15":             (25, 1, "lutff_7/in_1"), 
+        		"DATAIN_1":              (25, 1, "lutff_1/in_3"), 
+        		"DATAIN_2":              (25, 1, "lutff_2/in_3"), 
+        		"DATAIN_3":              (25, 1, "lutff_3/in_3"), 
+        		"DATAIN_4":              (25, 1, "lutff_4/in_3"), 
+        		"DATAIN_5":              (25, 1, "lutff_5/in_3"), 
+        		"DATAIN_6":              (25, 1, "lutff_6/in_3"), 
+        		"DATAIN_7":              (25, 1, "lutff_7/in_3"), 
+        		"DATAIN_8":              (25, 1, "lutff_0/in_1"), 
+        		"DATAIN_9":              (25, 1, "lutff_1/in_1"), 
+        		"DATAOUT_0":             (25, 1, "slf_op_0"), 
+        		"DATAOUT_10":            (25, 2, "slf_op_2"), 
+        		"DATAOUT_11":            (25, 2, "slf_op_3"), 
+        		"DATAOUT_12":            (25, 2, "slf_op_4"), 
+        		"DATAOUT_13":            (25, 2, "slf_op_5"), 
+        		"DATAOUT_14":            (25, 2, "slf_op_6"), 
+        		"DATAOUT_15":            (25, 2, "slf_op_7"), 
+        		"DATAOUT_1":             (25, 1, "slf_op_1"), 
+        		"DATAOUT_2":             (25, 1, "slf_op_2"), 
+        		"DATAOUT_3":             (25, 1, "slf_op_3"), 
+        		"DATAOUT_4":             (25, 1, "slf_op_4"), 
+        		"DATAOUT_5":             (25, 1, "slf_op_5"), 
+        		"DATAOUT_6":             (25, 1, "slf_op_6"), 
+        		"DATAOUT_7":             (25, 1, "slf_op_7"), 
+        		"DATAOUT_8":             (25, 2, "slf_op_0"), 
+        		"DATAOUT_9":             (25, 2, "slf_op_1"), 
+        		"MASKWREN_0":            (25, 3, "lutff_0/in_0"), 
+        		"MASKWREN_1":            (25, 3, "lutff_1/in_0"), 
+        		"MASKWREN_2":            (25, 3, "lutff_2/in_0"), 
+        		"MASKWREN_3":            (25, 3, "lutff_3/in_0"), 
+        		"POWEROFF":              (25, 4, "lutff_4/in_3"), 
+        		"SLEEP":                 (25, 4, "lutff_2/in_3"), 
+        		"SPRAM_EN":              (25, 1, "CBIT_0"), 
+        		"STANDBY":               (25, 4, "lutff_0/in_3"), 
+        		"WREN":                  (25, 3, "lutff_4/in_1"), 
+        	},
+        	(25, 0, 4): {
+        		"ADDRESS_0":             (25, 2, "lutff_6/in_0"), 
+        		"ADDRESS_10":            (25, 3, "lutff_0/in_1"), 
+        		"ADDRESS_11":            (25, 3, "lutff_1/in_1"), 
+        		"ADDRESS_12":            (25, 3, "lutff_2/in_1"), 
+        		"ADDRESS_13":            (25, 3, "lutff_3/in_1"), 
+        		"ADDRESS_1":             (25, 2, "lutff_7/in_0"), 
+        		"ADDRESS_2":             (25, 3, "lutff_0/in_3"), 
+        		"ADDRESS_3":             (25, 3, "lutff_1/in_3"), 
+        		"ADDRESS_4":             (25, 3, "lutff_2/in_3"), 
+        		"ADDRESS_5":             (25, 3, "lutff_3/in_3"), 
+        		"ADDRESS_6":             (25, 3, "lutff_4/in_3"), 
+        		"ADDRESS_7":             (25, 3, "lutff_5/in_3"), 
+        		"ADDRESS_8":             (25, 3, "lutff_6/in_3"), 
+        		"ADDRESS_9":             (25, 3, "lutff_7/in_3"), 
+        		"CHIPSELECT":            (25, 3, "lutff_7/in_1"), 
+        		"CLOCK":                 (25, 2, "clk"), 
+        		"DATAIN_0":              (25, 1, "lutff_0/in_0"), 
+        		"DATAIN_10":             (25, 2, "lutff_2/in_3"), 
+        		"DATAIN_11":             (25, 2, "lutff_3/in_3"), 
+        		"DATAIN_12":             (25, 2, "lutff_4/in_3"), 
+        		"DATAIN_13":             (25, 2, "lutff_5/in_3"), 
+        		"DATAIN_14":             (25, 2, "lutff_6/in_3"), 
+        		"DATAIN_15":             (25, 2, "lutff_7/in_3"), 
+        		"DATAIN_1":              (25, 1, "lutff_1/in_0"), 
+        		"DATAIN_2":              (25, 1, "lutff_2/in_0"), 
+        		"DATAIN_3":              (25, 1, "lutff_3/in_0"), 
+        		"DATAIN_4":              (25, 1, "lutff_4/in_0"), 
+        		"DATAIN_5":              (25, 1, "lutff_5/in_0"), 
+        		"DATAIN_6":              (25, 1, "lutff_6/in_0"), 
+        		"DATAIN_7":              (25, 1, "lutff_7/in_0"), 
+        		"DATAIN_8":              (25, 2, "lutff_0/in_3"), 
+        		"DATAIN_9":              (25, 2, "lutff_1/in_3"), 
+        		"DATAOUT_0":             (25, 3, "slf_op_0"), 
+        		"DATAOUT_10":            (25, 4, "slf_op_2"), 
+        		"DATAOUT_11":            (25, 4, "slf_op_3"), 
+        		"DATAOUT_12":            (25, 4, "slf_op_4"), 
+        		"DATAOUT_13":            (25, 4, "slf_op_5"), 
+        		"DATAOUT_14":            (25, 4, "slf_op_6"), 
+        		"DATAOUT_15":            (25, 4, "slf_op_7"), 
+        		"DATAOUT_1":             (25, 3, "slf_op_1"), 
+        		"DATAOUT_2":             (25, 3, "slf_op_2"), 
+        		"DATAOUT_3":             (25, 3, "slf_op_3"), 
+        		"DATAOUT_4":             (25, 3, "slf_op_4"), 
+        		"DATAOUT_5":             (25, 3, "slf_op_5"), 
+        		"DATAOUT_6":             (25, 3, "slf_op_6"), 
+        		"DATAOUT_7":             (25, 3, "slf_op_7"), 
+        		"DATAOUT_8":             (25, 4, "slf_op_0"), 
+        		"DATAOUT_9":             (25, 4, "slf_op_1"), 
+        		"MASKWREN_0":            (25, 3, "lutff_4/in_0"), 
+        		"MASKWREN_1":            (25, 3, "lutff_5/in_0"), 
+        		"MASKWREN_2":            (25, 3, "lutff_6/in_0"), 
+        		"MASKWREN_3":            (25, 3, "lutff_7/in_0"), 
+        		"POWEROFF":              (25, 4, "lutff_5/in_3"), 
+        		"SLEEP":                 (25, 4, "lutff_3/in_3"), 
+        		"SPRAM_EN":              (25, 1, "CBIT_1"), 
+        		"STANDBY":               (25, 4, "lutff_1/in_3"), 
+        		"WREN":                  (25, 3, "lutff_5/in_1"), 
+        	}
+        }
     }
-}
 
 # This contains the data for extra cells not included
 # in any previous databases
 
-extra_cells_db = {
-    "5k" : {
-        ("HFOSC", (0, 31, 1)) : {
-            "CLKHFPU":                      (0, 29, "lutff_0/in_1"),
-            "CLKHFEN":                      (0, 29, "lutff_7/in_3"),
-            "CLKHF":                        (0, 29, "glb_netwk_4"),
-            "CLKHF_FABRIC":                 (0, 28, "slf_op_7"),
-            "TRIM0":                        (25, 28, "lutff_4/in_0"),
-            "TRIM1":                        (25, 28, "lutff_5/in_0"),
-            "TRIM2":                        (25, 28, "lutff_6/in_0"),
-            "TRIM3":                        (25, 28, "lutff_7/in_0"),
-            "TRIM4":                        (25, 29, "lutff_0/in_3"),
-            "TRIM5":                        (25, 29, "lutff_1/in_3"),
-            "TRIM6":                        (25, 29, "lutff_2/in_3"),
-            "TRIM7":                        (25, 29, "lutff_3/in_3"),
-            "TRIM8":                        (25, 29, "lutff_4/in_3"),
-            "TRIM9":                        (25, 29, "lutff_5/in_3"),
-            "CLKHF_DIV_1":                  (0, 16, "CBIT_4"),
-            "CLKHF_DIV_0":                  (0, 16, "CBIT_3"),
-            "TRIM_EN":                      (0, 16, "CBIT_5")
-        },
-        ("LFOSC", (25, 31, 1)) : {
-            "CLKLFPU":                      (25, 29, "lutff_0/in_1"),
-            "CLKLFEN":                      (25, 29, "lutff_7/in_3"),
-            "CLKLF":                        (25, 29, "glb_netwk_5"),
-            "CLKLF_FABRIC":                 (25, 29, "slf_op_0")
-        },
-        ("RGBA_DRV", (0, 30, 0)) : {
-            "CURREN":                       (25, 29, "lutff_6/in_3"),
-            "RGBLEDEN":                     (0, 30, "lutff_1/in_1"),
-            "RGB0PWM":                      (0, 30, "lutff_2/in_1"),
-            "RGB1PWM":                      (0, 30, "lutff_3/in_1"),
-            "RGB2PWM":                      (0, 30, "lutff_4/in_1"),
-            "RGBA_DRV_EN":                  (0, 28, "CBIT_5"),
-            "RGB0_CURRENT_0":               (0, 28, "CBIT_6"),
-            "RGB0_CURRENT_1":               (0, 28, "CBIT_7"),
-            "RGB0_CURRENT_2":               (0, 29, "CBIT_0"),
-            "RGB0_CURRENT_3":               (0, 29, "CBIT_1"),
-            "RGB0_CURRENT_4":               (0, 29, "CBIT_2"),
-            "RGB0_CURRENT_5":               (0, 29, "CBIT_3"),
-            "RGB1_CURRENT_0":               (0, 29, "CBIT_4"),
-            "RGB1_CURRENT_1":               (0, 29, "CBIT_5"),
-            "RGB1_CURRENT_2":               (0, 29, "CBIT_6"),
-            "RGB1_CURRENT_3":               (0, 29, "CBIT_7"),
-            "RGB1_CURRENT_4":               (0, 30, "CBIT_0"),
-            "RGB1_CURRENT_5":               (0, 30, "CBIT_1"),
-            "RGB2_CURRENT_0":               (0, 30, "CBIT_2"),
-            "RGB2_CURRENT_1":               (0, 30, "CBIT_3"),
-            "RGB2_CURRENT_2":               (0, 30, "CBIT_4"),
-            "RGB2_CURRENT_3":               (0, 30, "CBIT_5"),
-            "RGB2_CURRENT_4":               (0, 30, "CBIT_6"),
-            "RGB2_CURRENT_5":               (0, 30, "CBIT_7"),
-            "CURRENT_MODE":                 (0, 28, "CBIT_4"),
+@db_loader("extra_cells_db")
+def load_extra_cells_db():
+    return {
+        "5k" : {
+            ("HFOSC", (0, 31, 1)) : {
+                "CLKHFPU":                      (0, 29, "lutff_0/in_1"),
+                "CLKHFEN":                      (0, 29, "lutff_7/in_3"),
+                "CLKHF":                        (0, 29, "glb_netwk_4"),
+                "CLKHF_FABRIC":                 (0, 28, "slf_op_7"),
+                "TRIM0":                        (25, 28, "lutff_4/in_0"),
+                "TRIM1":                        (25, 28, "lutff_5/in_0"),
+                "TRIM2":                        (25, 28, "lutff_6/in_0"),
+                "TRIM3":                        (25, 28, "lutff_7/in_0"),
+                "TRIM4":                        (25, 29, "lutff_0/in_3"),
+                "TRIM5":                        (25, 29, "lutff_1/in_3"),
+                "TRIM6":                        (25, 29, "lutff_2/in_3"),
+                "TRIM7":                        (25, 29, "lutff_3/in_3"),
+                "TRIM8":                        (25, 29, "lutff_4/in_3"),
+                "TRIM9":                        (25, 29, "lutff_5/in_3"),
+                "CLKHF_DIV_1":                  (0, 16, "CBIT_4"),
+                "CLKHF_DIV_0":                  (0, 16, "CBIT_3"),
+                "TRIM_EN":                      (0, 16, "CBIT_5")
+            },
+            ("LFOSC", (25, 31, 1)) : {
+                "CLKLFPU":                      (25, 29, "lutff_0/in_1"),
+                "CLKLFEN":                      (25, 29, "lutff_7/in_3"),
+                "CLKLF":                        (25, 29, "glb_netwk_5"),
+                "CLKLF_FABRIC":                 (25, 29, "slf_op_0")
+            },
+            ("RGBA_DRV", (0, 30, 0)) : {
+                "CURREN":                       (25, 29, "lutff_6/in_3"),
+                "RGBLEDEN":                     (0, 30, "lutff_1/in_1"),
+                "RGB0PWM":                      (0, 30, "lutff_2/in_1"),
+                "RGB1PWM":                      (0, 30, "lutff_3/in_1"),
+                "RGB2PWM":                      (0, 30, "lutff_4/in_1"),
+                "RGBA_DRV_EN":                  (0, 28, "CBIT_5"),
+                "RGB0_CURRENT_0":               (0, 28, "CBIT_6"),
+                "RGB0_CURRENT_1":               (0, 28, "CBIT_7"),
+                "RGB0_CURRENT_2":               (0, 29, "CBIT_0"),
+                "RGB0_CURRENT_3":               (0, 29, "CBIT_1"),
+                "RGB0_CURRENT_4":               (0, 29, "CBIT_2"),
+                "RGB0_CURRENT_5":               (0, 29, "CBIT_3"),
+                "RGB1_CURRENT_0":               (0, 29, "CBIT_4"),
+                "RGB1_CURRENT_1":               (0, 29, "CBIT_5"),
+                "RGB1_CURRENT_2":               (0, 29, "CBIT_6"),
+                "RGB1_CURRENT_3":               (0, 29, "CBIT_7"),
+                "RGB1_CURRENT_4":               (0, 30, "CBIT_0"),
+                "RGB1_CURRENT_5":               (0, 30, "CBIT_1"),
+                "RGB2_CURRENT_0":               (0, 30, "CBIT_2"),
+                "RGB2_CURRENT_1":               (0, 30, "CBIT_3"),
+                "RGB2_CURRENT_2":               (0, 30, "CBIT_4"),
+                "RGB2_CURRENT_3":               (0, 30, "CBIT_5"),
+                "RGB2_CURRENT_4":               (0, 30, "CBIT_6"),
+                "RGB2_CURRENT_5":               (0, 30, "CBIT_7"),
+                "CURRENT_MODE":                 (0, 28, "CBIT_4"),
             
-            "RGB0":                         (4, 31, 0),
-            "RGB1":                         (5, 31, 0),
-            "RGB2":                         (6, 31, 0),
-
+                "RGB0":                         (4, 31, 0),
+                "RGB1":                         (5, 31, 0),
+                "RGB2":                         (6, 31, 0),
+
+            },
+            ("I2C", (0, 31, 0)): {
+        		"I2CIRQ":                (0, 30, "slf_op_7"), 
+        		"I2CWKUP":               (0, 29, "slf_op_5"), 
+        		"I2C_ENABLE_0":          (13, 31, "cbit2usealt_in_0"), 
+        		"I2C_ENABLE_1":          (12, 31, "cbit2usealt_in_1"), 
+        		"SBACKO":                (0, 30, "slf_op_6"), 
+        		"SBADRI0":               (0, 30, "lutff_1/in_0"), 
+        		"SBADRI1":               (0, 30, "lutff_2/in_0"), 
+        		"SBADRI2":               (0, 30, "lutff_3/in_0"), 
+        		"SBADRI3":               (0, 30, "lutff_4/in_0"), 
+        		"SBADRI4":               (0, 30, "lutff_5/in_0"), 
+        		"SBADRI5":               (0, 30, "lutff_6/in_0"), 
+        		"SBADRI6":               (0, 30, "lutff_7/in_0"), 
+        		"SBADRI7":               (0, 29, "lutff_2/in_0"), 
+        		"SBCLKI":                (0, 30, "clk"), 
+        		"SBDATI0":               (0, 29, "lutff_5/in_0"), 
+        		"SBDATI1":               (0, 29, "lutff_6/in_0"), 
+        		"SBDATI2":               (0, 29, "lutff_7/in_0"), 
+        		"SBDATI3":               (0, 30, "lutff_0/in_3"), 
+        		"SBDATI4":               (0, 30, "lutff_5/in_1"), 
+        		"SBDATI5":               (0, 30, "lutff_6/in_1"), 
+        		"SBDATI6":               (0, 30, "lutff_7/in_1"), 
+        		"SBDATI7":               (0, 30, "lutff_0/in_0"), 
+        		"SBDATO0":               (0, 29, "slf_op_6"), 
+        		"SBDATO1":               (0, 29, "slf_op_7"), 
+        		"SBDATO2":               (0, 30, "slf_op_0"), 
+        		"SBDATO3":               (0, 30, "slf_op_1"), 
+        		"SBDATO4":               (0, 30, "slf_op_2"), 
+        		"SBDATO5":               (0, 30, "slf_op_3"), 
+        		"SBDATO6":               (0, 30, "slf_op_4"), 
+        		"SBDATO7":               (0, 30, "slf_op_5"), 
+        		"SBRWI":                 (0, 29, "lutff_4/in_0"), 
+        		"SBSTBI":                (0, 29, "lutff_3/in_0"), 
+        		"SCLI":                  (0, 29, "lutff_2/in_1"), 
+        		"SCLO":                  (0, 29, "slf_op_3"), 
+        		"SCLOE":                 (0, 29, "slf_op_4"), 
+        		"SDAI":                  (0, 29, "lutff_1/in_1"), 
+        		"SDAO":                  (0, 29, "slf_op_1"), 
+        		"SDAOE":                 (0, 29, "slf_op_2"), 
+        		"SDA_INPUT_DELAYED":     (12, 31, "SDA_input_delay"), 
+        		"SDA_OUTPUT_DELAYED":    (12, 31, "SDA_output_delay"), 
+        	},
+        	("I2C", (25, 31, 0)): {
+        		"I2CIRQ":                (25, 30, "slf_op_7"), 
+        		"I2CWKUP":               (25, 29, "slf_op_5"), 
+        		"I2C_ENABLE_0":          (19, 31, "cbit2usealt_in_0"), 
+        		"I2C_ENABLE_1":          (19, 31, "cbit2usealt_in_1"), 
+        		"SBACKO":                (25, 30, "slf_op_6"), 
+        		"SBADRI0":               (25, 30, "lutff_1/in_0"), 
+        		"SBADRI1":               (25, 30, "lutff_2/in_0"), 
+        		"SBADRI2":               (25, 30, "lutff_3/in_0"), 
+        		"SBADRI3":               (25, 30, "lutff_4/in_0"), 
+        		"SBADRI4":               (25, 30, "lutff_5/in_0"), 
+        		"SBADRI5":               (25, 30, "lutff_6/in_0"), 
+        		"SBADRI6":               (25, 30, "lutff_7/in_0"), 
+        		"SBADRI7":               (25, 29, "lutff_2/in_0"), 
+        		"SBCLKI":                (25, 30, "clk"), 
+        		"SBDATI0":               (25, 29, "lutff_5/in_0"), 
+        		"SBDATI1":               (25, 29, "lutff_6/in_0"), 
+        		"SBDATI2":               (25, 29, "lutff_7/in_0"), 
+        		"SBDATI3":               (25, 30, "lutff_0/in_3"), 
+        		"SBDATI4":               (25, 30, "lutff_5/in_1"), 
+        		"SBDATI5":               (25, 30, "lutff_6/in_1"), 
+        		"SBDATI6":               (25, 30, "lutff_7/in_1"), 
+        		"SBDATI7":               (25, 30, "lutff_0/in_0"), 
+        		"SBDATO0":               (25, 29, "slf_op_6"), 
+        		"SBDATO1":               (25, 29, "slf_op_7"), 
+        		"SBDATO2":               (25, 30, "slf_op_0"), 
+        		"SBDATO3":               (25, 30, "slf_op_1"), 
+        		"SBDATO4":               (25, 30, "slf_op_2"), 
+        		"SBDATO5":               (25, 30, "slf_op_3"), 
+        		"SBDATO6":               (25, 30, "slf_op_4"), 
+        		"SBDATO7":               (25, 30, "slf_op_5"), 
+        		"SBRWI":                 (25, 29, "lutff_4/in_0"), 
+        		"SBSTBI":                (25, 29, "lutff_3/in_0"), 
+        		"SCLI":                  (25, 29, "lutff_2/in_1"), 
+        		"SCLO":                  (25, 29, "slf_op_3"), 
+        		"SCLOE":                 (25, 29, "slf_op_4"), 
+        		"SDAI":                  (25, 29, "lutff_1/in_1"), 
+        		"SDAO":                  (25, 29, "slf_op_1"), 
+        		"SDAOE":                 (25, 29, "slf_op_2"), 
+        		"SDA_INPUT_DELAYED":     (19, 31, "SDA_input_delay"), 
+        		"SDA_OUTPUT_DELAYED":    (19, 31, "SDA_output_delay"), 
+        	},
+        	("SPI", (0, 0, 0)): {
+        		"MCSNO0":                (0, 21, "slf_op_2"), 
+        		"MCSNO1":                (0, 21, "slf_op_4"), 
+        		"MCSNO2":                (0, 21, "slf_op_7"), 
+        		"MCSNO3":                (0, 22, "slf_op_1"), 
+        		"MCSNOE0":               (0, 21, "slf_op_3"), 
+        		"MCSNOE1":               (0, 21, "slf_op_5"), 
+        		"MCSNOE2":               (0, 22, "slf_op_0"), 
+        		"MCSNOE3":               (0, 22, "slf_op_2"), 
+        		"MI":                    (0, 22, "lutff_0/in_1"), 
+        		"MO":                    (0, 20, "slf_op_6"), 
+        		"MOE":                   (0, 20, "slf_op_7"), 
+        		"SBACKO":                (0, 20, "slf_op_1"), 
+        		"SBADRI0":               (0, 19, "lutff_1/in_1"), 
+        		"SBADRI1":               (0, 19, "lutff_2/in_1"), 
+        		"SBADRI2":               (0, 20, "lutff_0/in_3"), 
+        		"SBADRI3":               (0, 20, "lutff_1/in_3"), 
+        		"SBADRI4":               (0, 20, "lutff_2/in_3"), 
+        		"SBADRI5":               (0, 20, "lutff_3/in_3"), 
+        		"SBADRI6":               (0, 20, "lutff_4/in_3"), 
+        		"SBADRI7":               (0, 20, "lutff_5/in_3"), 
+        		"SBCLKI":                (0, 20, "clk"), 
+        		"SBDATI0":               (0, 19, "lutff_1/in_3"), 
+        		"SBDATI1":               (0, 19, "lutff_2/in_3"), 
+        		"SBDATI2":               (0, 19, "lutff_3/in_3"), 
+        		"SBDATI3":               (0, 19, "lutff_4/in_3"), 
+        		"SBDATI4":               (0, 19, "lutff_5/in_3"), 
+        		"SBDATI5":               (0, 19, "lutff_6/in_3"), 
+        		"SBDATI6":               (0, 19, "lutff_7/in_3"), 
+        		"SBDATI7":               (0, 19, "lutff_0/in_1"), 
+        		"SBDATO0":               (0, 19, "slf_op_1"), 
+        		"SBDATO1":               (0, 19, "slf_op_2"), 
+        		"SBDATO2":               (0, 19, "slf_op_3"), 
+        		"SBDATO3":               (0, 19, "slf_op_4"), 
+        		"SBDATO4":               (0, 19, "slf_op_5"), 
+        		"SBDATO5":               (0, 19, "slf_op_6"), 
+        		"SBDATO6":               (0, 19, "slf_op_7"), 
+        		"SBDATO7":               (0, 20, "slf_op_0"), 
+        		"SBRWI":                 (0, 19, "lutff_0/in_3"), 
+        		"SBSTBI":                (0, 20, "lutff_6/in_3"), 
+        		"SCKI":                  (0, 22, "lutff_1/in_1"), 
+        		"SCKO":                  (0, 21, "slf_op_0"), 
+        		"SCKOE":                 (0, 21, "slf_op_1"), 
+        		"SCSNI":                 (0, 22, "lutff_2/in_1"), 
+        		"SI":                    (0, 22, "lutff_7/in_3"), 
+        		"SO":                    (0, 20, "slf_op_4"), 
+        		"SOE":                   (0, 20, "slf_op_5"), 
+        		"SPIIRQ":                (0, 20, "slf_op_2"), 
+        		"SPIWKUP":               (0, 20, "slf_op_3"), 
+        		"SPI_ENABLE_0":          (7, 0, "cbit2usealt_in_0"), 
+        		"SPI_ENABLE_1":          (7, 0, "cbit2usealt_in_1"), 
+        		"SPI_ENABLE_2":          (6, 0, "cbit2usealt_in_0"), 
+        		"SPI_ENABLE_3":          (6, 0, "cbit2usealt_in_1"), 
+        	},
+        	("SPI", (25, 0, 1)): {
+        		"MCSNO0":                (25, 21, "slf_op_2"), 
+        		"MCSNO1":                (25, 21, "slf_op_4"), 
+        		"MCSNO2":                (25, 21, "slf_op_7"), 
+        		"MCSNO3":                (25, 22, "slf_op_1"), 
+        		"MCSNOE0":               (25, 21, "slf_op_3"), 
+        		"MCSNOE1":               (25, 21, "slf_op_5"), 
+        		"MCSNOE2":               (25, 22, "slf_op_0"), 
+        		"MCSNOE3":               (25, 22, "slf_op_2"), 
+        		"MI":                    (25, 22, "lutff_0/in_1"), 
+        		"MO":                    (25, 20, "slf_op_6"), 
+        		"MOE":                   (25, 20, "slf_op_7"), 
+        		"SBACKO":                (25, 20, "slf_op_1"), 
+        		"SBADRI0":               (25, 19, "lutff_1/in_1"), 
+        		"SBADRI1":               (25, 19, "lutff_2/in_1"), 
+        		"SBADRI2":               (25, 20, "lutff_0/in_3"), 
+        		"SBADRI3":               (25, 20, "lutff_1/in_3"), 
+        		"SBADRI4":               (25, 20, "lutff_2/in_3"), 
+        		"SBADRI5":               (25, 20, "lutff_3/in_3"), 
+        		"SBADRI6":               (25, 20, "lutff_4/in_3"), 
+        		"SBADRI7":               (25, 20, "lutff_5/in_3"), 
+        		"SBCLKI":                (25, 20, "clk"), 
+        		"SBDATI0":               (25, 19, "lutff_1/in_3"), 
+        		"SBDATI1":               (25, 19, "lutff_2/in_3"), 
+        		"SBDATI2":               (25, 19, "lutff_3/in_3"), 
+        		"SBDATI3":               (25, 19, "lutff_4/in_3"), 
+        		"SBDATI4":               (25, 19, "lutff_5/in_3"), 
+        		"SBDATI5":               (25, 19, "lutff_6/in_3"), 
+        		"SBDATI6":               (25, 19, "lutff_7/in_3"), 
+        		"SBDATI7":               (25, 19, "lutff_0/in_1"), 
+        		"SBDATO0":               (25, 19, "slf_op_1"), 
+        		"SBDATO1":               (25, 19, "slf_op_2"), 
+        		"SBDATO2":               (25, 19, "slf_op_3"), 
+        		"SBDATO3":               (25, 19, "slf_op_4"), 
+        		"SBDATO4":               (25, 19, "slf_op_5"), 
+        		"SBDATO5":               (25, 19, "slf_op_6"), 
+        		"SBDATO6":               (25, 19, "slf_op_7"), 
+        		"SBDATO7":               (25, 20, "slf_op_0"), 
+        		"SBRWI":                 (25, 19, "lutff_0/in_3"), 
+        		"SBSTBI":                (25, 20, "lutff_6/in_3"), 
+        		"SCKI":                  (25, 22, "lutff_1/in_1"), 
+        		"SCKO":                  (25, 21, "slf_op_0"), 
+        		"SCKOE":                 (25, 21, "slf_op_1"), 
+        		"SCSNI":                 (25, 22, "lutff_2/in_1"), 
+        		"SI":                    (25, 22, "lutff_7/in_3"), 
+        		"SO":                    (25, 20, "slf_op_4"), 
+        		"SOE":                   (25, 20, "slf_op_5"), 
+        		"SPIIRQ":                (25, 20, "slf_op_2"), 
+        		"SPIWKUP":               (25, 20, "slf_op_3"), 
+        		"SPI_ENABLE_0":          (23, 0, "cbit2usealt_in_0"), 
+        		"SPI_ENABLE_1":          (24, 0, "cbit2usealt_in_0"), 
+        		"SPI_ENABLE_2":          (23, 0, "cbit2usealt_in_1"), 
+        		"SPI_ENABLE_3":          (24, 0, "cbit2usealt_in_1"), 
+        	},
+        	("LEDDA_IP", (0, 31, 2)): {
+        		"LEDDADDR0":             (0, 28, "lutff_4/in_0"), 
+        		"LEDDADDR1":             (0, 28, "lutff_5/in_0"), 
+        		"LEDDADDR2":             (0, 28, "lutff_6/in_0"), 
+        		"LEDDADDR3":             (0, 28, "lutff_7/in_0"), 
+        		"LEDDCLK":               (0, 29, "clk"), 
+        		"LEDDCS":                (0, 28, "lutff_2/in_0"), 
+        		"LEDDDAT0":              (0, 28, "lutff_2/in_1"), 
+        		"LEDDDAT1":              (0, 28, "lutff_3/in_1"), 
+        		"LEDDDAT2":              (0, 28, "lutff_4/in_1"), 
+        		"LEDDDAT3":              (0, 28, "lutff_5/in_1"), 
+        		"LEDDDAT4":              (0, 28, "lutff_6/in_1"), 
+        		"LEDDDAT5":              (0, 28, "lutff_7/in_1"), 
+        		"LEDDDAT6":              (0, 28, "lutff_0/in_0"), 
+        		"LEDDDAT7":              (0, 28, "lutff_1/in_0"), 
+        		"LEDDDEN":               (0, 28, "lutff_1/in_1"), 
+        		"LEDDEXE":               (0, 28, "lutff_0/in_1"), 
+        		"LEDDON":                (0, 29, "slf_op_0"), 
+        		"PWMOUT0":               (0, 28, "slf_op_4"), 
+        		"PWMOUT1":               (0, 28, "slf_op_5"), 
+        		"PWMOUT2":               (0, 28, "slf_op_6"), 
+        	},
+            ("IO_I3C", (25, 27, 0)): {
+                "PU_ENB":                (25, 27, "lutff_6/in_0"),
+                "WEAK_PU_ENB":           (25, 27, "lutff_4/in_0"),
+                "PACKAGE_PIN":           (19, 31, 0)
+            },
+            ("IO_I3C", (25, 27, 1)): {
+                "PU_ENB":                (25, 27, "lutff_7/in_0"),
+                "WEAK_PU_ENB":           (25, 27, "lutff_5/in_0"),
+                "PACKAGE_PIN":           (19, 31, 1)
+            }
         },
-        ("I2C", (0, 31, 0)): {
-    		"I2CIRQ":                (0, 30, "slf_op_7"), 
-    		"I2CWKUP":               (0, 29, "slf_op_5"), 
-    		"I2C_ENABLE_0":          (13, 31, "cbit2usealt_in_0"), 
-    		"I2C_ENABLE_1":          (12, 31, "cbit2usealt_in_1"), 
-    		"SBACKO":                (0, 30, "slf_op_6"), 
-    		"SBADRI0":               (0, 30, "lutff_1/in_0"), 
-    		"SBADRI1":               (0, 30, "lutff_2/in_0"), 
-    		"SBADRI2":               (0, 30, "lutff_3/in_0"), 
-    		"SBADRI3":               (0, 30, "lutff_4/in_0"), 
-    		"SBADRI4":               (0, 30, "lutff_5/in_0"), 
-    		"SBADRI5":               (0, 30, "lutff_6/in_0"), 
-    		"SBADRI6":               (0, 30, "lutff_7/in_0"), 
-    		"SBADRI7":               (0, 29, "lutff_2/in_0"), 
-    		"SBCLKI":                (0, 30, "clk"), 
-    		"SBDATI0":               (0, 29, "lutff_5/in_0"), 
-    		"SBDATI1":               (0, 29, "lutff_6/in_0"), 
-    		"SBDATI2":               (0, 29, "lutff_7/in_0"), 
-    		"SBDATI3":               (0, 30, "lutff_0/in_3"), 
-    		"SBDATI4":               (0, 30, "lutff_5/in_1"), 
-    		"SBDATI5":               (0, 30, "lutff_6/in_1"), 
-    		"SBDATI6":               (0, 30, "lutff_7/in_1"), 
-    		"SBDATI7":               (0, 30, "lutff_0/in_0"), 
-    		"SBDATO0":               (0, 29, "slf_op_6"), 
-    		"SBDATO1":               (0, 29, "slf_op_7"), 
-    		"SBDATO2":               (0, 30, "slf_op_0"), 
-    		"SBDATO3":               (0, 30, "slf_op_1"), 
-    		"SBDATO4":               (0, 30, "slf_op_2"), 
-    		"SBDATO5":               (0, 30, "slf_op_3"), 
-    		"SBDATO6":               (0, 30, "slf_op_4"), 
-    		"SBDATO7":               (0, 30, "slf_op_5"), 
-    		"SBRWI":                 (0, 29, "lutff_4/in_0"), 
-    		"SBSTBI":                (0, 29, "lutff_3/in_0"), 
-    		"SCLI":                  (0, 29, "lutff_2/in_1"), 
-    		"SCLO":                  (0, 29, "slf_op_3"), 
-    		"SCLOE":                 (0, 29, "slf_op_4"), 
-    		"SDAI":                  (0, 29, "lutff_1/in_1"), 
-    		"SDAO":                  (0, 29, "slf_op_1"), 
-    		"SDAOE":                 (0, 29, "slf_op_2"), 
-    		"SDA_INPUT_DELAYED":     (12, 31, "SDA_input_delay"), 
-    		"SDA_OUTPUT_DELAYED":    (12, 31, "SDA_output_delay"), 
-    	},
-    	("I2C", (25, 31, 0)): {
-    		"I2CIRQ":                (25, 30, "slf_op_7"), 
-    		"I2CWKUP":               (25, 29, "slf_op_5"), 
-    		"I2C_ENABLE_0":          (19, 31, "cbit2usealt_in_0"), 
-    		"I2C_ENABLE_1":          (19, 31, "cbit2usealt_in_1"), 
-    		"SBACKO":                (25, 30, "slf_op_6"), 
-    		"SBADRI0":               (25, 30, "lutff_1/in_0"), 
-    		"SBADRI1":               (25, 30, "lutff_2/in_0"), 
-    		"SBADRI2":               (25, 30, "lutff_3/in_0"), 
-    		"SBADRI3":               (25, 30, "lutff_4/in_0"), 
-    		"SBADRI4":               (25, 30, "lutff_5/in_0"), 
-    		"SBADRI5":               (25, 30, "lutff_6/in_0"), 
-    		"SBADRI6":               (25, 30, "lutff_7/in_0"), 
-    		"SBADRI7":               (25, 29, "lutff_2/in_0"), 
-    		"SBCLKI":                (25, 30, "clk"), 
-    		"SBDATI0":               (25, 29, "lutff_5/in_0"), 
-    		"SBDATI1":               (25, 29, "lutff_6/in_0"), 
-    		"SBDATI2":               (25, 29, "lutff_7/in_0"), 
-    		"SBDATI3":               (25, 30, "lutff_0/in_3"), 
-    		"SBDATI4":               (25, 30, "lutff_5/in_1"), 
-    		"SBDATI5":               (25, 30, "lutff_6/in_1"), 
-    		"SBDATI6":               (25, 30, "lutff_7/in_1"), 
-    		"SBDATI7":               (25, 30, "lutff_0/in_0"), 
-    		"SBDATO0":               (25, 29, "slf_op_6"), 
-    		"SBDATO1":               (25, 29, "slf_op_7"), 
-    		"SBDATO2":               (25, 30, "slf_op_0"), 
-    		"SBDATO3":               (25, 30, "slf_op_1"), 
-    		"SBDATO4":               (25, 30, "slf_op_2"), 
-    		"SBDATO5":               (25, 30, "slf_op_3"), 
-    		"SBDATO6":               (25, 30, "slf_op_4"), 
-    		"SBDATO7":               (25, 30, "slf_op_5"), 
-    		"SBRWI":                 (25, 29, "lutff_4/in_0"), 
-    		"SBSTBI":                (25, 29, "lutff_3/in_0"), 
-    		"SCLI":                  (25, 29, "lutff_2/in_1"), 
-    		"SCLO":                  (25, 29, "slf_op_3"), 
-    		"SCLOE":                 (25, 29, "slf_op_4"), 
-    		"SDAI":                  (25, 29, "lutff_1/in_1"), 
-    		"SDAO":                  (25, 29, "slf_op_1"), 
-    		"SDAOE":                 (25, 29, "slf_op_2"), 
-    		"SDA_INPUT_DELAYED":     (19, 31, "SDA_input_delay"), 
-    		"SDA_OUTPUT_DELAYED":    (19, 31, "SDA_output_delay"), 
-    	},
-    	("SPI", (0, 0, 0)): {
-    		"MCSNO0":                (0, 21, "slf_op_2"), 
-    		"MCSNO1":                (0, 21, "slf_op_4"), 
-    		"MCSNO2":                (0, 21, "slf_op_7"), 
-    		"MCSNO3":                (0, 22, "slf_op_1"), 
-    		"MCSNOE0":               (0, 21, "slf_op_3"), 
-    		"MCSNOE1":               (0, 21, "slf_op_5"), 
-    		"MCSNOE2":               (0, 22, "slf_op_0"), 
-    		"MCSNOE3":               (0, 22, "slf_op_2"), 
-    		"MI":                    (0, 22, "lutff_0/in_1"), 
-    		"MO":                    (0, 20, "slf_op_6"), 
-    		"MOE":                   (0, 20, "slf_op_7"), 
-    		"SBACKO":                (0, 20, "slf_op_1"), 
-    		"SBADRI0":               (0, 19, "lutff_1/in_1"), 
-    		"SBADRI1":               (0, 19, "lutff_2/in_1"), 
-    		"SBADRI2":               (0, 20, "lutff_0/in_3"), 
-    		"SBADRI3":               (0, 20, "lutff_1/in_3"), 
-    		"SBADRI4":               (0, 20, "lutff_2/in_3"), 
-    		"SBADRI5":               (0, 20, "lutff_3/in_3"), 
-    		"SBADRI6":               (0, 20, "lutff_4/in_3"), 
-    		"SBADRI7":               (0, 20, "lutff_5/in_3"), 
-    		"SBCLKI":                (0, 20, "clk"), 
-    		"SBDATI0":               (0, 19, "lutff_1/in_3"), 
-    		"SBDATI1":               (0, 19, "lutff_2/in_3"), 
-    		"SBDATI2":               (0, 19, "lutff_3/in_3"), 
-    		"SBDATI3":               (0, 19, "lutff_4/in_3"), 
-    		"SBDATI4":               (0, 19, "lutff_5/in_3"), 
-    		"SBDATI5":               (0, 19, "lutff_6/in_3"), 
-    		"SBDATI6":               (0, 19, "lutff_7/in_3"), 
-    		"SBDATI7":               (0, 19, "lutff_0/in_1"), 
-    		"SBDATO0":               (0, 19, "slf_op_1"), 
-    		"SBDATO1":               (0, 19, "slf_op_2"), 
-    		"SBDATO2":               (0, 19, "slf_op_3"), 
-    		"SBDATO3":               (0, 19, "slf_op_4"), 
-    		"SBDATO4":               (0, 19, "slf_op_5"), 
-    		"SBDATO5":               (0, 19, "slf_op_6"), 
-    		"SBDATO6":               (0, 19, "slf_op_7"), 
-    		"SBDATO7":               (0, 20, "slf_op_0"), 
-    		"SBRWI":                 (0, 19, "lutff_0/in_3"), 
-    		"SBSTBI":                (0, 20, "lutff_6/in_3"), 
-    		"SCKI":                  (0, 22, "lutff_1/in_1"), 
-    		"SCKO":                  (0, 21, "slf_op_0"), 
-    		"SCKOE":                 (0, 21, "slf_op_1"), 
-    		"SCSNI":                 (0, 22, "lutff_2/in_1"), 
-    		"SI":                    (0, 22, "lutff_7/in_3"), 
-    		"SO":                    (0, 20, "slf_op_4"), 
-    		"SOE":                   (0, 20, "slf_op_5"), 
-    		"SPIIRQ":                (0, 20, "slf_op_2"), 
-    		"SPIWKUP":               (0, 20, "slf_op_3"), 
-    		"SPI_ENABLE_0":          (7, 0, "cbit2usealt_in_0"), 
-    		"SPI_ENABLE_1":          (7, 0, "cbit2usealt_in_1"), 
-    		"SPI_ENABLE_2":          (6, 0, "cbit2usealt_in_0"), 
-    		"SPI_ENABLE_3":          (6, 0, "cbit2usealt_in_1"), 
-    	},
-    	("SPI", (25, 0, 1)): {
-    		"MCSNO0":                (25, 21, "slf_op_2"), 
-    		"MCSNO1":                (25, 21, "slf_op_4"), 
-    		"MCSNO2":                (25, 21, "slf_op_7"), 
-    		"MCSNO3":                (25, 22, "slf_op_1"), 
-    		"MCSNOE0":               (25, 21, "slf_op_3"), 
-    		"MCSNOE1":               (25, 21, "slf_op_5"), 
-    		"MCSNOE2":               (25, 22, "slf_op_0"), 
-    		"MCSNOE3":               (25, 22, "slf_op_2"), 
-    		"MI":                    (25, 22, "lutff_0/in_1"), 
-    		"MO":                    (25, 20, "slf_op_6"), 
-    		"MOE":                   (25, 20, "slf_op_7"), 
-    		"SBACKO":                (25, 20, "slf_op_1"), 
-    		"SBADRI0":               (25, 19, "lutff_1/in_1"), 
-    		"SBADRI1":               (25, 19, "lutff_2/in_1"), 
-    		"SBADRI2":               (25, 20, "lutff_0/in_3"), 
-    		"SBADRI3":               (25, 20, "lutff_1/in_3"), 
-    		"SBADRI4":               (25, 20, "lutff_2/in_3"), 
-    		"SBADRI5":               (25, 20, "lutff_3/in_3"), 
-    		"SBADRI6":               (25, 20, "lutff_4/in_3"), 
-    		"SBADRI7":               (25, 20, "lutff_5/in_3"), 
-    		"SBCLKI":                (25, 20, "clk"), 
-    		"SBDATI0":               (25, 19, "lutff_1/in_3"), 
-    		"SBDATI1":               (25, 19, "lutff_2/in_3"), 
-    		"SBDATI2":               (25, 19, "lutff_3/in_3"), 
-    		"SBDATI3":               (25, 19, "lutff_4/in_3"), 
-    		"SBDATI4":               (25, 19, "lutff_5/in_3"), 
-    		"SBDATI5":               (25, 19, "lutff_6/in_3"), 
-    		"SBDATI6":               (25, 19, "lutff_7/in_3"), 
-    		"SBDATI7":               (25, 19, "lutff_0/in_1"), 
-    		"SBDATO0":               (25, 19, "slf_op_1"), 
-    		"SBDATO1":               (25, 19, "slf_op_2"), 
-    		"SBDATO2":               (25, 19, "slf_op_3"), 
-    		"SBDATO3":               (25, 19, "slf_op_4"), 
-    		"SBDATO4":               (25, 19, "slf_op_5"), 
-    		"SBDATO5":               (25, 19, "slf_op_6"), 
-    		"SBDATO6":               (25, 19, "slf_op_7"), 
-    		"SBDATO7":               (25, 20, "slf_op_0"), 
-    		"SBRWI":                 (25, 19, "lutff_0/in_3"), 
-    		"SBSTBI":                (25, 20, "lutff_6/in_3"), 
-    		"SCKI":                  (25, 22, "lutff_1/in_1"), 
-    		"SCKO":                  (25, 21, "slf_op_0"), 
-    		"SCKOE":                 (25, 21, "slf_op_1"), 
-    		"SCSNI":                 (25, 22, "lutff_2/in_1"), 
-    		"SI":                    (25, 22, "lutff_7/in_3"), 
-    		"SO":                    (25, 20, "slf_op_4"), 
-    		"SOE":                   (25, 20, "slf_op_5"), 
-    		"SPIIRQ":                (25, 20, "slf_op_2"), 
-    		"SPIWKUP":               (25, 20, "slf_op_3"), 
-    		"SPI_ENABLE_0":          (23, 0, "cbit2usealt_in_0"), 
-    		"SPI_ENABLE_1":          (24, 0, "cbit2usealt_in_0"), 
-    		"SPI_ENABLE_2":          (23, 0, "cbit2usealt_in_1"), 
-    		"SPI_ENABLE_3":          (24, 0, "cbit2usealt_in_1"), 
-    	},
-    	("LEDDA_IP", (0, 31, 2)): {
-    		"LEDDADDR0":             (0, 28, "lutff_4/in_0"), 
-    		"LEDDADDR1":             (0, 28, "lutff_5/in_0"), 
-    		"LEDDADDR2":             (0, 28, "lutff_6/in_0"), 
-    		"LEDDADDR3":             (0, 28, "lutff_7/in_0"), 
-    		"LEDDCLK":               (0, 29, "clk"), 
-    		"LEDDCS":                (0, 28, "lutff_2/in_0"), 
-    		"LEDDDAT0":              (0, 28, "lutff_2/in_1"), 
-    		"LEDDDAT1":              (0, 28, "lutff_3/in_1"), 
-    		"LEDDDAT2":              (0, 28, "lutff_4/in_1"), 
-    		"LEDDDAT3":              (0, 28, "lutff_5/in_1"), 
-    		"LEDDDAT4":              (0, 28, "lutff_6/in_1"), 
-    		"LEDDDAT5":              (0, 28, "lutff_7/in_1"), 
-    		"LEDDDAT6":              (0, 28, "lutff_0/in_0"), 
-    		"LEDDDAT7":              (0, 28, "lutff_1/in_0"), 
-    		"LEDDDEN":               (0, 28, "lutff_1/in_1"), 
-    		"LEDDEXE":               (0, 28, "lutff_0/in_1"), 
-    		"LEDDON":                (0, 29, "slf_op_0"), 
-    		"PWMOUT0":               (0, 28, "slf_op_4"), 
-    		"PWMOUT1":               (0, 28, "slf_op_5"), 
-    		"PWMOUT2":               (0, 28, "slf_op_6"), 
-    	},
-        ("IO_I3C", (25, 27, 0)): {
-            "PU_ENB":                (25, 27, "lutff_6/in_0"),
-            "WEAK_PU_ENB":           (25, 27, "lutff_4/in_0"),
-            "PACKAGE_PIN":           (19, 31, 0)
-        },
-        ("IO_I3C", (25, 27, 1)): {
-            "PU_ENB":                (25, 27, "lutff_7/in_0"),
-            "WEAK_PU_ENB":           (25, 27, "lutff_5/in_0"),
-            "PACKAGE_PIN":           (19, 31, 1)
-        }
-    },
 
-    "u4k" : {
-        ("SPI", (0, 0, 0)): {
-            "MCSNO0":                (0, 3, "slf_op_1"), 
-            "MCSNO1":                (0, 3, "slf_op_3"), 
-            "MCSNO2":                (0, 3, "slf_op_6"), 
-            "MCSNO3":                (0, 4, "slf_op_0"), 
-            "MCSNOE0":               (0, 3, "slf_op_2"), 
-            "MCSNOE1":               (0, 3, "slf_op_4"), 
-            "MCSNOE2":               (0, 3, "slf_op_7"), 
-            "MCSNOE3":               (0, 4, "slf_op_1"), 
-            "MI":                    (0, 2, "lutff_0/in_1"), 
-            "MO":                    (0, 2, "slf_op_5"), 
-            "MOE":                   (0, 2, "slf_op_6"), 
-            "SBACKO":                (0, 2, "slf_op_0"), 
-            "SBADRI0":               (0, 1, "lutff_1/in_1"), 
-            "SBADRI1":               (0, 1, "lutff_2/in_1"), 
-            "SBADRI2":               (0, 2, "lutff_0/in_3"), 
-            "SBADRI3":               (0, 2, "lutff_1/in_3"), 
-            "SBADRI4":               (0, 2, "lutff_2/in_3"), 
-            "SBADRI5":               (0, 2, "lutff_3/in_3"), 
-            "SBADRI6":               (0, 2, "lutff_4/in_3"), 
-            "SBADRI7":               (0, 2, "lutff_5/in_3"), 
-            "SBCLKI":                (0, 1, "clk"), 
-            "SBDATI0":               (0, 1, "lutff_1/in_3"), 
-            "SBDATI1":               (0, 1, "lutff_2/in_3"), 
-            "SBDATI2":               (0, 1, "lutff_3/in_3"), 
-            "SBDATI3":               (0, 1, "lutff_4/in_3"), 
-            "SBDATI4":               (0, 1, "lutff_5/in_3"), 
-            "SBDATI5":               (0, 1, "lutff_6/in_3"), 
-            "SBDATI6":               (0, 1, "lutff_7/in_3"), 
-            "SBDATI7":               (0, 1, "lutff_0/in_1"), 
-            "SBDATO0":               (0, 1, "slf_op_0"), 
-            "SBDATO1":               (0, 1, "slf_op_1"), 
-            "SBDATO2":               (0, 1, "slf_op_2"), 
-            "SBDATO3":               (0, 1, "slf_op_3"), 
-            "SBDATO4":               (0, 1, "slf_op_4"), 
-            "SBDATO5":               (0, 1, "slf_op_5"), 
-            "SBDATO6":               (0, 1, "slf_op_6"), 
-            "SBDATO7":               (0, 1, "slf_op_7"), 
-            "SBRWI":                 (0, 1, "lutff_0/in_3"), 
-            "SBSTBI":                (0, 2, "lutff_6/in_3"), 
-            "SCKI":                  (0, 2, "lutff_1/in_1"), 
-            "SCKO":                  (0, 2, "slf_op_7"), 
-            "SCKOE":                 (0, 3, "slf_op_0"), 
-            "SCSNI":                 (0, 2, "lutff_2/in_1"), 
-            "SI":                    (0, 2, "lutff_7/in_3"), 
-            "SO":                    (0, 2, "slf_op_3"), 
-            "SOE":                   (0, 2, "slf_op_4"), 
-            "SPIIRQ":                (0, 2, "slf_op_1"), 
-            "SPIWKUP":               (0, 2, "slf_op_2"), 
-            "SPI_ENABLE_0":          (7, 0, "cbit2usealt_in_0"), 
-            "SPI_ENABLE_1":          (6, 0, "cbit2usealt_in_0"), 
-            "SPI_ENABLE_2":          (7, 0, "cbit2usealt_in_1"), 
-            "SPI_ENABLE_3":          (6, 0, "cbit2usealt_in_1"), 
-        },
-        ("SPI", (25, 0, 1)): {
-            "MCSNO0":                (25, 3, "slf_op_1"), 
-            "MCSNO1":                (25, 3, "slf_op_3"), 
-            "MCSNO2":                (25, 3, "slf_op_6"), 
-            "MCSNO3":                (25, 4, "slf_op_0"), 
-            "MCSNOE0":               (25, 3, "slf_op_2"), 
-            "MCSNOE1":               (25, 3, "slf_op_4"), 
-            "MCSNOE2":               (25, 3, "slf_op_7"), 
-            "MCSNOE3":               (25, 4, "slf_op_1"), 
-            "MI":                    (25, 2, "lutff_0/in_1"), 
-            "MO":                    (25, 2, "slf_op_5"), 
-            "MOE":                   (25, 2, "slf_op_6"), 
-            "SBACKO":                (25, 2, "slf_op_0"), 
-            "SBADRI0":               (25, 1, "lutff_1/in_1"), 
-            "SBADRI1":               (25, 1, "lutff_2/in_1"), 
-            "SBADRI2":               (25, 2, "lutff_0/in_3"), 
-            "SBADRI3":               (25, 2, "lutff_1/in_3"), 
-            "SBADRI4":               (25, 2, "lutff_2/in_3"), 
-            "SBADRI5":               (25, 2, "lutff_3/in_3"), 
-            "SBADRI6":               (25, 2, "lutff_4/in_3"), 
-            "SBADRI7":               (25, 2, "lutff_5/in_3"), 
-            "SBCLKI":                (25, 1, "clk"), 
-            "SBDATI0":               (25, 1, "lutff_1/in_3"), 
-            "SBDATI1":               (25, 1, "lutff_2/in_3"), 
-            "SBDATI2":               (25, 1, "lutff_3/in_3"), 
-            "SBDATI3":               (25, 1, "lutff_4/in_3"), 
-            "SBDATI4":               (25, 1, "lutff_5/in_3"), 
-            "SBDATI5":               (25, 1, "lutff_6/in_3"), 
-            "SBDATI6":               (25, 1, "lutff_7/in_3"), 
-            "SBDATI7":               (25, 1, "lutff_0/in_1"), 
-            "SBDATO0":               (25, 1, "slf_op_0"), 
-            "SBDATO1":               (25, 1, "slf_op_1"), 
-            "SBDATO2":               (25, 1, "slf_op_2"), 
-            "SBDATO3":               (25, 1, "slf_op_3"), 
-            "SBDATO4":               (25, 1, "slf_op_4"), 
-            "SBDATO5":               (25, 1, "slf_op_5"), 
-            "SBDATO6":               (25, 1, "slf_op_6"), 
-            "SBDATO7":               (25, 1, "slf_op_7"), 
-            "SBRWI":                 (25, 1, "lutff_0/in_3"), 
-            "SBSTBI":                (25, 2, "lutff_6/in_3"), 
-            "SCKI":                  (25, 2, "lutff_1/in_1"), 
-            "SCKO":                  (25, 2, "slf_op_7"), 
-            "SCKOE":                 (25, 3, "slf_op_0"), 
-            "SCSNI":                 (25, 2, "lutff_2/in_1"), 
-            "SI":                    (25, 2, "lutff_7/in_3"), 
-            "SO":                    (25, 2, "slf_op_3"), 
-            "SOE":                   (25, 2, "slf_op_4"), 
-            "SPIIRQ":                (25, 2, "slf_op_1"), 
-            "SPIWKUP":               (25, 2, "slf_op_2"), 
-            "SPI_ENABLE_0":          (24, 0, "cbit2usealt_in_0"), 
-            "SPI_ENABLE_1":          (24, 0, "cbit2usealt_in_1"), 
-            "SPI_ENABLE_2":          (23, 0, "cbit2usealt_in_0"), 
-            "SPI_ENABLE_3":          (23, 0, "cbit2usealt_in_1"), 
-        },
-        ("I2C", (0, 21, 0)): {
-            "I2CIRQ":                (0, 20, "slf_op_7"), 
-            "I2CWKUP":               (0, 19, "slf_op_5"), 
-            "I2C_ENABLE_0":          (13, 21, "cbit2usealt_in_0"), 
-            "I2C_ENABLE_1":          (12, 21, "cbit2usealt_in_1"), 
-            "SBACKO":                (0, 20, "slf_op_6"), 
-            "SBADRI0":               (0, 20, "lutff_1/in_0"), 
-            "SBADRI1":               (0, 20, "lutff_2/in_0"), 
-            "SBADRI2":               (0, 20, "lutff_3/in_0"), 
-            "SBADRI3":               (0, 20, "lutff_4/in_0"), 
-            "SBADRI4":               (0, 20, "lutff_5/in_0"), 
-            "SBADRI5":               (0, 20, "lutff_6/in_0"), 
-            "SBADRI6":               (0, 20, "lutff_7/in_0"), 
-            "SBADRI7":               (0, 19, "lutff_2/in_0"), 
-            "SBCLKI":                (0, 20, "clk"), 
-            "SBDATI0":               (0, 19, "lutff_5/in_0"), 
-            "SBDATI1":               (0, 19, "lutff_6/in_0"), 
-            "SBDATI2":               (0, 19, "lutff_7/in_0"), 
-            "SBDATI3":               (0, 20, "lutff_0/in_3"), 
-            "SBDATI4":               (0, 20, "lutff_5/in_1"), 
-            "SBDATI5":               (0, 20, "lutff_6/in_1"), 
-            "SBDATI6":               (0, 20, "lutff_7/in_1"), 
-            "SBDATI7":               (0, 20, "lutff_0/in_0"), 
-            "SBDATO0":               (0, 19, "slf_op_6"), 
-            "SBDATO1":               (0, 19, "slf_op_7"), 
-            "SBDATO2":               (0, 20, "slf_op_0"), 
-            "SBDATO3":               (0, 20, "slf_op_1"), 
-            "SBDATO4":               (0, 20, "slf_op_2"), 
-            "SBDATO5":               (0, 20, "slf_op_3"), 
-            "SBDATO6":               (0, 20, "slf_op_4"), 
-            "SBDATO7":               (0, 20, "slf_op_5"), 
-            "SBRWI":                 (0, 19, "lutff_4/in_0"), 
-            "SBSTBI":                (0, 19, "lutff_3/in_0"), 
-            "SCLI":                  (0, 19, "lutff_2/in_1"), 
-            "SCLO":                  (0, 19, "slf_op_3"), 
-            "SCLOE":                 (0, 19, "slf_op_4"), 
-            "SDAI":                  (0, 19, "lutff_1/in_1"), 
-            "SDAO":                  (0, 19, "slf_op_1"), 
-            "SDAOE":                 (0, 19, "slf_op_2"), 
-            "SDA_INPUT_DELAYED":     (12, 21, "SDA_input_delay"), 
-            "SDA_OUTPUT_DELAYED":    (12, 21, "SDA_output_delay"), 
-        },
-        ("I2C", (25, 21, 0)): {
-            "I2CIRQ":                (25, 20, "slf_op_7"), 
-            "I2CWKUP":               (25, 19, "slf_op_5"), 
-            "I2C_ENABLE_0":          (19, 21, "cbit2usealt_in_1"), 
-            "I2C_ENABLE_1":          (19, 21, "cbit2usealt_in_0"), 
-            "SBACKO":                (25, 20, "slf_op_6"), 
-            "SBADRI0":               (25, 20, "lutff_1/in_0"), 
-            "SBADRI1":               (25, 20, "lutff_2/in_0"), 
-            "SBADRI2":               (25, 20, "lutff_3/in_0"), 
-            "SBADRI3":               (25, 20, "lutff_4/in_0"), 
-            "SBADRI4":               (25, 20, "lutff_5/in_0"), 
-            "SBADRI5":               (25, 20, "lutff_6/in_0"), 
-            "SBADRI6":               (25, 20, "lutff_7/in_0"), 
-            "SBADRI7":               (25, 19, "lutff_2/in_0"), 
-            "SBCLKI":                (25, 20, "clk"), 
-            "SBDATI0":               (25, 19, "lutff_5/in_0"), 
-            "SBDATI1":               (25, 19, "lutff_6/in_0"), 
-            "SBDATI2":               (25, 19, "lutff_7/in_0"), 
-            "SBDATI3":               (25, 20, "lutff_0/in_3"), 
-            "SBDATI4":               (25, 20, "lutff_5/in_1"), 
-            "SBDATI5":               (25, 20, "lutff_6/in_1"), 
-            "SBDATI6":               (25, 20, "lutff_7/in_1"), 
-            "SBDATI7":               (25, 20, "lutff_0/in_0"), 
-            "SBDATO0":               (25, 19, "slf_op_6"), 
-            "SBDATO1":               (25, 19, "slf_op_7"), 
-            "SBDATO2":               (25, 20, "slf_op_0"), 
-            "SBDATO3":               (25, 20, "slf_op_1"), 
-            "SBDATO4":               (25, 20, "slf_op_2"), 
-            "SBDATO5":               (25, 20, "slf_op_3"), 
-            "SBDATO6":               (25, 20, "slf_op_4"), 
-            "SBDATO7":               (25, 20, "slf_op_5"), 
-            "SBRWI":                 (25, 19, "lutff_4/in_0"), 
-            "SBSTBI":                (25, 19, "lutff_3/in_0"), 
-            "SCLI":                  (25, 19, "lutff_2/in_1"), 
-            "SCLO":                  (25, 19, "slf_op_3"), 
-            "SCLOE":                 (25, 19, "slf_op_4"), 
-            "SDAI":                  (25, 19, "lutff_1/in_1"), 
-            "SDAO":                  (25, 19, "slf_op_1"), 
-            "SDAOE":                 (25, 19, "slf_op_2"), 
-            "SDA_INPUT_DELAYED":     (19, 21, "SDA_input_delay"), 
-            "SDA_OUTPUT_DELAYED":    (19, 21, "SDA_output_delay"), 
-        },
-        ("HFOSC", (0, 21, 1)) : {
-            "CLKHFPU":                      (0, 19, "lutff_0/in_1"),
-            "CLKHFEN":                      (0, 19, "lutff_7/in_3"),
-            "CLKHF":                        (0, 19, "glb_netwk_4"),
-            "CLKLF_FABRIC":                 (0, 18, "slf_op_7"),
-            "CLKHF_DIV_1":                  (0, 16, "CBIT_4"),
-            "CLKHF_DIV_0":                  (0, 16, "CBIT_3")
-        },
-        ("LFOSC", (25, 21, 1)) : {
-            "CLKLFPU":                      (25, 19, "lutff_0/in_1"),
-            "CLKLFEN":                      (25, 19, "lutff_7/in_3"),
-            "CLKLF":                        (25, 19, "glb_netwk_5"),
-            "CLKLF_FABRIC":                 (25, 19, "slf_op_0")
-        },
-        ("SMCCLK", (25, 3, 0)) : {
-            "CLK":                          (25, 3, "slf_op_5")
-        },
-        ("LED_DRV_CUR", (25, 21, 2)) : {
-            "LED_DRV_CUR_EN":               (25, 19, "CBIT_5"),
-            "EN":                           (25, 19, "lutff_6/in_3"),
-        },
-        ("RGB_DRV", (0, 21, 3)) : {
-            "RGB_DRV_EN":                   (0, 18, "CBIT_5"),
-            "RGB0_CURRENT_0":               (0, 18, "CBIT_6"),
-            "RGB0_CURRENT_1":               (0, 18, "CBIT_7"),
-            "RGB0_CURRENT_2":               (0, 19, "CBIT_0"),
-            "RGB0_CURRENT_3":               (0, 19, "CBIT_1"),
-            "RGB0_CURRENT_4":               (0, 19, "CBIT_2"),
-            "RGB0_CURRENT_5":               (0, 19, "CBIT_3"),
-            "RGB1_CURRENT_0":               (0, 19, "CBIT_4"),
-            "RGB1_CURRENT_1":               (0, 19, "CBIT_5"),
-            "RGB1_CURRENT_2":               (0, 19, "CBIT_6"),
-            "RGB1_CURRENT_3":               (0, 19, "CBIT_7"),
-            "RGB1_CURRENT_4":               (0, 20, "CBIT_0"),
-            "RGB1_CURRENT_5":               (0, 20, "CBIT_1"),
-            "RGB2_CURRENT_0":               (0, 20, "CBIT_2"),
-            "RGB2_CURRENT_1":               (0, 20, "CBIT_3"),
-            "RGB2_CURRENT_2":               (0, 20, "CBIT_4"),
-            "RGB2_CURRENT_3":               (0, 20, "CBIT_5"),
-            "RGB2_CURRENT_4":               (0, 20, "CBIT_6"),
-            "RGB2_CURRENT_5":               (0, 20, "CBIT_7"),
-            "RGBLEDEN":                     (0, 20, "lutff_1/in_1"),
-            "RGB0PWM":                      (0, 20, "lutff_2/in_1"),
-            "RGB1PWM":                      (0, 20, "lutff_3/in_1"),
-            "RGB2PWM":                      (0, 20, "lutff_4/in_1"),
-            "RGB0":                         (13, 21, 0),
-            "RGB1":                         (12, 21, 0),
-            "RGB2":                         (8, 21, 0)
-        },
+        "u4k" : {
+            ("SPI", (0, 0, 0)): {
+                "MCSNO0":                (0, 3, "slf_op_1"), 
+                "MCSNO1":                (0, 3, "slf_op_3"), 
+                "MCSNO2":                (0, 3, "slf_op_6"), 
+                "MCSNO3":                (0, 4, "slf_op_0"), 
+                "MCSNOE0":               (0, 3, "slf_op_2"), 
+                "MCSNOE1":               (0, 3, "slf_op_4"), 
+                "MCSNOE2":               (0, 3, "slf_op_7"), 
+                "MCSNOE3":               (0, 4, "slf_op_1"), 
+                "MI":                    (0, 2, "lutff_0/in_1"), 
+                "MO":                    (0, 2, "slf_op_5"), 
+                "MOE":                   (0, 2, "slf_op_6"), 
+                "SBACKO":                (0, 2, "slf_op_0"), 
+                "SBADRI0":               (0, 1, "lutff_1/in_1"), 
+                "SBADRI1":               (0, 1, "lutff_2/in_1"), 
+                "SBADRI2":               (0, 2, "lutff_0/in_3"), 
+                "SBADRI3":               (0, 2, "lutff_1/in_3"), 
+                "SBADRI4":               (0, 2, "lutff_2/in_3"), 
+                "SBADRI5":               (0, 2, "lutff_3/in_3"), 
+                "SBADRI6":               (0, 2, "lutff_4/in_3"), 
+                "SBADRI7":               (0, 2, "lutff_5/in_3"), 
+                "SBCLKI":                (0, 1, "clk"), 
+                "SBDATI0":               (0, 1, "lutff_1/in_3"), 
+                "SBDATI1":               (0, 1, "lutff_2/in_3"), 
+                "SBDATI2":               (0, 1, "lutff_3/in_3"), 
+                "SBDATI3":               (0, 1, "lutff_4/in_3"), 
+                "SBDATI4":               (0, 1, "lutff_5/in_3"), 
+                "SBDATI5":               (0, 1, "lutff_6/in_3"), 
+                "SBDATI6":               (0, 1, "lutff_7/in_3"), 
+                "SBDATI7":               (0, 1, "lutff_0/in_1"), 
+                "SBDATO0":               (0, 1, "slf_op_0"), 
+                "SBDATO1":               (0, 1, "slf_op_1"), 
+                "SBDATO2":               (0, 1, "slf_op_2"), 
+                "SBDATO3":               (0, 1, "slf_op_3"), 
+                "SBDATO4":               (0, 1, "slf_op_4"), 
+                "SBDATO5":               (0, 1, "slf_op_5"), 
+                "SBDATO6":               (0, 1, "slf_op_6"), 
+                "SBDATO7":               (0, 1, "slf_op_7"), 
+                "SBRWI":                 (0, 1, "lutff_0/in_3"), 
+                "SBSTBI":                (0, 2, "lutff_6/in_3"), 
+                "SCKI":                  (0, 2, "lutff_1/in_1"), 
+                "SCKO":                  (0, 2, "slf_op_7"), 
+                "SCKOE":                 (0, 3, "slf_op_0"), 
+                "SCSNI":                 (0, 2, "lutff_2/in_1"), 
+                "SI":                    (0, 2, "lutff_7/in_3"), 
+                "SO":                    (0, 2, "slf_op_3"), 
+                "SOE":                   (0, 2, "slf_op_4"), 
+                "SPIIRQ":                (0, 2, "slf_op_1"), 
+                "SPIWKUP":               (0, 2, "slf_op_2"), 
+                "SPI_ENABLE_0":          (7, 0, "cbit2usealt_in_0"), 
+                "SPI_ENABLE_1":          (6, 0, "cbit2usealt_in_0"), 
+                "SPI_ENABLE_2":          (7, 0, "cbit2usealt_in_1"), 
+                "SPI_ENABLE_3":          (6, 0, "cbit2usealt_in_1"), 
+            },
+            ("SPI", (25, 0, 1)): {
+                "MCSNO0":                (25, 3, "slf_op_1"), 
+                "MCSNO1":                (25, 3, "slf_op_3"), 
+                "MCSNO2":                (25, 3, "slf_op_6"), 
+                "MCSNO3":                (25, 4, "slf_op_0"), 
+                "MCSNOE0":               (25, 3, "slf_op_2"), 
+                "MCSNOE1":               (25, 3, "slf_op_4"), 
+                "MCSNOE2":               (25, 3, "slf_op_7"), 
+                "MCSNOE3":               (25, 4, "slf_op_1"), 
+                "MI":                    (25, 2, "lutff_0/in_1"), 
+                "MO":                    (25, 2, "slf_op_5"), 
+                "MOE":                   (25, 2, "slf_op_6"), 
+                "SBACKO":                (25, 2, "slf_op_0"), 
+                "SBADRI0":               (25, 1, "lutff_1/in_1"), 
+                "SBADRI1":               (25, 1, "lutff_2/in_1"), 
+                "SBADRI2":               (25, 2, "lutff_0/in_3"), 
+                "SBADRI3":               (25, 2, "lutff_1/in_3"), 
+                "SBADRI4":               (25, 2, "lutff_2/in_3"), 
+                "SBADRI5":               (25, 2, "lutff_3/in_3"), 
+                "SBADRI6":               (25, 2, "lutff_4/in_3"), 
+                "SBADRI7":               (25, 2, "lutff_5/in_3"), 
+                "SBCLKI":                (25, 1, "clk"), 
+                "SBDATI0":               (25, 1, "lutff_1/in_3"), 
+                "SBDATI1":               (25, 1, "lutff_2/in_3"), 
+                "SBDATI2":               (25, 1, "lutff_3/in_3"), 
+                "SBDATI3":               (25, 1, "lutff_4/in_3"), 
+                "SBDATI4":               (25, 1, "lutff_5/in_3"), 
+                "SBDATI5":               (25, 1, "lutff_6/in_3"), 
+                "SBDATI6":               (25, 1, "lutff_7/in_3"), 
+                "SBDATI7":               (25, 1, "lutff_0/in_1"), 
+                "SBDATO0":               (25, 1, "slf_op_0"), 
+                "SBDATO1":               (25, 1, "slf_op_1"), 
+                "SBDATO2":               (25, 1, "slf_op_2"), 
+                "SBDATO3":               (25, 1, "slf_op_3"), 
+                "SBDATO4":               (25, 1, "slf_op_4"), 
+                "SBDATO5":               (25, 1, "slf_op_5"), 
+                "SBDATO6":               (25, 1, "slf_op_6"), 
+                "SBDATO7":               (25, 1, "slf_op_7"), 
+                "SBRWI":                 (25, 1, "lutff_0/in_3"), 
+                "SBSTBI":                (25, 2, "lutff_6/in_3"), 
+                "SCKI":                  (25, 2, "lutff_1/in_1"), 
+                "SCKO":                  (25, 2, "slf_op_7"), 
+                "SCKOE":                 (25, 3, "slf_op_0"), 
+                "SCSNI":                 (25, 2, "lutff_2/in_1"), 
+                "SI":                    (25, 2, "lutff_7/in_3"), 
+                "SO":                    (25, 2, "slf_op_3"), 
+                "SOE":                   (25, 2, "slf_op_4"), 
+                "SPIIRQ":                (25, 2, "slf_op_1"), 
+                "SPIWKUP":               (25, 2, "slf_op_2"), 
+                "SPI_ENABLE_0":          (24, 0, "cbit2usealt_in_0"), 
+                "SPI_ENABLE_1":          (24, 0, "cbit2usealt_in_1"), 
+                "SPI_ENABLE_2":          (23, 0, "cbit2usealt_in_0"), 
+                "SPI_ENABLE_3":          (23, 0, "cbit2usealt_in_1"), 
+            },
+            ("I2C", (0, 21, 0)): {
+                "I2CIRQ":                (0, 20, "slf_op_7"), 
+                "I2CWKUP":               (0, 19, "slf_op_5"), 
+                "I2C_ENABLE_0":          (13, 21, "cbit2usealt_in_0"), 
+                "I2C_ENABLE_1":          (12, 21, "cbit2usealt_in_1"), 
+                "SBACKO":                (0, 20, "slf_op_6"), 
+                "SBADRI0":               (0, 20, "lutff_1/in_0"), 
+                "SBADRI1":               (0, 20, "lutff_2/in_0"), 
+                "SBADRI2":               (0, 20, "lutff_3/in_0"), 
+                "SBADRI3":               (0, 20, "lutff_4/in_0"), 
+                "SBADRI4":               (0, 20, "lutff_5/in_0"), 
+                "SBADRI5":               (0, 20, "lutff_6/in_0"), 
+                "SBADRI6":               (0, 20, "lutff_7/in_0"), 
+                "SBADRI7":               (0, 19, "lutff_2/in_0"), 
+                "SBCLKI":                (0, 20, "clk"), 
+                "SBDATI0":               (0, 19, "lutff_5/in_0"), 
+                "SBDATI1":               (0, 19, "lutff_6/in_0"), 
+                "SBDATI2":               (0, 19, "lutff_7/in_0"), 
+                "SBDATI3":               (0, 20, "lutff_0/in_3"), 
+                "SBDATI4":               (0, 20, "lutff_5/in_1"), 
+                "SBDATI5":               (0, 20, "lutff_6/in_1"), 
+                "SBDATI6":               (0, 20, "lutff_7/in_1"), 
+                "SBDATI7":               (0, 20, "lutff_0/in_0"), 
+                "SBDATO0":               (0, 19, "slf_op_6"), 
+                "SBDATO1":               (0, 19, "slf_op_7"), 
+                "SBDATO2":               (0, 20, "slf_op_0"), 
+                "SBDATO3":               (0, 20, "slf_op_1"), 
+                "SBDATO4":               (0, 20, "slf_op_2"), 
+                "SBDATO5":               (0, 20, "slf_op_3"), 
+                "SBDATO6":               (0, 20, "slf_op_4"), 
+                "SBDATO7":               (0, 20, "slf_op_5"), 
+                "SBRWI":                 (0, 19, "lutff_4/in_0"), 
+                "SBSTBI":                (0, 19, "lutff_3/in_0"), 
+                "SCLI":                  (0, 19, "lutff_2/in_1"), 
+                "SCLO":                  (0, 19, "slf_op_3"), 
+                "SCLOE":                 (0, 19, "slf_op_4"), 
+                "SDAI":                  (0, 19, "lutff_1/in_1"), 
+                "SDAO":                  (0, 19, "slf_op_1"), 
+                "SDAOE":                 (0, 19, "slf_op_2"), 
+                "SDA_INPUT_DELAYED":     (12, 21, "SDA_input_delay"), 
+                "SDA_OUTPUT_DELAYED":    (12, 21, "SDA_output_delay"), 
+            },
+            ("I2C", (25, 21, 0)): {
+                "I2CIRQ":                (25, 20, "slf_op_7"), 
+                "I2CWKUP":               (25, 19, "slf_op_5"), 
+                "I2C_ENABLE_0":          (19, 21, "cbit2usealt_in_1"), 
+                "I2C_ENABLE_1":          (19, 21, "cbit2usealt_in_0"), 
+                "SBACKO":                (25, 20, "slf_op_6"), 
+                "SBADRI0":               (25, 20, "lutff_1/in_0"), 
+                "SBADRI1":               (25, 20, "lutff_2/in_0"), 
+                "SBADRI2":               (25, 20, "lutff_3/in_0"), 
+                "SBADRI3":               (25, 20, "lutff_4/in_0"), 
+                "SBADRI4":               (25, 20, "lutff_5/in_0"), 
+                "SBADRI5":               (25, 20, "lutff_6/in_0"), 
+                "SBADRI6":               (25, 20, "lutff_7/in_0"), 
+                "SBADRI7":               (25, 19, "lutff_2/in_0"), 
+                "SBCLKI":                (25, 20, "clk"), 
+                "SBDATI0":               (25, 19, "lutff_5/in_0"), 
+                "SBDATI1":               (25, 19, "lutff_6/in_0"), 
+                "SBDATI2":               (25, 19, "lutff_7/in_0"), 
+                "SBDATI3":               (25, 20, "lutff_0/in_3"), 
+                "SBDATI4":               (25, 20, "lutff_5/in_1"), 
+                "SBDATI5":               (25, 20, "lutff_6/in_1"), 
+                "SBDATI6":               (25, 20, "lutff_7/in_1"), 
+                "SBDATI7":               (25, 20, "lutff_0/in_0"), 
+                "SBDATO0":               (25, 19, "slf_op_6"), 
+                "SBDATO1":               (25, 19, "slf_op_7"), 
+                "SBDATO2":               (25, 20, "slf_op_0"), 
+                "SBDATO3":               (25, 20, "slf_op_1"), 
+                "SBDATO4":               (25, 20, "slf_op_2"), 
+                "SBDATO5":               (25, 20, "slf_op_3"), 
+                "SBDATO6":               (25, 20, "slf_op_4"), 
+                "SBDATO7":               (25, 20, "slf_op_5"), 
+                "SBRWI":                 (25, 19, "lutff_4/in_0"), 
+                "SBSTBI":                (25, 19, "lutff_3/in_0"), 
+                "SCLI":                  (25, 19, "lutff_2/in_1"), 
+                "SCLO":                  (25, 19, "slf_op_3"), 
+                "SCLOE":                 (25, 19, "slf_op_4"), 
+                "SDAI":                  (25, 19, "lutff_1/in_1"), 
+                "SDAO":                  (25, 19, "slf_op_1"), 
+                "SDAOE":                 (25, 19, "slf_op_2"), 
+                "SDA_INPUT_DELAYED":     (19, 21, "SDA_input_delay"), 
+                "SDA_OUTPUT_DELAYED":    (19, 21, "SDA_output_delay"), 
+            },
+            ("HFOSC", (0, 21, 1)) : {
+                "CLKHFPU":                      (0, 19, "lutff_0/in_1"),
+                "CLKHFEN":                      (0, 19, "lutff_7/in_3"),
+                "CLKHF":                        (0, 19, "glb_netwk_4"),
+                "CLKLF_FABRIC":                 (0, 18, "slf_op_7"),
+                "CLKHF_DIV_1":                  (0, 16, "CBIT_4"),
+                "CLKHF_DIV_0":                  (0, 16, "CBIT_3")
+            },
+            ("LFOSC", (25, 21, 1)) : {
+                "CLKLFPU":                      (25, 19, "lutff_0/in_1"),
+                "CLKLFEN":                      (25, 19, "lutff_7/in_3"),
+                "CLKLF":                        (25, 19, "glb_netwk_5"),
+                "CLKLF_FABRIC":                 (25, 19, "slf_op_0")
+            },
+            ("SMCCLK", (25, 3, 0)) : {
+                "CLK":                          (25, 3, "slf_op_5")
+            },
+            ("LED_DRV_CUR", (25, 21, 2)) : {
+                "LED_DRV_CUR_EN":               (25, 19, "CBIT_5"),
+                "EN":                           (25, 19, "lutff_6/in_3"),
+            },
+            ("RGB_DRV", (0, 21, 3)) : {
+                "RGB_DRV_EN":                   (0, 18, "CBIT_5"),
+                "RGB0_CURRENT_0":               (0, 18, "CBIT_6"),
+                "RGB0_CURRENT_1":               (0, 18, "CBIT_7"),
+                "RGB0_CURRENT_2":               (0, 19, "CBIT_0"),
+                "RGB0_CURRENT_3":               (0, 19, "CBIT_1"),
+                "RGB0_CURRENT_4":               (0, 19, "CBIT_2"),
+                "RGB0_CURRENT_5":               (0, 19, "CBIT_3"),
+                "RGB1_CURRENT_0":               (0, 19, "CBIT_4"),
+                "RGB1_CURRENT_1":               (0, 19, "CBIT_5"),
+                "RGB1_CURRENT_2":               (0, 19, "CBIT_6"),
+                "RGB1_CURRENT_3":               (0, 19, "CBIT_7"),
+                "RGB1_CURRENT_4":               (0, 20, "CBIT_0"),
+                "RGB1_CURRENT_5":               (0, 20, "CBIT_1"),
+                "RGB2_CURRENT_0":               (0, 20, "CBIT_2"),
+                "RGB2_CURRENT_1":               (0, 20, "CBIT_3"),
+                "RGB2_CURRENT_2":               (0, 20, "CBIT_4"),
+                "RGB2_CURRENT_3":               (0, 20, "CBIT_5"),
+                "RGB2_CURRENT_4":               (0, 20, "CBIT_6"),
+                "RGB2_CURRENT_5":               (0, 20, "CBIT_7"),
+                "RGBLEDEN":                     (0, 20, "lutff_1/in_1"),
+                "RGB0PWM":                      (0, 20, "lutff_2/in_1"),
+                "RGB1PWM":                      (0, 20, "lutff_3/in_1"),
+                "RGB2PWM":                      (0, 20, "lutff_4/in_1"),
+                "RGB0":                         (13, 21, 0),
+                "RGB1":                         (12, 21, 0),
+                "RGB2":                         (8, 21, 0)
+            },
+        }
     }
-}
 
-iotile_full_db = parse_db(iceboxdb.database_io_txt)
-logictile_db = parse_db(iceboxdb.database_logic_txt, "1k")
-logictile_5k_db = parse_db(iceboxdb.database_logic_txt, "5k")
-logictile_8k_db = parse_db(iceboxdb.database_logic_txt, "8k")
-logictile_384_db = parse_db(iceboxdb.database_logic_txt, "384")
-rambtile_db = parse_db(iceboxdb.database_ramb_txt, "1k")
-ramttile_db = parse_db(iceboxdb.database_ramt_txt, "1k")
-rambtile_8k_db = parse_db(iceboxdb.database_ramb_8k_txt, "8k")
-ramttile_8k_db = parse_db(iceboxdb.database_ramt_8k_txt, "8k")
-
-ipcon_5k_db = parse_db(iceboxdb.database_ipcon_5k_txt, "5k")
-dsp0_5k_db = parse_db(iceboxdb.database_dsp0_5k_txt, "5k")
-dsp1_5k_db = parse_db(iceboxdb.database_dsp1_5k_txt, "5k")
-
-#This bit doesn't exist in DB because icecube won't ever set it,
-#but it exists
-dsp1_5k_db.append([["B4[7]"], "IpConfig", "CBIT_5"])
-
-
-dsp2_5k_db = parse_db(iceboxdb.database_dsp2_5k_txt, "5k")
-dsp3_5k_db = parse_db(iceboxdb.database_dsp3_5k_txt, "5k")
-
-dsp3_5k_db.append([["B2[7]"], "IpConfig", "CBIT_3"])   # for u4k HFOSC.CLKHF_DIV
-dsp3_5k_db.append([["B5[7]"], "IpConfig", "CBIT_4"])
-
-
-#Add missing LC_ bits to DSP and IPCon databases
-for db_to_fix in [ipcon_5k_db, dsp0_5k_db, dsp1_5k_db, dsp2_5k_db, dsp3_5k_db]:
-    for entry in db_to_fix:
-        if len(entry) >= 2 and entry[1].startswith("LC_"):
-            for lentry in logictile_5k_db:
-                if len(lentry) >= 2 and lentry[1] == entry[1]:
-                    entry[0] = lentry[0]
-
-iotile_l_db = list()
-iotile_r_db = list()
-iotile_t_db = list()
-iotile_b_db = list()
-
-for entry in iotile_full_db:
-    if entry[1] == "buffer" and entry[2].startswith("IO_L."):
-        new_entry = entry[:]
-        new_entry[2] = new_entry[2][5:]
-        iotile_l_db.append(new_entry)
-    elif entry[1] == "buffer" and entry[2].startswith("IO_R."):
-        new_entry = entry[:]
-        new_entry[2] = new_entry[2][5:]
-        iotile_r_db.append(new_entry)
-    elif entry[1] == "buffer" and entry[2].startswith("IO_T."):
-        new_entry = entry[:]
-        new_entry[2] = new_entry[2][5:]
-        iotile_t_db.append(new_entry)
-    elif entry[1] == "buffer" and entry[2].startswith("IO_B."):
-        new_entry = entry[:]
-        new_entry[2] = new_entry[2][5:]
-        iotile_b_db.append(new_entry)
-    else:
-        iotile_l_db.append(entry)
-        iotile_r_db.append(entry)
-        iotile_t_db.append(entry)
-        iotile_b_db.append(entry)
-
-logictile_db.append([["B1[49]"], "buffer", "carry_in", "carry_in_mux"])
-logictile_db.append([["B1[50]"], "CarryInSet"])
-
-logictile_5k_db.append([["B1[49]"], "buffer", "carry_in", "carry_in_mux"])
-logictile_5k_db.append([["B1[50]"], "CarryInSet"])
-
-logictile_8k_db.append([["B1[49]"], "buffer", "carry_in", "carry_in_mux"])
-logictile_8k_db.append([["B1[50]"], "CarryInSet"])
-
-logictile_384_db.append([["B1[49]"], "buffer", "carry_in", "carry_in_mux"])
-logictile_384_db.append([["B1[50]"], "CarryInSet"])
-
-# The 5k series has a couple of extra IO configuration bits. Add them in to a copy of the db here
-iotile_t_5k_db = list(iotile_t_db)
-iotile_t_5k_db.append([["B14[15]"], "IoCtrl", "padeb_test_1"])
-iotile_t_5k_db.append([["B15[14]"], "IoCtrl", "padeb_test_0"])
-iotile_t_5k_db.append([["B7[10]"], "IoCtrl", "cf_bit_32"])
-iotile_t_5k_db.append([["B6[10]"], "IoCtrl", "cf_bit_33"])
-iotile_t_5k_db.append([["B7[15]"], "IoCtrl", "cf_bit_34"])
-iotile_t_5k_db.append([["B6[15]"], "IoCtrl", "cf_bit_35"])
-iotile_t_5k_db.append([["B13[10]"], "IoCtrl", "cf_bit_36"])
-iotile_t_5k_db.append([["B12[10]"], "IoCtrl", "cf_bit_37"])
-iotile_t_5k_db.append([["B13[15]"], "IoCtrl", "cf_bit_38"])
-iotile_t_5k_db.append([["B12[15]"], "IoCtrl", "cf_bit_39"])
-iotile_t_5k_db.append([["B10[3]"], "IpConfig", "cbit2usealt_in_0"])
-iotile_t_5k_db.append([["B12[2]"], "IpConfig", "cbit2usealt_in_1"])
-iotile_t_5k_db.append([["B12[3]"], "IpConfig", "SDA_input_delay"])
-iotile_t_5k_db.append([["B15[3]"], "IpConfig", "SDA_output_delay"])
-
-iotile_b_5k_db = list(iotile_b_db)
-iotile_b_5k_db.append([["B14[15]"], "IoCtrl", "padeb_test_1"])
-iotile_b_5k_db.append([["B15[14]"], "IoCtrl", "padeb_test_0"])
-iotile_b_5k_db.append([["B7[10]"], "IoCtrl", "cf_bit_32"])
-iotile_b_5k_db.append([["B6[10]"], "IoCtrl", "cf_bit_33"])
-iotile_b_5k_db.append([["B7[15]"], "IoCtrl", "cf_bit_34"])
-iotile_b_5k_db.append([["B6[15]"], "IoCtrl", "cf_bit_35"])
-iotile_b_5k_db.append([["B13[10]"], "IoCtrl", "cf_bit_36"])
-iotile_b_5k_db.append([["B12[10]"], "IoCtrl", "cf_bit_37"])
-iotile_b_5k_db.append([["B13[15]"], "IoCtrl", "cf_bit_38"])
-iotile_b_5k_db.append([["B12[15]"], "IoCtrl", "cf_bit_39"])
-iotile_b_5k_db.append([["B10[3]"], "IpConfig", "cbit2usealt_in_0"])
-iotile_b_5k_db.append([["B12[2]"], "IpConfig", "cbit2usealt_in_1"])
-iotile_b_5k_db.append([["B12[3]"], "IpConfig", "SDA_input_delay"])
-iotile_b_5k_db.append([["B15[3]"], "IpConfig", "SDA_output_delay"])
-
-for db in [iotile_l_db, iotile_r_db, iotile_t_db, iotile_b_db, iotile_t_5k_db, iotile_b_5k_db, logictile_db, logictile_5k_db, logictile_8k_db, logictile_384_db, rambtile_db, ramttile_db, rambtile_8k_db, ramttile_8k_db, dsp0_5k_db, dsp1_5k_db, dsp2_5k_db, dsp3_5k_db, ipcon_5k_db]:
+@db_loader("iotile_full_db", "iotile_l_db", "iotile_r_db", "iotile_t_db", "iotile_b_db", "iotile_t_5k_db", "iotile_b_5k_db")
+def load_iotile_dbs():
+    import iceboxdb
+    iotile_full_db = parse_db(iceboxdb.database_io_txt)
+
+    iotile_l_db = list()
+    iotile_r_db = list()
+    iotile_t_db = list()
+    iotile_b_db = list()
+
+    for entry in iotile_full_db:
+        if entry[1] == "buffer" and entry[2].startswith("IO_L."):
+            new_entry = entry[:]
+            new_entry[2] = new_entry[2][5:]
+            iotile_l_db.append(new_entry)
+        elif entry[1] == "buffer" and entry[2].startswith("IO_R."):
+            new_entry = entry[:]
+            new_entry[2] = new_entry[2][5:]
+            iotile_r_db.append(new_entry)
+        elif entry[1] == "buffer" and entry[2].startswith("IO_T."):
+            new_entry = entry[:]
+            new_entry[2] = new_entry[2][5:]
+            iotile_t_db.append(new_entry)
+        elif entry[1] == "buffer" and entry[2].startswith("IO_B."):
+            new_entry = entry[:]
+            new_entry[2] = new_entry[2][5:]
+            iotile_b_db.append(new_entry)
+        else:
+            iotile_l_db.append(entry)
+            iotile_r_db.append(entry)
+            iotile_t_db.append(entry)
+            iotile_b_db.append(entry)
+
+    # The 5k series has a couple of extra IO configuration bits. Add them in to a copy of the db here
+    iotile_t_5k_db = list(iotile_t_db)
+    iotile_t_5k_db.append([["B14[15]"], "IoCtrl", "padeb_test_1"])
+    iotile_t_5k_db.append([["B15[14]"], "IoCtrl", "padeb_test_0"])
+    iotile_t_5k_db.append([["B7[10]"], "IoCtrl", "cf_bit_32"])
+    iotile_t_5k_db.append([["B6[10]"], "IoCtrl", "cf_bit_33"])
+    iotile_t_5k_db.append([["B7[15]"], "IoCtrl", "cf_bit_34"])
+    iotile_t_5k_db.append([["B6[15]"], "IoCtrl", "cf_bit_35"])
+    iotile_t_5k_db.append([["B13[10]"], "IoCtrl", "cf_bit_36"])
+    iotile_t_5k_db.append([["B12[10]"], "IoCtrl", "cf_bit_37"])
+    iotile_t_5k_db.append([["B13[15]"], "IoCtrl", "cf_bit_38"])
+    iotile_t_5k_db.append([["B12[15]"], "IoCtrl", "cf_bit_39"])
+    iotile_t_5k_db.append([["B10[3]"], "IpConfig", "cbit2usealt_in_0"])
+    iotile_t_5k_db.append([["B12[2]"], "IpConfig", "cbit2usealt_in_1"])
+    iotile_t_5k_db.append([["B12[3]"], "IpConfig", "SDA_input_delay"])
+    iotile_t_5k_db.append([["B15[3]"], "IpConfig", "SDA_output_delay"])
+
+    iotile_b_5k_db = list(iotile_b_db)
+    iotile_b_5k_db.append([["B14[15]"], "IoCtrl", "padeb_test_1"])
+    iotile_b_5k_db.append([["B15[14]"], "IoCtrl", "padeb_test_0"])
+    iotile_b_5k_db.append([["B7[10]"], "IoCtrl", "cf_bit_32"])
+    iotile_b_5k_db.append([["B6[10]"], "IoCtrl", "cf_bit_33"])
+    iotile_b_5k_db.append([["B7[15]"], "IoCtrl", "cf_bit_34"])
+    iotile_b_5k_db.append([["B6[15]"], "IoCtrl", "cf_bit_35"])
+    iotile_b_5k_db.append([["B13[10]"], "IoCtrl", "cf_bit_36"])
+    iotile_b_5k_db.append([["B12[10]"], "IoCtrl", "cf_bit_37"])
+    iotile_b_5k_db.append([["B13[15]"], "IoCtrl", "cf_bit_38"])
+    iotile_b_5k_db.append([["B12[15]"], "IoCtrl", "cf_bit_39"])
+    iotile_b_5k_db.append([["B10[3]"], "IpConfig", "cbit2usealt_in_0"])
+    iotile_b_5k_db.append([["B12[2]"], "IpConfig", "cbit2usealt_in_1"])
+    iotile_b_5k_db.append([["B12[3]"], "IpConfig", "SDA_input_delay"])
+    iotile_b_5k_db.append([["B15[3]"], "IpConfig", "SDA_output_delay"])
+
+    # The split databases share their common entries, so they must be
+    # normalized in this order.
+    for db in [iotile_l_db, iotile_r_db, iotile_t_db, iotile_b_db, iotile_t_5k_db, iotile_b_5k_db]:
+        normalize_db(db)
+
+    return iotile_full_db, iotile_l_db, iotile_r_db, iotile_t_db, iotile_b_db, iotile_t_5k_db, iotile_b_5k_db
+
+def load_logictile_db(device):
+    import iceboxdb
+    db = parse_db(iceboxdb.database_logic_txt, device)
+    db.append([["B1[49]"], "buffer", "carry_in", "carry_in_mux"])
+    db.append([["B1[50]"], "CarryInSet"])
+    return normalize_db(db)
+
+db_loader("logictile_db")(lambda: load_logictile_db("1k"))
+db_loader("logictile_5k_db")(lambda: load_logictile_db("5k"))
+db_loader("logictile_8k_db")(lambda: load_logictile_db("8k"))
+db_loader("logictile_384_db")(lambda: load_logictile_db("384"))
+
+@db_loader("rambtile_db")
+def load_rambtile_db():
+    import iceboxdb
+    return normalize_db(parse_db(iceboxdb.database_ramb_txt, "1k"), ramb=True)
+
+@db_loader("ramttile_db")
+def load_ramttile_db():
+    import iceboxdb
+    return normalize_db(parse_db(iceboxdb.database_ramt_txt, "1k"), ramt=True)
+
+@db_loader("rambtile_8k_db")
+def load_rambtile_8k_db():
+    import iceboxdb
+    return normalize_db(parse_db(iceboxdb.database_ramb_8k_txt, "8k"), ramb_8k=True)
+
+@db_loader("ramttile_8k_db")
+def load_ramttile_8k_db():
+    import iceboxdb
+    return normalize_db(parse_db(iceboxdb.database_ramt_8k_txt, "8k"), ramt_8k=True)
+
+# The config bits of the LC_ entries of the 5k logic tile database, by
+# entry name.
+def logictile_5k_lc_bits():
+    lc_bits = dict()
+    for lentry in get_db("logictile_5k_db"):
+        if len(lentry) >= 2 and lentry[1].startswith("LC_"):
+            lc_bits[lentry[1]] = lentry[0]
+    return lc_bits
+
+def load_ultra_db(name):
+    import iceboxdb
+    db = parse_db(getattr(iceboxdb, "database_%s_txt" % name), "5k")
+    if name == "dsp1_5k":
+        #This bit doesn't exist in DB because icecube won't ever set it,
+        #but it exists
+        db.append([["B4[7]"], "IpConfig", "CBIT_5"])
+    if name == "dsp3_5k":
+        db.append([["B2[7]"], "IpConfig", "CBIT_3"])   # for u4k HFOSC.CLKHF_DIV
+        db.append([["B5[7]"], "IpConfig", "CBIT_4"])
+
+    #Add missing LC_ bits to DSP and IPCon databases
+    lc_bits = logictile_5k_lc_bits()
+    for entry in db:
+        if len(entry) >= 2 and entry[1] in lc_bits:
+            entry[0] = lc_bits[entry[1]]
+
+    return normalize_db(db)
+
+db_loader("ipcon_5k_db")(lambda: load_ultra_db("ipcon_5k"))
+db_loader("dsp0_5k_db")(lambda: load_ultra_db("dsp0_5k"))
+db_loader("dsp1_5k_db")(lambda: load_ultra_db("dsp1_5k"))
+db_loader("dsp2_5k_db")(lambda: load_ultra_db("dsp2_5k"))
+db_loader("dsp3_5k_db")(lambda: load_ultra_db("dsp3_5k"))
+
+# Normalize the net names of the routing entries of a tile database and
+# sort out duplicate entries, in place.
+def normalize_db(db, ramb=False, ramt=False, ramb_8k=False, ramt_8k=False):
     for entry in db:
         if entry[1] in ("buffer", "routing"):
-            entry[2] = netname_normalize(entry[2],
-                                         ramb=(db == rambtile_db),
-                                         ramt=(db == ramttile_db),
-                                         ramb_8k=(db == rambtile_8k_db),
-                                         ramt_8k=(db == ramttile_8k_db))
-            entry[3] = netname_normalize(entry[3],
-                                         ramb=(db == rambtile_db),
-                                         ramt=(db == ramttile_db),
-                                         ramb_8k=(db == rambtile_8k_db),
-                                         ramt_8k=(db == ramttile_8k_db))
+            entry[2] = netname_normalize(entry[2], ramb=ramb, ramt=ramt, ramb_8k=ramb_8k, ramt_8k=ramt_8k)
+            entry[3] = netname_normalize(entry[3], ramb=ramb, ramt=ramt, ramb_8k=ramb_8k, ramt_8k=ramt_8k)
     unique_entries = dict()
     while db:
         entry = db.pop()
@@ -6168,6 +8081,7 @@ for db in [iotile_l_db, iotile_r_db, iotile_t_db, iotile_b_db, iotile_t_5k_db, i
         unique_entries[key] = entry
     for key in sorted(unique_entries):
         db.append(unique_entries[key])
+    return db
 
 if __name__ == "__main__":
     run_checks()
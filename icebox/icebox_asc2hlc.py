@@ -709,6 +709,22 @@ class Fabric:
         for xy in sorted(self.tiles.keys(), key = lambda xy: (xy[1], xy[0])):
             self.tiles[xy].printout(options)
 
+# Indices of the compiled database entries which have an effect when
+# they don't match. Cached per compiled database (see icebox.compile_db(),
+# whose cache is bounded the same way).
+inverted_entries = (['IoCtrl', 'IE_0'], ['IoCtrl', 'IE_1'],
+                    ['RamConfig', 'PowerUp'])
+inverted_entry_index_cache = icebox.bounded_cache(256)
+
+def inverted_entry_indices(compiled):
+    key = id(compiled)
+    cached = inverted_entry_index_cache.get(key)
+    if cached is None or cached[0] is not compiled:
+        cached = inverted_entry_index_cache[key] = (compiled, [
+            i for i, (mask, value, entry) in enumerate(compiled)
+            if entry[1:] in inverted_entries])
+    return cached[1]
+
 class Tile:
     def __init__(self, fabric, xy, data, is_logic_block):
         self.fabric = fabric
@@ -724,21 +740,24 @@ class Tile:
 
         x, y = xy
         db = self.ic.tile_db(x, y)
-        mapped_bits = set()
 
-        # 'data' is a list of strings containing a series of zeroes and
-        # ones.  'bits' is a set of strings containing an entry
-        # "B<row>[<col>]" or "!B<row>[<col>]" for each bit.
+        # 'data' is an icebox.tilebits object; each database entry is
+        # compiled to a (mask, value) pair which matches iff
+        # data.bits & mask == value.  'mapped_bits' collects the bits
+        # required to be set by matching entries.
+        #
+        # Only entries reachable from the set bits of the tile (via the
+        # inverted bit index) can match; the entries whose absence has
+        # a meaning of its own are visited as well.
 
-        bits = set()
-        for k, line in enumerate(data):
-            for i in range(len(line)):
-                if line[i] == '1':
-                    bits.add('B%d[%d]' % (k, i))
-                else:
-                    bits.add('!B%d[%d]' % (k, i))
+        mapped_bits = 0
+
+        compiled = icebox.compile_db(db, data.width)
+        indices = set(icebox.get_bit_index(compiled).match_indices(data.bits))
+        indices.update(inverted_entry_indices(compiled))
 
-        for entry in db:
+        for i in sorted(indices):
+            mask, value, entry = compiled[i]
             # LC bits don't have a useful entry in the database; skip them
             # for now
             if re_match_cached(r'LC_', entry[1]):
@@ -752,13 +771,9 @@ class Tile:
                 continue
 
             # are all required bits set/unset?
-            match = True
-            for bit in entry[0]:
-                if not bit in bits:
-                    match = False
+            match = data.bits & mask == value
             if match:
-                for bit in entry[0]:
-                    mapped_bits.add(bit)
+                mapped_bits |= value
 
             if entry[1:] == ['IoCtrl', 'IE_0']:
                 if match != (self.ic.device == '1k'):
@@ -840,7 +855,7 @@ class Tile:
             for i in range(len(line)):
                 if 36 <= i <= 45 and is_logic_block:
                     self.bitinfo[-1] += '*' if line[i] == '1' else '-'
-                elif line[i] == '1' and 'B%d[%d]' % (k, i) not in mapped_bits:
+                elif line[i] == '1' and not (mapped_bits >> (k * data.width + i)) & 1:
                     self.unknown_bits = True
                     extra_text += ' B%d[%d]' % (k, i)
                     self.bitinfo[-1] += '?'
@@ -23,6 +23,7 @@ mode_lm4k = False
 mode_5k = False
 mode_u4k = False
 mode_8k = False
+jobs = None
 
 def usage():
     print("""
@@ -42,11 +43,16 @@ Usage: %s [options] [bitmap.asc]
 
     -u
         create chipdb for u4k device
+
+    -j <n>
+        build the routing graph of the device first, following the
+        routing in <n> worker processes (default: $ICEBOX_JOBS if set,
+        else the graph is only used if it is already cached)
 """ % os.path.basename(sys.argv[0]))
     sys.exit(0)
 
 try:
-    opts, args = getopt.getopt(sys.argv[1:], "3584u")
+    opts, args = getopt.getopt(sys.argv[1:], "3584uj:")
 except:
     usage()
 
@@ -61,9 +67,24 @@ for o, a in opts:
         mode_lm4k = True
     elif o == "-u":
         mode_u4k = True
+    elif o == "-j":
+        try:
+            jobs = int(a)
+        except ValueError:
+            jobs = 0
+        if jobs < 1:
+            print("Error: -j needs a positive number of worker processes, not '%s'!" % a, file=sys.stderr)
+            sys.exit(1)
     else:
         usage()
 
+if jobs is None and os.environ.get("ICEBOX_JOBS", "").strip():
+    try:
+        jobs = icebox.default_jobs()
+    except ValueError as e:
+        print("Error: %s!" % e, file=sys.stderr)
+        sys.exit(1)
+
 ic = icebox.iceconfig()
 if mode_8k:
     ic.setup_empty_8k()
@@ -203,7 +224,9 @@ print("""#
 #
 """ % ic.device)
 
-all_group_segments = ic.group_segments(all_tiles, connect_gb=False)
+if jobs is not None:
+    ic.routing_graph(jobs)
+all_group_segments = ic.all_group_segments()
 
 print(".device %s %d %d %d" % (ic.device, ic.max_x+1, ic.max_y+1, len(all_group_segments)))
 print()
@@ -362,7 +385,7 @@ for idx in sorted(extra_bits):
     print("%s %s" % (idx, extra_bits[idx]))
 print()
 
-for group in sorted(all_group_segments):
+for group in ic.sorted_groups(all_group_segments):
     netidx = len(net_to_segs)
     net_to_segs.append(group)
     print(".net %d" % netidx)
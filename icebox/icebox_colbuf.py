@@ -72,13 +72,13 @@ def make_cache(stmt, raw_db):
                     value = "0"
                     bit = bit[1:]
                 match = re_match_cached("B([0-9]+)\[([0-9]+)\]", bit)
-                cache_entry[1].append((int(match.group(1)), int(match.group(2)), value))
+                cache_entry[1].append((int(match.group(1)), int(match.group(2)), value == "1"))
             cache.append(cache_entry)
     return cache
 
 def match_cache_entry(cache_entry, tile_dat):
     for entry in cache_entry[1]:
-        if tile_dat[entry[0]][entry[1]] != entry[2]:
+        if tile_dat.get_bit(entry[0], entry[1]) != entry[2]:
             return False
     return True
 
@@ -90,13 +90,10 @@ def analyze_tile(ic, cache, tile_pos):
             glbs.add(cache_entry[0])
     return glbs
 
-colbuf_map = dict()
+colbuf_map = ic.colbuf_map()
 used_glbs_map = dict()
 driven_glbs_map = dict()
 
-for entry in ic.colbuf_db():
-    colbuf_map[(entry[2], entry[3])] = (entry[0], entry[1])
-
 for tiles in [ic.io_tiles, ic.logic_tiles, ic.ramb_tiles, ic.ramt_tiles]:
     cache = None
     for tile in tiles:
@@ -117,15 +114,11 @@ for tiles in [ic.io_tiles, ic.logic_tiles, ic.ramb_tiles, ic.ramt_tiles]:
             driven_glbs_map[tile] = glbs
 
 def set_colbuf(ic, tile, bit, value):
-    tile_dat = ic.tile(tile[0], tile[1])
     tile_db = ic.tile_db(tile[0], tile[1])
     for entry in tile_db:
         if entry[1] == "ColBufCtrl" and entry[2] == "glb_netwk_%d" % bit:
             match = re_match_cached("B([0-9]+)\[([0-9]+)\]", entry[0][0])
-            l = tile_dat[int(match.group(1))]
-            n = int(match.group(2))
-            l = l[:n] + value + l[n+1:]
-            tile_dat[int(match.group(1))] = l
+            ic.set_bit(tile[0], tile[1], int(match.group(1)), int(match.group(2)), value == "1")
             return
     assert False
 
@@ -45,26 +45,13 @@ def format_bits(line_nr, this_line, other_line):
     return text
 
 def explained_bits(db, tile):
-    bits = set()
-    mapped_bits = set()
-    for k, line in enumerate(tile):
-        for i in range(len(line)):
-            if line[i] == "1":
-                bits.add("B%d[%d]" % (k, i))
-            else:
-                bits.add("!B%d[%d]" % (k, i))
     text = set()
-    for entry in db:
+    for entry in icebox.match_entries(tile, db):
         if re_match_cached(r"LC_", entry[1]):
             continue
         if entry[1] in ("routing", "buffer"):
             continue
-        match = True
-        for bit in entry[0]:
-            if not bit in bits:
-                match = False
-        if match:
-            text.add("<%s> %s" % (",".join(entry[0]), " ".join(entry[1:])))
+        text.add("<%s> %s" % (",".join(entry[0]), " ".join(entry[1:])))
     return text
 
 def diff_tiles(stmt, tiles1, tiles2):
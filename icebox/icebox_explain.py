@@ -70,18 +70,11 @@ ic = icebox.iceconfig()
 ic.read_file(args[0])
 print("Fabric size (without IO tiles): %d x %d" % (ic.max_x-1, ic.max_y-1))
 
-def print_tile(stmt, ic, x, y, tile, db):
+def print_tile(stmt, ic, x, y, tile):
     if single_tile is not None and single_tile != (x, y):
         return
 
-    bits = set()
-    mapped_bits = set()
-    for k, line in enumerate(tile):
-        for i in range(len(line)):
-            if line[i] == "1":
-                bits.add("B%d[%d]" % (k, i))
-            else:
-                bits.add("!B%d[%d]" % (k, i))
+    mapped_bits = 0
 
     if re_search_cached(r"logic_tile", stmt):
         active_luts = set([i for i in range(8) if "1" in icebox.get_lutff_bits(tile, i)])
@@ -89,29 +82,20 @@ def print_tile(stmt, ic, x, y, tile, db):
     text = set()
     used_lc = set()
     text_default_mask = 0
-    for entry in db:
+    for entry in ic.match_entries(x, y):
         if re_match_cached(r"LC_", entry[1]):
             continue
-        if entry[1] in ("routing", "buffer"):
-            if not ic.tile_has_net(x, y, entry[2]): continue
-            if not ic.tile_has_net(x, y, entry[3]): continue
-        match = True
-        for bit in entry[0]:
-            if not bit in bits:
-                match = False
-        if match:
-            for bit in entry[0]:
-                mapped_bits.add(bit)
-            if entry[1] == "IoCtrl" and entry[2] == "IE_0":
-                text_default_mask |= 1
-            if entry[1] == "IoCtrl" and entry[2] == "IE_1":
-                text_default_mask |= 2
-            if entry[1] == "RamConfig" and entry[2] == "PowerUp":
-                text_default_mask |= 4
-            if print_bits:
-                text.add("<%s> %s" % (" ".join(entry[0]), " ".join(entry[1:])))
-            else:
-                text.add(" ".join(entry[1:]))
+        mapped_bits |= icebox.compile_pattern(entry[0], tile.width)[1]
+        if entry[1] == "IoCtrl" and entry[2] == "IE_0":
+            text_default_mask |= 1
+        if entry[1] == "IoCtrl" and entry[2] == "IE_1":
+            text_default_mask |= 2
+        if entry[1] == "RamConfig" and entry[2] == "PowerUp":
+            text_default_mask |= 4
+        if print_bits:
+            text.add("<%s> %s" % (" ".join(entry[0]), " ".join(entry[1:])))
+        else:
+            text.add(" ".join(entry[1:]))
     bitinfo = list()
     print_bitinfo = False
     for k, line in enumerate(tile):
@@ -126,7 +110,7 @@ def print_tile(stmt, ic, x, y, tile, db):
                     bitinfo[-1] += "*"
                 else:
                     bitinfo[-1] += "-"
-            elif line[i] == "1" and "B%d[%d]" % (k, i) not in mapped_bits:
+            elif line[i] == "1" and not (mapped_bits >> (k * tile.width + i)) & 1:
                 print_bitinfo = True
                 extra_text += " B%d[%d]" % (k, i)
                 bitinfo[-1] += "?"
@@ -156,23 +140,23 @@ def print_tile(stmt, ic, x, y, tile, db):
             print(line)
 
 for idx in ic.io_tiles:
-    print_tile(".io_tile %d %d" % idx, ic, idx[0], idx[1], ic.io_tiles[idx], ic.tile_db(idx[0], idx[1]))
+    print_tile(".io_tile %d %d" % idx, ic, idx[0], idx[1], ic.io_tiles[idx])
 
 for idx in ic.logic_tiles:
-    print_tile(".logic_tile %d %d" % idx, ic, idx[0], idx[1], ic.logic_tiles[idx], ic.tile_db(idx[0], idx[1]))
+    print_tile(".logic_tile %d %d" % idx, ic, idx[0], idx[1], ic.logic_tiles[idx])
 
 for idx in ic.ramb_tiles:
-    print_tile(".ramb_tile %d %d" % idx, ic, idx[0], idx[1], ic.ramb_tiles[idx], ic.tile_db(idx[0], idx[1]))
+    print_tile(".ramb_tile %d %d" % idx, ic, idx[0], idx[1], ic.ramb_tiles[idx])
 
 for idx in ic.ramt_tiles:
-    print_tile(".ramt_tile %d %d" % idx, ic, idx[0], idx[1], ic.ramt_tiles[idx], ic.tile_db(idx[0], idx[1]))
+    print_tile(".ramt_tile %d %d" % idx, ic, idx[0], idx[1], ic.ramt_tiles[idx])
 
 for i in range(4):
     for idx in ic.dsp_tiles[i]:
-        print_tile(".dsp%d_tile %d %d" % (i, idx[0], idx[1]), ic, idx[0], idx[1], ic.dsp_tiles[i][idx], ic.tile_db(idx[0], idx[1]))
+        print_tile(".dsp%d_tile %d %d" % (i, idx[0], idx[1]), ic, idx[0], idx[1], ic.dsp_tiles[i][idx])
 
 for idx in ic.ipcon_tiles:
-    print_tile(".ipcon_tile %d %d" % idx, ic, idx[0], idx[1], ic.ipcon_tiles[idx], ic.tile_db(idx[0], idx[1]))
+    print_tile(".ipcon_tile %d %d" % idx, ic, idx[0], idx[1], ic.ipcon_tiles[idx])
 
 for bit in ic.extra_bits:
     print()
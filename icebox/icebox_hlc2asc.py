@@ -585,6 +585,10 @@ class Main:
                 self.ic.setup_empty_384()
             else:
                 raise ParseError("Unknown device {}".format(self.device))
+            # Number .sym> nets against the connectivity as of the first
+            # .sym> directive and keep no undo journal; writeout() ends
+            # the batch.
+            self.ic.begin_batch(journal=False)
 
         #elif fields[0] == 'coldboot' and fields[1] == '=' \
         #        and self.coldboot is None:
@@ -691,17 +695,14 @@ class Main:
                 tile.apply_directive('RamConfig', 'PowerUp')
 
         # enable column buffers
-        colbuf_db = self.ic.colbuf_db()
+        colbuf_map = self.ic.colbuf_map()
         for x, y in list(self.tiles):
             for src, dst in self.tiles[x, y].buffers + \
                             self.tiles[x, y].routings:
                 if not src.startswith('glb_netwk_'):
                     continue
-                driving_xy = [(src_x, src_y)
-                              for src_x, src_y, dst_x, dst_y in colbuf_db
-                              if dst_x == x and dst_y == y]
-                assert len(driving_xy) == 1
-                driving_xy, = driving_xy
+                assert (x, y) in colbuf_map
+                driving_xy = colbuf_map[x, y]
 
                 if driving_xy not in self.tiles:
                     if driving_xy in self.ic.logic_tiles:
@@ -718,6 +719,7 @@ class Main:
 
                 self.tiles[driving_xy].apply_directive('ColBufCtrl', src)
 
+        self.ic.end_batch()
         self.ic.write_file('/dev/stdout')
 
 class Tile:
@@ -801,10 +803,9 @@ clearing:{:<30} - current set  :{}""".format(
         self.bits_cleared.update(bits_clear)
 
         for row, col in bits_set:
-            assert row < len(self.data)
-            assert col < len(self.data[row])
-            self.data[row] = self.data[row][:col] + '1' + \
-                             self.data[row][col + 1:]
+            assert row < self.data.height
+            assert col < self.data.width
+            self.ic.set_bit(self.x, self.y, row, col)
 
     def read(self, fields):
         if len(fields) == 3 and fields[1] == '->':
@@ -315,7 +315,7 @@ configuration bits it has and how it is connected to its neighbourhood.</p>""" %
     print("""<p>This section lists all nets in the tile and how this
 nets are connected with nets from cells in its neighbourhood.</p>""")
 
-    grouped_segs = ic.group_segments(set([(tx, ty)]))
+    grouped_segs = ic.nets_touching(tx, ty)
     groups_indexed = dict()
     this_tile_nets = dict()
 
@@ -63,14 +63,9 @@ pll_locations = set()
 global_nets = set()
 
 if verbose:
-    print("Analyzing connectivity.")
+    print("Analyzing connectivity and counting resources.")
 
-connections = sorted(ic.group_segments())
-
-if verbose:
-    print("Counting resources.")
-
-for segs in connections:
+for segs in ic.iter_group_segments():
     for seg in segs:
         if ic.tile_type(seg[0], seg[1]) == "IO" and seg[2].startswith("io_"):
             match = re_match_cached("io_(\d+)/D_(IN|OUT)_(\d+)", seg[2])
@@ -221,6 +221,7 @@ for bit in ic.extra_bits:
             s2 = (pin_entry[0], pin_entry[1], "padin_%d" % pin_entry[2])
             extra_connections.append((s1, s2))
 
+ieren_rmap = ic.ieren_rmap()
 for idx, tile in list(ic.io_tiles.items()):
     tc = icebox.tileconfig(tile)
     iocells_type[(idx[0], idx[1], 0)] = ["0" for i in range(6)]
@@ -228,9 +229,8 @@ for idx, tile in list(ic.io_tiles.items()):
     for entry in ic.tile_db(idx[0], idx[1]):
         if check_ieren and entry[1] == "IoCtrl" and entry[2].startswith("IE_") and not tc.match(entry[0]):
             iren_idx = (idx[0], idx[1], 0 if entry[2] == "IE_0" else 1)
-            for iren_entry in ic.ieren_db():
-                if iren_idx[0] == iren_entry[3] and iren_idx[1] == iren_entry[4] and iren_idx[2] == iren_entry[5]:
-                    iocells_inbufs.add((iren_entry[0], iren_entry[1], iren_entry[2]))
+            if iren_idx in ieren_rmap:
+                iocells_inbufs.add(ieren_rmap[iren_idx])
         if entry[1] == "NegClk" and tc.match(entry[0]):
             iocells_negclk.add((idx[0], idx[1], 0))
             iocells_negclk.add((idx[0], idx[1], 1))
@@ -293,16 +293,15 @@ for segs in sorted(ic.group_segments(extra_connections=extra_connections, extra_
             idx = (s[0], s[1], int(match.group(1)))
             p = "io_%d_%d_%d" % idx
             if lookup_pins or pcf_data:
-                for entry in ic.pinloc_db(package):
-                    if idx[0] == entry[1] and idx[1] == entry[2] and idx[2] == entry[3]:
-                        if (entry[0],) in pcf_data:
-                            p = pcf_data[(entry[0],)]
-                            unmatched_ports.discard(p)
-                        elif (entry[1], entry[2], entry[3]) in pcf_data:
-                            p = pcf_data[(entry[1], entry[2], entry[3])]
-                            unmatched_ports.discard(p)
-                        elif lookup_pins:
-                            p = "pin_%s" % entry[0]
+                for pin in ic.pinloc_rmap(package).get(idx, ()):
+                    if (pin,) in pcf_data:
+                        p = pcf_data[(pin,)]
+                        unmatched_ports.discard(p)
+                    elif idx in pcf_data:
+                        p = pcf_data[idx]
+                        unmatched_ports.discard(p)
+                    elif lookup_pins:
+                        p = "pin_%s" % pin
             if not renamed_net_to_port:
                 n = p
                 if idx in iocells_in and idx not in iocells_out:
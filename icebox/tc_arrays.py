@@ -0,0 +1,75 @@
+# Test case for `icebox': Do the NumPy tile arrays match match_entries()?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import random, sys
+import icebox
+from tc_fixtures import set_random_pips
+
+def test_arrays(ic):
+    import numpy
+    sys.stderr.write("testing tile arrays for the `%s' device...\n" % ic.device)
+    for kind in ("io", "logic", "ramb", "ramt"):
+        coords, tiles = ic.as_array(kind)
+        if not coords:
+            continue
+        packed_coords, packed = ic.as_array(kind, packed=True)
+        # IO tiles on different sides have different databases.
+        by_db = dict()
+        for i, (x, y) in enumerate(coords):
+            by_db.setdefault(id(ic.tile_db(x, y)), []).append(i)
+        matches, usage = dict(), dict()
+        for indices in by_db.values():
+            db = ic.tile_db(*coords[indices[0]])
+            for i, m, u in zip(indices, icebox.match_array(tiles[indices], db), icebox.usage_array(tiles[indices], db)):
+                matches[i], usage[i] = m, u
+        for i, (x, y) in enumerate(coords):
+            tile = ic.tile(x, y)
+            db = ic.tile_db(x, y)
+            bits = numpy.array([[tile.get_bit(row, col) for col in range(tile.width)] for row in range(tile.height)])
+            entries = icebox.match_entries(tile, db)
+            used = set()
+            for entry in entries:
+                used.update(bit for bit in entry[0] if not bit.startswith("!"))
+            expected_usage = numpy.array([["B%d[%d]" % (row, col) in used for col in range(tile.width)] for row in range(tile.height)])
+            if (tiles[i] != bits).any() or \
+                    int.from_bytes(packed[i].tobytes(), "little") != tile.bits or \
+                    [db[k] for k in numpy.flatnonzero(matches[i])] != entries or \
+                    (usage[i] != expected_usage).any():
+                sys.stderr.write("ERROR: %s tile arrays differ at (%d, %d)\n" % (kind, x, y))
+                sys.exit(1)
+        if packed_coords != coords or \
+                (icebox.count_bits_array(tiles) != [bin(ic.tile(x, y).bits).count("1") for x, y in coords]).any():
+            sys.stderr.write("ERROR: %s tile arrays differ\n" % kind)
+            sys.exit(1)
+
+def main():
+    try:
+        import numpy
+    except ImportError:
+        sys.stderr.write("skipping tile array tests: NumPy is not installed\n")
+        return
+
+    rng = random.Random(1)
+    for setup in ("setup_empty_384", "setup_empty_1k"):
+        ic = icebox.iceconfig()
+        getattr(ic, setup)()
+        # Random pips and random bits, so that other entries match too.
+        set_random_pips(ic, rng)
+        for rec in rng.sample(ic.tile_records(), 20):
+            for k in range(8):
+                ic.set_bit(rec.x, rec.y, rng.randrange(rec.data.height), rng.randrange(rec.data.width))
+        test_arrays(ic)
+
+if __name__ == '__main__':
+    main()
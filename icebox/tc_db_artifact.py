@@ -0,0 +1,71 @@
+# Test case for `icebox': Is the database artifact used only when it is usable?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os, pickle, sys, tempfile
+import icebox
+from tc_fixtures import check
+
+# Forget the loaded databases, so that the next get_db() tries the
+# artifact again.
+def reset():
+    for name in list(icebox.loaded_dbs):
+        vars(icebox).pop(name, None)
+    icebox.loaded_dbs.clear()
+    icebox.db_artifact_state.pop("loaded", None)
+
+# Load the databases with the artifact in filename, and check that they
+# were read from it or not and match those built from the texts.
+def check_artifact(filename, expected, used, what):
+    reset()
+    icebox.db_artifact_filename = lambda: filename
+    db = icebox.get_db("logictile_db")
+    check(icebox.db_artifact_state["loaded"] == used,
+          "%s artifact %s" % (what, "not used" if used else "used"))
+    ic = icebox.iceconfig()
+    ic.setup_empty_1k()
+    check(db == expected and ic.tile_db(1, 1) == expected,
+          "databases differ with the %s artifact" % what)
+
+def main():
+    sys.stderr.write("testing the database artifact...\n")
+    db_artifact_filename = icebox.db_artifact_filename
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "iceboxdb.pickle")
+        try:
+            # Without the artifact the texts are used.
+            reset()
+            icebox.db_artifact_filename = lambda: filename
+            expected = icebox.get_db("logictile_db")
+            check(not icebox.db_artifact_state["loaded"], "missing artifact used")
+
+            icebox.write_db_artifact(filename)
+            check_artifact(filename, expected, True, "current")
+
+            with open(filename, "rb") as f:
+                artifact = pickle.load(f)
+            artifact["digest"] = "0" * 40
+            with open(filename, "wb") as f:
+                pickle.dump(artifact, f)
+            check_artifact(filename, expected, False, "stale")
+
+            for data in (b"garbage", b"garbage\n", pickle.dumps(artifact)[:100]):
+                with open(filename, "wb") as f:
+                    f.write(data)
+                check_artifact(filename, expected, False, "corrupt")
+        finally:
+            icebox.db_artifact_filename = db_artifact_filename
+            reset()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+# Test case for `icebox': Do tile edits, undo, snapshots and clones work?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import random, sys
+import icebox
+from tc_fixtures import check, private_cache_dir, random_config
+
+def make_config(setup, seed):
+    ic = random_config(setup, seed)
+    ic.symbols[0] = set(["sym"])
+    ic.dirty_tiles = set()
+    return ic
+
+def tile_bits(ic):
+    return dict(((kind, idx), icebox.as_tilebits(tile).bits)
+                for kind, tiles in ic.tile_kinds() for idx, tile in tiles.items())
+
+# Flip random bits through set_bit(), set_row() and set_tile_bits(),
+# returning the tiles that changed.
+def random_edits(ic, rng, count):
+    changed = set()
+    records = ic.tile_records()
+    for i in range(count):
+        rec = rng.choice(records)
+        before = rec.data.bits
+        row = rng.randrange(rec.data.height)
+        col = rng.randrange(rec.data.width)
+        if i % 3 == 0:
+            ic.set_bit(rec.x, rec.y, row, col, rec.data.bits >> (row * rec.data.width + col) & 1 == 0)
+        elif i % 3 == 1:
+            line = rec.data[row]
+            ic.set_row(rec.x, rec.y, row, line[:col] + "10"[int(line[col])] + line[col + 1:])
+        else:
+            ic.set_tile_bits(rec.x, rec.y, rec.data.bits ^ 1 << rng.randrange(rec.data.width * rec.data.height))
+        if rec.data.bits != before:
+            changed.add((rec.x, rec.y))
+    return changed
+
+def test_undo(ic, rng):
+    sys.stderr.write("testing tile edits and undo...\n")
+    saved = tile_bits(ic)
+    snapshot = ic.snapshot()
+    groups = ic.all_group_segments()
+
+    mark = len(ic.journal)
+    changed = random_edits(ic, rng, 30)
+    check(ic.dirty_tiles == changed, "dirty tiles differ from the edited tiles")
+    check(ic.all_groups is None and ic.net_map is None, "edit kept the connectivity")
+    check(len(ic.journal) == mark + 30, "edits not journaled")
+
+    # Undoing the last edit, then back to the mark, restores the tiles.
+    x, y, bits = ic.journal[-1]
+    ic.undo()
+    check(ic.tile(x, y).bits == bits, "undo() did not revert the last edit")
+    ic.undo(mark)
+    check(tile_bits(ic) == tile_bits(snapshot) == saved, "undo to mark differs from snapshot")
+    check(ic.all_group_segments() == groups, "groups differ after undo")
+
+    # restore() brings back the snapshot, and can do so again.
+    for i in range(2):
+        random_edits(ic, rng, 10)
+        ic.symbols.clear()
+        ic.restore(snapshot)
+        check(tile_bits(ic) == saved and ic.symbols == {0: set(["sym"])}, "restored config differs")
+        check(ic.journal == [], "restore() kept the journal")
+        check(ic.all_group_segments() == groups, "groups differ after restore")
+
+def test_batch(ic, rng):
+    sys.stderr.write("testing batches of tile edits...\n")
+    ic.get_net_number(min(ic.all_group_segments())[0])
+    net_map = ic.net_map
+    mark = len(ic.journal)
+    with ic.batch(journal=False):
+        with ic.batch():
+            changed = random_edits(ic, rng, 10)
+        check(ic.net_map is net_map, "nested batch dropped the connectivity")
+    check(changed and ic.net_map is None, "batch kept the connectivity")
+    check(len(ic.journal) == mark, "edits of an unjournaled batch were journaled")
+
+    with ic.batch():
+        random_edits(ic, rng, 10)
+    check(len(ic.journal) == mark + 10, "edits of a batch not journaled")
+    ic.get_net_number(min(ic.all_group_segments())[0])
+    net_map = ic.net_map
+    with ic.batch():
+        ic.undo(mark)
+        check(ic.net_map is net_map, "undo in a batch dropped the connectivity")
+    check(ic.net_map is None, "batch with undo kept the connectivity")
+
+# Tiles stored as lists of row strings can be edited too, and undoing
+# the edit of a tile removed since does nothing.
+def test_list_tiles():
+    sys.stderr.write("testing edits of list tiles...\n")
+    ic = make_config(icebox.iceconfig.setup_empty_384, 3)
+    saved = tile_bits(ic)
+    groups = ic.all_group_segments()
+    rows = list(ic.tile(1, 1))
+    ic.logic_tiles[(1, 1)] = list(rows)
+    mark = len(ic.journal)
+    ic.set_bit(1, 1, 0, 0, rows[0][0] == "0")
+    ic.set_row(1, 1, 1, rows[1][::-1])
+    ic.set_tile_bits(1, 1, icebox.tilebits(rows).bits)
+    check(ic.tile(1, 1) == rows and ic.logic_tiles[(1, 1)] is ic.tile(1, 1) and len(ic.journal) == mark + 3,
+          "edits of a list tile differ")
+    ic.undo(mark)
+    check(tile_bits(ic) == saved and ic.all_group_segments() == groups, "undo of list tile edits differs")
+
+    ic.set_bit(1, 1, 0, 0, rows[0][0] == "0")
+    del ic.logic_tiles[(1, 1)]
+    ic.undo(mark)
+    check(ic.tile(1, 1) is None and len(ic.journal) == mark, "undo of a removed tile")
+
+def test_restore_other_device():
+    sys.stderr.write("testing restore across devices...\n")
+    small = make_config(icebox.iceconfig.setup_empty_384, 1)
+    large = make_config(icebox.iceconfig.setup_empty_1k, 2)
+    large.tile_records()
+
+    large.restore(small.snapshot())
+    check((large.device, large.max_x, large.max_y) == ("384", small.max_x, small.max_y), "device not restored")
+    check(tile_bits(large) == tile_bits(small), "tiles of the other device not restored")
+    check([rec.data.bits for rec in large.tile_records()] == [rec.data.bits for rec in small.tile_records()] and
+          large.tile(10, 10) is None, "tile grid of the other device kept")
+    check(large.group_segments() == small.group_segments(), "groups differ after restore across devices")
+
+def test_clone(ic, rng):
+    sys.stderr.write("testing clones...\n")
+    saved = tile_bits(ic)
+    clone = ic.clone()
+    check(tile_bits(clone) == saved and clone.symbols == ic.symbols, "clone differs")
+    check(clone.all_group_segments() == ic.all_group_segments(), "groups of clone differ")
+
+    random_edits(clone, rng, 20)
+    clone.symbols[0].add("other")
+    clone.extra_bits.add((0, 1, 2))
+    check(tile_bits(ic) == saved and ic.symbols == {0: set(["sym"])} and not ic.extra_bits,
+          "editing the clone changed the original")
+
+    cloned = tile_bits(clone)
+    random_edits(ic, rng, 20)
+    check(tile_bits(clone) == cloned, "editing the original changed the clone")
+
+def main():
+    with private_cache_dir():
+        run_tests()
+
+def run_tests():
+    rng = random.Random(1)
+    ic = make_config(icebox.iceconfig.setup_empty_384, 1)
+    test_undo(ic, rng)
+    test_batch(ic, rng)
+    test_list_tiles()
+    test_restore_other_device()
+    test_clone(ic, rng)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# Shared fixtures of the `icebox' test cases.
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import contextlib, os, random, sys, tempfile
+import icebox
+
+# Run the enclosed test with the routing graph cache in a temporary
+# directory, so that it neither reads nor fills the user's cache.
+@contextlib.contextmanager
+def private_cache_dir():
+    saved = os.environ.get("ICEBOX_CACHE_DIR")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["ICEBOX_CACHE_DIR"] = cache_dir
+        try:
+            yield cache_dir
+        finally:
+            if saved is None:
+                del os.environ["ICEBOX_CACHE_DIR"]
+            else:
+                os.environ["ICEBOX_CACHE_DIR"] = saved
+
+# Turn on a random subset of the routing and buffer pips of ic, each pip
+# with the given probability, as long as it does not need a bit cleared
+# that an earlier pip set. The bits are set with iceconfig.set_bit(),
+# like any other edit.
+def set_random_pips(ic, rng, probability=0.02):
+    for rec in ic.tile_records():
+        width = rec.data.width
+        for mask, value, entry in icebox.compile_db(ic.tile_db(rec.x, rec.y), width):
+            if entry[1] in ("routing", "buffer") and rng.random() < probability and \
+                    rec.data.bits & (mask & ~value) == 0:
+                while value:
+                    pos = (value & -value).bit_length() - 1
+                    ic.set_bit(rec.x, rec.y, pos // width, pos % width)
+                    value &= value - 1
+
+# A configuration set up by setup (e.g. iceconfig.setup_empty_384) with
+# a random subset of the routing and buffer pips turned on.
+def random_config(setup, seed):
+    ic = icebox.iceconfig()
+    setup(ic)
+    set_random_pips(ic, random.Random(seed))
+    return ic
+
+def error(what):
+    sys.stderr.write("ERROR: %s\n" % what)
+    sys.exit(1)
+
+def check(ok, what):
+    if not ok:
+        error(what)
@@ -0,0 +1,319 @@
+# Test case for `icebox': Does union-find grouping match the plain BFS?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import concurrent.futures, os, random, sys, threading
+import icebox
+from tc_fixtures import private_cache_dir, set_random_pips
+
+def test_group_segments(ic):
+    sys.stderr.write("testing union-find grouping "
+                     "for the `%s' device...\n" % ic.device)
+
+    # Turn on a random subset of the routing and buffer pips.
+    rng = random.Random(1)
+    set_random_pips(ic, rng)
+
+    all_tiles = set((rec.x, rec.y) for rec in ic.tile_records())
+    ic.routing_graph()
+    icebox.check_group_segments = True
+    ic.group_segments(all_tiles, connect_gb = False)
+    ic.group_segments()
+    icebox.check_group_segments = False
+
+    # all_group_segments() regroups incrementally after tile edits.
+    sys.stderr.write("testing incremental regrouping "
+                     "for the `%s' device...\n" % ic.device)
+    ic.all_group_segments()
+    records = list(ic.tile_records())
+    for i in range(4):
+        for k in range(5):
+            rec = rng.choice(records)
+            entries = [e for e in icebox.compile_db(ic.tile_db(rec.x, rec.y), rec.data.width)
+                       if e[2][1] in ("routing", "buffer")]
+            if entries:
+                mask, value, entry = rng.choice(entries)
+                ic.set_tile_bits(rec.x, rec.y, rec.data.bits ^ value)
+        if ic.all_group_segments() != ic.group_segments(all_tiles, connect_gb = False):
+            sys.stderr.write("ERROR: incremental groups differ after %d edits\n" % (5 * (i + 1)))
+            sys.exit(1)
+
+def test_edit_query_loop(ic):
+    sys.stderr.write("testing net numbers after edits without a routing graph "
+                     "for the `%s' device...\n" % ic.device)
+    icebox.routing_graphs.pop(ic.device, None)
+    icebox.routing_graph_cache_misses.add(ic.device)
+
+    # Count the full groupings; the reference numbering below calls the
+    # method of the class.
+    full_groupings = list()
+    def group_segments(*args, **kwargs):
+        full_groupings.append(args)
+        return icebox.iceconfig.group_segments(ic, *args, **kwargs)
+    ic.group_segments = group_segments
+
+    rng = random.Random(2)
+    all_tiles = set((rec.x, rec.y) for rec in ic.tile_records())
+    for i in range(4):
+        set_random_pips(ic, rng, 0.005)
+        groups = sorted(icebox.iceconfig.group_segments(ic, all_tiles, connect_gb = False))
+        for netidx, group in enumerate(groups):
+            for segment in group[:1] + group[-1:]:
+                if ic.get_net_number(segment) != netidx:
+                    sys.stderr.write("ERROR: wrong net number for %s after %d edit rounds\n" % (segment, i + 1))
+                    sys.exit(1)
+    # Only the first query groups the whole device; the edits after it
+    # are regrouped incrementally on the routing graph built then.
+    if len(full_groupings) != 1 or ic.segment_groups is None:
+        sys.stderr.write("ERROR: %d full groupings in an edit and query loop\n" % len(full_groupings))
+        sys.exit(1)
+    del ic.group_segments
+
+# sorted_groups(), iter_group_segments() and follow_net_many() against
+# the plain calls they stand in for, first without and then with the
+# routing graph in memory.
+def test_grouping_helpers(ic):
+    sys.stderr.write("testing sorted_groups(), iter_group_segments() and follow_net_many() "
+                     "for the `%s' device...\n" % ic.device)
+    icebox.routing_graphs.pop(ic.device, None)
+    icebox.routing_graph_cache_misses.add(ic.device)
+    set_random_pips(ic, random.Random(3))
+    all_tiles = set((rec.x, rec.y) for rec in ic.tile_records())
+    netnames = ic.netname_table()
+
+    orders = list()
+    for use_graph in (False, True):
+        if use_graph:
+            ic.routing_graph()
+            ic.invalidate_connectivity()
+        groups = ic.all_group_segments()
+        if (ic.segment_groups is not None) != use_graph or ic.sorted_groups(groups) != sorted(groups):
+            sys.stderr.write("ERROR: sorted_groups() differs from sorted()\n")
+            sys.exit(1)
+
+        # The same groups, in the same order on every call.
+        for i in range(2):
+            orders.append(list(ic.iter_group_segments(all_tiles, connect_gb = False)))
+        if set(orders[-1]) != groups or len(orders[-1]) != len(groups) or orders[-1] != orders[0]:
+            sys.stderr.write("ERROR: iter_group_segments() differs from all_group_segments()\n")
+            sys.exit(1)
+
+        # Ascending segments, then the rest in random order.
+        segments = sorted(netnames.pack(s) for group in groups for s in group)
+        rest = segments[len(segments) // 2:]
+        random.Random(4).shuffle(rest)
+        segments[len(segments) // 2:] = rest
+        for use in (False, True):
+            offsets, neighbours = ic.follow_net_many(segments, use)
+            for i, s in enumerate(segments):
+                if set(netnames.unpack(k) for k in neighbours[offsets[i]:offsets[i+1]]) != ic.follow_net(netnames.unpack(s)):
+                    sys.stderr.write("ERROR: follow_net_many() differs from follow_net() for %s\n" % (netnames.unpack(s),))
+                    sys.exit(1)
+
+# tile_has_net() answers for names no database or wire uses without
+# interning them, so any number of them leaves the netname table usable.
+def test_unknown_netnames(ic):
+    sys.stderr.write("testing tile_has_net() for unknown net names "
+                     "for the `%s' device...\n" % ic.device)
+    known = len(ic.netname_table())
+    for i in range((1 << 16) + 10):
+        netname = "no_such_net_%d" % i
+        if ic.tile_has_net(0, 5, netname) != ic.compute_tile_has_net(0, 5, netname):
+            sys.stderr.write("ERROR: tile_has_net() differs for %s\n" % netname)
+            sys.exit(1)
+    if len(ic.netname_table()) != known:
+        sys.stderr.write("ERROR: tile_has_net() interned unknown net names\n")
+        sys.exit(1)
+    other = icebox.iceconfig()
+    getattr(other, "setup_empty_" + ic.device)()
+    if not other.tile_has_net(1, 1, "lutff_0/out") or (1, 1, "lutff_0/out") not in other.trace((1, 1, "lutff_0/out")):
+        sys.stderr.write("ERROR: net queries fail after unknown net names\n")
+        sys.exit(1)
+
+def test_parallel_routing_graph(device):
+    sys.stderr.write("testing routing graph bands "
+                     "for the `%s' device...\n" % device)
+    graphs = [icebox.build_routing_graph(device, jobs) for jobs in (1, 3)]
+
+    # With other threads running the bands are not forked.
+    def no_pool(*args, **kwargs):
+        raise AssertionError("forked while other threads run")
+    pool = concurrent.futures.ProcessPoolExecutor
+    concurrent.futures.ProcessPoolExecutor = no_pool
+    try:
+        thread = threading.Thread(target=lambda: graphs.append(icebox.build_routing_graph(device, 3)))
+        thread.start()
+        thread.join()
+    finally:
+        concurrent.futures.ProcessPoolExecutor = pool
+    if len(graphs) != 3:
+        sys.stderr.write("ERROR: routing graph not built with other threads running\n")
+        sys.exit(1)
+    if len(set((tuple(g.segments), tuple(g.offsets), tuple(g.targets)) for g in graphs)) != 1:
+        sys.stderr.write("ERROR: routing graphs built in bands differ\n")
+        sys.exit(1)
+
+    # $ICEBOX_JOBS is parsed once; values below 1 count as 1.
+    saved = os.environ.get("ICEBOX_JOBS")
+    try:
+        for value, jobs in (("", 1), ("-2", 1), ("4", 4), ("x", None)):
+            icebox.default_jobs_state.clear()
+            os.environ["ICEBOX_JOBS"] = value
+            try:
+                parsed = icebox.default_jobs()
+            except ValueError:
+                parsed = None
+            os.environ["ICEBOX_JOBS"] = "2"
+            if parsed != jobs or (jobs is not None and icebox.default_jobs() != jobs):
+                sys.stderr.write("ERROR: ICEBOX_JOBS=%r gives %r jobs\n" % (value, parsed))
+                sys.exit(1)
+    finally:
+        icebox.default_jobs_state.clear()
+        if saved is None:
+            os.environ.pop("ICEBOX_JOBS", None)
+        else:
+            os.environ["ICEBOX_JOBS"] = saved
+
+# With $ICEBOX_JOBS above 1, grouping a whole device builds the routing
+# graph in that many worker processes instead of grouping without it.
+def test_jobs_routing_graph(device):
+    sys.stderr.write("testing ICEBOX_JOBS for whole-device groupings "
+                     "for the `%s' device...\n" % device)
+    saved = os.environ.get("ICEBOX_JOBS")
+    build_routing_graph = icebox.build_routing_graph
+    built = list()
+    def record_build(device, jobs=None):
+        built.append(icebox.default_jobs() if jobs is None else jobs)
+        return build_routing_graph(device, jobs)
+    icebox.build_routing_graph = record_build
+    try:
+        results = list()
+        for value, expected in (("1", []), ("2", [2])):
+            os.environ["ICEBOX_JOBS"] = value
+            icebox.default_jobs_state.clear()
+            for grouping in ("all_group_segments", "group_segments"):
+                icebox.routing_graphs.pop(device, None)
+                icebox.routing_graph_cache_misses.add(device)
+                del built[:]
+                ic = icebox.iceconfig()
+                getattr(ic, "setup_empty_" + device)()
+                if grouping == "all_group_segments":
+                    results.append(ic.all_group_segments())
+                else:
+                    results.append(ic.group_segments(set((rec.x, rec.y) for rec in ic.tile_records()), connect_gb = False))
+                if built != expected or (device in icebox.routing_graphs) != bool(expected):
+                    sys.stderr.write("ERROR: %s with ICEBOX_JOBS=%s built the routing graph with %s jobs\n" % (grouping, value, built))
+                    sys.exit(1)
+        if any(groups != results[0] for groups in results):
+            sys.stderr.write("ERROR: groups differ with ICEBOX_JOBS\n")
+            sys.exit(1)
+    finally:
+        icebox.build_routing_graph = build_routing_graph
+        icebox.default_jobs_state.clear()
+        if saved is None:
+            os.environ.pop("ICEBOX_JOBS", None)
+        else:
+            os.environ["ICEBOX_JOBS"] = saved
+
+def test_routing_graph_cache(device):
+    sys.stderr.write("testing the routing graph cache "
+                     "for the `%s' device...\n" % device)
+    graph = icebox.get_routing_graph(device)
+    unpack = icebox.get_netname_table(device).unpack
+    expected = sorted((unpack(s), sorted(unpack(k) for k in graph.neighbours(s))) for s in graph.segments)
+
+    icebox.save_routing_graph(graph)
+    mapped = icebox.load_routing_graph(device)
+    # Load into a netname table that numbers the names differently.
+    table = icebox.netname_tables.pop(device)
+    try:
+        netnames = icebox.get_netname_table(device)
+        for name in reversed(table.names):
+            netnames.intern(name)
+        loaded = icebox.load_routing_graph(device)
+    finally:
+        icebox.netname_tables[device] = table
+
+    for cached, netnames in ((mapped, table), (loaded, netnames)):
+        if cached is None or list(cached.segments) != sorted(cached.segments) or \
+                sorted((netnames.unpack(s), sorted(netnames.unpack(k) for k in cached.neighbours(s))) for s in cached.segments) != expected:
+            sys.stderr.write("ERROR: cached routing graph differs\n")
+            sys.exit(1)
+
+    # A damaged cache file is ignored. The loaded graphs map the old
+    # file, so it is replaced instead of truncated in place.
+    filename = icebox.routing_graph_cache_filename(device)
+    with open(filename, "rb") as f:
+        data = f.read(100)
+    os.remove(filename)
+    with open(filename, "wb") as f:
+        f.write(data)
+    if icebox.load_routing_graph(device) is not None:
+        sys.stderr.write("ERROR: damaged routing graph cache was loaded\n")
+        sys.exit(1)
+
+    # Saving removes the files of the device left by other keys, and
+    # the temporary file of a failed write.
+    cache_dir = os.path.dirname(filename)
+    stale = [os.path.join(cache_dir, name) for name in
+             ("routing-graph-%s-0123456789abcdef.bin" % device, "routing-graph-1k-0123456789abcdef.bin")]
+    for name in stale:
+        with open(name, "wb") as f:
+            f.write(data)
+    icebox.save_routing_graph(graph)
+    if os.path.exists(stale[0]) or not os.path.exists(stale[1]) or icebox.load_routing_graph(device) is None:
+        sys.stderr.write("ERROR: stale routing graph caches not removed\n")
+        sys.exit(1)
+    os.remove(filename)
+    os.mkdir(filename)
+    icebox.save_routing_graph(graph)
+    os.rmdir(filename)
+    if sorted(os.listdir(cache_dir)) != [os.path.basename(stale[1])]:
+        sys.stderr.write("ERROR: failed routing graph cache write left %s\n" % sorted(os.listdir(cache_dir)))
+        sys.exit(1)
+
+def main():
+    with private_cache_dir():
+        run_tests()
+
+def run_tests():
+    ic = icebox.iceconfig()
+    ic.setup_empty_384()
+    test_edit_query_loop(ic)
+
+    ic = icebox.iceconfig()
+    ic.setup_empty_384()
+    test_grouping_helpers(ic)
+
+    ic = icebox.iceconfig()
+    ic.setup_empty_384()
+    test_unknown_netnames(ic)
+
+    test_parallel_routing_graph("384")
+    test_jobs_routing_graph("384")
+    test_routing_graph_cache("384")
+
+    ic = icebox.iceconfig()
+    ic.setup_empty_384()
+    test_group_segments(ic)
+
+    ic = icebox.iceconfig()
+    ic.setup_empty_1k()
+    test_group_segments(ic)
+
+    ic = icebox.iceconfig()
+    ic.setup_empty_5k()
+    test_group_segments(ic)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# Test case for `icebox_hlc2asc': Are .sym> nets numbered as they always were?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os, subprocess, sys
+import icebox
+from tc_fixtures import private_cache_dir, random_config
+
+# The .sym lines icebox_hlc2asc has always written for make_hlc(). The
+# nets are numbered as of the first .sym> directive, when only the
+# first tile is configured.
+expected_symbols = [
+    ".sym 2371 sym_2",
+    ".sym 5640 sym_1",
+    ".sym 5819 sym_3",
+    ".sym 938 sym_0",
+]
+
+def run(*args):
+    return subprocess.run([sys.executable] + list(args), check=True,
+                          stdout=subprocess.PIPE, universal_newlines=True).stdout
+
+# A high-level representation of a 384 device with a random subset of the
+# routing and buffer pips turned on, with .sym> directives for the first
+# net routed at the top level of the first, fifth, tenth and twentieth
+# tile.
+def make_hlc(tmpdir):
+    ic = random_config(icebox.iceconfig.setup_empty_384, 1)
+    asc = os.path.join(tmpdir, "sym.asc")
+    ic.write_file(asc)
+
+    lines = list()
+    tiles = 0
+    pending = False
+    for line in run("icebox_asc2hlc.py", asc).splitlines():
+        # Some random pips name nets a tile does not have; asc2hlc lists
+        # their bits in ';' comments, which hlc2asc does not read. Pips
+        # from the global nets would need column buffers the 384 device
+        # lacks.
+        if line.startswith(";") or "glb_netwk_" in line:
+            continue
+        lines.append(line)
+        fields = line.split()
+        if len(fields) == 4 and fields[0].endswith("_tile") and fields[3] == "{":
+            tiles += 1
+            pending = tiles in (1, 5, 10, 20)
+        elif pending and line.startswith("    ") and not line.startswith("     ") \
+                and len(fields) == 3 and fields[1] in ("->", "~>"):
+            lines.append("    %s .sym> sym_%d" % (fields[0], (1, 5, 10, 20).index(tiles)))
+            pending = False
+    hlc = os.path.join(tmpdir, "sym.hlc")
+    with open(hlc, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return hlc
+
+def main():
+    sys.stderr.write("testing .sym> numbering of icebox_hlc2asc...\n")
+    with private_cache_dir() as tmpdir:
+        hlc = make_hlc(tmpdir)
+        symbols = sorted(line for line in run("icebox_hlc2asc.py", hlc).splitlines()
+                         if line.startswith(".sym "))
+    if symbols != expected_symbols:
+        sys.stderr.write("ERROR: expected %s, got %s\n" % (expected_symbols, symbols))
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Test case for `icebox': Is importing the module cheap?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os, subprocess, sys, tempfile
+
+# Import time budget in seconds, not counting byte-compilation. It only
+# catches gross regressions, since timings vary a lot between machines
+# and under load; $ICEBOX_IMPORT_BUDGET_MS overrides it. The real check
+# is that importing builds none of the lazily loaded tables.
+budget = float(os.environ.get("ICEBOX_IMPORT_BUDGET_MS", "1000")) / 1000
+
+probe = """
+import sys, time
+start = time.perf_counter()
+import icebox
+elapsed = time.perf_counter() - start
+assert "iceboxdb" not in sys.modules, "import icebox loaded iceboxdb"
+assert not icebox.loaded_dbs, "import icebox loaded %s" % sorted(icebox.loaded_dbs)
+built = sorted(name for name in icebox.db_loaders if name in vars(icebox))
+assert not built, "import icebox built %s" % built
+assert not icebox.routing_graphs and not icebox.netname_tables, "import icebox built connectivity tables"
+print(elapsed)
+"""
+
+def main():
+    sys.stderr.write("testing that `import icebox' builds no tables "
+                     "(time budget %d ms)...\n" % (budget * 1000))
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    with tempfile.TemporaryDirectory() as pycache:
+        cmd = [sys.executable, "-X", "pycache_prefix=" + pycache, "-c", probe]
+        times = []
+        # The first run only fills the byte-code cache.
+        for i in range(4):
+            try:
+                out = subprocess.check_output(cmd, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+            except subprocess.CalledProcessError:
+                sys.stderr.write("ERROR: import icebox does more than it should\n")
+                sys.exit(1)
+            times.append(float(out))
+        elapsed = min(times[1:])
+
+    sys.stderr.write("import icebox: %.1f ms\n" % (elapsed * 1000))
+    if elapsed > budget:
+        sys.stderr.write("ERROR: import takes longer than %d ms\n" % (budget * 1000))
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# Test case for `icebox': Do configurations survive pickling and copying?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import copy, gc, pickle, sys, weakref
+import icebox
+from tc_fixtures import error, private_cache_dir, random_config
+
+def check_copy(ic, other, how):
+    if other.all_group_segments() != ic.all_group_segments() or \
+            [rec.data.bits for rec in other.tile_records()] != [rec.data.bits for rec in ic.tile_records()]:
+        error("%s configuration differs" % how)
+    # The copy owns its tile dicts: changing them drops its tile grid.
+    other.tile(1, 1)
+    other.logic_tiles[(1, 1)] = other.logic_tiles[(1, 1)]
+    if other.tile_grid is not None:
+        error("%s configuration does not track its tiles" % how)
+
+def main():
+    with private_cache_dir():
+        run_tests()
+
+def run_tests():
+    sys.stderr.write("testing pickling and copying of configurations...\n")
+    ic = random_config(icebox.iceconfig.setup_empty_384, 1)
+    ic.routing_graph()
+    ic.all_group_segments()
+    check_copy(ic, pickle.loads(pickle.dumps(ic)), "unpickled")
+    check_copy(ic, copy.deepcopy(ic), "copied")
+
+    # A tiledict takes the arguments of dict; the owner is keyword-only.
+    tiles = icebox.tiledict(ic.logic_tiles, ic=ic)
+    if dict(icebox.tiledict(ic.logic_tiles)) != ic.logic_tiles or tiles.owner() is not ic or tiles != ic.logic_tiles:
+        error("tiledict does not take the arguments of dict")
+    del tiles
+
+    # A configuration is freed by reference counting alone.
+    gc.disable()
+    ref = weakref.ref(ic)
+    del ic
+    gc.enable()
+    if ref() is not None:
+        error("configuration is part of a reference cycle")
+
+if __name__ == '__main__':
+    main()
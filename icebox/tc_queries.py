@@ -0,0 +1,71 @@
+# Test case for `icebox': Do the net and pip queries match a full grouping?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os, sys
+import icebox
+from tc_fixtures import error, private_cache_dir, random_config
+
+# Regions as (x0, y0, x1, y1), some of them reaching past the device.
+regions = [(0, 0, 100, 100), (1, 1, 3, 4), (2, 2, 2, 2), (-5, -5, 0, 0), (4, 6, 20, 20), (5, 5, 4, 4)]
+
+# A 384 design with a random subset of the routing and buffer pips
+# turned on, written to an .asc file and read back.
+def read_config(tmpdir):
+    ic = random_config(icebox.iceconfig.setup_empty_384, 1)
+    filename = os.path.join(tmpdir, "queries.asc")
+    ic.write_file(filename)
+    ic = icebox.iceconfig()
+    ic.read_file(filename)
+    return ic
+
+def test_trace(ic):
+    sys.stderr.write("testing trace() against group_segments()...\n")
+    for group in ic.group_segments():
+        for segment in group[0], group[-1]:
+            if ic.trace(segment) != group:
+                error("trace(%s) differs from its group" % (segment,))
+
+def test_nets_touching(ic):
+    sys.stderr.write("testing nets_touching() against group_segments()...\n")
+    for rec in ic.tile_records():
+        expected = set(group for group in ic.group_segments(set([(rec.x, rec.y)]))
+                       if any((x, y) == (rec.x, rec.y) for x, y, netname in group))
+        if ic.nets_touching(rec.x, rec.y) != expected:
+            error("nets_touching(%d, %d) differs" % (rec.x, rec.y))
+
+def test_regions(ic):
+    sys.stderr.write("testing nets_in_region() and pips_in_region()...\n")
+    groups = sorted(ic.group_segments(set((rec.x, rec.y) for rec in ic.tile_records()), connect_gb=False))
+    for x0, y0, x1, y1 in regions:
+        def inside(x, y):
+            return x0 <= x <= x1 and y0 <= y <= y1
+        nets = [netidx for netidx, group in enumerate(groups)
+                if any(inside(x, y) for x, y, netname in group)]
+        if ic.nets_in_region(x0, y0, x1, y1) != nets:
+            error("nets_in_region(%d, %d, %d, %d) differs" % (x0, y0, x1, y1))
+
+        pips = [(rec.x, rec.y, entry[2], entry[3]) for rec in ic.tile_records() if inside(rec.x, rec.y)
+                for entry in ic.match_entries(rec.x, rec.y) if entry[1] in ("routing", "buffer")]
+        if sorted(ic.pips_in_region(x0, y0, x1, y1)) != sorted(pips):
+            error("pips_in_region(%d, %d, %d, %d) differs" % (x0, y0, x1, y1))
+
+def main():
+    with private_cache_dir() as tmpdir:
+        ic = read_config(tmpdir)
+        test_trace(ic)
+        test_nets_touching(ic)
+        test_regions(ic)
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,7 @@ import sys
 import icebox
 from icebox_asc2hlc import translate_netname
 from icebox_hlc2asc import untranslate_netname
+from tc_fixtures import private_cache_dir
 
 def test_netname_translation(ic):
     sys.stderr.write("testing backward netname translation "
@@ -55,17 +56,18 @@ def test_netname_translation(ic):
         sys.exit(1)
 
 def main():
-    ic = icebox.iceconfig()
-    ic.setup_empty_384()
-    test_netname_translation(ic)
+    with private_cache_dir():
+        ic = icebox.iceconfig()
+        ic.setup_empty_384()
+        test_netname_translation(ic)
 
-    ic = icebox.iceconfig()
-    ic.setup_empty_1k()
-    test_netname_translation(ic)
+        ic = icebox.iceconfig()
+        ic.setup_empty_1k()
+        test_netname_translation(ic)
 
-    ic = icebox.iceconfig()
-    ic.setup_empty_8k()
-    test_netname_translation(ic)
+        ic = icebox.iceconfig()
+        ic.setup_empty_8k()
+        test_netname_translation(ic)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,61 @@
+# Test case for `icebox': Do concurrent analyses match serial runs?
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import icebox
+from tc_fixtures import private_cache_dir, random_config
+
+# Number of configurations analyzed in parallel.
+num_configs = 6
+
+def make_config(seed):
+    # Alternate between the 384 and 1k devices.
+    if seed % 2:
+        return random_config(icebox.iceconfig.setup_empty_384, seed)
+    return random_config(icebox.iceconfig.setup_empty_1k, seed)
+
+def analyze(seed):
+    ic = make_config(seed)
+    entries = [(rec.x, rec.y, ic.match_entries(rec.x, rec.y)) for rec in ic.tile_records()]
+    groups = sorted(tuple(sorted(group)) for group in ic.group_segments())
+    ic.routing_graph()
+    all_groups = ic.all_group_segments()
+    numbers = sorted((ic.get_net_number(seg), seg) for group in all_groups for seg in group)
+    return entries, groups, numbers
+
+def main():
+    with private_cache_dir():
+        run_tests()
+
+def run_tests():
+    sys.stderr.write("testing %d concurrent analyses against "
+                     "serial runs...\n" % num_configs)
+
+    # Switch threads often, so that the first uses of the lazily loaded
+    # databases and routing graphs overlap.
+    sys.setswitchinterval(1e-5)
+
+    with ThreadPoolExecutor(max_workers=num_configs) as pool:
+        parallel = list(pool.map(analyze, range(num_configs)))
+
+    sys.setswitchinterval(0.005)
+
+    for seed in range(num_configs):
+        if analyze(seed) != parallel[seed]:
+            sys.stderr.write("ERROR: results for configuration %d differ\n" % seed)
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()